@@ -0,0 +1,95 @@
+"""Load benchmark for serving many applications from one event loop.
+
+Simulates a server hosting ``--apps`` sessions, with ``--clients`` concurrent clients each sending
+``--requests`` step requests to random sessions, and reports the p50/p99 latency of a request.
+It compares rebuilding the application from the persister on every request (``initialize_from(...).build()``)
+with keeping them in an :py:class:`ApplicationPool <burr.core.pool.ApplicationPool>`.
+
+    python benchmarks/application_pool.py --apps 1000 --clients 100 --requests 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from burr.core import ApplicationBuilder, State, action, default
+from burr.core.persistence import InMemoryPersister
+from burr.core.pool import ApplicationPool
+
+
+@action(reads=["count"], writes=["count"])
+async def increment(state: State) -> State:
+    await asyncio.sleep(0)
+    return state.update(count=state["count"] + 1)
+
+
+def builder_factory(persister: InMemoryPersister) -> ApplicationBuilder:
+    return (
+        ApplicationBuilder()
+        .with_actions(increment=increment)
+        .with_transitions(("increment", "increment", default))
+        .initialize_from(
+            persister,
+            resume_at_next_action=True,
+            default_state={"count": 0},
+            default_entrypoint="increment",
+        )
+        .with_state_persister(persister)
+    )
+
+
+async def rebuild_step(persister: InMemoryPersister, app_id: str):
+    app = builder_factory(persister).with_identifiers(app_id=app_id).build()
+    await app.astep()
+
+
+async def run_load(step, num_apps: int, num_clients: int, num_requests: int) -> list:
+    latencies = []
+
+    async def client(seed: int):
+        rng = random.Random(seed)
+        for _ in range(num_requests):
+            start = time.perf_counter()
+            await step(f"app_{rng.randrange(num_apps)}")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[client(i) for i in range(num_clients)])
+    return latencies
+
+
+def report(name: str, latencies: list, seconds: float):
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:>8}: p50 {quantiles[49] * 1e3:7.3f} ms, p99 {quantiles[98] * 1e3:7.3f} ms, "
+        f"{len(latencies) / seconds:9.0f} steps / s"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--apps", type=int, default=1000)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=None, help="Defaults to --apps")
+    args = parser.parse_args()
+
+    # In-memory persisters do not block the event loop -- with a database, use an async persister
+    rebuild_persister, pool_persister = InMemoryPersister(), InMemoryPersister()
+    pool = ApplicationPool(
+        lambda: builder_factory(pool_persister),
+        max_size=args.pool_size if args.pool_size is not None else args.apps,
+    )
+    for name, step in [
+        ("rebuild", lambda app_id: rebuild_step(rebuild_persister, app_id)),
+        ("pool", lambda app_id: pool.astep(app_id)),
+    ]:
+        start = time.perf_counter()
+        latencies = await run_load(step, args.apps, args.clients, args.requests)
+        report(name, latencies, time.perf_counter() - start)
+    print(f"pool stats: {pool.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
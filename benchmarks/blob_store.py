@@ -0,0 +1,67 @@
+"""Benchmark for persisting states with a large, unchanging field, with and without a blob store.
+
+Saves ``--steps`` states for each of ``--apps`` applications to a SQLite persister, where each state holds
+a ``--document-kb`` document (the same for every application) and a counter, then loads the latest state of
+every application, reading only the counter. Reports the time per save/load and the bytes stored.
+
+    python benchmarks/blob_store.py --apps 20 --steps 50 --document-kb 256
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from burr.core import State
+from burr.core.persistence import LocalBlobStore, SQLitePersister
+
+
+def directory_size(directory: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory)
+        for name in names
+    )
+
+
+def bench(use_blob_store: bool, args):
+    document = "lorem ipsum " * (args.document_kb * 1024 // 12)
+    with tempfile.TemporaryDirectory() as directory:
+        blob_store = LocalBlobStore(os.path.join(directory, "blobs")) if use_blob_store else None
+        persister = SQLitePersister.from_values(
+            os.path.join(directory, "burr.db"), blob_store=blob_store
+        )
+        persister.initialize()
+        start = time.perf_counter()
+        for app in range(args.apps):
+            state = State({"document": document, "count": 0})
+            for step in range(args.steps):
+                state = state.update(count=step)
+                persister.save("benchmark", f"app_{app}", step, "step", state, "completed")
+        save_seconds = (time.perf_counter() - start) / (args.apps * args.steps)
+        start = time.perf_counter()
+        for app in range(args.apps):
+            assert persister.load("benchmark", f"app_{app}")["state"]["count"] == args.steps - 1
+        load_seconds = (time.perf_counter() - start) / args.apps
+        persister.cleanup()
+        stored_bytes = directory_size(directory)
+    name = "blob store" if use_blob_store else "inline"
+    print(
+        f"{name:>10}: save {save_seconds * 1e3:8.2f} ms, load {load_seconds * 1e3:8.2f} ms, "
+        f"stored {stored_bytes / 2**20:8.1f} MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--apps", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--document-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    bench(False, args)
+    bench(True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Microbenchmark for lifecycle hook dispatch.
+
+Builds applications with ``--adapters`` counts of no-op lifecycle adapters (each implementing the
+pre/post step and pre/post execute call hooks) and times ``Application.step`` on a no-op action,
+as well as dispatching a hook that the adapters implement and one that none of them implement
+directly through the ``LifecycleAdapterSet``.
+
+    python benchmarks/hook_dispatch.py --adapters 0 1 5
+"""
+
+import argparse
+import timeit
+
+from burr.core import ApplicationBuilder, State, action, default
+from burr.lifecycle import (
+    PostApplicationExecuteCallHook,
+    PostRunStepHook,
+    PreApplicationExecuteCallHook,
+    PreRunStepHook,
+)
+from burr.lifecycle.internal import LifecycleAdapterSet
+
+
+class NoOpAdapter(
+    PreRunStepHook, PostRunStepHook, PreApplicationExecuteCallHook, PostApplicationExecuteCallHook
+):
+    def pre_run_step(self, **future_kwargs):
+        pass
+
+    def post_run_step(self, **future_kwargs):
+        pass
+
+    def pre_run_execute_call(self, **future_kwargs):
+        pass
+
+    def post_run_execute_call(self, **future_kwargs):
+        pass
+
+
+@action(reads=["count"], writes=["count"])
+def noop(state: State) -> State:
+    return state
+
+
+def build_app(num_adapters: int):
+    return (
+        ApplicationBuilder()
+        .with_actions(noop=noop)
+        .with_transitions(("noop", "noop", default))
+        .with_state(count=0)
+        .with_entrypoint("noop")
+        .with_hooks(*[NoOpAdapter() for _ in range(num_adapters)])
+        .build()
+    )
+
+
+def timed(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--adapters", type=int, nargs="+", default=[0, 1, 5])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    state = State({"count": 0})
+    for num_adapters in args.adapters:
+        app = build_app(num_adapters)
+        adapter_set = LifecycleAdapterSet(*[NoOpAdapter() for _ in range(num_adapters)])
+        step = timed(app.step, args.number)
+        implemented = timed(
+            lambda: adapter_set.call_all_lifecycle_hooks_sync(
+                "post_run_step",
+                app_id="app_id",
+                partition_key=None,
+                action=noop,
+                state=state,
+                result={},
+                sequence_id=0,
+                exception=None,
+            ),
+            args.number,
+        )
+        unimplemented = timed(
+            lambda: adapter_set.call_all_lifecycle_hooks_sync(
+                "post_stream_item", item={}, item_index=0, action="noop"
+            ),
+            args.number,
+        )
+        print(
+            f"{num_adapters} adapters: step {step * 1e6:7.2f} us, "
+            f"implemented hook {implemented * 1e6:6.2f} us, "
+            f"unimplemented hook {unimplemented * 1e6:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
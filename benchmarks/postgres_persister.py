@@ -0,0 +1,158 @@
+"""Benchmark for loading state with the PostgreSQL persisters, against a local postgres.
+
+Saves ``--steps`` states for each of ``--apps`` applications, then loads the latest state of every
+application with each persister configuration, and reports loads/second:
+
+- psycopg2 on a single connection, and on a connection pool shared by ``--concurrency`` threads
+- asyncpg on a single connection without the JSONB codec (loads one at a time, as a connection
+  only runs one query at a time), and on a pool with the codec, ``--concurrency`` loads at a time
+
+    python benchmarks/postgres_persister.py --host localhost --port 5432 --user postgres --password postgres
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import time
+
+import asyncpg
+
+from burr.core import State
+from burr.integrations.persisters.b_asyncpg import AsyncPostgreSQLPersister
+from burr.integrations.persisters.b_psycopg2 import PostgreSQLPersister
+
+TABLE_NAME = "burr_benchmark_state"
+
+
+def make_state(app: int, step: int) -> State:
+    return State(
+        {
+            "app": app,
+            "step": step,
+            "chat_history": [{"role": "user", "content": "hello " * 20} for _ in range(step + 1)],
+        }
+    )
+
+
+def populate(args) -> PostgreSQLPersister:
+    persister = PostgreSQLPersister.from_values(
+        args.db_name, args.user, args.password, args.host, args.port, table_name=TABLE_NAME
+    )
+    cursor = persister.connection.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    persister.connection.commit()
+    persister.initialize()
+    for app in range(args.apps):
+        persister.save_many(
+            [
+                {
+                    "partition_key": "benchmark",
+                    "app_id": f"app_{app}",
+                    "sequence_id": step,
+                    "position": "step",
+                    "state": make_state(app, step),
+                    "status": "completed",
+                }
+                for step in range(args.steps)
+            ]
+        )
+    return persister
+
+
+def report(name: str, loads: int, seconds: float):
+    print(f"{name:>40}: {loads / seconds:10.0f} loads / s")
+
+
+def bench_psycopg2(args):
+    app_ids = [f"app_{app}" for app in range(args.apps)]
+    persister = PostgreSQLPersister.from_values(
+        args.db_name, args.user, args.password, args.host, args.port, table_name=TABLE_NAME
+    )
+    start = time.perf_counter()
+    for app_id in app_ids:
+        persister.load("benchmark", app_id)
+    report("psycopg2, single connection", len(app_ids), time.perf_counter() - start)
+    persister.cleanup()
+
+    persister = PostgreSQLPersister.from_values(
+        args.db_name,
+        args.user,
+        args.password,
+        args.host,
+        args.port,
+        table_name=TABLE_NAME,
+        pool_size=args.concurrency,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        # warm up, so we do not time opening the pool's connections
+        list(executor.map(lambda app_id: persister.load("benchmark", app_id), app_ids))
+        start = time.perf_counter()
+        list(executor.map(lambda app_id: persister.load("benchmark", app_id), app_ids))
+        report(
+            f"psycopg2, pool ({args.concurrency} threads)",
+            len(app_ids),
+            time.perf_counter() - start,
+        )
+    persister.cleanup()
+
+
+async def bench_asyncpg(args):
+    app_ids = [f"app_{app}" for app in range(args.apps)]
+    connection = await asyncpg.connect(
+        user=args.user,
+        password=args.password,
+        database=args.db_name,
+        host=args.host,
+        port=args.port,
+    )
+    async with AsyncPostgreSQLPersister(connection, table_name=TABLE_NAME) as persister:
+        start = time.perf_counter()
+        for app_id in app_ids:
+            await persister.load("benchmark", app_id)
+        report("asyncpg, single connection, no codec", len(app_ids), time.perf_counter() - start)
+
+    persister = await AsyncPostgreSQLPersister.from_values(
+        args.db_name,
+        args.user,
+        args.password,
+        args.host,
+        args.port,
+        table_name=TABLE_NAME,
+        pool_size=args.concurrency,
+    )
+    async with persister:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def load(app_id: str):
+            async with semaphore:
+                await persister.load("benchmark", app_id)
+
+        await asyncio.gather(*[load(app_id) for app_id in app_ids])  # warm up
+        start = time.perf_counter()
+        await asyncio.gather(*[load(app_id) for app_id in app_ids])
+        report(
+            f"asyncpg, pool + codec ({args.concurrency} at a time)",
+            len(app_ids),
+            time.perf_counter() - start,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--db-name", default="postgres")
+    parser.add_argument("--user", default="postgres")
+    parser.add_argument("--password", default="postgres")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5432)
+    parser.add_argument("--apps", type=int, default=2_000)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    populate(args).cleanup()
+    bench_psycopg2(args)
+    asyncio.run(bench_asyncpg(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark for saving and loading state with the Redis persister, against a local redis-server.
+
+For each state encoding, saves ``--steps`` states for each of ``--apps`` applications, then loads the
+latest state of every application, and reports the time per save/load and the stored size of a state.
+
+    python benchmarks/redis_persister.py --host localhost --port 6379 --db 15
+"""
+
+import argparse
+import time
+
+import redis
+
+from burr.core import State
+from burr.integrations.persisters.b_redis import RedisBasePersister
+
+
+def make_state(app: int, step: int) -> State:
+    return State(
+        {
+            "app": app,
+            "step": step,
+            "chat_history": [
+                {"role": "user", "content": f"question {i} " * 20} for i in range(step + 1)
+            ],
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--db", type=int, default=15, help="Database to use -- this flushes it!")
+    parser.add_argument("--apps", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+
+    connection = redis.Redis(host=args.host, port=args.port, db=args.db)
+    for state_encoding, compression in [
+        ("json", None),
+        ("msgpack", None),
+        ("json", "zstd"),
+        ("msgpack", "zstd"),
+    ]:
+        connection.flushdb()
+        persister = RedisBasePersister(
+            connection, state_encoding=state_encoding, compression=compression
+        )
+        start = time.perf_counter()
+        for app in range(args.apps):
+            for step in range(args.steps):
+                persister.save(
+                    "benchmark", f"app_{app}", step, "step", make_state(app, step), "completed"
+                )
+        save_seconds = (time.perf_counter() - start) / (args.apps * args.steps)
+        start = time.perf_counter()
+        for app in range(args.apps):
+            persister.load("benchmark", f"app_{app}")
+        load_seconds = (time.perf_counter() - start) / args.apps
+        state_bytes = connection.hstrlen(
+            persister.create_key("app_0", "benchmark", args.steps - 1), "state"
+        )
+        name = f"{state_encoding}+{compression}" if compression else state_encoding
+        print(
+            f"{name:>14}: save {save_seconds * 1e6:8.1f} us, load {load_seconds * 1e6:8.1f} us, "
+            f"last state {state_bytes:6d} bytes"
+        )
+    connection.flushdb()
+
+
+if __name__ == "__main__":
+    main()
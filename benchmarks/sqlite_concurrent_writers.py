@@ -0,0 +1,108 @@
+"""Benchmark for several processes saving state to the same SQLite database at once.
+
+Starts ``--processes`` processes, each running ``--threads`` threads that save ``--steps`` states for an
+application of their own (with a copy of the persister, as parallel sub-applications do). Runs this with
+the default persister and with ``production_mode=True``, and reports saves/second, the slowest save, and
+how many saves failed with "database is locked".
+
+    python benchmarks/sqlite_concurrent_writers.py --processes 4 --threads 8 --steps 100
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from burr.core import State
+from burr.core.persistence import SQLitePersister
+
+
+def make_state(step: int) -> State:
+    return State({"step": step, "chat_history": [{"role": "user", "content": "hello " * 20}] * 5})
+
+
+def run_process(db_path: str, production_mode: bool, process: int, args, barrier, results):
+    persister = SQLitePersister.from_values(
+        db_path, production_mode=production_mode, connect_kwargs={"check_same_thread": False}
+    )
+    latencies, locked = [], [0]
+
+    def run_thread(thread: int):
+        copy = persister.copy()
+        for step in range(args.steps):
+            start = time.perf_counter()
+            try:
+                copy.save(
+                    "benchmark",
+                    f"app_{process}_{thread}",
+                    step,
+                    "step",
+                    make_state(step),
+                    "completed",
+                )
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                locked[0] += 1
+            latencies.append(time.perf_counter() - start)
+        copy.cleanup()
+
+    threads = [threading.Thread(target=run_thread, args=(i,)) for i in range(args.threads)]
+    # wait for every process to be up, so we time saving, not starting python
+    barrier.wait()
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    end = time.time()
+    persister.cleanup()
+    results.put((start, end, max(latencies), locked[0]))
+
+
+def bench(production_mode: bool, args):
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "burr.db")
+        SQLitePersister.from_values(db_path, production_mode=production_mode).initialize()
+        # spawn, so no process inherits sqlite's state from another
+        context = multiprocessing.get_context("spawn")
+        barrier = context.Barrier(args.processes)
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=run_process, args=(db_path, production_mode, i, args, barrier, results)
+            )
+            for i in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        starts, ends, latencies, locked_counts = zip(*[results.get() for _ in processes])
+        for process in processes:
+            process.join()
+    saves = args.processes * args.threads * args.steps
+    seconds = max(ends) - min(starts)
+    slowest = max(latencies)
+    locked = sum(locked_counts)
+    name = "production mode" if production_mode else "default"
+    print(
+        f"{name:>16}: {saves / seconds:8.0f} saves / s, slowest save {slowest * 1e3:8.1f} ms, "
+        f"{locked} saves failed with 'database is locked'"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=100)
+    args = parser.parse_args()
+
+    bench(False, args)
+    bench(True, args)
+
+
+if __name__ == "__main__":
+    main()
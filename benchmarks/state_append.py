@@ -0,0 +1,59 @@
+"""Benchmark for the per-step cost of state operations as an application's history grows.
+
+Times a step of an application whose state holds a ``history`` list of ``N`` items, for a range of
+``N``, for two actions: one that updates an unrelated counter, and one that appends to the history.
+Reads are shared with the prior state (copy-on-write), so the update stays flat as the history grows.
+Appending is still O(N) per step -- the operation mutates the list in place, so it makes a shallow copy
+of it first (see ``StateDelta.mutates``) -- but that copy is cheap next to deep-copying the values read.
+
+    python benchmarks/state_append.py --number 2000 --sizes 100 1000 10000 100000
+"""
+
+import argparse
+import timeit
+
+from burr.core import ApplicationBuilder, State, action, default
+
+
+@action(reads=["count"], writes=["count"])
+def update(state: State) -> State:
+    return state.update(count=state["count"] + 1)
+
+
+@action(reads=["history"], writes=["history"])
+def append(state: State) -> State:
+    return state.append(history={"role": "user", "content": "hello"})
+
+
+def build_app(action_, history_size: int):
+    return (
+        ApplicationBuilder()
+        .with_actions(step=action_)
+        .with_transitions(("step", "step", default))
+        .with_state(
+            count=0,
+            history=[{"role": "user", "content": "hello"} for _ in range(history_size)],
+        )
+        .with_entrypoint("step")
+        .build()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'history size':>12}  {'update':>14}  {'append':>14}")
+    for size in args.sizes:
+        timings = []
+        for action_ in [update, append]:
+            app = build_app(action_, size)
+            seconds = min(timeit.repeat(app.step, number=args.number, repeat=3)) / args.number
+            timings.append(f"{seconds * 1e6:8.2f} us/step")
+        print(f"{size:>12}  " + "  ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Microbenchmark for the framework overhead of a single application step.
+
+Runs an application that loops on a single no-op action and times ``Application.step``,
+for a function-based action, a class-based action, and an action that takes an input and the
+injected ``__context``. As the action does nothing, this is all overhead of the framework
+(resolving the next action, processing inputs, lifecycle hooks, state bookkeeping).
+
+    python benchmarks/step_overhead.py --number 20000
+"""
+
+import argparse
+import timeit
+
+from burr.core import Action, ApplicationBuilder, ApplicationContext, State, action, default
+
+
+@action(reads=["count"], writes=["count"])
+def noop(state: State) -> State:
+    return state
+
+
+@action(reads=["count"], writes=["count"])
+def noop_with_inputs(state: State, increment: int, __context: ApplicationContext) -> State:
+    return state
+
+
+class NoOp(Action):
+    @property
+    def reads(self) -> list[str]:
+        return ["count"]
+
+    @property
+    def writes(self) -> list[str]:
+        return ["count"]
+
+    def run(self, state: State, **run_kwargs) -> dict:
+        return {}
+
+    def update(self, result: dict, state: State) -> State:
+        return state
+
+
+def build_app(action_):
+    return (
+        ApplicationBuilder()
+        .with_actions(noop=action_)
+        .with_transitions(("noop", "noop", default))
+        .with_state(count=0)
+        .with_entrypoint("noop")
+        .build()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for name, action_, inputs in [
+        ("function-based", noop, None),
+        ("class-based", NoOp(), None),
+        ("inputs + __context", noop_with_inputs, {"increment": 1}),
+    ]:
+        app = build_app(action_)
+        seconds = (
+            min(timeit.repeat(lambda: app.step(inputs=inputs), number=args.number, repeat=5))
+            / args.number
+        )
+        print(f"{name:>20}: {seconds * 1e6:8.2f} us / step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Microbenchmark for the overhead of creating sub-applications in parallel actions.
+
+Creates the sub-application for each of a set of ``SubGraphTask`` objects sharing one graph (as
+``MapStates`` does for every state it maps over), both through the ``ApplicationBuilder`` and from
+the graph's cached application template, and times creation alone (the sub-applications are not run).
+
+    python benchmarks/subgraph_task_creation.py --number 2000
+"""
+
+import argparse
+import concurrent.futures
+import timeit
+
+from burr.core import ApplicationContext, State, action, default
+from burr.core.graph import GraphBuilder
+from burr.core.parallelism import RunnableGraph, SubGraphTask
+
+
+@action(reads=["count"], writes=["count"])
+def increment(state: State) -> State:
+    return state.update(count=state["count"] + 1)
+
+
+@action(reads=["count"], writes=["result"])
+def finish(state: State) -> State:
+    return state.update(result=state["count"])
+
+
+def build_graph() -> RunnableGraph:
+    graph = (
+        GraphBuilder()
+        .with_actions(increment=increment, finish=finish)
+        .with_transitions(("increment", "finish", default))
+        .build()
+    )
+    return RunnableGraph(graph=graph, entrypoint="increment", halt_after=["finish"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args()
+
+    context = ApplicationContext(
+        app_id="parent",
+        partition_key=None,
+        sequence_id=0,
+        tracker=None,
+        parallel_executor_factory=concurrent.futures.ThreadPoolExecutor,
+        state_initializer=None,
+        state_persister=None,
+        action_name="map_states",
+    )
+    graph = build_graph()
+    tasks = [
+        SubGraphTask(
+            graph=graph,
+            inputs={},
+            state=State({"count": i}),
+            application_id=f"child_{i}",
+        )
+        for i in range(args.number)
+    ]
+
+    for name, create in [
+        ("builder", lambda task: task._create_app_builder(context).build()),
+        ("template", lambda task: task._create_app_from_template(context)),
+    ]:
+        seconds = min(timeit.repeat(lambda: [create(task) for task in tasks], number=1, repeat=5))
+        print(f"{name:>10}: {seconds / args.number * 1e6:8.2f} us / sub-application")
+
+
+if __name__ == "__main__":
+    main()
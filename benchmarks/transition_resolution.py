@@ -0,0 +1,74 @@
+"""Microbenchmark for resolving the next action of a graph with many transitions.
+
+Builds a graph of ``--actions`` actions, each with ``--edges-per-action`` conditional transitions
+(alternating ``expr`` and ``when`` conditions, with only the last one matching) plus a trailing ``default``.
+It then times ``Graph.get_next_node`` against evaluating each condition through ``Condition.run``
+(how transitions were resolved before graphs were compiled into decision tables).
+
+    python benchmarks/transition_resolution.py --actions 20 --edges-per-action 25
+"""
+
+import argparse
+import timeit
+
+from burr.core import Condition, Result, State, default
+from burr.core.graph import Graph, GraphBuilder
+
+
+def build_graph(num_actions: int, edges_per_action: int) -> Graph:
+    actions = {f"action_{i}": Result("counter") for i in range(num_actions)}
+    transitions = []
+    for i in range(num_actions):
+        for j in range(edges_per_action):
+            target = f"action_{(i + j + 1) % num_actions}"
+            condition = (
+                Condition.expr(f"counter == {j} and flag")
+                if j % 2 == 0
+                else Condition.when(counter=j, flag=True)
+            )
+            transitions.append((f"action_{i}", target, condition))
+        transitions.append((f"action_{i}", f"action_{i}", default))
+    return GraphBuilder().with_actions(**actions).with_transitions(*transitions).build()
+
+
+def resolve_with_run(graph: Graph, prior_step: str, state: State):
+    for next_action, condition in graph._adjacency_map[prior_step]:
+        if condition.run(state)[Condition.KEY]:
+            return graph._action_map[next_action]
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--actions", type=int, default=20)
+    parser.add_argument("--edges-per-action", type=int, default=25)
+    parser.add_argument("--state-size", type=int, default=100, help="Number of other state fields")
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args()
+
+    graph = build_graph(args.actions, args.edges_per_action)
+    state = State(
+        {
+            "counter": args.edges_per_action - 1,
+            "flag": True,
+            **{f"field_{i}": i for i in range(args.state_size)},
+        }
+    )
+    prior_step = "action_0"
+    expected = graph.get_next_node(prior_step, state, entrypoint=prior_step)
+    assert resolve_with_run(graph, prior_step, state) is expected
+
+    print(
+        f"{args.actions} actions, {len(graph.transitions)} transitions, "
+        f"{args.state_size + 2} state fields"
+    )
+    for name, fn in [
+        ("Condition.run loop", lambda: resolve_with_run(graph, prior_step, state)),
+        ("Graph.get_next_node", lambda: graph.get_next_node(prior_step, state, prior_step)),
+    ]:
+        seconds = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+        print(f"{name:>20}: {seconds * 1e6:8.2f} us / resolution")
+
+
+if __name__ == "__main__":
+    main()
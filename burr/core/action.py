@@ -40,6 +40,8 @@ from burr.core.typing import ActionSchema
 # TODO - come up with a better way to attach integrations to core objects
 imported_pydantic = False
 if TYPE_CHECKING:
+    from burr.core.cache import ActionCache
+
     try:
         from pydantic import BaseModel
     except ImportError:
@@ -248,6 +250,34 @@ class Action(Function, Reducer, abc.ABC):
         """
         return []
 
+    @property
+    def cache(self) -> Union[bool, "ActionCache", None]:
+        """Whether (and where) the results of this action are cached. Only use this if the action is
+        deterministic given the state it reads and its inputs. Override to enable caching for a class-based action.
+
+        :return: An :py:class:`ActionCache <burr.core.cache.ActionCache>` to cache in, True to cache in the
+            application's cache (see ``ApplicationBuilder.with_action_cache``), or False/None to not cache
+        """
+        return None
+
+    @property
+    def cache_version(self) -> Optional[str]:
+        """Version of this action's logic, included in its cache key. Bump it to invalidate the action's
+        cached results when its behavior changes. Override to set it for a class-based action.
+
+        :return: The version, None if the action is not versioned
+        """
+        return None
+
+    @property
+    def cache_identity(self) -> List[Any]:
+        """Identifies the implementation of this action in its cache key (along with its name), so
+        results are not shared between different actions that happen to have the same name.
+
+        :return: The qualified name of the action's class, and its :py:meth:`cache_version`
+        """
+        return [f"{type(self).__module__}.{type(self).__qualname__}", self.cache_version]
+
 
 class Condition(Function):
     KEY = "PROCEED"
@@ -305,11 +335,13 @@ class Condition(Function):
         visitor = NameVisitor()
         visitor.visit(tree)
         keys = list(visitor.names)
+        # Compile once, rather than on every evaluation
+        code = compile(tree, "<string>", "eval")
 
-        # Compile the expression into a callable function
         def condition_func(state: State) -> bool:
-            __globals = state.get_all()  # we can get all because externally we will subset
-            return eval(compile(tree, "<string>", "eval"), {}, __globals)
+            # Only the keys the expression names -- the rest of the state need not be copied
+            __locals = {key: state[key] for key in keys if key in state}
+            return eval(code, {}, __locals)
 
         return Condition(keys, condition_func, name=expr)
 
@@ -341,7 +373,7 @@ class Condition(Function):
     #     )
 
     def _validate(self, state: State):
-        missing_keys = set(self._keys) - set(state.keys())
+        missing_keys = [key for key in self._keys if key not in state]
         if missing_keys:
             raise ValueError(
                 f"Missing keys in state required by condition: {self} {', '.join(missing_keys)}"
@@ -355,6 +387,29 @@ class Condition(Function):
     def reads(self) -> list[str]:
         return self._keys
 
+    def compile(self) -> Optional[Callable[[State], bool]]:
+        """Compiles the condition into a function of state that validates and resolves it --
+        equivalent to ``run(state)[Condition.KEY]`` but without building the result dict.
+        This is what graphs use to choose transitions.
+
+        :return: The function, or None if the condition is always true (``default``)
+        """
+        if self is Condition.default:
+            return None
+        if type(self).run is not Condition.run:
+            # subclasses that customize run() are respected
+            return lambda state: self.run(state)[Condition.KEY]
+        keys = tuple(dict.fromkeys(self._keys))
+        resolver = self._resolver
+
+        def evaluate(state: State) -> bool:
+            for key in keys:
+                if key not in state:
+                    self._validate(state)  # raises with the missing keys
+            return resolver(state)
+
+        return evaluate
+
     @classmethod
     def when(cls, **kwargs):
         """Returns a condition that checks if the given keys are in the
@@ -366,9 +421,10 @@ class Condition(Function):
         :return: A condition that checks if the given keys are in the state and equal to the given values
         """
         keys = list(kwargs.keys())
+        items = tuple(kwargs.items())
 
         def condition_func(state: State) -> bool:
-            for key, value in kwargs.items():
+            for key, value in items:
                 if state.get(key) != value:
                     return False
             return True
@@ -596,6 +652,8 @@ class FunctionBasedAction(SingleStepAction):
         originating_fn: Optional[Callable] = None,
         schema: ActionSchema = DEFAULT_SCHEMA,
         tags: Optional[List[str]] = None,
+        cache: Union[bool, "ActionCache", None] = None,
+        cache_version: Optional[str] = None,
     ):
         """Instantiates a function-based action with the given function, reads, and writes.
         The function must take in a state and return a tuple of (result, new_state).
@@ -605,6 +663,8 @@ class FunctionBasedAction(SingleStepAction):
         :param writes: Keys that the function writes to the state
         :param bound_params: Prior bound parameters
         :param input_spec: Specification for inputs. Will derive from function if not provided.
+        :param cache: Whether (and where) to cache the results of this action, see :py:meth:`Action.cache`
+        :param cache_version: Version of the function's logic, see :py:meth:`Action.cache_version`
         """
         super(FunctionBasedAction, self).__init__()
         self._originating_fn = originating_fn if originating_fn is not None else fn
@@ -622,6 +682,8 @@ class FunctionBasedAction(SingleStepAction):
         )
         self._schema = schema
         self._tags = tags if tags is not None else []
+        self._cache = cache
+        self._cache_version = cache_version
 
     @property
     def fn(self) -> Callable:
@@ -647,6 +709,24 @@ class FunctionBasedAction(SingleStepAction):
     def tags(self) -> list[str]:
         return self._tags
 
+    @property
+    def cache(self) -> Union[bool, "ActionCache", None]:
+        return self._cache
+
+    @property
+    def cache_version(self) -> Optional[str]:
+        return self._cache_version
+
+    @property
+    def cache_identity(self) -> List[Any]:
+        """Identifies the function (and the parameters bound to it) in the action's cache key.
+        If the bound parameters cannot be serialized, the action's results are not cached.
+
+        :return: The qualified name of the function, its bound parameters, and the cache version
+        """
+        fn = self._originating_fn
+        return [f"{fn.__module__}.{fn.__qualname__}", self._bound_params, self._cache_version]
+
     def with_params(self, **kwargs: Any) -> "FunctionBasedAction":
         """Binds parameters to the function.
         Note that there is no reason to call this by the user. This *could*
@@ -665,6 +745,8 @@ class FunctionBasedAction(SingleStepAction):
             originating_fn=self._originating_fn,
             schema=self._schema,
             tags=self._tags,
+            cache=self._cache,
+            cache_version=self._cache_version,
         )
 
     def run_and_update(self, state: State, **run_kwargs) -> tuple[dict, State]:
@@ -1258,7 +1340,14 @@ class action:
             tags=tags,
         )
 
-    def __init__(self, reads: List[str], writes: List[str], tags: Optional[List[str]] = None):
+    def __init__(
+        self,
+        reads: List[str],
+        writes: List[str],
+        tags: Optional[List[str]] = None,
+        cache: Union[bool, "ActionCache", None] = None,
+        cache_version: Optional[str] = None,
+    ):
         """Decorator to create a function-based action. This is user-facing.
         Note that, in the future, with typed state, we may not need this for
         all cases.
@@ -1269,17 +1358,32 @@ class action:
 
         :param reads: Items to read from the state
         :param writes: Items to write to the state
+        :param tags: Optional list of tags to associate with this action
+        :param cache: Caches the results of this action, keyed by the values it reads and its inputs.
+            Pass an :py:class:`ActionCache <burr.core.cache.ActionCache>`, or True to use the application's
+            cache (see ``ApplicationBuilder.with_action_cache``). Only use this if the action is deterministic.
+        :param cache_version: Version of the function's logic, part of its cache key -- bump it to invalidate
+            results cached before the function changed.
         :return: The decorator to assign the function as an action
         """
         self.reads = reads
         self.writes = writes
         self.tags = tags
+        self.cache = cache
+        self.cache_version = cache_version
 
     def __call__(self, fn) -> FunctionRepresentingAction:
         setattr(
             fn,
             FunctionBasedAction.ACTION_FUNCTION,
-            FunctionBasedAction(fn, self.reads, self.writes, tags=self.tags),
+            FunctionBasedAction(
+                fn,
+                self.reads,
+                self.writes,
+                tags=self.tags,
+                cache=self.cache,
+                cache_version=self.cache_version,
+            ),
         )
         setattr(fn, "bind", types.MethodType(bind, fn))
         return fn
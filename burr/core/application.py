@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import dataclasses
 import functools
 import inspect
 import logging
 import pprint
+import time
 import uuid
-from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from typing import (
     TYPE_CHECKING,
@@ -15,8 +17,10 @@ from typing import (
     AsyncGenerator,
     Callable,
     Dict,
+    FrozenSet,
     Generator,
     Generic,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -43,6 +47,7 @@ from burr.core.action import (
     StreamingAction,
     StreamingResultContainer,
 )
+from burr.core.cache import ActionCache, CachedActionResult, create_cache_key
 from burr.core.graph import Graph, GraphBuilder
 from burr.core.persistence import (
     AsyncBaseStateLoader,
@@ -50,7 +55,7 @@ from burr.core.persistence import (
     BaseStateLoader,
     BaseStateSaver,
 )
-from burr.core.state import State
+from burr.core.state import DeleteField, State, StateDelta
 from burr.core.typing import ActionSchema, DictBasedTypingSystem, TypingSystem
 from burr.core.validation import BASE_ERROR_MESSAGE
 from burr.lifecycle.base import ExecuteMethod, LifecycleAdapter, PostRunStepHook, PreRunStepHook
@@ -122,26 +127,151 @@ def _remap_dunder_parameters(
     :param vars_to_remap: the variables to remap
     :return: potentially new dict with the remapped variable, else the original dict.
     """
+    return _apply_mangled_parameters(inputs, _get_mangled_parameters(run_method, vars_to_remap))
+
+
+def _get_mangled_parameters(run_method: Callable, vars_to_remap: List[str]) -> Dict[str, str]:
+    """Finds the (potentially name-mangled) parameters in the signature of the run method
+    that correspond to the __dunder variables.
+
+    :param run_method: the run method to inspect.
+    :param vars_to_remap: the variables to remap
+    :return: dict of __dunder variable -> mangled parameter name, for the variables that are mangled.
+    """
     # Get the signature of the method being run. This should be Function.run() or similar.
     signature = inspect.signature(run_method)
-    mangled_params: Dict[str, Optional[str]] = {v: None for v in vars_to_remap}
+    mangled_params: Dict[str, str] = {}
     # Find the name-mangled __context variable
-    for dunder_param in mangled_params.keys():
+    for dunder_param in vars_to_remap:
         for param in signature.parameters.values():
             if param.name.endswith(dunder_param):
                 mangled_params[dunder_param] = param.name
                 break
+    return mangled_params
+
 
+def _apply_mangled_parameters(inputs: Dict[str, Any], mangled_params: Dict[str, str]) -> dict:
+    """Remaps the __dunder variables in the inputs to their mangled names.
+
+    :param inputs: the inputs to remap
+    :param mangled_params: the mangled parameters, as returned by _get_mangled_parameters
+    :return: potentially new dict with the remapped variable, else the original dict.
+    """
     # If any mangled __parameter is found, remap the value in inputs
-    if any(mangled_params.values()):
+    if mangled_params:
         inputs = inputs.copy()
         for dunder_param, mangled_name in mangled_params.items():
-            if mangled_name and dunder_param in inputs:
+            if dunder_param in inputs:
                 inputs[mangled_name] = inputs.pop(dunder_param)
     return inputs
 
 
-def _run_function(function: Function, state: State, inputs: Dict[str, Any], name: str) -> dict:
+@dataclasses.dataclass(frozen=True)
+class _ActionPlan:
+    """Execution plan for an action, compiled once when the application is built.
+
+    This holds everything about running an action that does not change between steps (its inputs,
+    which of them the application injects, what it writes, etc...), so each step can look it up
+    rather than recompute it. Internal-facing.
+    """
+
+    required_inputs: FrozenSet[str]
+    optional_inputs: FrozenSet[str]
+    # required + optional, what we let through from the user-provided inputs
+    declared_inputs: FrozenSet[str]
+    # declared inputs that are provided by the application's dependency factories (E.G. __context)
+    injected_inputs: Tuple[str, ...]
+    writes: FrozenSet[str]
+    is_async: bool
+    # __dunder inputs -> their name-mangled parameters in the signature of run()
+    mangled_parameters: Dict[str, str]
+    # cache to look up/store results in, None if the action is not cached
+    cache: Optional[ActionCache] = None
+    # whether the action overrides validate_inputs, in which case we still call it per step
+    # (otherwise _process_inputs has already done the equivalent validation)
+    custom_validation: bool = False
+
+    def validate_inputs(self, action: Function, inputs: Optional[Dict[str, Any]]) -> None:
+        """Calls the action's own validate_inputs, if it has one. The base implementation
+        is skipped, as the inputs have already been validated against the plan."""
+        if self.custom_validation:
+            action.validate_inputs(inputs)
+
+    @staticmethod
+    def compile(
+        action: Action,
+        dependency_factory: Iterable[str],
+        default_cache: Optional[ActionCache] = None,
+        cached_actions: Optional[FrozenSet[str]] = None,
+    ) -> "_ActionPlan":
+        """Compiles the execution plan for an action.
+
+        :param action: Action to compile the plan for
+        :param dependency_factory: Names of the inputs the application can inject
+        :param default_cache: Cache set on the application, for actions that opt into caching
+        :param cached_actions: Names of the actions to use the default cache for, None for all
+            that opt in (with ``cache=True``)
+        :return: The execution plan
+        """
+        cache = _resolve_action_cache(action, default_cache, cached_actions)
+        required_inputs, optional_inputs = action.optional_and_required_inputs
+        declared_inputs = frozenset(required_inputs | optional_inputs)
+        injected_inputs = tuple(
+            input_ for input_ in dependency_factory if input_ in declared_inputs
+        )
+        mangled_parameters = {}
+        if injected_inputs and not action.single_step:
+            # single-step actions do not need remapping (see _run_single_step_action)
+            mangled_parameters = _get_mangled_parameters(action.run, list(injected_inputs))
+        return _ActionPlan(
+            required_inputs=frozenset(required_inputs),
+            optional_inputs=frozenset(optional_inputs),
+            declared_inputs=declared_inputs,
+            injected_inputs=injected_inputs,
+            writes=frozenset(action.writes),
+            is_async=action.is_async(),
+            mangled_parameters=mangled_parameters,
+            cache=cache,
+            custom_validation=type(action).validate_inputs is not Function.validate_inputs,
+        )
+
+
+def _resolve_action_cache(
+    action: Action,
+    default_cache: Optional[ActionCache],
+    cached_actions: Optional[FrozenSet[str]],
+) -> Optional[ActionCache]:
+    """Resolves the cache an action uses -- its own, the application's (if it opted in or is
+    named in ``with_action_cache``), or none."""
+    cache = action.cache
+    if cache is None and cached_actions is not None and action.name in cached_actions:
+        cache = True
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        if default_cache is None:
+            raise ValueError(
+                BASE_ERROR_MESSAGE
+                + f"Action: {action.name} asks to be cached (cache=True), but no cache was "
+                f"provided. Pass one to ApplicationBuilder.with_action_cache(...)."
+            )
+        cache = default_cache
+    if action.streaming:
+        raise ValueError(
+            BASE_ERROR_MESSAGE
+            + f"Action: {action.name} is a streaming action, which cannot be cached -- "
+            f"its result is only known once the stream has been consumed."
+        )
+    return cache
+
+
+def _run_function(
+    function: Function,
+    state: State,
+    inputs: Dict[str, Any],
+    name: str,
+    plan: Optional[_ActionPlan] = None,
+) -> dict:
     """Runs a function, returning the result of running the function.
     Note this restricts the keys in the state to only those that the
     function reads.
@@ -149,31 +279,44 @@ def _run_function(function: Function, state: State, inputs: Dict[str, Any], name
     :param function: Function to run
     :param state: State at time of execution
     :param inputs: Inputs to the function
+    :param plan: Execution plan of the action, if it has been compiled. If so, the inputs
+        have already been validated against it (see Application._process_inputs).
     :return:
     """
-    if function.is_async():
+    if plan.is_async if plan is not None else function.is_async():
         raise ValueError(
             f"Cannot run async: {name} "
             "in non-async context. Use astep()/aiterate()/arun() "
             "instead...)"
         )
     state_to_use = state.subset(*function.reads)
-    function.validate_inputs(inputs)
-    if "__context" in inputs or "__tracer" in inputs:
-        # potentially need to remap the __context & __tracer variables
-        inputs = _remap_dunder_parameters(function.run, inputs, ["__context", "__tracer"])
+    if plan is not None:
+        plan.validate_inputs(function, inputs)
+        inputs = _apply_mangled_parameters(inputs, plan.mangled_parameters)
+    else:
+        function.validate_inputs(inputs)
+        if "__context" in inputs or "__tracer" in inputs:
+            # potentially need to remap the __context & __tracer variables
+            inputs = _remap_dunder_parameters(function.run, inputs, ["__context", "__tracer"])
     result = function.run(state_to_use, **inputs)
     _validate_result(result, name)
     return result
 
 
 async def _arun_function(
-    function: Function, state: State, inputs: Dict[str, Any], name: str
+    function: Function,
+    state: State,
+    inputs: Dict[str, Any],
+    name: str,
+    plan: Optional[_ActionPlan] = None,
 ) -> dict:
     """Runs a function, returning the result of running the function.
     Async version of the above."""
     state_to_use = state.subset(*function.reads)
-    function.validate_inputs(inputs)
+    if plan is None:
+        function.validate_inputs(inputs)
+    else:
+        plan.validate_inputs(function, inputs)
     result = await function.run(state_to_use, **inputs)
     _validate_result(result, name)
     return result
@@ -182,9 +325,10 @@ async def _arun_function(
 def _state_update(state_to_modify: State, modified_state: State) -> State:
     """Performs a state update for an action -- allowing for deletes.
 
-    This is suboptimal -- we should not be observing the state, we should be using the state commands and layering in deltas.
-    That said, we currently eagerly evaluate the state at all operations, which means we have to do it this way. See
-    https://github.com/DAGWorks-Inc/burr/issues/33 for a more detailed plan.
+    If the modified state was derived from the state to modify purely through state operations
+    (the common case), its journal tells us exactly what changed, so we can use it directly.
+    Otherwise, we fall back to observing the state. See https://github.com/DAGWorks-Inc/burr/issues/33
+    for more details.
 
     This function was written to solve this issue: https://github.com/DAGWorks-Inc/burr/issues/28.
 
@@ -194,6 +338,9 @@ def _state_update(state_to_modify: State, modified_state: State) -> State:
     :param state_to_modify: The state to modify-- this is the original
     :return:
     """
+    deltas = modified_state._deltas_since(state_to_modify)
+    if deltas is not None and not _deltas_touch_private_fields(deltas):
+        return modified_state
     # We want to wipe these, as these should never be changed by the action
     # an action that modifies these is going to incur "undefined behavior" -- we can effectively
     # do anything we want -- in this case we're dropping it, but we may error out in the future
@@ -213,9 +360,25 @@ def _state_update(state_to_modify: State, modified_state: State) -> State:
     return state_to_modify.merge(modified_state_without_private_fields).wipe(delete=deleted_keys)
 
 
-def _validate_reducer_writes(reducer: Reducer, state: State, name: str) -> None:
+def _deltas_touch_private_fields(deltas: Tuple[StateDelta, ...]) -> bool:
+    """Whether any of the state deltas read/write internal (double underscore) fields"""
+    for delta in deltas:
+        for key in delta.reads():
+            if key.startswith("__"):
+                return True
+        for key in delta.writes():
+            if key.startswith("__"):
+                return True
+    return False
+
+
+def _validate_reducer_writes(
+    reducer: Reducer, state: State, name: str, plan: Optional[_ActionPlan] = None
+) -> None:
     required_writes = reducer.writes
-    missing_writes = set(reducer.writes) - state.keys()
+    missing_writes = {
+        key for key in (plan.writes if plan is not None else required_writes) if key not in state
+    }
     if len(missing_writes) > 0:
         raise ValueError(
             f"State is missing write keys after running: {name}. Missing keys are: {missing_writes}. "
@@ -223,26 +386,38 @@ def _validate_reducer_writes(reducer: Reducer, state: State, name: str) -> None:
         )
 
 
-def _run_reducer(reducer: Reducer, state: State, result: dict, name: str) -> State:
+def _run_reducer(
+    reducer: Reducer, state: State, result: dict, name: str, plan: Optional[_ActionPlan] = None
+) -> State:
     """Runs the reducer, returning the new state. Note this restricts the
     keys in the state to only those that the function writes.
 
     :param reducer:
     :param state:
     :param result:
+    :param plan: Execution plan of the action, if it has been compiled
     :return:
     """
     # TODO -- better guarding on state reads/writes
     new_state = reducer.update(result, state)
-    keys_in_new_state = set(new_state.keys())
-    new_keys = keys_in_new_state - set(state.keys())
-    extra_keys = new_keys - set(reducer.writes)
+    deltas = new_state._deltas_since(state)
+    if deltas is not None:
+        # we know what was written, so we don't have to diff the whole state
+        new_keys = {
+            key
+            for delta in deltas
+            for key in delta.writes()
+            if key not in state and key in new_state
+        }
+    else:
+        new_keys = set(new_state.keys()) - set(state.keys())
+    extra_keys = new_keys - (plan.writes if plan is not None else set(reducer.writes))
     if len(extra_keys) > 0:
         raise ValueError(
             f"Action {name} attempted to write to keys {extra_keys} "
             f"that it did not declare. It declared: ({reducer.writes})!"
         )
-    _validate_reducer_writes(reducer, new_state, name)
+    _validate_reducer_writes(reducer, new_state, name, plan)
     return _state_update(state, new_state)
 
 
@@ -282,7 +457,10 @@ def _format_BASE_ERROR_MESSAGE(action: Action, input_state: State, inputs: dict)
 
 
 def _run_single_step_action(
-    action: SingleStepAction, state: State, inputs: Optional[Dict[str, Any]]
+    action: SingleStepAction,
+    state: State,
+    inputs: Optional[Dict[str, Any]],
+    plan: Optional[_ActionPlan] = None,
 ) -> Tuple[Dict[str, Any], State]:
     """Runs a single step action. This API is internal-facing and a bit in flux, but
     it corresponds to the SingleStepAction class.
@@ -290,19 +468,145 @@ def _run_single_step_action(
     :param action: Action to run
     :param state: State to run with
     :param inputs: Inputs to pass directly to the action
+    :param plan: Execution plan of the action, if it has been compiled. If so, the inputs
+        have already been validated against it (see Application._process_inputs).
     :return: The result of running the action, and the new state
     """
     # TODO -- guard all reads/writes with a subset of the state
-    action.validate_inputs(inputs)
+    if plan is None:
+        action.validate_inputs(inputs)
+    else:
+        plan.validate_inputs(action, inputs)
     result, new_state = _adjust_single_step_output(
         action.run_and_update(state, **inputs), action.name, action.schema
     )
     _validate_result(result, action.name, action.schema)
     out = result, _state_update(state, new_state)
-    _validate_reducer_writes(action, new_state, action.name)
+    _validate_reducer_writes(action, new_state, action.name, plan)
     return out
 
 
+def _run_sync_action(
+    action: Action,
+    state: State,
+    inputs: Dict[str, Any],
+    plan: Optional[_ActionPlan] = None,
+) -> Tuple[dict, State]:
+    """Runs a synchronous (non-streaming) action, returning the result and the new state.
+    This is what we hand to the sync action executor, so it has to be picklable (module-level).
+
+    :param action: Action to run
+    :param state: State to run with
+    :param inputs: Processed inputs to the action
+    :param plan: Execution plan of the action, if it has been compiled
+    :return: The result of running the action, and the new state
+    """
+    if action.single_step:
+        return _run_single_step_action(action, state, inputs, plan=plan)
+    result = _run_function(action, state, inputs, name=action.name, plan=plan)
+    return result, _run_reducer(action, state, result, action.name, plan=plan)
+
+
+@dataclasses.dataclass(frozen=True)
+class _StreamItemCoalescing:
+    """Policy for coalescing the stream item hooks, see ApplicationBuilder.with_stream_item_coalescing."""
+
+    max_items: Optional[int] = None
+    max_interval_ms: Optional[float] = None
+
+
+class _StreamItemHookBuffer:
+    """Delivers the post_stream_item(s) hooks for a single stream. Without a coalescing policy, every
+    item is delivered as it is yielded. With one, the first item is still delivered right away (so the
+    time to first item is exact), but the ones after are buffered, and delivered in one call per batch.
+    Internal-facing."""
+
+    def __init__(
+        self,
+        lifecycle_adapters: LifecycleAdapterSet,
+        coalescing: Optional[_StreamItemCoalescing],
+        is_async: bool,
+        **hook_kwargs: Any,
+    ):
+        # async runs call both sync and async hooks
+        hook_type = None if is_async else False
+        self.lifecycle_adapters = lifecycle_adapters
+        self.run_item_hooks = lifecycle_adapters.does_hook("post_stream_item", is_async=hook_type)
+        self.run_batch_hooks = lifecycle_adapters.does_hook("post_stream_items", is_async=hook_type)
+        self.enabled = self.run_item_hooks or self.run_batch_hooks
+        self.coalescing = coalescing
+        self.hook_kwargs = hook_kwargs
+        self.items: List[Any] = []
+        self.first_item_index = 0
+        self.last_item_index = 0
+        self.first_stream_item_start_time = None
+        self.delivered_first = False
+        self.last_flush_time = 0.0
+
+    def add(self, item: Any, item_index: int, first_stream_item_start_time) -> bool:
+        """Buffers an item.
+
+        :return: Whether the buffer should be flushed
+        """
+        if not self.items:
+            self.first_item_index = item_index
+        self.items.append(item)
+        self.last_item_index = item_index
+        self.first_stream_item_start_time = first_stream_item_start_time
+        if self.coalescing is None or not self.delivered_first:
+            return True
+        if self.coalescing.max_items is not None and len(self.items) >= self.coalescing.max_items:
+            return True
+        return (
+            self.coalescing.max_interval_ms is not None
+            and (time.monotonic() - self.last_flush_time) * 1000 >= self.coalescing.max_interval_ms
+        )
+
+    def _pop_hook_calls(self) -> List[Tuple[str, Dict[str, Any]]]:
+        if not self.items:
+            return []
+        common_kwargs = dict(
+            first_stream_item_start_time=self.first_stream_item_start_time, **self.hook_kwargs
+        )
+        calls = []
+        if self.run_item_hooks:
+            # item hooks get the latest item, and the number of items it stands for
+            calls.append(
+                (
+                    "post_stream_item",
+                    dict(
+                        item=self.items[-1],
+                        item_index=self.last_item_index,
+                        item_count=len(self.items),
+                        **common_kwargs,
+                    ),
+                )
+            )
+        if self.run_batch_hooks:
+            calls.append(
+                (
+                    "post_stream_items",
+                    dict(items=self.items, first_item_index=self.first_item_index, **common_kwargs),
+                )
+            )
+        self.items = []
+        self.delivered_first = True
+        self.last_flush_time = time.monotonic()
+        return calls
+
+    def flush(self):
+        """Delivers the buffered items to the hooks."""
+        for hook_name, kwargs in self._pop_hook_calls():
+            self.lifecycle_adapters.call_all_lifecycle_hooks_sync(hook_name, **kwargs)
+
+    async def aflush(self):
+        """Delivers the buffered items to the hooks, async version."""
+        for hook_name, kwargs in self._pop_hook_calls():
+            await self.lifecycle_adapters.call_all_lifecycle_hooks_sync_and_async(
+                hook_name, **kwargs
+            )
+
+
 def _run_single_step_streaming_action(
     action: SingleStepStreamingAction,
     state: State,
@@ -311,11 +615,22 @@ def _run_single_step_streaming_action(
     app_id: str,
     partition_key: Optional[str],
     lifecycle_adapters: LifecycleAdapterSet = LifecycleAdapterSet(),
+    stream_item_coalescing: Optional[_StreamItemCoalescing] = None,
 ) -> Generator[Tuple[dict, Optional[State]], None, None]:
     """Runs a single step streaming action. This API is internal-facing.
     This normalizes + validates the output."""
     action.validate_inputs(inputs)
     stream_initialize_time = system.now()
+    hook_buffer = _StreamItemHookBuffer(
+        lifecycle_adapters,
+        stream_item_coalescing,
+        is_async=False,
+        stream_initialize_time=stream_initialize_time,
+        action=action.name,
+        app_id=app_id,
+        partition_key=partition_key,
+        sequence_id=sequence_id,
+    )
     first_stream_start_time = None
     generator = action.stream_run_and_update(state, **inputs)
     result = None
@@ -334,19 +649,12 @@ def _run_single_step_streaming_action(
         if state_update is None:
             if first_stream_start_time is None:
                 first_stream_start_time = system.now()
-            lifecycle_adapters.call_all_lifecycle_hooks_sync(
-                "post_stream_item",
-                item=result,
-                item_index=count,
-                stream_initialize_time=stream_initialize_time,
-                first_stream_item_start_time=first_stream_start_time,
-                action=action.name,
-                app_id=app_id,
-                partition_key=partition_key,
-                sequence_id=sequence_id,
-            )
+            if hook_buffer.enabled and hook_buffer.add(result, count, first_stream_start_time):
+                hook_buffer.flush()
             yield result, None
 
+    # deliver the items still buffered, if we are coalescing
+    hook_buffer.flush()
     if state_update is None:
         raise ValueError(
             f"Action {action.name} did not return a state update. For streaming actions, the last yield "
@@ -365,10 +673,21 @@ async def _arun_single_step_streaming_action(
     app_id: str,
     partition_key: Optional[str],
     lifecycle_adapters: LifecycleAdapterSet = LifecycleAdapterSet(),
+    stream_item_coalescing: Optional[_StreamItemCoalescing] = None,
 ) -> AsyncGenerator[Tuple[dict, Optional[State]], None]:
     """Runs a single step streaming action in async. See the synchronous version for more details."""
     action.validate_inputs(inputs)
     stream_initialize_time = system.now()
+    hook_buffer = _StreamItemHookBuffer(
+        lifecycle_adapters,
+        stream_item_coalescing,
+        is_async=True,
+        stream_initialize_time=stream_initialize_time,
+        action=action.name,
+        app_id=app_id,
+        partition_key=partition_key,
+        sequence_id=sequence_id,
+    )
     first_stream_start_time = None
     generator = action.stream_run_and_update(state, **inputs)
     result = None
@@ -386,19 +705,12 @@ async def _arun_single_step_streaming_action(
         if state_update is None:
             if first_stream_start_time is None:
                 first_stream_start_time = system.now()
-            await lifecycle_adapters.call_all_lifecycle_hooks_sync_and_async(
-                "post_stream_item",
-                item=result,
-                item_index=count,
-                stream_initialize_time=stream_initialize_time,
-                first_stream_item_start_time=first_stream_start_time,
-                action=action.name,
-                app_id=app_id,
-                partition_key=partition_key,
-                sequence_id=sequence_id,
-            )
+            if hook_buffer.enabled and hook_buffer.add(result, count, first_stream_start_time):
+                await hook_buffer.aflush()
             count += 1
             yield result, None
+    # deliver the items still buffered, if we are coalescing
+    await hook_buffer.aflush()
     if state_update is None:
         raise ValueError(
             f"Action {action.name} did not return a state update. For async actions, the last yield "
@@ -419,6 +731,7 @@ def _run_multi_step_streaming_action(
     app_id: str,
     partition_key: Optional[str],
     lifecycle_adapters: LifecycleAdapterSet = LifecycleAdapterSet(),
+    stream_item_coalescing: Optional[_StreamItemCoalescing] = None,
 ) -> Generator[Tuple[dict, Optional[State]], None, None]:
     """Runs a multi-step streaming action. E.G. one with a run/reduce step.
     This API is internal-facing. Note that this converts the shape of a
@@ -429,6 +742,16 @@ def _run_multi_step_streaming_action(
     """
     action.validate_inputs(inputs)
     stream_initialize_time = system.now()
+    hook_buffer = _StreamItemHookBuffer(
+        lifecycle_adapters,
+        stream_item_coalescing,
+        is_async=False,
+        stream_initialize_time=stream_initialize_time,
+        action=action.name,
+        app_id=app_id,
+        partition_key=partition_key,
+        sequence_id=sequence_id,
+    )
     generator = action.stream_run(state, **inputs)
     result = None
     first_stream_start_time = None
@@ -442,19 +765,12 @@ def _run_multi_step_streaming_action(
         if next_result is not None:
             if first_stream_start_time is None:
                 first_stream_start_time = system.now()
-            lifecycle_adapters.call_all_lifecycle_hooks_sync(
-                "post_stream_item",
-                item=next_result,
-                item_index=count,
-                stream_initialize_time=stream_initialize_time,
-                first_stream_item_start_time=first_stream_start_time,
-                action=action.name,
-                app_id=app_id,
-                partition_key=partition_key,
-                sequence_id=sequence_id,
-            )
+            if hook_buffer.enabled and hook_buffer.add(next_result, count, first_stream_start_time):
+                hook_buffer.flush()
             count += 1
             yield next_result, None
+    # deliver the items still buffered, if we are coalescing
+    hook_buffer.flush()
     state_update = _run_reducer(action, state, result, action.name)
     _validate_result(result, action.name, action.schema)
     _validate_reducer_writes(action, state_update, action.name)
@@ -469,10 +785,21 @@ async def _arun_multi_step_streaming_action(
     app_id: str,
     partition_key: Optional[str],
     lifecycle_adapters: LifecycleAdapterSet = LifecycleAdapterSet(),
+    stream_item_coalescing: Optional[_StreamItemCoalescing] = None,
 ) -> AsyncGenerator[Tuple[dict, Optional[State]], None]:
     """Runs a multi-step streaming action in async. See the synchronous version for more details."""
     action.validate_inputs(inputs)
     stream_initialize_time = system.now()
+    hook_buffer = _StreamItemHookBuffer(
+        lifecycle_adapters,
+        stream_item_coalescing,
+        is_async=True,
+        stream_initialize_time=stream_initialize_time,
+        action=action.name,
+        app_id=app_id,
+        partition_key=partition_key,
+        sequence_id=sequence_id,
+    )
     generator = action.stream_run(state, **inputs)
     result = None
     first_stream_start_time = None
@@ -486,19 +813,12 @@ async def _arun_multi_step_streaming_action(
         if next_result is not None:
             if first_stream_start_time is None:
                 first_stream_start_time = system.now()
-            await lifecycle_adapters.call_all_lifecycle_hooks_sync_and_async(
-                "post_stream_item",
-                item=next_result,
-                stream_initialize_time=stream_initialize_time,
-                item_index=count,
-                first_stream_item_start_time=first_stream_start_time,
-                action=action.name,
-                app_id=app_id,
-                partition_key=partition_key,
-                sequence_id=sequence_id,
-            )
+            if hook_buffer.enabled and hook_buffer.add(next_result, count, first_stream_start_time):
+                await hook_buffer.aflush()
             count += 1
             yield next_result, None
+    # deliver the items still buffered, if we are coalescing
+    await hook_buffer.aflush()
     state_update = _run_reducer(action, state, result, action.name)
     _validate_result(result, action.name, action.schema)
     _validate_reducer_writes(action, state_update, action.name)
@@ -506,16 +826,22 @@ async def _arun_multi_step_streaming_action(
 
 
 async def _arun_single_step_action(
-    action: SingleStepAction, state: State, inputs: Optional[Dict[str, Any]]
+    action: SingleStepAction,
+    state: State,
+    inputs: Optional[Dict[str, Any]],
+    plan: Optional[_ActionPlan] = None,
 ) -> Tuple[dict, State]:
     """Runs a single step action in async. See the synchronous version for more details."""
     state_to_use = state
-    action.validate_inputs(inputs)
+    if plan is None:
+        action.validate_inputs(inputs)
+    else:
+        plan.validate_inputs(action, inputs)
     result, new_state = _adjust_single_step_output(
         await action.run_and_update(state_to_use, **inputs), action.name, action.schema
     )
     _validate_result(result, action.name, action.schema)
-    _validate_reducer_writes(action, new_state, action.name)
+    _validate_reducer_writes(action, new_state, action.name, plan)
     return result, _state_update(state, new_state)
 
 
@@ -615,13 +941,14 @@ class _call_execute_method_pre_post:
     def call_pre(self, app) -> bool:
         if should_run_hooks := (app.uid not in _run_call_var.get({})):
             _run_call_var.set({**_run_call_var.get({}), **{app.uid: self.method}})
-            app._adapter_set.call_all_lifecycle_hooks_sync(
-                "pre_run_execute_call",
-                app_id=app._uid,
-                partition_key=app._partition_key,
-                state=app.state,
-                method=self.method,
-            )
+            if app._adapter_set.does_hook("pre_run_execute_call"):
+                app._adapter_set.call_all_lifecycle_hooks_sync(
+                    "pre_run_execute_call",
+                    app_id=app._uid,
+                    partition_key=app._partition_key,
+                    state=app.state,
+                    method=self.method,
+                )
         return should_run_hooks
 
     def call_post(self, app, exc) -> bool:
@@ -629,26 +956,28 @@ class _call_execute_method_pre_post:
             app.uid in _run_call_var.get(dict) and _run_call_var.get()[app.uid] == self.method
         ):
             _run_call_var.set({k: v for k, v in _run_call_var.get().items() if k != app.uid})
-            app._adapter_set.call_all_lifecycle_hooks_sync(
-                "post_run_execute_call",
-                app_id=app.uid,
-                partition_key=app._partition_key,
-                state=app.state,
-                method=self.method,
-                exception=exc,
-            )
+            if app._adapter_set.does_hook("post_run_execute_call"):
+                app._adapter_set.call_all_lifecycle_hooks_sync(
+                    "post_run_execute_call",
+                    app_id=app.uid,
+                    partition_key=app._partition_key,
+                    state=app.state,
+                    method=self.method,
+                    exception=exc,
+                )
         return should_run_hooks
 
     async def acall_pre(self, app) -> bool:
         if should_run_hooks := (app.uid not in _run_call_var.get({})):
             _run_call_var.set({**_run_call_var.get({}), **{app.uid: self.method}})
-            await app._adapter_set.call_all_lifecycle_hooks_sync_and_async(
-                "pre_run_execute_call",
-                app_id=app._uid,
-                partition_key=app._partition_key,
-                state=app.state,
-                method=self.method,
-            )
+            if app._adapter_set.does_hook("pre_run_execute_call", is_async=None):
+                await app._adapter_set.call_all_lifecycle_hooks_sync_and_async(
+                    "pre_run_execute_call",
+                    app_id=app._uid,
+                    partition_key=app._partition_key,
+                    state=app.state,
+                    method=self.method,
+                )
         return should_run_hooks
 
     async def acall_post(self, app, exc) -> bool:
@@ -656,14 +985,15 @@ class _call_execute_method_pre_post:
             app.uid in _run_call_var.get(dict) and _run_call_var.get()[app.uid] == self.method
         ):
             _run_call_var.set({k: v for k, v in _run_call_var.get().items() if k != app.uid})
-            await app._adapter_set.call_all_lifecycle_hooks_sync_and_async(
-                "post_run_execute_call",
-                app_id=app._uid,
-                partition_key=app._partition_key,
-                state=app.state,
-                method=self.method,
-                exception=exc,
-            )
+            if app._adapter_set.does_hook("post_run_execute_call", is_async=None):
+                await app._adapter_set.call_all_lifecycle_hooks_sync_and_async(
+                    "post_run_execute_call",
+                    app_id=app._uid,
+                    partition_key=app._partition_key,
+                    state=app.state,
+                    method=self.method,
+                    exception=exc,
+                )
         return should_run_hooks
 
     def __call__(self, fn: CallableT) -> CallableT:
@@ -773,6 +1103,11 @@ class Application(Generic[ApplicationStateType]):
         parallel_executor_factory: Optional[Executor] = None,
         state_persister: Union[BaseStateSaver, LifecycleAdapter, None] = None,
         state_initializer: Union[BaseStateLoader, LifecycleAdapter, None] = None,
+        sync_action_executor: Optional[Executor] = None,
+        action_cache: Optional[ActionCache] = None,
+        cached_actions: Optional[FrozenSet[str]] = None,
+        stream_item_coalescing: Optional[_StreamItemCoalescing] = None,
+        _template: Optional["_ApplicationTemplate"] = None,
     ):
         """Instantiates an Application. This is an internal API -- use the builder!
 
@@ -786,20 +1121,33 @@ class Application(Generic[ApplicationStateType]):
             So if this starts at 0, the first one you will see will be 1.
         :param adapter_set: Set of lifecycle adapters
         :param builder: Builder that created this application
+        :param sync_action_executor: Executor to run synchronous actions on in async runs,
+            None to run them on the event loop
+        :param action_cache: Cache for the actions that opt into caching
+        :param cached_actions: Names of the actions to cache in action_cache, None for those that opt in
+        :param stream_item_coalescing: Policy for coalescing the stream item hooks, None to deliver every item
+        :param _template: Template this is stamped out from (see _ApplicationTemplate), in which case the
+            adapter set passed in is already complete, and we reuse the template's compiled action plans
         """
         self._partition_key = partition_key
         self._uid = uid
         self.entrypoint = entrypoint
 
         self._graph = graph
-        self._public_facing_graph = ApplicationGraph(
-            actions=graph.actions,
-            transitions=graph.transitions,
-            entrypoint=graph.get_action(entrypoint),
-        )
         self._state = state
-        adapter_set = adapter_set if adapter_set is not None else LifecycleAdapterSet()
-        self._adapter_set = adapter_set.with_new_adapters(TracerFactoryContextHook(adapter_set))
+        if _template is None:
+            self._public_facing_graph = ApplicationGraph(
+                actions=graph.actions,
+                transitions=graph.transitions,
+                entrypoint=graph.get_action(entrypoint),
+            )
+            adapter_set = adapter_set if adapter_set is not None else LifecycleAdapterSet()
+            self._base_adapter_set = adapter_set
+            self._adapter_set = adapter_set.with_new_adapters(TracerFactoryContextHook(adapter_set))
+        else:
+            self._public_facing_graph = _template.public_facing_graph
+            self._base_adapter_set = _template.base_adapter_set
+            self._adapter_set = adapter_set
         # TODO -- consider adding global inputs + global input factories to the builder
         self._tracker = tracker
 
@@ -821,9 +1169,24 @@ class Application(Generic[ApplicationStateType]):
             ),
             "__context": self._context_factory,
         }
+        self._action_plans = (
+            {
+                action.name: _ActionPlan.compile(
+                    action,
+                    self._dependency_factory,
+                    default_cache=action_cache,
+                    cached_actions=cached_actions,
+                )
+                for action in graph.actions
+            }
+            if _template is None
+            else _template.action_plans
+        )
         self._spawning_parent_pointer = spawning_parent_pointer
         self._state_initializer = state_initializer
         self._state_persister = state_persister
+        self._sync_action_executor = sync_action_executor
+        self._stream_item_coalescing = stream_item_coalescing
         self._adapter_set.call_all_lifecycle_hooks_sync(
             "post_application_create",
             state=self._state,
@@ -875,13 +1238,14 @@ class Application(Generic[ApplicationStateType]):
     ) -> Optional[Tuple[Action, dict, State]]:
         """Internal-facing version of step. This is the same as step, but with an additional
         parameter to hide hook execution so async can leverage it."""
-        with self.context:
-            next_action = self.get_next_action()
+        next_action = self.get_next_action()
+        with self._context_factory(next_action, self.sequence_id):
             if next_action is None:
                 return None
             if inputs is None:
                 inputs = {}
-            action_inputs = self._process_inputs(inputs, next_action)
+            plan = self._action_plans[next_action.name]
+            action_inputs = self._process_inputs(inputs, next_action, plan)
             if _run_hooks:
                 self._adapter_set.call_all_lifecycle_hooks_sync(
                     "pre_run_step",
@@ -896,16 +1260,14 @@ class Application(Generic[ApplicationStateType]):
             result = None
             new_state = self._state
             try:
-                if next_action.single_step:
-                    result, new_state = _run_single_step_action(
-                        next_action, self._state, action_inputs
-                    )
+                cache_key, cached = self._get_cached_result(next_action, plan, action_inputs)
+                if cached is not None:
+                    result, new_state = cached
                 else:
-                    result = _run_function(
-                        next_action, self._state, action_inputs, name=next_action.name
+                    result, new_state = _run_sync_action(
+                        next_action, self._state, action_inputs, plan
                     )
-                    new_state = _run_reducer(next_action, self._state, result, next_action.name)
-
+                    self._cache_result(plan, cache_key, result, new_state)
                 new_state = self._update_internal_state_value(new_state, next_action)
                 self._set_state(new_state)
             except Exception as e:
@@ -926,6 +1288,115 @@ class Application(Generic[ApplicationStateType]):
                     )
             return next_action, result, new_state
 
+    def _cache_key(
+        self, action: Action, plan: _ActionPlan, inputs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Creates the key to look up the result of an action in its cache.
+
+        :param action: Action to look up
+        :param plan: Execution plan of the action
+        :param inputs: Processed inputs to the action
+        :return: The cache key, None if the action is not cached, or its reads/inputs cannot be serialized
+        """
+        if plan.cache is None:
+            return None
+        return create_cache_key(
+            action.name,
+            {key: self._state[key] for key in action.reads if key in self._state},
+            # injected inputs (E.G. __context) change every step, and do not change the result
+            {key: value for key, value in inputs.items() if not key.startswith("__")},
+            action.cache_identity,
+        )
+
+    def _replay_cached_result(
+        self, action: Action, cache_key: str, cached: Optional[CachedActionResult]
+    ) -> Optional[Tuple[dict, State]]:
+        """Logs a cache lookup, and replays the action's cached writes/deletes on the current state.
+
+        :param action: Action that was looked up
+        :param cache_key: Key it was looked up with
+        :param cached: The cached result, None if it was a miss
+        :return: The result + new state if it was a hit
+        """
+        if self._adapter_set.does_hook("do_log_attributes"):
+            self._adapter_set.call_all_lifecycle_hooks_sync(
+                "do_log_attributes",
+                attributes={"__burr_cache_hit": cached is not None, "__burr_cache_key": cache_key},
+                action=action.name,
+                action_sequence_id=self.sequence_id,
+                span=None,
+                tags={},
+                app_id=self._uid,
+                partition_key=self._partition_key,
+            )
+        if cached is None:
+            return None
+        new_state = self._state.update(**cached.writes)
+        if cached.deletes:
+            new_state = new_state.wipe(delete=list(cached.deletes))
+        return dict(cached.result), new_state
+
+    def _get_cached_result(
+        self, action: Action, plan: _ActionPlan, inputs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Tuple[dict, State]]]:
+        """Looks up the result of an action in its cache (if it has one).
+
+        :param action: Action to look up
+        :param plan: Execution plan of the action
+        :param inputs: Processed inputs to the action
+        :return: The cache key (None if the action is not cached, or its reads/inputs cannot be
+            serialized), and the result + new state if it was a hit
+        """
+        cache_key = self._cache_key(action, plan, inputs)
+        if cache_key is None:
+            return None, None
+        return cache_key, self._replay_cached_result(action, cache_key, plan.cache.get(cache_key))
+
+    async def _aget_cached_result(
+        self, action: Action, plan: _ActionPlan, inputs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Tuple[dict, State]]]:
+        """Async version of _get_cached_result, so caches can do their I/O off the event loop."""
+        cache_key = self._cache_key(action, plan, inputs)
+        if cache_key is None:
+            return None, None
+        cached = await plan.cache.aget(cache_key)
+        return cache_key, self._replay_cached_result(action, cache_key, cached)
+
+    def _cached_action_result(
+        self, plan: _ActionPlan, result: dict, new_state: State
+    ) -> CachedActionResult:
+        """Records what running an action did to the state -- the values of the fields it wrote,
+        and the fields it deleted -- so a cache hit can replay it."""
+        deltas = new_state._deltas_since(self._state)
+        if deltas is not None:
+            # the journal tells us what was deleted, so we don't have to diff the whole state
+            deleted = {
+                key for delta in deltas if isinstance(delta, DeleteField) for key in delta.keys
+            }
+        else:
+            deleted = self._state.keys()
+        return CachedActionResult(
+            result=result,
+            writes={key: new_state[key] for key in plan.writes if key in new_state},
+            deletes=tuple(key for key in deleted if key in self._state and key not in new_state),
+        )
+
+    def _cache_result(
+        self, plan: _ActionPlan, cache_key: Optional[str], result: dict, new_state: State
+    ):
+        """Stores the result of an action in its cache, if it was looked up (see _get_cached_result)."""
+        if cache_key is None:
+            return
+        plan.cache.set(cache_key, self._cached_action_result(plan, result, new_state))
+
+    async def _acache_result(
+        self, plan: _ActionPlan, cache_key: Optional[str], result: dict, new_state: State
+    ):
+        """Async version of _cache_result."""
+        if cache_key is None:
+            return
+        await plan.cache.aset(cache_key, self._cached_action_result(plan, result, new_state))
+
     def reset_to_entrypoint(self) -> None:
         """Resets the state machine to the entrypoint action -- you probably want to consider having a loop
         in your graph, but this will do the trick if you need it!"""
@@ -942,44 +1413,56 @@ class Application(Generic[ApplicationStateType]):
         )
         return new_state
 
-    def _process_inputs(self, inputs: Dict[str, Any], action: Action) -> Dict[str, Any]:
-        """Processes inputs, injecting the common inputs and ensuring that all required inputs are present."""
-        starting_with_double_underscore = {key for key in inputs.keys() if key.startswith("__")}
-        if len(starting_with_double_underscore) > 0:
-            raise ValueError(
-                BASE_ERROR_MESSAGE
-                + f"Inputs starting with a double underscore ({starting_with_double_underscore}) "
-                f"are reserved for internal use/injected inputs. "
-                "Please do not directly pass keys starting with a double underscore."
-            )
-        inputs = inputs.copy()
+    def _process_inputs(
+        self, inputs: Dict[str, Any], action: Action, plan: Optional[_ActionPlan] = None
+    ) -> Dict[str, Any]:
+        """Processes inputs, injecting the common inputs and ensuring that all required inputs are present.
+
+        :param inputs: Inputs passed in by the user
+        :param action: Action to process the inputs for
+        :param plan: Execution plan of the action, looked up if not provided
+        :return: The inputs to run the action with
+        """
+        if plan is None:
+            plan = self._action_plans[action.name]
         processed_inputs = {}
-        required_inputs, optional_inputs = action.optional_and_required_inputs
-        for key in list(inputs.keys()):
-            if key in required_inputs or key in optional_inputs:
-                processed_inputs[key] = inputs.pop(key)
-        if len(inputs) > 0 and logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                f"Keys {inputs.keys()} were passed in as inputs to action "
-                f"{action.name}, but not declared by the action as an input. "
-                f"Action only needs: {required_inputs} (optionally: {optional_inputs}) "
-                f"so we're just letting you know some inputs are being skipped."
-            )
-        missing_inputs = required_inputs - set(processed_inputs.keys())
-        additional_inputs = optional_inputs - set(processed_inputs.keys())
-        for input_ in missing_inputs | additional_inputs:
-            # if we can find it in the dependency factory, we'll use that
-            # TODO -- figure out what happens if people attempt to override default factory
-            # inputs
-            if input_ in self._dependency_factory:
-                processed_inputs[input_] = self._dependency_factory[input_](
-                    action, self.sequence_id
+        skipped_inputs = []
+        for key, value in inputs.items():
+            if key in plan.declared_inputs and not key.startswith("__"):
+                processed_inputs[key] = value
+            else:
+                skipped_inputs.append(key)
+        if skipped_inputs:
+            starting_with_double_underscore = {
+                key for key in skipped_inputs if key.startswith("__")
+            }
+            if len(starting_with_double_underscore) > 0:
+                raise ValueError(
+                    BASE_ERROR_MESSAGE
+                    + f"Inputs starting with a double underscore ({starting_with_double_underscore}) "
+                    f"are reserved for internal use/injected inputs. "
+                    "Please do not directly pass keys starting with a double underscore."
+                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Keys {skipped_inputs} were passed in as inputs to action "
+                    f"{action.name}, but not declared by the action as an input. "
+                    f"Action only needs: {set(plan.required_inputs)} "
+                    f"(optionally: {set(plan.optional_inputs)}) "
+                    f"so we're just letting you know some inputs are being skipped."
                 )
-                if input_ in missing_inputs:
-                    missing_inputs.remove(input_)
+        # if we can find it in the dependency factory, we'll use that
+        # TODO -- figure out what happens if people attempt to override default factory
+        # inputs
+        for input_ in plan.injected_inputs:
+            processed_inputs[input_] = self._dependency_factory[input_](action, self.sequence_id)
+        if len(processed_inputs) == len(plan.declared_inputs):
+            # everything the action declares is there, so nothing is missing
+            return processed_inputs
+        missing_inputs = {key for key in plan.required_inputs if key not in processed_inputs}
         if len(missing_inputs) > 0:
             missing_inputs_dict = {key: "FILL ME IN" for key in missing_inputs}
-            missing_inputs_dict.update({key: "..." for key in inputs.keys()})
+            missing_inputs_dict.update({key: "..." for key in skipped_inputs})
             addendum = (
                 "\nPlease double check the values passed to the keyword argument `inputs` to however you're running "
                 "the burr application.\n"
@@ -1014,8 +1497,8 @@ class Application(Generic[ApplicationStateType]):
 
     async def _astep(self, inputs: Optional[Dict[str, Any]], _run_hooks: bool = True):
         # we want to increment regardless of failure
-        with self.context:
-            next_action = self.get_next_action()
+        next_action = self.get_next_action()
+        with self._context_factory(next_action, self.sequence_id):
             if next_action is None:
                 return None
             if inputs is None:
@@ -1034,21 +1517,30 @@ class Application(Generic[ApplicationStateType]):
             result = None
             new_state = self._state
             try:
-                if not next_action.is_async():
+                if not next_action.is_async() and self._sync_action_executor is None:
                     # we can just delegate to the synchronous version, it will block the event loop,
-                    # but that's safer than assuming its OK to launch a thread
-                    # TODO -- add an option/configuration to launch a thread (yikes, not super safe, but for a pure function
-                    # which this is supposed to be its OK).
+                    # but that's safer than assuming its OK to launch a thread -- to run it in a thread
+                    # (or process), users can opt in with ApplicationBuilder.with_sync_action_executor.
                     # this delegates hooks to the synchronous version, so we'll call all of them as well
                     # In this case we allow the self._step to do input processing
-                    return self._step(
+                    out = self._step(
                         inputs=inputs, _run_hooks=False
                     )  # Skip hooks as we already ran all of them/will run all of them in this function's finally
+                    _, result, new_state = out
+                    return out
                 # In this case we want to process inputs because we run the function directly
-                action_inputs = self._process_inputs(inputs, next_action)
-                if next_action.single_step:
+                plan = self._action_plans[next_action.name]
+                action_inputs = self._process_inputs(inputs, next_action, plan)
+                cache_key, cached = await self._aget_cached_result(next_action, plan, action_inputs)
+                if cached is not None:
+                    result, new_state = cached
+                elif not next_action.is_async():
+                    result, new_state = await self._arun_in_sync_action_executor(
+                        next_action, action_inputs, plan
+                    )
+                elif next_action.single_step:
                     result, new_state = await _arun_single_step_action(
-                        next_action, self._state, inputs=action_inputs
+                        next_action, self._state, inputs=action_inputs, plan=plan
                     )
                 else:
                     result = await _arun_function(
@@ -1056,8 +1548,13 @@ class Application(Generic[ApplicationStateType]):
                         self._state,
                         inputs=action_inputs,
                         name=next_action.name,
+                        plan=plan,
+                    )
+                    new_state = _run_reducer(
+                        next_action, self._state, result, next_action.name, plan=plan
                     )
-                    new_state = _run_reducer(next_action, self._state, result, next_action.name)
+                if cached is None:
+                    await self._acache_result(plan, cache_key, result, new_state)
                 new_state = self._update_internal_state_value(new_state, next_action)
                 self._set_state(new_state)
             except Exception as e:
@@ -1079,6 +1576,29 @@ class Application(Generic[ApplicationStateType]):
 
             return next_action, result, new_state
 
+    async def _arun_in_sync_action_executor(
+        self, action: Action, inputs: Dict[str, Any], plan: _ActionPlan
+    ) -> Tuple[dict, State]:
+        """Runs a synchronous action on the sync action executor, so it does not block the event loop.
+
+        :param action: Action to run
+        :param inputs: Processed inputs to the action
+        :param plan: Execution plan of the action
+        :return: The result of running the action, and the new state
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(self._sync_action_executor, ProcessPoolExecutor):
+            # Context variables do not cross process boundaries, and the plan may not be picklable
+            # (E.G. if it holds a cache), so we send just what we need
+            fn = functools.partial(_run_sync_action, action, self._state, inputs)
+        else:
+            # We run in a copy of the current context, so the action sees the application context
+            # and tracer (set by the pre_run_step hooks) the same way it would on the event loop
+            fn = functools.partial(
+                contextvars.copy_context().run, _run_sync_action, action, self._state, inputs, plan
+            )
+        return await loop.run_in_executor(self._sync_action_executor, fn)
+
     def _parse_action_list(self, action_list: list[str]) -> Tuple[List[str], List[str]]:
         """Utility function to parse a list of actions/tags into a list of actions and a list of tags."""
         actions = []
@@ -1536,6 +2056,7 @@ class Application(Generic[ApplicationStateType]):
                     app_id=self._uid,
                     partition_key=self._partition_key,
                     lifecycle_adapters=self._adapter_set,
+                    stream_item_coalescing=self._stream_item_coalescing,
                 )
                 return next_action, StreamingResultContainer(
                     generator, self._state, process_result, callback
@@ -1550,6 +2071,7 @@ class Application(Generic[ApplicationStateType]):
                     app_id=self._uid,
                     partition_key=self._partition_key,
                     lifecycle_adapters=self._adapter_set,
+                    stream_item_coalescing=self._stream_item_coalescing,
                 )
         except Exception as e:
             # We only want to raise this in the case of an exception
@@ -1792,6 +2314,7 @@ class Application(Generic[ApplicationStateType]):
                     app_id=self._uid,
                     partition_key=self._partition_key,
                     lifecycle_adapters=self._adapter_set,
+                    stream_item_coalescing=self._stream_item_coalescing,
                 )
                 return next_action, AsyncStreamingResultContainer(
                     generator, self._state, process_result, callback
@@ -1814,6 +2337,7 @@ class Application(Generic[ApplicationStateType]):
                     app_id=self._uid,
                     partition_key=self._partition_key,
                     lifecycle_adapters=self._adapter_set,
+                    stream_item_coalescing=self._stream_item_coalescing,
                 )
         except Exception as e:
             # We only want to raise this in the case of an exception
@@ -2032,10 +2556,13 @@ class Application(Generic[ApplicationStateType]):
         return self._context_factory(self.get_next_action(), self.sequence_id)
 
     def _increment_sequence_id(self):
-        if SEQUENCE_ID not in self._state:
-            self._state = self._state.update(**{SEQUENCE_ID: 0})
+        # Every step starts by incrementing the sequence ID, so we commit here -- the journal of the
+        # state then contains exactly what the step changed
+        committed_state = self._state.commit()
+        if SEQUENCE_ID not in committed_state:
+            self._state = committed_state.update(**{SEQUENCE_ID: 0})
         else:
-            self._state = self._state.update(**{SEQUENCE_ID: self.sequence_id + 1})
+            self._state = committed_state.update(**{SEQUENCE_ID: self.sequence_id + 1})
 
     def _set_sequence_id(self, sequence_id: int):
         self._state = self._state.update(**{SEQUENCE_ID: sequence_id})
@@ -2066,7 +2593,8 @@ class Application(Generic[ApplicationStateType]):
     @property
     def builder(self) -> Optional["ApplicationBuilder[ApplicationStateType]"]:
         """Returns the application builder that was used to build this application.
-        Note that this asusmes the application was built using the builder. Otherwise,
+        Note that this asusmes the application was built using the builder. Otherwise
+        (E.G. for the sub-applications that parallel actions run), this is None.
 
         :return: The application builder
         """
@@ -2106,6 +2634,99 @@ class Application(Generic[ApplicationStateType]):
             )
 
 
+@dataclasses.dataclass
+class _ApplicationTemplate:
+    """Everything about a built application that does not depend on its identifiers or state -- its graph,
+    compiled action plans, hooks and settings. This stamps out applications of the same shape without going
+    through the builder (and recompiling all of that), which we use for sub-applications
+    (see burr.core.parallelism). Internal-facing."""
+
+    graph: Graph
+    entrypoint: str
+    public_facing_graph: ApplicationGraph
+    action_plans: Dict[str, _ActionPlan]
+    # adapters as passed to the application, and with the ones it adds (what it runs with)
+    base_adapter_set: LifecycleAdapterSet
+    adapter_set: LifecycleAdapterSet
+    tracker: Optional["TrackingClient"]
+    parallel_executor_factory: Callable[[], Executor]
+    state_persister: Union[BaseStateSaver, LifecycleAdapter, None]
+    sync_action_executor: Optional[Executor]
+    stream_item_coalescing: Optional[_StreamItemCoalescing]
+    typing_system: TypingSystem
+
+    @staticmethod
+    def from_application(app: "Application") -> "_ApplicationTemplate":
+        """Creates a template from an application. Applications loaded through a state initializer
+        cannot be templated, as their state is loaded by the builder.
+
+        :param app: Application to create the template from
+        :return: The template
+        """
+        return _ApplicationTemplate(
+            graph=app._graph,
+            entrypoint=app.entrypoint,
+            public_facing_graph=app._public_facing_graph,
+            action_plans=app._action_plans,
+            base_adapter_set=app._base_adapter_set,
+            adapter_set=app._adapter_set,
+            tracker=app._tracker,
+            parallel_executor_factory=app._parallel_executor_factory,
+            state_persister=app._state_persister,
+            sync_action_executor=app._sync_action_executor,
+            stream_item_coalescing=app._stream_item_coalescing,
+            typing_system=app._state.typing_system,
+        )
+
+    def create(
+        self,
+        uid: str,
+        partition_key: Optional[str],
+        state: State,
+        spawning_parent_pointer: Optional[burr_types.ParentPointer] = None,
+        tracker: Optional["TrackingClient"] = None,
+    ) -> "Application":
+        """Stamps out an application from this template.
+
+        :param uid: ID of the application
+        :param partition_key: Partition key of the application
+        :param state: State to start with
+        :param spawning_parent_pointer: Pointer to the application that spawned this one
+        :param tracker: Tracker for the application, in place of the template's
+        :return: The application
+        """
+        if tracker is self.tracker:
+            adapter_set = self.adapter_set
+        else:
+            # Trackers are stateful, so each application may get its own
+            adapters = [
+                adapter for adapter in self.base_adapter_set.adapters if adapter is not self.tracker
+            ]
+            if tracker is not None:
+                adapters.append(tracker)
+            base_adapter_set = LifecycleAdapterSet(*adapters)
+            adapter_set = base_adapter_set.with_new_adapters(
+                TracerFactoryContextHook(base_adapter_set)
+            )
+        return Application(
+            graph=self.graph,
+            state=state.with_typing_system(self.typing_system),
+            partition_key=partition_key,
+            uid=uid,
+            entrypoint=self.entrypoint,
+            adapter_set=adapter_set,
+            # the template was built by a placeholder builder, which does not describe this application
+            builder=None,
+            spawning_parent_pointer=spawning_parent_pointer,
+            tracker=tracker,
+            parallel_executor_factory=self.parallel_executor_factory,
+            state_persister=self.state_persister,
+            sync_action_executor=self.sync_action_executor,
+            stream_item_coalescing=self.stream_item_coalescing,
+            _template=self,
+        )
+
+
 def _validate_app_id(app_id: Optional[str]):
     if app_id is None:
         raise ValueError(
@@ -2145,6 +2766,10 @@ class ApplicationBuilder(Generic[StateType]):
         self.graph_builder = None
         self.typing_system = None
         self.parallel_executor_factory = None
+        self.sync_action_executor = None
+        self.action_cache: Optional[ActionCache] = None
+        self.cached_actions: Optional[FrozenSet[str]] = None
+        self.stream_item_coalescing: Optional[_StreamItemCoalescing] = None
         self.state_persister = None
         self._is_async: bool = False
 
@@ -2274,6 +2899,76 @@ class ApplicationBuilder(Generic[StateType]):
         self.parallel_executor_factory = executor_factory
         return self
 
+    def with_sync_action_executor(self, executor: Executor) -> "ApplicationBuilder[StateType]":
+        """Assigns an executor to run synchronous (non-streaming) actions on when the application is run
+        asynchronously (``astep``/``aiterate``/``arun``). By default, these run directly on the event loop,
+        blocking it for as long as the action takes -- with this, they are awaited through
+        ``loop.run_in_executor`` instead, so other coroutines (E.G. concurrent requests in a web server)
+        can make progress in the meantime.
+
+        With a thread pool, the action runs in a copy of the caller's context, so
+        ``ApplicationContext.get()`` and tracing (``__tracer``/``@trace``) work as they do on the event loop.
+        With a :py:class:`ProcessPoolExecutor <concurrent.futures.ProcessPoolExecutor>`, the action,
+        state, inputs and results must be picklable, and the action cannot take the ``__context`` or
+        ``__tracer`` inputs. Note that lifecycle hooks are still called on the event loop.
+
+        The application does not shut the executor down -- you own its lifecycle, and can share it between
+        applications.
+
+        :param executor: Executor to run synchronous actions on
+        :return: The application builder for future chaining.
+        """
+        self.sync_action_executor = executor
+        return self
+
+    def with_stream_item_coalescing(
+        self, max_items: Optional[int] = None, max_interval_ms: Optional[float] = None
+    ) -> "ApplicationBuilder[StateType]":
+        """Coalesces the ``post_stream_item`` hooks of streaming actions, for applications that stream many
+        items (E.G. tokens from an LLM) to hooks that do work per item (E.G. trackers). Items after the first
+        are buffered, and delivered once ``max_items`` are buffered or ``max_interval_ms`` has passed since the
+        last delivery (whichever comes first), and at the end of the stream. The first item is always delivered
+        as soon as it is yielded, so time to first item is exact.
+
+        Hooks implementing ``post_stream_item`` are called once per batch with its latest item (and ``item_count``,
+        the size of the batch), those implementing ``post_stream_items`` get every item of the batch.
+        This does not change what is yielded to the caller of ``stream_result``/``astream_result``.
+
+        :param max_items: Number of items to deliver at once
+        :param max_interval_ms: Maximum time between deliveries, in milliseconds. Note this is checked
+            when an item is yielded, so a stalled stream is not delivered until it yields/ends.
+        :return: The application builder for future chaining.
+        """
+        if max_items is None and max_interval_ms is None:
+            raise ValueError(
+                BASE_ERROR_MESSAGE
+                + "You must specify at least one of max_items or max_interval_ms to coalesce stream items."
+            )
+        self.stream_item_coalescing = _StreamItemCoalescing(
+            max_items=max_items, max_interval_ms=max_interval_ms
+        )
+        return self
+
+    def with_action_cache(
+        self, cache: ActionCache, actions: Optional[List[str]] = None
+    ) -> "ApplicationBuilder[StateType]":
+        """Assigns a cache for action results. Cached actions are looked up by a hash of their name,
+        the values of the state fields they read and their inputs -- on a hit, the action is skipped,
+        and the cached result and writes are applied to the state. Only cache deterministic actions
+        (retrieval, embedding, prompt formatting, etc...) -- and note streaming actions cannot be cached.
+
+        The cache can be shared between applications (see :py:mod:`burr.core.cache` for the implementations).
+        Hits and misses are logged to the tracker as attributes of the step.
+
+        :param cache: Cache to use, E.G. :py:class:`InMemoryActionCache <burr.core.cache.InMemoryActionCache>`
+        :param actions: Names of the actions to cache. If not provided, only actions that opt in with
+            ``@action(..., cache=True)`` are cached.
+        :return: The application builder for future chaining.
+        """
+        self.action_cache = cache
+        self.cached_actions = frozenset(actions) if actions is not None else None
+        return self
+
     def _initialize_graph_builder(self):
         if self.graph_builder is None:
             self.graph_builder = GraphBuilder()
@@ -2702,6 +3397,10 @@ class ApplicationBuilder(Generic[StateType]):
             parallel_executor_factory=self.parallel_executor_factory,
             state_persister=self.state_persister,
             state_initializer=self.state_initializer,
+            sync_action_executor=self.sync_action_executor,
+            action_cache=self.action_cache,
+            cached_actions=self.cached_actions,
+            stream_item_coalescing=self.stream_item_coalescing,
         )
 
     @telemetry.capture_function_usage
@@ -0,0 +1,349 @@
+"""Caches for the results of deterministic actions.
+
+An action that is deterministic given the state it reads and its inputs (retrieval, embedding,
+prompt formatting, etc...) can be cached -- the application then looks up its result by a hash of
+the action (its name, implementation and version), the fields it reads and its inputs, and skips
+running it on a hit.
+Opt in by passing ``cache=...`` to :py:class:`@action <burr.core.action.action>`, or through
+:py:meth:`ApplicationBuilder.with_action_cache <burr.core.application.ApplicationBuilder.with_action_cache>`.
+"""
+
+import abc
+import asyncio
+import dataclasses
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from burr.core import serde
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedActionResult:
+    """The cached outcome of running an action.
+
+    :param result: The result of the action
+    :param writes: The values of the fields the action writes, in the state after it ran
+    :param deletes: The fields the action deleted from the state
+    """
+
+    result: Dict[str, Any]
+    writes: Dict[str, Any]
+    deletes: Tuple[str, ...] = ()
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters for a cache, across every application using it."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+def _serialize_for_key(value: Any) -> Any:
+    """Converts a value in a cache key to JSON, tagging every container with its type -- plain JSON
+    would give (1, 2) and [1, 2] (or {1: x} and {"1": x}) the same key. Only uses serializers registered
+    with :py:mod:`burr.core.serde` for other types -- the default one (``str(value)``) is not a faithful
+    representation of the value, so two different values could share a key."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return ["list", [_serialize_for_key(item) for item in value]]
+    if isinstance(value, tuple):
+        return ["tuple", [_serialize_for_key(item) for item in value]]
+    if isinstance(value, (set, frozenset)):
+        return ["set", sorted((_serialize_for_key(item) for item in value), key=json.dumps)]
+    if isinstance(value, dict):
+        items = [[_serialize_for_key(key), _serialize_for_key(item)] for key, item in value.items()]
+        return ["dict", sorted(items, key=lambda item: json.dumps(item[0]))]
+    if serde.serialize.dispatch(type(value)) is serde.serialize.dispatch(object):
+        raise TypeError(f"Cannot create a cache key from a value of type: {type(value)}")
+    return [
+        f"{type(value).__module__}.{type(value).__qualname__}",
+        _serialize_for_key(serde.serialize(value)),
+    ]
+
+
+def create_cache_key(
+    action_name: str,
+    read_values: Dict[str, Any],
+    inputs: Dict[str, Any],
+    action_identity: Any = None,
+) -> Optional[str]:
+    """Creates a stable key for an action's result, from the action, the values it reads and its inputs.
+    Values are keyed by their (type-tagged) JSON form, using the serializers registered in
+    :py:mod:`burr.core.serde` for other types, so this is stable across processes.
+
+    :param action_name: Name of the action
+    :param read_values: Values of the fields of state the action reads
+    :param inputs: Inputs to the action (excluding injected ones, E.G. ``__context``)
+    :param action_identity: Identifies the action's implementation, see
+        :py:meth:`Action.cache_identity <burr.core.action.Action.cache_identity>`
+    :return: The cache key, or None if the values cannot be serialized (in which case we do not cache)
+    """
+    try:
+        payload = json.dumps(
+            [
+                action_name,
+                _serialize_for_key(action_identity),
+                _serialize_for_key(read_values),
+                _serialize_for_key(inputs),
+            ]
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ActionCache(abc.ABC):
+    """Base class for action caches. Implementations store :py:class:`CachedActionResult` by key,
+    and must be safe to share between threads (and applications)."""
+
+    def __init__(self):
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[CachedActionResult]:
+        """Gets a cached result.
+
+        :param key: Cache key
+        :return: The cached result, or None if it is not cached (or has expired)
+        """
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: CachedActionResult):
+        """Caches a result.
+
+        :param key: Cache key
+        :param value: Result to cache
+        """
+        pass
+
+    def get(self, key: str) -> Optional[CachedActionResult]:
+        """Gets a cached result, recording a hit or miss.
+
+        :param key: Cache key
+        :return: The cached result, or None if it is not cached
+        """
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return value
+
+    def set(self, key: str, value: CachedActionResult):
+        """Caches a result.
+
+        :param key: Cache key
+        :param value: Result to cache
+        """
+        self._set(key, value)
+
+    async def aget(self, key: str) -> Optional[CachedActionResult]:
+        """Gets a cached result from an async application. By default this calls :py:meth:`get`
+        directly -- caches that block on I/O should override it (see :py:class:`SQLiteActionCache`).
+
+        :param key: Cache key
+        :return: The cached result, or None if it is not cached
+        """
+        return self.get(key)
+
+    async def aset(self, key: str, value: CachedActionResult):
+        """Caches a result from an async application. See :py:meth:`aget`.
+
+        :param key: Cache key
+        :param value: Result to cache
+        """
+        self.set(key, value)
+
+    def _record_evictions(self, count: int = 1):
+        with self._stats_lock:
+            self._stats.evictions += count
+
+    def stats(self) -> CacheStats:
+        """Gives the hit/miss/eviction counts of this cache.
+
+        :return: A snapshot of the stats
+        """
+        with self._stats_lock:
+            return dataclasses.replace(self._stats)
+
+
+class InMemoryActionCache(ActionCache):
+    """In-memory LRU cache, with an optional time-to-live. Values are stored as-is (not copied),
+    which is safe as state is immutable -- just don't mutate the results of cached actions."""
+
+    def __init__(self, max_size: Optional[int] = 1024, ttl_seconds: Optional[float] = None):
+        """Constructor
+
+        :param max_size: Maximum number of results to keep, evicting the least recently used. None for unbounded.
+        :param ttl_seconds: How long results are valid for, None for forever
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, CachedActionResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[CachedActionResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._record_evictions()
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: CachedActionResult):
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._record_evictions(evicted)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteActionCache(ActionCache):
+    """On-disk cache, stored in a SQLite database, so results survive restarts and can be shared
+    between processes on the same machine. Results are pickled -- only use this with a database you trust.
+    Async applications look up/store results in the default executor, so they do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        table_name: str = "burr_action_cache",
+        ttl_seconds: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ):
+        """Constructor
+
+        :param db_path: Path to the database
+        :param table_name: Table to store results in
+        :param ttl_seconds: How long results are valid for, None for forever
+        :param max_size: Maximum number of results to keep, evicting the least recently used. None for unbounded.
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table_name}_last_used ON {self.table_name} (last_used)"
+        )
+        connection.commit()
+        return connection
+
+    def copy(self) -> "SQLiteActionCache":
+        return SQLiteActionCache(
+            db_path=self.db_path,
+            table_name=self.table_name,
+            ttl_seconds=self.ttl_seconds,
+            max_size=self.max_size,
+        )
+
+    def _get(self, key: str) -> Optional[CachedActionResult]:
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self.connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                self.connection.commit()
+                self._record_evictions()
+                return None
+            self.connection.execute(
+                f"UPDATE {self.table_name} SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self.connection.commit()
+        return pickle.loads(value)
+
+    def _set(self, key: str, value: CachedActionResult):
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at, last_used) "
+                f"VALUES (?, ?, ?, ?)",
+                (key, pickle.dumps(value), expires_at, now),
+            )
+            evicted = 0
+            if self.max_size is not None:
+                evicted = self.connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN ("
+                    f"SELECT key FROM {self.table_name} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                ).rowcount
+            self.connection.commit()
+        if evicted:
+            self._record_evictions(evicted)
+
+    async def aget(self, key: str) -> Optional[CachedActionResult]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def aset(self, key: str, value: CachedActionResult):
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, value)
+
+    def cleanup(self):
+        """Closes the connection to the database."""
+        self.connection.close()
+
+    def __getstate__(self):
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("connection", "_lock", "_stats_lock")
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.connection = self._connect()
@@ -3,7 +3,7 @@ import dataclasses
 import inspect
 import logging
 import pathlib
-from typing import Any, Callable, List, Literal, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 from burr import telemetry
 from burr.core.action import Action, Condition, create_action, default
@@ -110,6 +110,7 @@ class Graph:
         self._action_map = {action.name: action for action in self.actions}
         self._adjacency_map = self._create_adjacency_map(self.transitions)
         self._action_tag_map = self._create_action_tag_map(self.actions)
+        self._decision_table = self._create_decision_table(self._adjacency_map, self._action_map)
 
     @staticmethod
     def _create_adjacency_map(transitions: List[Transition]) -> dict:
@@ -120,6 +121,24 @@ class Graph:
             adjacency_map[from_.name].append((to.name, transition.condition))
         return adjacency_map
 
+    @staticmethod
+    def _create_decision_table(
+        adjacency_map: dict, action_map: Dict[str, Action]
+    ) -> Dict[str, Tuple[Tuple[Action, Optional[Callable[[State], bool]]], ...]]:
+        """Compiles the transitions out of each action into an ordered tuple of
+        (next action, compiled condition), where a condition of None always holds.
+        Transitions after one that always holds can never be taken, so they are dropped."""
+        decision_table = {}
+        for from_, possibilities in adjacency_map.items():
+            decisions = []
+            for to, condition in possibilities:
+                evaluate = condition.compile()
+                decisions.append((action_map[to], evaluate))
+                if evaluate is None:
+                    break
+            decision_table[from_] = tuple(decisions)
+        return decision_table
+
     @staticmethod
     def _create_action_tag_map(actions: List[Action]) -> dict[str, List[Action]]:
         """Creates a mapping of action tags to lists of corresponding actions.
@@ -139,10 +158,9 @@ class Graph:
         """Gives the next node to execute given state + prior step."""
         if prior_step is None:
             return self._action_map[entrypoint]
-        possibilities = self._adjacency_map[prior_step]
-        for next_action, condition in possibilities:
-            if condition.run(state)[Condition.KEY]:
-                return self._action_map[next_action]
+        for next_action, evaluate in self._decision_table.get(prior_step, ()):
+            if evaluate is None or evaluate(state):
+                return next_action
         return None
 
     def get_action(self, action_name: str) -> Optional[Action]:
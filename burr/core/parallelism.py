@@ -1,9 +1,11 @@
 import abc
 import asyncio
+import concurrent.futures
 import dataclasses
 import hashlib
 import inspect
 import logging
+import time
 from typing import (
     Any,
     AsyncGenerator,
@@ -20,9 +22,10 @@ from typing import (
 
 from burr.common import async_utils
 from burr.common.async_utils import SyncOrAsyncGenerator, SyncOrAsyncGeneratorOrItemOrList
-from burr.core import Action, ApplicationBuilder, ApplicationContext, Graph, State
-from burr.core.action import SingleStepAction
-from burr.core.application import ApplicationIdentifiers
+from burr.common.types import ParentPointer
+from burr.core import Action, Application, ApplicationBuilder, ApplicationContext, Graph, State
+from burr.core.action import SingleStepAction, create_action
+from burr.core.application import PRIOR_STEP, ApplicationIdentifiers, _ApplicationTemplate
 from burr.core.graph import GraphBuilder
 from burr.core.persistence import BaseStateLoader, BaseStateSaver
 from burr.lifecycle import LifecycleAdapter
@@ -43,6 +46,29 @@ class RunnableGraph:
     graph: Graph
     entrypoint: str
     halt_after: List[str]
+    # Built lazily, on the first sub-application we create that can use it (see SubGraphTask)
+    _template: Optional[_ApplicationTemplate] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _get_template(self) -> _ApplicationTemplate:
+        """Gives the application template for this graph, building it on first use. This is built once
+        and shared by every sub-application we run for this graph, so they do not have to go through
+        the builder (and re-validate/re-compile the graph) for each one.
+
+        :return: The application template
+        """
+        if self._template is None:
+            # the identifiers and state are placeholders -- each application gets its own
+            app = (
+                ApplicationBuilder()
+                .with_graph(self.graph)
+                .with_entrypoint(self.entrypoint)
+                .with_identifiers(app_id="template")
+                .build()
+            )
+            self._template = _ApplicationTemplate.from_application(app)
+        return self._template
 
     @staticmethod
     def create(from_: SubgraphType) -> "RunnableGraph":
@@ -124,12 +150,34 @@ class SubGraphTask:
 
         return builder
 
+    def _create_app_from_template(self, parent_context: ApplicationIdentifiers) -> Application:
+        """Creates the sub-application from the graph's template, which is cheaper than building it.
+        We can only do this if we don't need the builder to wire up (and validate) a persister,
+        or to load state with an initializer."""
+        return self.graph._get_template().create(
+            uid=self.application_id,
+            partition_key=parent_context.partition_key,  # cascade the partition key
+            state=self.state,
+            spawning_parent_pointer=ParentPointer(
+                app_id=parent_context.app_id,
+                sequence_id=parent_context.sequence_id,
+                partition_key=parent_context.partition_key,
+            ),
+            tracker=self.tracker,
+        )
+
+    def _can_use_template(self) -> bool:
+        return self.state_persister is None and self.state_initializer is None
+
     def run(
         self,
         parent_context: ApplicationContext,
     ) -> State:
         """Runs the task -- this simply executes it by instantiating a sub-application"""
-        app = self._create_app_builder(parent_context).build()
+        if self._can_use_template():
+            app = self._create_app_from_template(parent_context)
+        else:
+            app = self._create_app_builder(parent_context).build()
         action, result, state = app.run(
             halt_after=self.graph.halt_after,
             inputs={key: value for key, value in self.inputs.items() if not key.startswith("__")},
@@ -138,7 +186,9 @@ class SubGraphTask:
 
     async def arun(self, parent_context: ApplicationContext):
         # Here for backwards compatibility, not ideal
-        if (self.state_initializer is not None and not self.state_initializer.is_async()) or (
+        if self._can_use_template():
+            app = self._create_app_from_template(parent_context)
+        elif (self.state_initializer is not None and not self.state_initializer.is_async()) or (
             self.state_persister is not None and not self.state_persister.is_async()
         ):
             logger.warning(
@@ -155,6 +205,12 @@ class SubGraphTask:
         return state
 
 
+def _run_task(task: SubGraphTask, context: ApplicationContext, started_at: List[float]) -> State:
+    """Runs a task on the parallel executor, recording when it started (see _run_tasks)."""
+    started_at.append(time.monotonic())
+    return task.run(context)
+
+
 def _stable_app_id_hash(app_id: str, child_key: str) -> str:
     """Gives a stable hash for an application. Given the parent app_id and a child key,
     this will give a hash that will be stable across runs.
@@ -225,7 +281,11 @@ class TaskBasedParallelAction(SingleStepAction):
                 return state.update(all_llm_outputs=all_llm_outputs)
 
     Note that it can be synchronous *or* asynchronous. Synchronous implementations will use the standard/
-    supplied executor. Asynchronous implementations will use asyncio.gather. Note that, while asynchronous
+    supplied executor. Asynchronous implementations will run the tasks concurrently on the event loop.
+    Either way, tasks are pulled from the generator lazily, at most :py:meth:`max_concurrency` at a time,
+    and states are passed to reduce as they become available, so large fan-outs do not have to be held in
+    memory at once. Every task runs, even if reduce does not consume all of their states.
+    See :py:meth:`task_timeout` and :py:meth:`yield_as_completed` as well. Note that, while asynchronous
     implementations may implement the tasks as either synchronous or asynchronous generators, synchronous implementations
     can only use synchronous generators. Furthermore, with asynchronous implementations, the generator for reduce
     will be asynchronous as well (regardless of whether your task functions are asynchronous).
@@ -236,8 +296,8 @@ class TaskBasedParallelAction(SingleStepAction):
 
     def run_and_update(self, state: State, **run_kwargs) -> Tuple[dict, State]:
         """Runs and updates. This is not user-facing, so do not override it.
-        This runs all actions in parallel (using the supplied executor, from the context),
-        and then reduces the results.
+        This runs all tasks in parallel (using the supplied executor, from the context, or the event loop),
+        at most :py:meth:`max_concurrency` at a time, and reduces the results as they come in.
 
         :param state: Input state
         :param run_kwargs: Additional inputs (runtime inputs)
@@ -252,18 +312,16 @@ class TaskBasedParallelAction(SingleStepAction):
                 delete=[item for item in state.keys() if item.startswith("__")]
             )
             task_generator = self.tasks(state_without_internals, context, run_kwargs)
-
-            def execute_task(task):
-                return task.run(run_kwargs["__context"])
-
-            with context.parallel_executor_factory() as executor:
-                # Directly map the generator to the executor
-                results = list(executor.map(execute_task, task_generator))
-
-            def state_generator() -> Generator[Any, None, None]:
-                yield from results
-
-            return {}, self.reduce(state_without_internals, state_generator())
+            states = self._run_tasks(task_generator, context)
+            try:
+                new_state = self.reduce(state_without_internals, states)
+                # reduce does not have to consume every state, but every task still has to run
+                for _ in states:
+                    pass
+                return {}, new_state
+            finally:
+                # cancels any tasks left if reduce failed
+                states.close()
 
         async def _arun_and_update():
             context: ApplicationContext = run_kwargs.get("__context")
@@ -273,23 +331,160 @@ class TaskBasedParallelAction(SingleStepAction):
                 delete=[item for item in state.keys() if item.startswith("__")]
             )
             task_generator = self.tasks(state_without_internals, context, run_kwargs)
+            states = self._arun_tasks(task_generator, context)
+            try:
+                new_state = await self.reduce(state_without_internals, states)
+                async for _ in states:
+                    pass
+                return {}, new_state
+            finally:
+                await states.aclose()
 
-            async def state_generator():
-                """This makes it easier on the user -- if they don't have an async generator we can still exhause it
-                This way we run through all of the task generators. These correspond to the task generation capabilities above (the map*/task generation stuff)
-                """
-                all_tasks = await async_utils.arealize(task_generator)
-                coroutines = [item.arun(context) for item in all_tasks]
-                results = await asyncio.gather(*coroutines)
-                # TODO -- yield in order...
+        if self.is_async():
+            return _arun_and_update()  # type: ignore
+        return _run_and_update()
+
+    def _run_tasks(
+        self, tasks: Generator[SubGraphTask, None, None], context: ApplicationContext
+    ) -> Generator[State, None, None]:
+        """Runs tasks on the parallel executor, yielding their states. Tasks are pulled from the generator
+        as slots free up, so at most max_concurrency are in flight. Tasks still running when this is
+        closed (or fails) are cancelled, if they have not started. Their timeouts count from when they
+        start, as the executor may queue them behind others."""
+        max_concurrency = self.max_concurrency()
+        timeout = self.task_timeout()
+        as_completed = self.yield_as_completed()
+        task_iterator = iter(tasks)
+        executor = context.parallel_executor_factory()
+        # future -> (task, [time it started running, once it has]), in order of submission
+        in_flight: Dict[concurrent.futures.Future, Tuple[SubGraphTask, List[float]]] = {}
+
+        def fill():
+            while max_concurrency is None or len(in_flight) < max_concurrency:
+                task = next(task_iterator, None)
+                if task is None:
+                    return
+                started_at: List[float] = []
+                in_flight[executor.submit(_run_task, task, context, started_at)] = (
+                    task,
+                    started_at,
+                )
+
+        def wait_timeout() -> Optional[float]:
+            """How long until the next task could time out -- for tasks that have not started yet,
+            that is at least the timeout."""
+            if timeout is None:
+                return None
+            deadlines = [
+                started_at[0] + timeout if started_at else time.monotonic() + timeout
+                for _, started_at in in_flight.values()
+            ]
+            return max(min(deadlines) - time.monotonic(), 0)
+
+        completed = False
+        try:
+            fill()
+            while in_flight:
+                waiting_on = in_flight if as_completed else [next(iter(in_flight))]
+                done, _ = concurrent.futures.wait(
+                    waiting_on,
+                    timeout=wait_timeout(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    now = time.monotonic()
+                    for future, (task, started_at) in in_flight.items():
+                        if started_at and started_at[0] + timeout <= now and not future.done():
+                            raise TimeoutError(
+                                f"Task for sub-application: {task.application_id} did not complete "
+                                f"within {timeout} seconds."
+                            )
+                    continue
+                results = [future.result() for future in in_flight if future in done]
+                for future in done:
+                    del in_flight[future]
+                fill()
+                yield from results
+            completed = True
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=completed)
+
+    async def _arun_tasks(
+        self, tasks: SyncOrAsyncGenerator[SubGraphTask], context: ApplicationContext
+    ) -> AsyncGenerator[State, None]:
+        """Runs tasks on the event loop, yielding their states. See _run_tasks."""
+        max_concurrency = self.max_concurrency()
+        timeout = self.task_timeout()
+        as_completed = self.yield_as_completed()
+        task_generator = async_utils.asyncify_generator(tasks)
+        # asyncio task -> sub-graph task, in order of submission
+        in_flight: Dict[asyncio.Task, SubGraphTask] = {}
+
+        async def fill():
+            while max_concurrency is None or len(in_flight) < max_concurrency:
+                try:
+                    task = await task_generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                coroutine = task.arun(context)
+                if timeout is not None:
+                    coroutine = asyncio.wait_for(coroutine, timeout)
+                in_flight[asyncio.ensure_future(coroutine)] = task
+
+        try:
+            await fill()
+            while in_flight:
+                waiting_on = in_flight if as_completed else [next(iter(in_flight))]
+                done, _ = await asyncio.wait(waiting_on, return_when=asyncio.FIRST_COMPLETED)
+                results = []
+                for future in [future for future in in_flight if future in done]:
+                    task = in_flight.pop(future)
+                    try:
+                        results.append(future.result())
+                    except asyncio.TimeoutError as e:
+                        raise TimeoutError(
+                            f"Task for sub-application: {task.application_id} did not complete "
+                            f"within {timeout} seconds."
+                        ) from e
+                await fill()
                 for result in results:
                     yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            await task_generator.aclose()
+
+    def max_concurrency(self) -> Optional[int]:
+        """Maximum number of tasks to run at once. Tasks are pulled from :py:meth:`tasks` as others complete,
+        so this bounds memory as well as the load on whatever the tasks call (E.G. an LLM API).
+        Override this to set it. Note that for synchronous actions, the executor may also bound concurrency.
+
+        :return: The maximum number of concurrent tasks, None (the default) for no limit
+        """
+        return None
 
-            return {}, await self.reduce(state_without_internals, state_generator())
+    def task_timeout(self) -> Optional[float]:
+        """Time each task has to complete, from when it starts running. If a task times out, the action fails with
+        a ``TimeoutError``, and the tasks still in flight are cancelled (synchronous tasks that are already
+        running are left to finish, as threads cannot be interrupted). Override this to set it.
 
-        if self.is_async():
-            return _arun_and_update()  # type: ignore
-        return _run_and_update()
+        :return: The timeout in seconds, None (the default) for no timeout
+        """
+        return None
+
+    def yield_as_completed(self) -> bool:
+        """Whether to pass states to :py:meth:`reduce` as their tasks complete (True), or in the order the
+        tasks were created (False, the default). Either way, reduce gets states as soon as they are available
+        (in that order), so it can run incrementally -- with True, one slow task does not hold up the rest.
+        Override this to set it.
+
+        :return: Whether to yield states as they complete
+        """
+        return False
 
     def is_async(self) -> bool:
         """This says whether or not the action is async. Note you have to override this if you have async tasks
@@ -469,7 +664,7 @@ class MapActionsAndStates(TaskBasedParallelAction):
         :return: Generator of tasks to run
         """
 
-        def _create_task(key: str, action: Action, substate: State) -> SubGraphTask:
+        def _create_task(key: str, graph: RunnableGraph, substate: State) -> SubGraphTask:
             tracker = _cascade_adapter(self.tracker(), context.tracker)
             state_initializer_behavior = self.state_initializer()
             state_initializer = _cascade_adapter(
@@ -489,7 +684,7 @@ class MapActionsAndStates(TaskBasedParallelAction):
             else:
                 state_persister = _cascade_adapter(self.state_persister(), context.state_persister)
             return SubGraphTask(
-                graph=RunnableGraph.create(action),
+                graph=graph,
                 inputs=inputs,
                 state=substate,
                 application_id=_stable_app_id_hash(context.app_id, key),
@@ -500,9 +695,11 @@ class MapActionsAndStates(TaskBasedParallelAction):
 
         def _tasks() -> Generator[SubGraphTask, None, None]:
             for i, action in enumerate(self.actions(state, context, inputs)):
+                # one graph per action, so its sub-applications share the graph's template
+                graph = RunnableGraph.create(action)
                 for j, substate in enumerate(self.states(state, context, inputs)):
                     key = f"{i}-{j}"  # this is a stable hash for now but will not handle caching
-                    yield _create_task(key, action, substate)
+                    yield _create_task(key, graph, substate)
 
         async def _atasks() -> AsyncGenerator[SubGraphTask, None]:
             action_generator = async_utils.asyncify_generator(self.actions(state, context, inputs))
@@ -510,9 +707,10 @@ class MapActionsAndStates(TaskBasedParallelAction):
             actions = await async_utils.arealize(action_generator)
             states = await async_utils.arealize(state_generator)
             for i, action in enumerate(actions):
+                graph = RunnableGraph.create(action)
                 for j, substate in enumerate(states):
                     key = f"{i}-{j}"
-                    yield _create_task(key, action, substate)
+                    yield _create_task(key, graph, substate)
 
         return _atasks() if self.is_async() else _tasks()
 
@@ -854,6 +1052,144 @@ class PassThroughMapActionsAndStates(MapActionsAndStates):
         return self._reads
 
 
+class ParallelActions(MapActions):
+    """Runs a group of independent actions concurrently over the current state, and merges their writes.
+    Create this with :py:func:`parallel` rather than directly.
+
+    Actions are independent if none of them writes a field another one reads or writes -- in which case
+    the result does not depend on the order they run in, so we can run them all at once. Like any
+    :py:class:`MapActions`, each action is run as its own sub-application, on the parallel executor
+    (see ``ApplicationBuilder.with_parallel_executor``) if they are all synchronous, and as tasks on the
+    event loop otherwise.
+    """
+
+    def __init__(self, actions: List[Action]):
+        """Constructor. Use :py:func:`parallel` instead.
+
+        :param actions: Named actions to run in parallel
+        """
+        super().__init__()
+        _validate_independent(actions)
+        self._actions = actions
+
+    def actions(
+        self, state: State, inputs: Dict[str, Any], context: ApplicationContext
+    ) -> Generator[SubgraphType, None, None]:
+        yield from self._actions
+
+    def reduce(self, state: State, states: SyncOrAsyncGenerator[State]) -> State:
+        """Merges the writes of each action into the state. Not user-facing."""
+        if self.is_async():
+            return self._areduce(state, states)  # type: ignore
+        return self._merge(state, list(states))
+
+    async def _areduce(self, state: State, states: AsyncGenerator[State, None]) -> State:
+        return self._merge(state, [item async for item in states])
+
+    def _merge(self, state: State, states: List[State]) -> State:
+        # states do not come in the order of the actions if yield_as_completed() is True, so match each
+        # one to the action its sub-application ran (each runs just the one)
+        actions_by_name = {action.name: action for action in self._actions}
+        for action_state in states:
+            action = actions_by_name[action_state[PRIOR_STEP]]
+            state = state.update(
+                **{key: action_state[key] for key in action.writes if key in action_state}
+            )
+            deleted = [key for key in action.writes if key not in action_state and key in state]
+            if deleted:
+                state = state.wipe(delete=deleted)
+        return state
+
+    def is_async(self) -> bool:
+        return any(action.is_async() for action in self._actions)
+
+    @property
+    def inputs(self) -> Union[list[str], tuple[list[str], list[str]]]:
+        required_inputs, optional_inputs = {"__context"}, set()
+        for action in self._actions:
+            action_required_inputs, action_optional_inputs = action.optional_and_required_inputs
+            required_inputs |= {key for key in action_required_inputs if not key.startswith("__")}
+            optional_inputs |= {key for key in action_optional_inputs if not key.startswith("__")}
+        return sorted(required_inputs), sorted(optional_inputs - required_inputs)
+
+    @property
+    def reads(self) -> list[str]:
+        return sorted({key for action in self._actions for key in action.reads})
+
+    @property
+    def writes(self) -> list[str]:
+        return sorted({key for action in self._actions for key in action.writes})
+
+
+def _validate_independent(actions: List[Action]):
+    """Validates that a group of actions can run in parallel, I.E. none of them writes a field
+    another one reads or writes."""
+    for i, action in enumerate(actions):
+        for other in actions[i + 1 :]:
+            conflicts = (set(action.writes) & (set(other.reads) | set(other.writes))) | (
+                set(other.writes) & set(action.reads)
+            )
+            if conflicts:
+                raise ValueError(
+                    f"Actions: {action.name} and {other.name} cannot run in parallel, as they "
+                    f"conflict on fields: {sorted(conflicts)} (one of them writes what the other one "
+                    f"reads or writes). Run them one after the other instead."
+                )
+
+
+def parallel(
+    *actions: Union[Action, Callable], **named_actions: Union[Action, Callable]
+) -> ParallelActions:
+    """Creates an action that runs a group of independent actions concurrently, merging their writes.
+    This saves you from writing a :py:class:`MapActions` subclass when all you want is to run a few
+    actions that do not depend on each other (E.G. a retrieval and a web search) at the same time.
+
+    .. code-block:: python
+
+        from burr.core import ApplicationBuilder, State, action
+        from burr.core.parallelism import parallel
+
+        @action(reads=["query"], writes=["documents"])
+        def retrieve(state: State) -> State:
+            ...
+
+        @action(reads=["query"], writes=["search_results"])
+        def search(state: State) -> State:
+            ...
+
+        app = (
+            ApplicationBuilder()
+            .with_actions(
+                research=parallel(retrieve, search),
+                answer=answer,
+            )
+            .with_transitions(("research", "answer"))
+            ...
+        )
+
+    Actions cannot depend on each other -- if one writes a field another one reads or writes,
+    this raises a ValueError.
+
+    :param actions: Actions (or functions decorated with ``@action``) to run. Named after their function
+        if they have not been named.
+    :param named_actions: Actions to run, by name
+    :return: An action that runs all of them in parallel
+    """
+    all_actions = []
+    for action in actions:
+        name = getattr(action, "name", None) or getattr(action, "__name__", None)
+        if name is None:
+            raise ValueError(
+                f"Cannot determine the name of action: {action}. Pass it as a keyword argument instead."
+            )
+        all_actions.append(create_action(action, name))
+    all_actions.extend(create_action(action, name) for name, action in named_actions.items())
+    names = [action.name for action in all_actions]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Actions run in parallel must have unique names, got: {names}")
+    return ParallelActions(all_actions)
+
+
 def map_reduce_action(
     # action: Optional[SubgraphType]=None,
     action: Union[
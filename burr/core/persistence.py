@@ -1,15 +1,43 @@
 import abc
+import asyncio
+import atexit
+import collections
+import concurrent.futures
 import datetime
+import functools
+import hashlib
 import json
+import os
+import queue
 import sqlite3
+import threading
+import time
+import weakref
 from abc import ABCMeta
-from collections import defaultdict
-from typing import Any, Dict, Literal, Optional, TypedDict
+from collections import OrderedDict, defaultdict
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
 from burr.common.types import BaseCopyable
-from burr.core import Action
-from burr.core.state import State, logger
-from burr.lifecycle import PostRunStepHook, PostRunStepHookAsync
+from burr.core import Action, serde
+from burr.core.state import LazyValue, State, _serialize_field, logger
+from burr.lifecycle import (
+    PostApplicationExecuteCallHook,
+    PostApplicationExecuteCallHookAsync,
+    PostRunStepHook,
+    PostRunStepHookAsync,
+)
+from burr.lifecycle.base import ExecuteMethod
 
 try:
     from typing import Self
@@ -17,6 +45,18 @@ except ImportError:
     Self = None
 
 
+# Key under which incremental (delta) saves store the serialized state journal in place of the full state
+JOURNAL_KEY = "__burr_journal__"
+
+# Run on every connection a sqlite persister opens in production mode. WAL lets readers (in any process) run
+# alongside the writer, and in WAL mode synchronous=NORMAL only fsyncs at checkpoints -- commits survive an
+# application crash, but the last few can be lost on power loss.
+SQLITE_PRODUCTION_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+# How long a sqlite connection in production mode waits for another process' write lock before raising
+# "database is locked". Only used if ``timeout`` is not passed in ``connect_kwargs``.
+SQLITE_PRODUCTION_BUSY_TIMEOUT_MS = 30_000
+
+
 class PersistedStateData(TypedDict):
     partition_key: str
     app_id: str
@@ -27,6 +67,17 @@ class PersistedStateData(TypedDict):
     status: str
 
 
+class StateToPersist(TypedDict):
+    """A single save request -- these are the arguments to :py:meth:`BaseStateSaver.save`"""
+
+    partition_key: Optional[str]
+    app_id: str
+    sequence_id: int
+    position: str
+    state: State
+    status: Literal["completed", "failed"]
+
+
 class BaseStateLoader(abc.ABC):
     """Base class for state initialization. This goes together with a BaseStateSaver to form the
     database for your application."""
@@ -126,6 +177,15 @@ class BaseStateSaver(abc.ABC):
         """
         pass
 
+    def save_many(self, to_persist: List[StateToPersist], **kwargs):
+        """Saves a batch of states, in order. By default this calls :py:meth:`save` for each one --
+        override this if your database has a more efficient bulk path (E.G. executemany).
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        for item in to_persist:
+            self.save(**item, **kwargs)
+
     def is_async(self) -> bool:
         return False
 
@@ -171,6 +231,15 @@ class AsyncBaseStateSaver(abc.ABC):
         """
         pass
 
+    async def save_many(self, to_persist: List[StateToPersist], **kwargs):
+        """Saves a batch of states, in order. By default this calls :py:meth:`save` for each one --
+        override this if your database has a more efficient bulk path.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        for item in to_persist:
+            await self.save(**item, **kwargs)
+
     def is_async(self) -> bool:
         return True
 
@@ -237,6 +306,375 @@ class PersisterHookAsync(PostRunStepHookAsync):
             )
 
 
+class WriteBehindPersister(BaseStateLoader, PostRunStepHook, PostApplicationExecuteCallHook):
+    """Wraps a state saver so that saving happens in the background, rather than in the step loop.
+    Saves are placed on a bounded queue, and a worker thread drains it, writing in batches with
+    :py:meth:`save_many <BaseStateSaver.save_many>` (which persisters can implement as a bulk insert).
+
+    Pass this to ``with_state_persister`` in place of the persister it wraps. If the wrapped persister is
+    also a loader, this can be passed to ``initialize_from`` -- loading flushes pending saves first.
+
+    .. code-block:: python
+
+        persister = SQLitePersister(db_path="burr.db", connect_kwargs={"check_same_thread": False})
+        persister.initialize()
+        write_behind_persister = WriteBehindPersister(persister, max_queue_size=1000)
+        app = (
+            ApplicationBuilder()
+            ...
+            .with_state_persister(write_behind_persister)
+            .build()
+        )
+
+    Saves are durable (flushed) when the application methods listed in ``flush_after`` return,
+    when :py:meth:`flush` or :py:meth:`close` are called, and at interpreter exit. Note that the
+    wrapped persister is called from the worker thread, so it has to support that (E.G. sqlite needs
+    ``check_same_thread=False``).
+    """
+
+    def __init__(
+        self,
+        persister: BaseStateSaver,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 100,
+        on_full: Literal["block", "raise"] = "block",
+        flush_after: Collection[ExecuteMethod] = (
+            ExecuteMethod.run,
+            ExecuteMethod.iterate,
+            ExecuteMethod.arun,
+            ExecuteMethod.aiterate,
+        ),
+    ):
+        """Constructor
+
+        :param persister: The persister to wrap
+        :param max_queue_size: Maximum number of saves that can be pending at once
+        :param max_batch_size: Maximum number of saves to write in a single call to ``save_many``
+        :param on_full: What to do if the queue is full -- "block" waits for space (slowing down the application
+            to the speed of the database), "raise" raises an error.
+        :param flush_after: Application methods that, when they return, wait for all pending saves to be written.
+            Defaults to run(), iterate(), arun() and aiterate(). Add step() if you need every step to be
+            durable when it returns. Flushing blocks, so in an async application prefer
+            :py:class:`AsyncWriteBehindPersister`.
+        """
+        if on_full not in ("block", "raise"):
+            raise ValueError(f"on_full must be one of 'block' or 'raise', got: {on_full}")
+        self.persister = persister
+        self.max_batch_size = max_batch_size
+        self.on_full = on_full
+        self.flush_after = set(flush_after)
+        self._queue: "queue.Queue[Optional[StateToPersist]]" = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._error: Optional[Exception] = None
+        atexit.register(_flush_write_behind_persister_at_exit, weakref.ref(self))
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run_worker, daemon=True)
+                self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            item = self._queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.max_batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self.persister.save_many(batch)
+            except Exception as e:
+                logger.exception("Failed to save batch of %d states in the background", len(batch))
+                self._error = e
+            finally:
+                for _ in range(len(batch) + (1 if item is None else 0)):
+                    self._queue.task_done()
+            if item is None:
+                return
+
+    def enqueue(self, to_persist: StateToPersist):
+        """Queues a state to be saved, applying backpressure if the queue is full.
+
+        :param to_persist: The state (and identifiers) to save
+        """
+        self._ensure_worker()
+        if self.on_full == "block":
+            self._queue.put(to_persist)
+        else:
+            try:
+                self._queue.put_nowait(to_persist)
+            except queue.Full as e:
+                raise RuntimeError(
+                    f"Write-behind queue is full ({self._queue.maxsize} pending saves). "
+                    f"The database is not keeping up -- consider increasing max_queue_size or setting on_full='block'."
+                ) from e
+
+    def flush(self):
+        """Waits until every pending save has been written. If a background save failed
+        since the last flush, this raises its exception."""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Flushes all pending saves and stops the worker thread."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+        self.flush()
+
+    def post_run_step(
+        self,
+        *,
+        app_id: str,
+        partition_key: str,
+        sequence_id: int,
+        state: "State",
+        action: "Action",
+        result: Optional[Dict[str, Any]],
+        exception: Exception,
+        **future_kwargs: Any,
+    ):
+        self.enqueue(
+            {
+                "partition_key": partition_key,
+                "app_id": app_id,
+                "sequence_id": sequence_id,
+                "position": action.name,
+                "state": state,
+                "status": "completed" if exception is None else "failed",
+            }
+        )
+
+    def post_run_execute_call(
+        self,
+        *,
+        app_id: str,
+        partition_key: str,
+        state: "State",
+        method: ExecuteMethod,
+        exception: Optional[Exception],
+        **future_kwargs,
+    ):
+        if method in self.flush_after:
+            self.flush()
+
+    def _loader(self) -> BaseStateLoader:
+        if not isinstance(self.persister, BaseStateLoader):
+            raise TypeError(
+                f"{self.persister.__class__.__name__} is not a state loader, so it cannot be used to load state."
+            )
+        return self.persister
+
+    def load(
+        self, partition_key: str, app_id: Optional[str], sequence_id: Optional[int] = None, **kwargs
+    ) -> Optional[PersistedStateData]:
+        loader = self._loader()
+        self.flush()
+        return loader.load(partition_key, app_id, sequence_id, **kwargs)
+
+    def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
+        loader = self._loader()
+        self.flush()
+        return loader.list_app_ids(partition_key, **kwargs)
+
+
+def _flush_write_behind_persister_at_exit(persister_ref: "weakref.ref[WriteBehindPersister]"):
+    persister = persister_ref()
+    if persister is not None:
+        persister.flush()
+
+
+class AsyncWriteBehindPersister(
+    AsyncBaseStateLoader, PostRunStepHookAsync, PostApplicationExecuteCallHookAsync
+):
+    """Asynchronous version of :py:class:`WriteBehindPersister`. Saves are placed on a bounded
+    ``asyncio.Queue``, and a worker task (started on the running event loop) drains it, writing in batches
+    with :py:meth:`save_many <AsyncBaseStateSaver.save_many>`.
+
+    Saves are durable when the application methods listed in ``flush_after`` return, or when
+    :py:meth:`flush` or :py:meth:`close` are awaited. The worker task stops once a flush has written
+    everything queued (and starts again on the next save), so it does not outlive the application call
+    (or the event loop) it was started in.
+    """
+
+    def __init__(
+        self,
+        persister: AsyncBaseStateSaver,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 100,
+        on_full: Literal["block", "raise"] = "block",
+        flush_after: Collection[ExecuteMethod] = (
+            ExecuteMethod.arun,
+            ExecuteMethod.aiterate,
+        ),
+    ):
+        """Constructor
+
+        :param persister: The persister to wrap
+        :param max_queue_size: Maximum number of saves that can be pending at once
+        :param max_batch_size: Maximum number of saves to write in a single call to ``save_many``
+        :param on_full: What to do if the queue is full -- "block" waits for space, "raise" raises an error.
+        :param flush_after: Application methods that, when they return, wait for all pending saves to be written.
+            Defaults to arun() and aiterate(). Add astep() if you need every step to be durable when it returns.
+        """
+        if on_full not in ("block", "raise"):
+            raise ValueError(f"on_full must be one of 'block' or 'raise', got: {on_full}")
+        self.persister = persister
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.on_full = on_full
+        self.flush_after = set(flush_after)
+        # created lazily, as these have to be bound to the running event loop
+        self._queue: Optional["asyncio.Queue[StateToPersist]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+        # saves queued (or waiting to be) and not yet written
+        self._pending = 0
+
+    def _ensure_worker(self) -> "asyncio.Queue[StateToPersist]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run_worker())
+        return self._queue
+
+    async def _run_worker(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self.persister.save_many(batch)
+            except Exception as e:
+                logger.exception("Failed to save batch of %d states in the background", len(batch))
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                self._pending -= len(batch)
+
+    async def enqueue(self, to_persist: StateToPersist):
+        """Queues a state to be saved, applying backpressure if the queue is full.
+
+        :param to_persist: The state (and identifiers) to save
+        """
+        _queue = self._ensure_worker()
+        self._pending += 1
+        if self.on_full == "block":
+            try:
+                await _queue.put(to_persist)
+            except BaseException:
+                self._pending -= 1
+                raise
+        else:
+            try:
+                _queue.put_nowait(to_persist)
+            except asyncio.QueueFull as e:
+                self._pending -= 1
+                raise RuntimeError(
+                    f"Write-behind queue is full ({self.max_queue_size} pending saves). "
+                    f"The database is not keeping up -- consider increasing max_queue_size or setting on_full='block'."
+                ) from e
+
+    async def flush(self):
+        """Waits until every pending save has been written, and stops the worker task. If a background
+        save failed since the last flush, this raises its exception."""
+        if self._queue is not None:
+            await self._queue.join()
+            self._stop_worker_if_idle()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def close(self):
+        """Flushes all pending saves and stops the worker task."""
+        try:
+            await self.flush()
+        finally:
+            if self._worker is not None:
+                self._worker.cancel()
+                self._worker = None
+
+    def _stop_worker_if_idle(self):
+        """Stops the worker if nothing is queued -- saves queued after this start a new one. As this does
+        not await, nothing can be queued between the check and the cancel."""
+        if self._queue is None or self._pending:
+            return
+        if self._worker is not None:
+            # the worker is waiting on an empty queue, so cancelling it does not lose a save
+            self._worker.cancel()
+            self._worker = None
+        # the queue is bound to the event loop it was created on (in python < 3.10), which may not be
+        # the one we are next used on
+        self._queue = None
+
+    async def post_run_step(
+        self,
+        *,
+        app_id: str,
+        partition_key: str,
+        sequence_id: int,
+        state: "State",
+        action: "Action",
+        result: Optional[dict],
+        exception: Exception,
+        **future_kwargs: Any,
+    ):
+        await self.enqueue(
+            {
+                "partition_key": partition_key,
+                "app_id": app_id,
+                "sequence_id": sequence_id,
+                "position": action.name,
+                "state": state,
+                "status": "completed" if exception is None else "failed",
+            }
+        )
+
+    async def post_run_execute_call(
+        self,
+        *,
+        app_id: str,
+        partition_key: str,
+        state: "State",
+        method: ExecuteMethod,
+        exception: Optional[Exception],
+        **future_kwargs,
+    ):
+        if method in self.flush_after:
+            await self.flush()
+
+    def _loader(self) -> AsyncBaseStateLoader:
+        if not isinstance(self.persister, AsyncBaseStateLoader):
+            raise TypeError(
+                f"{self.persister.__class__.__name__} is not a state loader, so it cannot be used to load state."
+            )
+        return self.persister
+
+    async def load(
+        self, partition_key: str, app_id: Optional[str], sequence_id: Optional[int] = None, **kwargs
+    ) -> Optional[PersistedStateData]:
+        loader = self._loader()
+        await self.flush()
+        return await loader.load(partition_key, app_id, sequence_id, **kwargs)
+
+    async def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
+        loader = self._loader()
+        await self.flush()
+        return await loader.list_app_ids(partition_key, **kwargs)
+
+
 class DevNullPersister(BaseStatePersister):
     """Does nothing, do not use this. This is for testing only."""
 
@@ -285,8 +723,668 @@ class AsyncDevNullPersister(AsyncBaseStatePersister):
         return
 
 
+# serde key of a reference to a state field that was offloaded to a blob store
+BLOB_REFERENCE_SERDE_KEY = "blob"
+
+
+def _is_blob_reference(value: Any) -> bool:
+    return isinstance(value, dict) and value.get(serde.KEY) == BLOB_REFERENCE_SERDE_KEY
+
+
+@serde.deserializer.register(BLOB_REFERENCE_SERDE_KEY)
+def _deserialize_unresolved_blob_reference(value: dict, **kwargs) -> Any:
+    # persisters with a blob store replace references before deserializing, so this means there is none
+    raise ValueError(
+        f"State field refers to blob {value['key']}, but no blob store was given to load it from. "
+        f"Pass the blob store it was saved with to the persister (blob_store=...)."
+    )
+
+
+class BlobStore(abc.ABC):
+    """Content-addressed storage for large state fields (documents, embeddings, images...).
+
+    Persisters given a blob store (``blob_store=...``) store each top-level state field whose serialized
+    (JSON) form is at least ``min_size_bytes`` here, keyed by its SHA-256, and persist a reference to it in
+    its place -- so a value is stored once, however many states (or applications) hold it. Loaded states
+    fetch these fields the first time they are accessed.
+
+    .. code-block:: python
+
+        blob_store = LocalBlobStore("./burr_blobs")
+        persister = SQLitePersister.from_values(db_path="burr.db", blob_store=blob_store)
+
+    Blobs are reference counted -- every persisted state that refers to a blob holds a reference, released
+    when the persister deletes it (E.G. with :py:meth:`SQLitePersister.compact`) or with :py:meth:`release`.
+    :py:meth:`collect` deletes the blobs nothing refers to. Persisters release the references of a save
+    that fails after offloading.
+
+    Reference counts are kept in a sqlite database, so processes can share a blob store. Implementations
+    store the bytes -- see :py:class:`LocalBlobStore` and :py:class:`S3BlobStore`.
+    """
+
+    def __init__(self, refcount_db_path: str, min_size_bytes: int = 16 * 1024):
+        """Constructor
+
+        :param refcount_db_path: Path to the sqlite database to keep reference counts in
+        :param min_size_bytes: Fields whose serialized form is at least this large are offloaded
+        """
+        self.refcount_db_path = refcount_db_path
+        self.min_size_bytes = min_size_bytes
+        self._connect()
+
+    def _connect(self):
+        # autocommit, so we control transactions ourselves
+        self._refcounts = sqlite3.connect(
+            self.refcount_db_path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._refcounts.execute(
+            "CREATE TABLE IF NOT EXISTS blob_refcounts (key TEXT PRIMARY KEY, count INTEGER NOT NULL)"
+        )
+        self._refcounts_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def put(self, key: str, data: bytes):
+        """Stores a blob. This has to be atomic -- a concurrent :py:meth:`get` never sees part of it.
+
+        :param key: The blob's key (the SHA-256 of the data)
+        :param data: The blob
+        """
+        pass
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes:
+        """Fetches a blob.
+
+        :param key: The blob's key
+        :return: The blob
+        """
+        pass
+
+    @abc.abstractmethod
+    def exists(self, key: str) -> bool:
+        """Checks if a blob is stored.
+
+        :param key: The blob's key
+        """
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Deletes a blob, if it is stored.
+
+        :param key: The blob's key
+        """
+        pass
+
+    def offload(self, serialized_state: dict) -> dict:
+        """Stores the large fields of a serialized state, replacing them with references, and takes a
+        reference to every blob the result refers to (including references that were already there).
+
+        :param serialized_state: The serialized state to persist
+        :return: The serialized state with large fields replaced by references
+        """
+        out = {}
+        to_store = {}
+        for field, value in serialized_state.items():
+            if not _is_blob_reference(value) and isinstance(value, (str, list, dict)):
+                data = json.dumps(value).encode()
+                if len(data) >= self.min_size_bytes:
+                    key = hashlib.sha256(data).hexdigest()
+                    to_store[key] = data
+                    value = {serde.KEY: BLOB_REFERENCE_SERDE_KEY, "key": key, "size": len(data)}
+            out[field] = value
+        references = self.references(out)
+        if references:
+            # before storing, so a concurrent collect() cannot delete them (see collect())
+            self.acquire(references)
+        try:
+            for key, data in to_store.items():
+                if not self.exists(key):
+                    self.put(key, data)
+        except Exception:
+            self.release(references)
+            raise
+        return out
+
+    def rehydrate(self, serialized_state: dict, **serde_kwargs) -> dict:
+        """Replaces references in a serialized state with values that fetch the blob when accessed,
+        to pass to :py:meth:`State.deserialize <burr.core.state.State.deserialize>`.
+
+        :param serialized_state: The persisted serialized state
+        :param serde_kwargs: The kwargs to deserialize the fields with, once they are fetched
+        :return: The serialized state, with lazy values in place of references
+        """
+        return {
+            field: (
+                BlobReference(self, field, value, serde_kwargs)
+                if _is_blob_reference(value)
+                else value
+            )
+            for field, value in serialized_state.items()
+        }
+
+    def load(self, key: str) -> Any:
+        """Fetches a blob, and decodes it to the serialized field it holds.
+
+        :param key: The blob's key
+        """
+        return json.loads(self.get(key))
+
+    @staticmethod
+    def references(serialized_state: dict) -> List[str]:
+        """Lists the blobs a persisted (serialized) state refers to, once per reference.
+
+        :param serialized_state: The persisted serialized state
+        """
+        return [value["key"] for value in serialized_state.values() if _is_blob_reference(value)]
+
+    def acquire(self, keys: Iterable[str]):
+        """Takes a reference to each of the blobs (repeated keys take a reference each).
+
+        :param keys: The keys of the blobs
+        """
+        counts = collections.Counter(keys)
+        with self._refcounts_lock:
+            self._refcounts.execute("BEGIN IMMEDIATE")
+            try:
+                self._refcounts.executemany(
+                    "INSERT INTO blob_refcounts (key, count) VALUES (?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET count = count + excluded.count",
+                    counts.items(),
+                )
+                self._refcounts.execute("COMMIT")
+            except Exception:
+                self._refcounts.execute("ROLLBACK")
+                raise
+
+    def release(self, keys: Iterable[str]):
+        """Releases a reference to each of the blobs -- E.G. ``release(blob_store.references(state))``
+        after deleting a persisted state. Blobs are deleted by :py:meth:`collect`.
+
+        :param keys: The keys of the blobs
+        """
+        counts = collections.Counter(keys)
+        with self._refcounts_lock:
+            self._refcounts.execute("BEGIN IMMEDIATE")
+            try:
+                self._refcounts.executemany(
+                    "UPDATE blob_refcounts SET count = count - ? WHERE key = ?",
+                    [(count, key) for key, count in counts.items()],
+                )
+                self._refcounts.execute("COMMIT")
+            except Exception:
+                self._refcounts.execute("ROLLBACK")
+                raise
+
+    def refcount(self, key: str) -> int:
+        """Gives the number of references to a blob.
+
+        :param key: The blob's key
+        """
+        with self._refcounts_lock:
+            row = self._refcounts.execute(
+                "SELECT count FROM blob_refcounts WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    def collect(self) -> int:
+        """Deletes every blob nothing refers to. This holds the reference count database's write lock
+        while deleting, so a concurrent :py:meth:`offload` either takes its reference first (and the blob
+        is kept), or after (and stores the blob again).
+
+        :return: The number of blobs deleted
+        """
+        with self._refcounts_lock:
+            self._refcounts.execute("BEGIN IMMEDIATE")
+            try:
+                keys = [
+                    row[0]
+                    for row in self._refcounts.execute(
+                        "SELECT key FROM blob_refcounts WHERE count <= 0"
+                    )
+                ]
+                for key in keys:
+                    self.delete(key)
+                self._refcounts.executemany(
+                    "DELETE FROM blob_refcounts WHERE key = ?", [(key,) for key in keys]
+                )
+                self._refcounts.execute("COMMIT")
+            except Exception:
+                self._refcounts.execute("ROLLBACK")
+                raise
+        return len(keys)
+
+    def close(self):
+        """Closes the reference count database."""
+        self._refcounts.close()
+
+    def __getstate__(self) -> dict:
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_refcounts", "_refcounts_lock")
+        }
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._connect()
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store on the local filesystem. Blobs are files under ``root_dir`` (sharded by the first two
+    characters of the key), and reference counts are kept in ``root_dir/refcounts.db``."""
+
+    def __init__(self, root_dir: str, min_size_bytes: int = 16 * 1024):
+        """Constructor
+
+        :param root_dir: Directory to store blobs in -- this is created if it does not exist
+        :param min_size_bytes: Fields whose serialized form is at least this large are offloaded
+        """
+        self.root_dir = os.fspath(root_dir)
+        os.makedirs(self.root_dir, exist_ok=True)
+        super().__init__(os.path.join(self.root_dir, "refcounts.db"), min_size_bytes)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_dir, key[:2], key)
+
+    def put(self, key: str, data: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def get(self, key: str) -> bytes:
+        with open(self._path(key), "rb") as f:
+            return f.read()
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class S3BlobStore(BlobStore):
+    """Blob store on S3, or anything that speaks its API (MinIO, moto...). Pass a boto3 S3 client (or one
+    with the same ``put_object``/``get_object``/``head_object``/``delete_object`` methods). Reference counts
+    are kept in a local sqlite database -- share it between processes that share the bucket."""
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        refcount_db_path: str,
+        prefix: str = "burr-blobs/",
+        min_size_bytes: int = 16 * 1024,
+    ):
+        """Constructor
+
+        :param client: The S3 client, E.G. ``boto3.client("s3")``
+        :param bucket: The bucket to store blobs in
+        :param refcount_db_path: Path to the sqlite database to keep reference counts in
+        :param prefix: Prefix of the blobs' object keys
+        :param min_size_bytes: Fields whose serialized form is at least this large are offloaded
+        """
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        super().__init__(refcount_db_path, min_size_bytes)
+
+    def put(self, key: str, data: bytes):
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def get(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"].read()
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except Exception as e:
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if error_code in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+
+class BlobReference(LazyValue):
+    """A state field offloaded to a blob store, fetched (and deserialized) the first time it is accessed.
+    Persisting it with the same blob store saves the reference again, so it is not fetched just to be saved.
+    """
+
+    def __init__(self, blob_store: BlobStore, field: str, reference: dict, serde_kwargs: dict):
+        self.blob_store = blob_store
+        self.field = field
+        self.reference = reference
+        self.serde_kwargs = serde_kwargs
+        self._loaded = False
+        self._value = None
+
+    @property
+    def key(self) -> str:
+        return self.reference["key"]
+
+    def resolve(self) -> Any:
+        if not self._loaded:
+            serialized = {self.field: self.blob_store.load(self.key)}
+            self._value = State.deserialize(serialized, **self.serde_kwargs)[self.field]
+            self._loaded = True
+        return self._value
+
+    def __copy__(self) -> "BlobReference":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "BlobReference":
+        return self
+
+    def __reduce__(self):
+        # pickled (E.G. to send a state to another process) as the value, not the reference
+        return _loaded_blob, (self.resolve(),)
+
+
+def _loaded_blob(value: Any) -> Any:
+    return value
+
+
+def serialize_state(
+    state: State, serde_kwargs: dict, blob_store: Optional[BlobStore] = None
+) -> dict:
+    """Serializes a state for a persister to save, offloading large fields to the blob store if there is one
+    (and taking references to them -- see :py:meth:`BlobStore.offload`).
+
+    :param state: The state to serialize
+    :param serde_kwargs: The persister's serde kwargs
+    :param blob_store: The persister's blob store, if it has one
+    :return: The serialized state
+    """
+    if blob_store is None:
+        return state.serialize(**serde_kwargs)
+    serialized = {
+        # fields loaded from this blob store are still in it, so we do not fetch them to save them
+        field: (
+            value.reference
+            if isinstance(value, BlobReference) and value.blob_store is blob_store
+            else _serialize_field(field, value, **serde_kwargs)
+        )
+        for field, value in state._state.items()
+    }
+    return blob_store.offload(serialized)
+
+
+def deserialize_state(
+    serialized_state: dict, serde_kwargs: dict, blob_store: Optional[BlobStore] = None
+) -> State:
+    """Deserializes a state a persister loaded. Fields in the blob store (if there is one) are fetched
+    when they are first accessed.
+
+    :param serialized_state: The serialized state
+    :param serde_kwargs: The persister's serde kwargs
+    :param blob_store: The persister's blob store, if it has one
+    :return: The state
+    """
+    if blob_store is not None:
+        serialized_state = blob_store.rehydrate(serialized_state, **serde_kwargs)
+    return State.deserialize(serialized_state, **serde_kwargs)
+
+
+def _sqlite_production_pragmas(connect_kwargs: Optional[dict]) -> List[str]:
+    pragmas = []
+    if "timeout" not in (connect_kwargs or {}):
+        # first, so setting the journal mode waits for other processes as well
+        pragmas.append(f"PRAGMA busy_timeout={SQLITE_PRODUCTION_BUSY_TIMEOUT_MS}")
+    return pragmas + list(SQLITE_PRODUCTION_PRAGMAS)
+
+
+def _is_sqlite_locked_error(e: Exception) -> bool:
+    return isinstance(e, sqlite3.OperationalError) and "locked" in str(e)
+
+
+def _configure_sqlite_for_production(
+    connection: sqlite3.Connection, connect_kwargs: Optional[dict]
+):
+    """Runs the production mode PRAGMAs. Setting the journal mode can fail with "database is locked"
+    without waiting on the busy timeout (E.G. while another process opens the WAL), so we retry those.
+    """
+    deadline = time.monotonic() + SQLITE_PRODUCTION_BUSY_TIMEOUT_MS / 1000
+    for pragma in _sqlite_production_pragmas(connect_kwargs):
+        while True:
+            try:
+                connection.execute(pragma)
+                break
+            except sqlite3.OperationalError as e:
+                if not _is_sqlite_locked_error(e) or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.01)
+
+
+def _connect_sqlite_for_production(
+    db_path: str, connect_kwargs: Optional[dict]
+) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path, **{**(connect_kwargs or {}), "check_same_thread": False})
+    _configure_sqlite_for_production(connection, connect_kwargs)
+    return connection
+
+
+class _SQLiteWriter:
+    """Owns the only connection this process writes to a sqlite database with, on a thread of its own.
+    Saves from every persister on that database (E.G. copies used by parallel sub-applications) are queued,
+    and whatever is queued when the thread gets to it is written in a single transaction -- so concurrent
+    saves share a commit, and contend for the database's write lock once, rather than once each.
+
+    Writers are shared per database file -- use :py:meth:`acquire` and :py:meth:`release`.
+    """
+
+    MAX_BATCH_SIZE = 256
+
+    _writers: Dict[str, "_SQLiteWriter"] = {}
+    _writers_lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, db_path: str, connect_kwargs: Optional[dict]) -> "_SQLiteWriter":
+        key = os.path.abspath(db_path)
+        with cls._writers_lock:
+            writer = cls._writers.get(key)
+            if writer is None:
+                writer = cls._writers[key] = _SQLiteWriter(key, db_path, connect_kwargs)
+            writer._references += 1
+            return writer
+
+    def release(self):
+        with self._writers_lock:
+            self._references -= 1
+            if self._references > 0:
+                return
+            if self._writers.get(self._key) is self:
+                del self._writers[self._key]
+        # after anything already queued, so pending saves are still written
+        self._queue.put(None)
+        # so the connection is closed when we return, E.G. before the process forks
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def __init__(self, key: str, db_path: str, connect_kwargs: Optional[dict]):
+        self._key = key
+        self._references = 0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        # set once the thread stops -- requests made after that fail with it, rather than wait forever
+        self._stopped_error: Optional[BaseException] = None
+        self._queue_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(db_path, connect_kwargs),
+            name=f"burr-sqlite-writer-{os.path.basename(db_path)}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, persister: "SQLitePersister", to_persist: List[StateToPersist]):
+        """Writes the states in a transaction (possibly shared with other saves), blocking until it commits.
+
+        :param persister: The persister saving, which converts the states to rows
+        :param to_persist: The states to save
+        """
+        future = concurrent.futures.Future()
+        self._put((persister, to_persist, future))
+        future.result()
+
+    def execute(self, function: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Runs a function with the writer's connection (on its thread, in order with the saves queued before
+        it), blocking until it returns. The function manages its own transaction.
+
+        :param function: Function to call with the connection
+        :return: What the function returns
+        """
+        future = concurrent.futures.Future()
+        self._put((None, function, future))
+        return future.result()
+
+    def _put(self, request: tuple):
+        with self._queue_lock:
+            if self._stopped_error is not None:
+                raise self._stopped_error
+            self._queue.put(request)
+
+    def _run(self, db_path: str, connect_kwargs: Optional[dict]):
+        connection = None
+        batch = []
+        error: BaseException = RuntimeError(
+            "The SQLite writer stopped before writing this request."
+        )
+        try:
+            connection = _connect_sqlite_for_production(db_path, connect_kwargs)
+            while True:
+                request = self._queue.get()
+                batch = []
+                while request is not None:
+                    batch.append(request)
+                    if len(batch) >= self.MAX_BATCH_SIZE:
+                        break
+                    try:
+                        request = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write_requests(connection, batch)
+                if request is None:
+                    return
+        except BaseException as e:
+            logger.exception("SQLite writer for %s failed", db_path)
+            error = e
+        finally:
+            if connection is not None:
+                connection.close()
+            # Fail whatever we did not get to (E.G. if we could not connect), so no request waits forever
+            with self._queue_lock:
+                self._stopped_error = error
+                while not self._queue.empty():
+                    request = self._queue.get_nowait()
+                    if request is not None:
+                        batch.append(request)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            with self._writers_lock:
+                # so the next persister on this database gets a working writer
+                if self._writers.get(self._key) is self:
+                    del self._writers[self._key]
+
+    def _write_requests(self, connection: sqlite3.Connection, requests: List[tuple]):
+        """Writes the queued requests in order -- consecutive saves share a transaction, functions
+        (see :py:meth:`execute`) run on their own"""
+        saves = []
+        for request in requests:
+            persister, function, future = request
+            if persister is not None:
+                saves.append(request)
+                continue
+            if saves:
+                self._write_batch(connection, saves)
+                saves = []
+            try:
+                result = function(connection)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+        if saves:
+            self._write_batch(connection, saves)
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[tuple]):
+        try:
+            self._transaction(connection, batch)
+        except Exception as e:
+            if len(batch) == 1:
+                if not batch[0][2].done():
+                    batch[0][2].set_exception(e)
+                return
+            # One of the saves failed (E.G. a duplicate key), and took the others down with it -- write them
+            # one transaction each, so only that one fails
+            for request in batch:
+                try:
+                    self._transaction(connection, [request])
+                except Exception as request_error:
+                    if not request[2].done():
+                        request[2].set_exception(request_error)
+                else:
+                    if not request[2].done():
+                        request[2].set_result(None)
+            return
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    @staticmethod
+    def _transaction(connection: sqlite3.Connection, batch: List[tuple]):
+        # IMMEDIATE takes the write lock up front, waiting on other processes with the busy timeout
+        connection.execute("BEGIN IMMEDIATE")
+        # persister -> rows it serialized, so we can release their blob references if this fails
+        serialized = []
+        try:
+            for persister, to_persist, _ in batch:
+                rows = persister._rows_to_insert(to_persist)
+                serialized.append((persister, rows))
+                connection.executemany(persister._insert_statement(), rows)
+            connection.commit()
+        except Exception:
+            if connection.in_transaction:
+                connection.rollback()
+            for persister, _, _ in batch:
+                # We may have recorded states as saved that were not, so the next save has to be a checkpoint
+                persister._last_saved.clear()
+            for persister, rows in serialized:
+                persister._release_blob_references(rows)
+            raise
+
+
 class SQLitePersister(BaseStatePersister, BaseCopyable):
-    """Class for SQLite persistence of state. This is a simple implementation."""
+    """Class for SQLite persistence of state. This is a simple implementation.
+
+    By default, this uses a single connection, and commits every save. If several threads or processes
+    share the database, use ``production_mode=True``:
+
+    .. code-block:: python
+
+        persister = SQLitePersister.from_values(db_path="burr.db", production_mode=True)
+
+    This enables WAL (so reads do not wait for writes), waits up to
+    ``SQLITE_PRODUCTION_BUSY_TIMEOUT_MS`` for other processes' writes, gives every thread that reads its own
+    connection, and writes from a single thread per database per process, which commits concurrent
+    saves (E.G. from parallel sub-applications) together. Saves still return once they are committed.
+    As with any sqlite connection, do not carry a persister over a fork -- create one in each process.
+
+    To store large state fields once (and out of the database), pass a :py:class:`BlobStore`. Checkpoints
+    (full states) offload to it, deltas saved with ``checkpoint_every`` are stored inline.
+    """
 
     @classmethod
     def from_config(cls, config: dict) -> "SQLitePersister":
@@ -307,6 +1405,9 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         table_name: str = "burr_state",
         serde_kwargs: dict = None,
         connect_kwargs: dict = None,
+        checkpoint_every: Optional[int] = None,
+        production_mode: bool = False,
+        blob_store: Optional[BlobStore] = None,
     ) -> "SQLitePersister":
         """Creates a new instance of the SQLitePersister from passed in values.
 
@@ -314,13 +1415,25 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         :param table_name: the table name to store things under.
         :param serde_kwargs: kwargs for state serialization/deserialization.
         :param connect_kwargs: kwargs to pass to the aiosqlite.connect method.
+        :param checkpoint_every: if set, enables incremental persistence. See the constructor.
+        :param production_mode: if set, tunes the persister for concurrent use. See the class docstring.
+        :param blob_store: if set, large state fields are stored in this. See the class docstring.
         :return: async sqlite persister instance with an open connection. You are responsible
             for closing the connection yourself.
         """
         connection = sqlite3.connect(
             db_path, **connect_kwargs if connect_kwargs is not None else {}
         )
-        return cls(db_path, table_name, serde_kwargs, connection=connection)
+        return cls(
+            db_path,
+            table_name,
+            serde_kwargs,
+            connect_kwargs=connect_kwargs,
+            connection=connection,
+            checkpoint_every=checkpoint_every,
+            production_mode=production_mode,
+            blob_store=blob_store,
+        )
 
     def copy(self) -> "Self":
         return SQLitePersister(
@@ -328,9 +1441,14 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             table_name=self.table_name,
             serde_kwargs=self.serde_kwargs,
             connect_kwargs=self._connect_kwargs,
+            checkpoint_every=self.checkpoint_every,
+            production_mode=self.production_mode,
+            blob_store=self.blob_store,
         )
 
     PARTITION_KEY_DEFAULT = ""
+    # Maximum number of apps we keep the last saved state around for when saving incrementally
+    MAX_INCREMENTAL_APPS = 1024
 
     def __init__(
         self,
@@ -339,6 +1457,9 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         serde_kwargs: dict = None,
         connect_kwargs: dict = None,
         connection: sqlite3.Connection = None,
+        checkpoint_every: Optional[int] = None,
+        production_mode: bool = False,
+        blob_store: Optional[BlobStore] = None,
     ):
         """Constructor
 
@@ -349,9 +1470,30 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             Use check_same_thread=False to enable use ina  multithreaded context
         :param connection: ability to instantiate a db outside of the persister and pass
             in the connection to be used.
+        :param checkpoint_every: if set, enables incremental persistence. Rather than saving the full state
+            every step, we save the state's journal (just what the step changed), and a full checkpoint every
+            ``checkpoint_every`` steps (as well as whenever the state was not derived from the last state
+            we saved, E.G. on the first save or after a call to ``update_state``). Loading replays deltas
+            from the nearest checkpoint. If None (the default), the full state is saved every time.
+        :param production_mode: if set, tunes the persister for concurrent use (WAL, a busy timeout, a
+            connection per reading thread and a shared writer thread). See the class docstring.
+        :param blob_store: if set, large fields of the states we save are stored in this, and the states
+            store references to them. See :py:class:`BlobStore`.
         """
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError(
+                f"checkpoint_every must be a positive integer, got: {checkpoint_every}"
+            )
+        if production_mode and db_path == ":memory:":
+            raise ValueError(
+                "production_mode needs a database file -- every connection to :memory: is a new database."
+            )
         self.db_path = db_path
         self.table_name = table_name
+        self.checkpoint_every = checkpoint_every
+        self.blob_store = blob_store
+        # (partition_key, app_id) -> (last state saved, saves since checkpoint), in LRU order
+        self._last_saved: OrderedDict[Tuple[str, str], Tuple[State, int]] = OrderedDict()
 
         # Here for backwards compatibility, the original idea was to create the connection
         # but later we realized it also makes sense to pass the connection to the class and
@@ -366,12 +1508,39 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         self.serde_kwargs = serde_kwargs or {}
         self._initialized = False
         self._connect_kwargs = connect_kwargs
+        self.production_mode = production_mode
+        self._setup_production_mode()
+
+    def _setup_production_mode(self):
+        self._writer: Optional[_SQLiteWriter] = None
+        if not self.production_mode:
+            return
+        _configure_sqlite_for_production(self.connection, self._connect_kwargs)
+        self._writer = _SQLiteWriter.acquire(self.db_path, self._connect_kwargs)
+        # Connections other threads read with, opened as needed. The constructing thread reads with ours.
+        self._thread_local = threading.local()
+        self._thread_local.connection = self.connection
+        self._read_connections: List[sqlite3.Connection] = []
+        self._read_connections_lock = threading.Lock()
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Gives the connection to read with. In production mode, that is one per thread, so threads do not
+        wait on each other's reads (sqlite3 connections serialize calls from different threads)."""
+        if not self.production_mode:
+            return self.connection
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is None:
+            connection = _connect_sqlite_for_production(self.db_path, self._connect_kwargs)
+            self._thread_local.connection = connection
+            with self._read_connections_lock:
+                self._read_connections.append(connection)
+        return connection
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.connection.close()
+        self.cleanup()
         return False
 
     def set_serde_kwargs(self, serde_kwargs: dict):
@@ -399,6 +1568,13 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             CREATE INDEX IF NOT EXISTS {table_name}_created_at_index ON {table_name} (created_at);
         """
         )
+        # Covers list_app_ids and loading the latest state of a partition, so they read just the index
+        cursor.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {table_name}_partition_key_created_at_index
+            ON {table_name} (partition_key, created_at, app_id);
+        """
+        )
         self.connection.commit()
 
     def initialize(self):
@@ -426,7 +1602,7 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             partition_key if partition_key is not None else SQLitePersister.PARTITION_KEY_DEFAULT
         )
 
-        cursor = self.connection.cursor()
+        cursor = self._read_connection().cursor()
         cursor.execute(
             f"SELECT DISTINCT app_id FROM {self.table_name} "
             f"WHERE partition_key = ? "
@@ -457,7 +1633,7 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             partition_key if partition_key is not None else SQLitePersister.PARTITION_KEY_DEFAULT
         )
         logger.debug("Loading %s, %s, %s", partition_key, app_id, sequence_id)
-        cursor = self.connection.cursor()
+        cursor = self._read_connection().cursor()
         if app_id is None:
             # get latest for all app_ids
             cursor.execute(
@@ -482,7 +1658,7 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         row = cursor.fetchone()
         if row is None:
             return None
-        _state = State.deserialize(json.loads(row[1]), **self.serde_kwargs)
+        _state = self._reconstruct_state(partition_key, row[3], row[2], json.loads(row[1]))
         return {
             "partition_key": partition_key,
             "app_id": row[3],
@@ -493,6 +1669,139 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             "status": row[5],
         }
 
+    def _reconstruct_state(
+        self, partition_key: str, app_id: str, sequence_id: int, serialized_state: dict
+    ) -> State:
+        """Deserializes a stored state. If it is a delta, this finds the nearest prior checkpoint and
+        replays every delta since then."""
+        if JOURNAL_KEY not in serialized_state:
+            return deserialize_state(serialized_state, self.serde_kwargs, self.blob_store)
+        journals = [serialized_state[JOURNAL_KEY]]
+        cursor = self._read_connection().cursor()
+        cursor.execute(
+            f"SELECT state FROM {self.table_name} "
+            f"WHERE partition_key = ? AND app_id = ? AND sequence_id < ? "
+            f"ORDER BY sequence_id DESC",
+            (partition_key, app_id, sequence_id),
+        )
+        for (prior_state,) in cursor:
+            serialized_prior = json.loads(prior_state)
+            if JOURNAL_KEY not in serialized_prior:
+                state = deserialize_state(serialized_prior, self.serde_kwargs, self.blob_store)
+                for journal in reversed(journals):
+                    state = state.apply_serialized_journal(journal, **self.serde_kwargs)
+                return state
+            journals.append(serialized_prior[JOURNAL_KEY])
+        raise ValueError(
+            f"Could not find a checkpoint to reconstruct state for app_id: {app_id}, "
+            f"sequence_id: {sequence_id} (partition_key: {partition_key}) from. "
+            f"Was it pruned without calling compact()?"
+        )
+
+    def _serialize_for_save(self, partition_key: str, app_id: str, state: State) -> dict:
+        """Serializes the state to save -- either the full state, or, when saving incrementally
+        and the state was derived from the last one we saved, just the journal."""
+        if self.checkpoint_every is None:
+            return serialize_state(state, self.serde_kwargs, self.blob_store)
+        key = (partition_key, app_id)
+        last_saved, saves_since_checkpoint = self._last_saved.pop(key, (None, 0))
+        deltas = state._deltas_since(last_saved) if last_saved is not None else None
+        # We only track a bounded number of apps -- any others will just save a checkpoint next
+        if len(self._last_saved) >= SQLitePersister.MAX_INCREMENTAL_APPS:
+            self._last_saved.popitem(last=False)
+        if deltas is not None and saves_since_checkpoint + 1 < self.checkpoint_every:
+            self._last_saved[key] = (state, saves_since_checkpoint + 1)
+            return {JOURNAL_KEY: state.serialize_journal(since=last_saved, **self.serde_kwargs)}
+        self._last_saved[key] = (state, 0)
+        return serialize_state(state, self.serde_kwargs, self.blob_store)
+
+    def compact(
+        self,
+        partition_key: Optional[str],
+        app_id: str,
+        before_sequence_id: Optional[int] = None,
+    ) -> int:
+        """Prunes persisted history for an app. The state at ``before_sequence_id`` (the latest, by default)
+        is rewritten as a full checkpoint if it is a delta, and every entry prior to it is deleted. States
+        at or after ``before_sequence_id`` can still be loaded, earlier ones cannot. With a blob store, this
+        releases the deleted states' references to blobs -- call :py:meth:`BlobStore.collect` to delete
+        the blobs nothing refers to anymore.
+
+        :param partition_key: The partition key
+        :param app_id: The app ID to compact
+        :param before_sequence_id: The sequence ID to compact up to. Defaults to the latest.
+        :return: The number of entries that were deleted
+        """
+        partition_key = (
+            partition_key if partition_key is not None else SQLitePersister.PARTITION_KEY_DEFAULT
+        )
+        loaded = self.load(partition_key, app_id, before_sequence_id)
+        if loaded is None:
+            return 0
+        checkpoint = serialize_state(loaded["state"], self.serde_kwargs, self.blob_store)
+        compact = functools.partial(
+            self._compact, partition_key, app_id, loaded["sequence_id"], checkpoint
+        )
+        try:
+            # in production mode, the writer's connection is the only one we write with
+            deleted, released = (
+                self._writer.execute(compact)
+                if self._writer is not None
+                else compact(self.connection)
+            )
+        except Exception:
+            if self.blob_store is not None:
+                # the checkpoint was not written, so it does not hold its references
+                self.blob_store.release(BlobStore.references(checkpoint))
+            raise
+        if released:
+            self.blob_store.release(released)
+        return deleted
+
+    def _compact(
+        self,
+        partition_key: str,
+        app_id: str,
+        sequence_id: int,
+        checkpoint: dict,
+        connection: sqlite3.Connection,
+    ) -> Tuple[int, List[str]]:
+        """Rewrites the state at sequence_id as the checkpoint, and deletes the ones before it, in a
+        transaction. Returns the number of states deleted, and the blob references they (and the state
+        rewritten) held."""
+        cursor = connection.cursor()
+        if not connection.in_transaction:
+            # IMMEDIATE takes the write lock up front, so the states we read are the ones we delete
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            released = []
+            if self.blob_store is not None:
+                # the states we delete or rewrite -- the rewritten one took its references again
+                cursor.execute(
+                    f"SELECT state FROM {self.table_name} "
+                    f"WHERE partition_key = ? AND app_id = ? AND sequence_id <= ?",
+                    (partition_key, app_id, sequence_id),
+                )
+                for (serialized_state,) in cursor.fetchall():
+                    released.extend(BlobStore.references(json.loads(serialized_state)))
+            cursor.execute(
+                f"UPDATE {self.table_name} SET state = ? "
+                f"WHERE partition_key = ? AND app_id = ? AND sequence_id = ?",
+                (json.dumps(checkpoint), partition_key, app_id, sequence_id),
+            )
+            cursor.execute(
+                f"DELETE FROM {self.table_name} "
+                f"WHERE partition_key = ? AND app_id = ? AND sequence_id < ?",
+                (partition_key, app_id, sequence_id),
+            )
+            deleted = cursor.rowcount
+            connection.commit()
+        except Exception:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+        return deleted, released
+
     def save(
         self,
         partition_key: Optional[str],
@@ -529,20 +1838,90 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
             state,
             status,
         )
-        partition_key = (
-            partition_key if partition_key is not None else SQLitePersister.PARTITION_KEY_DEFAULT
+        self.save_many(
+            [
+                {
+                    "partition_key": partition_key,
+                    "app_id": app_id,
+                    "sequence_id": sequence_id,
+                    "position": position,
+                    "state": state,
+                    "status": status,
+                }
+            ]
         )
+
+    def save_many(self, to_persist: List[StateToPersist], **kwargs):
+        """Saves a batch of states in a single transaction, using executemany.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        if self._writer is not None:
+            self._writer.write(self, to_persist)
+            return
         cursor = self.connection.cursor()
-        json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        cursor.execute(
+        rows = []
+        try:
+            rows = self._rows_to_insert(to_persist)
+            cursor.executemany(self._insert_statement(), rows)
+            self.connection.commit()
+        except Exception:
+            # We may have recorded states as saved that were not, so the next save has to be a checkpoint
+            self._last_saved.clear()
+            self._release_blob_references(rows)
+            raise
+
+    def _insert_statement(self) -> str:
+        return (
             f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
-            f"VALUES (?, ?, ?, ?, ?, ?)",
-            (partition_key, app_id, sequence_id, position, json_state, status),
+            f"VALUES (?, ?, ?, ?, ?, ?)"
         )
-        self.connection.commit()
+
+    def _rows_to_insert(self, to_persist: List[StateToPersist]) -> List[tuple]:
+        """Converts the states to save to rows to insert. If one fails, this releases the blob references
+        taken for the others."""
+        rows = []
+        try:
+            for item in to_persist:
+                rows.append(self._row_to_insert(**item))
+        except Exception:
+            self._release_blob_references(rows)
+            raise
+        return rows
+
+    def _release_blob_references(self, rows: List[tuple]):
+        """Releases the blob references taken when serializing rows that were not written (see BlobStore.offload)"""
+        if self.blob_store is None or not rows:
+            return
+        self.blob_store.release(
+            key for row in rows for key in BlobStore.references(json.loads(row[4]))
+        )
+
+    def _row_to_insert(
+        self,
+        partition_key: Optional[str],
+        app_id: str,
+        sequence_id: int,
+        position: str,
+        state: State,
+        status: str,
+    ) -> tuple:
+        """Converts the arguments to save to a row to insert"""
+        partition_key = (
+            partition_key if partition_key is not None else SQLitePersister.PARTITION_KEY_DEFAULT
+        )
+        json_state = json.dumps(self._serialize_for_save(partition_key, app_id, state))
+        return partition_key, app_id, sequence_id, position, json_state, status
 
     def cleanup(self):
         """Closes the connection to the database."""
+        if getattr(self, "_writer", None) is not None:
+            self._writer.release()
+            self._writer = None
+            with self._read_connections_lock:
+                read_connections, self._read_connections = self._read_connections, []
+            for connection in read_connections:
+                connection.close()
         self.connection.close()
 
     def __del__(self):
@@ -551,17 +1930,32 @@ class SQLitePersister(BaseStatePersister, BaseCopyable):
         # method within a REST API framework.
 
         # closes connection at end when things are being shutdown.
-        self.connection.close()
+        if hasattr(self, "connection"):
+            self.cleanup()
 
     def __getstate__(self):
-        return {key: value for key, value in self.__dict__.items() if key != "connection"}
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key
+            not in (
+                "connection",
+                "_last_saved",
+                "_writer",
+                "_thread_local",
+                "_read_connections",
+                "_read_connections_lock",
+            )
+        }
 
     def __setstate__(self, state):
         for key, value in state.items():
             setattr(self, key, value)
+        self._last_saved = OrderedDict()
         self.connection = sqlite3.connect(
             self.db_path, **self._connect_kwargs if self._connect_kwargs is not None else {}
         )
+        self._setup_production_mode()
 
 
 class InMemoryPersister(BaseStatePersister):
@@ -0,0 +1,252 @@
+"""Keeps a pool of live applications, so servers that host one application per session do not
+rebuild (and reload from the persister) on every request. See :py:class:`ApplicationPool`."""
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from burr.core.action import Action
+from burr.core.application import Application, ApplicationBuilder
+from burr.core.state import State
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[Optional[str], str]
+
+
+@dataclasses.dataclass
+class _PoolEntry:
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+    app: Optional[Application] = None
+    # callers that hold or are waiting on the lock -- we do not evict an entry in use
+    users: int = 0
+    # evicted while in use -- dropped when its last user releases it, or rebuilt by the next one
+    stale: bool = False
+
+
+@dataclasses.dataclass
+class PoolStats:
+    """Counters for an application pool."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ApplicationPool:
+    """Pool of live applications for servers that host many of them (E.G. one per user session),
+    keyed by ``(partition_key, app_id)``.
+
+    The first time an application is used, the pool builds it through ``builder_factory`` -- which should
+    load it from your persister (``ApplicationBuilder.initialize_from(...)``) and save it after every step
+    (``with_state_persister(...)``). After that, it is kept in memory, so later requests skip the load.
+    When the pool holds more than ``max_size`` applications, it drops the least recently used ones that
+    are not in use -- their state has already been saved by the persister, so they are just rebuilt from
+    it on their next use.
+
+    Access to each application is serialized (steps on the same application run one at a time, in the
+    order they were requested), and at most ``max_concurrent_steps`` steps (or builds, which load from the
+    persister) run at once across the pool, handed out first-come first-served, so one busy application
+    cannot starve the others. Builds with a synchronous persister/initializer run in the event loop's
+    default executor, so loading does not block the loop -- the persister must be usable from another
+    thread (E.G. a ``SQLitePersister`` with ``connect_kwargs={"check_same_thread": False}``).
+
+    .. code-block:: python
+
+        def builder_factory() -> ApplicationBuilder:
+            return (
+                ApplicationBuilder()
+                .with_graph(graph)
+                .initialize_from(persister, resume_at_next_action=True, default_state={}, default_entrypoint="prompt")
+                .with_state_persister(persister)
+            )
+
+        pool = ApplicationPool(builder_factory, max_size=10_000)
+
+        @app.post("/chat/{user_id}/{session_id}")
+        async def chat(user_id: str, session_id: str, prompt: str):
+            action, result, state = await pool.arun(
+                session_id, partition_key=user_id, halt_after=["response"], inputs={"prompt": prompt}
+            )
+            return result
+
+    This is meant to be used from a single event loop -- the applications are run asynchronously.
+    """
+
+    def __init__(
+        self,
+        builder_factory: Callable[[], ApplicationBuilder],
+        max_size: int = 1024,
+        max_concurrent_steps: Optional[int] = None,
+    ):
+        """Constructor
+
+        :param builder_factory: Creates a (fresh) builder for an application. The pool sets its identifiers,
+            and builds it with ``abuild`` if its persister/initializer is async, and ``build`` (in the default
+            executor) otherwise.
+        :param max_size: Maximum number of applications to keep in memory
+        :param max_concurrent_steps: Maximum number of steps/runs (and builds) to execute at once, None for
+            unbounded
+        """
+        self.builder_factory = builder_factory
+        self.max_size = max_size
+        self.max_concurrent_steps = max_concurrent_steps
+        self._entries: OrderedDict[PoolKey, _PoolEntry] = OrderedDict()
+        # created on first use -- on python < 3.10 it binds to the event loop current at creation
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stats = PoolStats()
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if self._semaphore is None and self.max_concurrent_steps is not None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_steps)
+        return self._semaphore
+
+    async def _build(self, app_id: str, partition_key: Optional[str]) -> Application:
+        builder = self.builder_factory().with_identifiers(
+            app_id=app_id, partition_key=partition_key
+        )
+        if any(
+            adapter is not None and adapter.is_async()
+            for adapter in (builder.state_persister, builder.state_initializer)
+        ):
+            return await builder.abuild()
+        return await asyncio.get_running_loop().run_in_executor(None, builder.build)
+
+    @contextlib.asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Holds one of the max_concurrent_steps slots, if they are bounded."""
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            yield
+        else:
+            async with semaphore:
+                yield
+
+    def _evict(self):
+        """Drops least recently used applications that are not in use, until we are within max_size."""
+        if len(self._entries) <= self.max_size:
+            return
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_size:
+                break
+            if self._entries[key].users == 0:
+                del self._entries[key]
+                self._stats.evictions += 1
+
+    @contextlib.asynccontextmanager
+    async def acquire(
+        self, app_id: str, partition_key: Optional[str] = None
+    ) -> AsyncIterator[Application]:
+        """Gives exclusive access to an application, building it if it is not in the pool.
+        Use this if you want to do more than run it (E.G. read its state, or call ``astream_result``).
+
+        .. code-block:: python
+
+            async with pool.acquire(session_id, partition_key=user_id) as app:
+                ...
+
+        :param app_id: ID of the application
+        :param partition_key: Partition key of the application
+        :return: A context manager that yields the application
+        """
+        key = (partition_key, app_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _PoolEntry()
+        else:
+            self._entries.move_to_end(key)
+        entry.users += 1
+        try:
+            async with entry.lock, self._slot():
+                if entry.stale:
+                    # evicted while the previous caller was using it, so we rebuild it
+                    entry.app, entry.stale = None, False
+                if entry.app is None:
+                    self._stats.misses += 1
+                    entry.app = await self._build(app_id, partition_key)
+                else:
+                    self._stats.hits += 1
+                yield entry.app
+        finally:
+            entry.users -= 1
+            if (
+                (entry.app is None or entry.stale)
+                and entry.users == 0
+                and self._entries.get(key) is entry
+            ):
+                # the build failed (or it was evicted while in use), so we do not hold on to it
+                del self._entries[key]
+            self._evict()
+
+    async def astep(
+        self,
+        app_id: str,
+        partition_key: Optional[str] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[Action, dict, State]]:
+        """Runs a single step of an application. See :py:meth:`Application.astep`.
+
+        :param app_id: ID of the application
+        :param partition_key: Partition key of the application
+        :param inputs: Inputs to the action
+        :return: The action that was run, its result, and the new state
+        """
+        async with self.acquire(app_id, partition_key) as app:
+            return await app.astep(inputs=inputs)
+
+    async def arun(
+        self,
+        app_id: str,
+        partition_key: Optional[str] = None,
+        halt_before: Optional[Union[str, List[str]]] = None,
+        halt_after: Optional[Union[str, List[str]]] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Action, Optional[dict], State]:
+        """Runs an application until it halts. See :py:meth:`Application.arun`.
+
+        :param app_id: ID of the application
+        :param partition_key: Partition key of the application
+        :param halt_before: Actions to halt before
+        :param halt_after: Actions to halt after
+        :param inputs: Inputs to the action
+        :return: The last action run, its result, and the final state
+        """
+        async with self.acquire(app_id, partition_key) as app:
+            return await app.arun(halt_before=halt_before, halt_after=halt_after, inputs=inputs)
+
+    def evict(self, app_id: str, partition_key: Optional[str] = None) -> bool:
+        """Drops an application from the pool (E.G. because its state was changed elsewhere), so it is
+        rebuilt on its next use. Callers using it at the time are not affected -- if it is in use, it is
+        rebuilt by the next caller once they are done with it, so two copies never run at once.
+
+        :param app_id: ID of the application
+        :param partition_key: Partition key of the application
+        :return: Whether it was in the pool
+        """
+        key = (partition_key, app_id)
+        entry = self._entries.get(key)
+        if entry is None or entry.stale:
+            return False
+        if entry.users == 0:
+            del self._entries[key]
+        else:
+            entry.stale = True
+        self._stats.evictions += 1
+        return True
+
+    def stats(self) -> PoolStats:
+        """Gives the hit/miss/eviction counts of this pool.
+
+        :return: A snapshot of the stats
+        """
+        return dataclasses.replace(self._stats)
+
+    def __contains__(self, key: PoolKey) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.app is not None and not entry.stale
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,8 +4,21 @@ import dataclasses
 import importlib
 import inspect
 import logging
+import weakref
 from functools import cached_property
-from typing import Any, Callable, Dict, Generic, Iterator, Mapping, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from burr.core import serde
 from burr.core.typing import DictBasedTypingSystem, TypingSystem
@@ -97,6 +110,13 @@ class StateDelta(abc.ABC):
         """Returns the keys that this state delta writes"""
         pass
 
+    def mutates(self) -> list[str]:
+        """Returns the keys whose values this state delta mutates in place (rather than replacing).
+        These (and only these) get copied before :py:meth:`apply_mutate` is called, so the prior
+        state is left untouched. By default this is every key that is read, which is conservative --
+        subclasses that only replace values should return an empty list."""
+        return self.reads()
+
     @abc.abstractmethod
     def apply_mutate(self, inputs: dict):
         """Applies the state delta to the inputs"""
@@ -119,6 +139,10 @@ class SetFields(StateDelta):
     def writes(self) -> list[str]:
         return list(self.values.keys())
 
+    def mutates(self) -> list[str]:
+        # values are replaced wholesale, nothing to copy
+        return []
+
     def apply_mutate(self, inputs: dict):
         inputs.update(self.values)
 
@@ -209,6 +233,10 @@ class IncrementFields(StateDelta):
     def writes(self) -> list[str]:
         return list(self.values.keys())
 
+    def mutates(self) -> list[str]:
+        # integers are immutable -- += rebinds the key
+        return []
+
     def validate(self, input_state: Dict[str, Any]):
         incorrect_types = {}
         for write_key in self.writes():
@@ -244,11 +272,150 @@ class DeleteField(StateDelta):
     def writes(self) -> list[str]:
         return []
 
+    def mutates(self) -> list[str]:
+        return []
+
     def apply_mutate(self, inputs: dict):
         for key in self.keys:
             inputs.pop(key, None)
 
 
+class LazyValue:
+    """A value in state that is loaded the first time it is accessed -- E.G. a large field that a persister
+    offloaded to a :py:class:`BlobStore <burr.core.persistence.BlobStore>`. State loads these when they are
+    read (including by operations that modify them), so actions never see them. These come from
+    :py:meth:`State.deserialize`.
+
+    Subclasses implement :py:meth:`resolve`. This is not an ABC, as we check for it on hot paths, where
+    ``isinstance`` against an ABC is several times slower.
+    """
+
+    def resolve(self) -> Any:
+        """Loads the value. Implementations should cache it, as this is called on every access."""
+        raise NotImplementedError(f"{self.__class__.__name__} must implement resolve()")
+
+    def serialize(self, key: str, **kwargs) -> Any:
+        """Serializes the value of a field. By default this loads it -- override this if the serialized
+        form can refer to wherever the value is stored instead.
+
+        :param key: The field this is the value of
+        :param kwargs: The serde kwargs
+        """
+        return _serialize_field(key, self.resolve(), **kwargs)
+
+
+def _resolve(value: Any) -> Any:
+    return value.resolve() if isinstance(value, LazyValue) else value
+
+
+def _serialize_field(k: str, v: Any, **kwargs) -> Union[dict, str]:
+    """chooses the correct serde function for the given key and calls it"""
+    if isinstance(v, LazyValue):
+        return v.serialize(k, **kwargs)
+    if k in FIELD_SERIALIZATION:
+        result = FIELD_SERIALIZATION[k][0](v, **kwargs)
+        if not isinstance(result, dict):
+            raise ValueError(
+                f"Field serde for {k} must return a dict,"
+                f" but {FIELD_SERIALIZATION[k][0].__name__} returned {type(result)} ({str(result)[0:10]})."
+            )
+        return result
+    return serde.serialize(v, **kwargs)
+
+
+def _deserialize_field(k: str, v: Union[str, dict], **kwargs) -> Any:
+    """chooses the correct serde function for the given key and calls it"""
+    if isinstance(v, LazyValue):
+        # deserialized when it is loaded
+        return v
+    if k in FIELD_SERIALIZATION:
+        return FIELD_SERIALIZATION[k][1](v, **kwargs)
+    return serde.deserialize(v, **kwargs)
+
+
+# State deltas that we know how to serialize as part of a journal
+_JOURNAL_SERIALIZABLE_DELTAS = (SetFields, AppendFields, ExtendFields, IncrementFields, DeleteField)
+_JOURNAL_DELTAS_BY_NAME = {delta.name(): delta for delta in _JOURNAL_SERIALIZABLE_DELTAS}
+
+
+def _serialize_delta_value(delta: StateDelta, key: str, value: Any, **kwargs) -> Any:
+    """Serializes a single value of a state delta -- whole values (set) go through field-level serde,
+    elements (append/extend) through the general serde."""
+    if isinstance(delta, SetFields):
+        return _serialize_field(key, value, **kwargs)
+    if isinstance(delta, AppendFields):
+        return serde.serialize(value, **kwargs)
+    if isinstance(delta, ExtendFields):
+        return [serde.serialize(item, **kwargs) for item in value]
+    return value
+
+
+def _deserialize_delta_value(delta_cls: type, key: str, value: Any, **kwargs) -> Any:
+    """Inverse of _serialize_delta_value"""
+    if delta_cls is SetFields:
+        return _deserialize_field(key, value, **kwargs)
+    if delta_cls is AppendFields:
+        return serde.deserialize(value, **kwargs)
+    if delta_cls is ExtendFields:
+        return [serde.deserialize(item, **kwargs) for item in value]
+    return value
+
+
+class _Lineage:
+    """Identifies a set of states derived (through operations) from the same committed state.
+    Holds a weak reference to the state that was committed, so we can tell what a state was derived
+    from across a commit without keeping every prior state alive."""
+
+    def __init__(self, committed_from: Optional["State"] = None):
+        self._committed_from = weakref.ref(committed_from) if committed_from is not None else None
+
+    def committed_from(self) -> Optional["State"]:
+        return self._committed_from() if self._committed_from is not None else None
+
+    def __getstate__(self):
+        # weak references cannot be pickled -- the link is meaningless in another process anyway
+        return {"_committed_from": None}
+
+
+class _JournalEntry:
+    """An operation in a state's journal, linked to the entry before it. The journal is persistent --
+    applying an operation adds an entry in O(1), and states derived from one another share the entries
+    they have in common -- so it is only walked when it is read."""
+
+    __slots__ = ("delta", "parent", "length")
+
+    def __init__(self, delta: "StateDelta", parent: Optional["_JournalEntry"]):
+        self.delta = delta
+        self.parent = parent
+        self.length = parent.length + 1 if parent is not None else 1
+
+    def __reduce__(self):
+        # flattened, so pickling a long journal does not recurse through every entry
+        return _journal_from_deltas, (_deltas_between(self, None),)
+
+
+def _journal_from_deltas(deltas: Tuple["StateDelta", ...]) -> Optional[_JournalEntry]:
+    entry = None
+    for delta in deltas:
+        entry = _JournalEntry(delta, entry)
+    return entry
+
+
+def _deltas_between(
+    entry: Optional[_JournalEntry], ancestor: Optional[_JournalEntry]
+) -> Optional[Tuple["StateDelta", ...]]:
+    """Gives the operations applied after ``ancestor`` to get to ``entry``, or None if ``entry`` does not
+    descend from it. This is proportional to the number of operations between them."""
+    ancestor_length = ancestor.length if ancestor is not None else 0
+    deltas = []
+    while entry is not None and entry.length > ancestor_length:
+        deltas.append(entry.delta)
+        entry = entry.parent
+    if entry is not ancestor:
+        return None
+    return tuple(reversed(deltas))
+
+
 StateType = TypeVar("StateType", bound=Union[Dict[str, Any], Any])
 AssignedStateType = TypeVar("AssignedStateType")
 
@@ -267,6 +434,32 @@ class State(Mapping, Generic[StateType]):
             typing_system if typing_system is not None else DictBasedTypingSystem()  # type: ignore
         )
         self._state = initial_values
+        # The journal is the sequence of operations applied since the state was last committed.
+        # States derived from the same committed state share a lineage, which allows us to tell
+        # whether one state was derived from another purely through operations.
+        self._journal: Optional[_JournalEntry] = None
+        self._lineage = _Lineage()
+        # Whether any value may be a LazyValue, so states without any skip checking for them
+        self._has_lazy_values = False
+
+    def _derive(
+        self,
+        values: Dict[str, Any],
+        journal: Optional[_JournalEntry],
+        typing_system: Optional[TypingSystem] = None,
+        has_lazy_values: Optional[bool] = None,
+    ) -> "State":
+        """Creates a new state in the same lineage as this one, carrying the given journal"""
+        state = State(
+            values,
+            typing_system=typing_system if typing_system is not None else self._typing_system,
+        )
+        state._journal = journal
+        state._lineage = self._lineage
+        state._has_lazy_values = (
+            has_lazy_values if has_lazy_values is not None else self._has_lazy_values
+        )
+        return state
 
     @property
     def typing_system(self) -> TypingSystem[StateType]:
@@ -276,7 +469,38 @@ class State(Mapping, Generic[StateType]):
         self, typing_system: TypingSystem[AssignedStateType]
     ) -> "State[AssignedStateType]":
         """Copies state with a specific typing system"""
-        return State(self._state, typing_system=typing_system)
+        return self._derive(self._state, self._journal, typing_system=typing_system)
+
+    @property
+    def journal(self) -> Tuple[StateDelta, ...]:
+        """The operations (state deltas) applied to this state since it was last committed.
+        The application commits state at the beginning of every step, so within a step (and in any
+        hooks that run after it) this represents exactly what that step changed.
+
+        :return: A tuple of state deltas, in the order they were applied
+        """
+        return _deltas_between(self._journal, None)
+
+    def commit(self) -> "State[StateType]":
+        """Commits the state, returning a state with the same values and an empty journal.
+        This is O(1) -- the underlying values are shared.
+
+        :return: A new state object with an empty journal
+        """
+        committed = State(self._state, typing_system=self._typing_system)
+        committed._lineage = _Lineage(committed_from=self)
+        committed._has_lazy_values = self._has_lazy_values
+        return committed
+
+    def _deltas_since(self, prior: "State") -> Optional[Tuple[StateDelta, ...]]:
+        """Returns the operations that were applied to ``prior`` to produce this state,
+        or None if this state was not derived from ``prior`` purely through operations."""
+        if self._lineage is not prior._lineage:
+            if self._lineage.committed_from() is prior:
+                # we were derived from a commit of prior, so everything in the journal is new
+                return self.journal
+            return None
+        return _deltas_between(self._journal, prior._journal)
 
     @cached_property
     def data(self) -> StateType:
@@ -285,55 +509,144 @@ class State(Mapping, Generic[StateType]):
     def apply_operation(self, operation: StateDelta) -> "State[StateType]":
         """Applies a given operation to the state, returning a new state"""
 
-        new_state = copy.copy(self._state)  # TODO -- restrict to just the read keys
-        for field in operation.reads():
-            # This ensures we only copy the fields that are read by value
-            # and copy the others by value
+        new_state = copy.copy(self._state)
+        has_lazy_values = self._has_lazy_values
+        if has_lazy_values and not isinstance(operation, (SetFields, DeleteField)):
+            # The operation reads the prior values (only set/delete do not), so they have to be loaded
+            for field in operation.reads():
+                if isinstance(new_state.get(field), LazyValue):
+                    new_state[field] = new_state[field].resolve()
+        if isinstance(operation, SetFields) and not has_lazy_values:
+            # E.G. merging in a state with lazy values
+            has_lazy_values = any(
+                isinstance(value, LazyValue) for value in operation.values.values()
+            )
+        for field in operation.mutates():
+            # Copy-on-write -- we only (shallow) copy the values that the operation
+            # mutates in place. Everything else is shared with the prior state, which is safe
+            # as state is immutable. This keeps the cost of an operation proportional
+            # to the size of what it touches, rather than deep-copying read values.
             # TODO -- make this more efficient when we have immutable transactions
             # with event-based history: https://github.com/DAGWorks-Inc/burr/issues/33
             if field in new_state:
-                # currently the reads() includes optional fields
+                # currently the mutates() includes optional fields
                 # We should clean that up, but this is an internal API so not worried now
-                new_state[field] = copy.deepcopy(new_state[field])
+                new_state[field] = copy.copy(new_state[field])
         operation.validate(new_state)
         operation.apply_mutate(
             new_state
         )  # todo -- validate that the write keys are the only different ones
-        return State(new_state, typing_system=self._typing_system)
+        return self._derive(
+            new_state, _JournalEntry(operation, self._journal), has_lazy_values=has_lazy_values
+        )
 
     def get_all(self) -> Dict[str, Any]:
         """Returns the entire state, realize as a dictionary. This is a copy."""
-        return dict(self)
+        if not self._has_lazy_values:
+            return dict(self._state)
+        return {k: _resolve(v) for k, v in self._state.items()}
 
     def serialize(self, **kwargs) -> dict:
         """Converts the state to a JSON serializable object"""
-        _dict = self.get_all()
-
-        def _serialize(k, v, **extrakwargs) -> Union[dict, str]:
-            """chooses the correct serde function for the given key and calls it"""
-            if k in FIELD_SERIALIZATION:
-                result = FIELD_SERIALIZATION[k][0](v, **extrakwargs)
-                if not isinstance(result, dict):
-                    raise ValueError(
-                        f"Field serde for {k} must return a dict,"
-                        f" but {FIELD_SERIALIZATION[k][0].__name__} returned {type(result)} ({str(result)[0:10]})."
-                    )
-                return result
-            return serde.serialize(v, **extrakwargs)
-
-        return {k: _serialize(k, v, **kwargs) for k, v in _dict.items()}
+        return {k: _serialize_field(k, v, **kwargs) for k, v in self._state.items()}
 
     @classmethod
     def deserialize(cls, json_dict: dict, **kwargs) -> "State[StateType]":
         """Converts a dictionary representing a JSON object back into a state"""
+        state = State({k: _deserialize_field(k, v, **kwargs) for k, v in json_dict.items()})
+        state._has_lazy_values = any(isinstance(v, LazyValue) for v in state._state.values())
+        return state
+
+    def serialize_journal(self, since: Optional["State"] = None, **kwargs) -> List[dict]:
+        """Converts the journal (the operations applied since the last commit) to a list of JSON
+        serializable objects. Applying these (with :py:meth:`apply_serialized_journal`) to the state
+        as it was at the last commit produces this state.
+
+        Values are serialized with the same serde as :py:meth:`serialize`. Appending to/extending
+        a field with field-level serde (or applying a custom state delta) cannot be represented
+        element-wise, so for those fields we instead record their final value (or deletion).
+
+        :param since: Optional prior state this was derived from -- if passed, only the operations
+            applied after it are serialized.
+        :return: A list of serialized state deltas, in the order they should be applied
+        """
+        journal = self.journal
+        if since is not None:
+            journal = self._deltas_since(since)
+            if journal is None:
+                raise ValueError(
+                    "Cannot serialize the journal since a state this state was not derived from."
+                )
+        fallback_keys = set()
+        for delta in journal:
+            if type(delta) not in _JOURNAL_SERIALIZABLE_DELTAS:
+                fallback_keys.update(delta.reads())
+                fallback_keys.update(delta.writes())
+            elif isinstance(delta, (AppendFields, ExtendFields)):
+                fallback_keys.update(key for key in delta.values if key in FIELD_SERIALIZATION)
+        out = []
+        for delta in journal:
+            if type(delta) not in _JOURNAL_SERIALIZABLE_DELTAS:
+                continue
+            if isinstance(delta, DeleteField):
+                keys = [key for key in delta.keys if key not in fallback_keys]
+                if keys:
+                    out.append({"name": delta.name(), "operation": {"keys": keys}})
+                continue
+            values = {
+                key: _serialize_delta_value(delta, key, value, **kwargs)
+                for key, value in delta.values.items()
+                if key not in fallback_keys
+            }
+            if values:
+                out.append({"name": delta.name(), "operation": {"values": values}})
+        # these are ordered for determinism
+        fallback_set = sorted(key for key in fallback_keys if key in self._state)
+        fallback_delete = sorted(key for key in fallback_keys if key not in self._state)
+        if fallback_set:
+            out.append(
+                {
+                    "name": SetFields.name(),
+                    "operation": {
+                        "values": {
+                            key: _serialize_field(key, self._state[key], **kwargs)
+                            for key in fallback_set
+                        }
+                    },
+                }
+            )
+        if fallback_delete:
+            out.append({"name": DeleteField.name(), "operation": {"keys": fallback_delete}})
+        return out
 
-        def _deserialize(k, v: Union[str, dict], **extrakwargs) -> Callable:
-            """chooses the correct serde function for the given key and calls it"""
-            if k in FIELD_SERIALIZATION:
-                return FIELD_SERIALIZATION[k][1](v, **extrakwargs)
-            return serde.deserialize(v, **extrakwargs)
+    def apply_serialized_journal(
+        self, serialized_journal: List[dict], **kwargs
+    ) -> "State[StateType]":
+        """Applies a journal serialized with :py:meth:`serialize_journal` to this state.
 
-        return State({k: _deserialize(k, v, **kwargs) for k, v in json_dict.items()})
+        :param serialized_journal: The serialized state deltas to apply, in order
+        :return: A new state object with the deltas applied
+        """
+        state = self
+        for entry in serialized_journal:
+            name, operation = entry["name"], entry["operation"]
+            if name not in _JOURNAL_DELTAS_BY_NAME:
+                raise ValueError(
+                    f"Cannot apply serialized state delta with unknown name: {name}. "
+                    f"Known names are: {list(_JOURNAL_DELTAS_BY_NAME)}"
+                )
+            delta_cls = _JOURNAL_DELTAS_BY_NAME[name]
+            if delta_cls is DeleteField:
+                delta = DeleteField(list(operation["keys"]))
+            else:
+                delta = delta_cls(
+                    {
+                        key: _deserialize_delta_value(delta_cls, key, value, **kwargs)
+                        for key, value in operation["values"].items()
+                    }
+                )
+            state = state.apply_operation(delta)
+        return state
 
     def update(self, **updates: Any) -> "State[StateType]":
         """Updates the state with a set of key-value pairs
@@ -418,14 +731,20 @@ class State(Mapping, Generic[StateType]):
     def merge(self, other: "State") -> "State[StateType]":
         """Merges two states together, overwriting the values in self
         with those in other."""
-        return State({**self.get_all(), **other.get_all()}, self.typing_system)
+        return self.apply_operation(SetFields(dict(other._state)))
 
     def subset(self, *keys: str, ignore_missing: bool = True) -> "State[StateType]":
         """Returns a subset of the state, with only the given keys"""
-        return State(
-            {key: self[key] for key in keys if key in self or not ignore_missing},
+        state = State(
+            {
+                key: self._state[key] if key in self._state else self[key]
+                for key in keys
+                if key in self._state or not ignore_missing
+            },
             self.typing_system,
         )
+        state._has_lazy_values = self._has_lazy_values
+        return state
 
     def __getitem__(self, __k: str) -> Any:
         if __k not in self._state:
@@ -435,7 +754,16 @@ class State(Mapping, Generic[StateType]):
                 "(a) ensure that an upstream action has produced this state/it is set as an initial state value and "
                 "(b) ensure that your action declares this as a read key."
             )
-        return self._state[__k]
+        value = self._state[__k]
+        return value.resolve() if self._has_lazy_values and isinstance(value, LazyValue) else value
+
+    def __contains__(self, __k: object) -> bool:
+        # Overridden so membership checks do not go through (and format the error of) __getitem__
+        return __k in self._state
+
+    def get(self, __k: str, default: Any = None) -> Any:
+        value = self._state.get(__k, default)
+        return value.resolve() if self._has_lazy_values and isinstance(value, LazyValue) else value
 
     def __len__(self) -> int:
         return len(self._state)
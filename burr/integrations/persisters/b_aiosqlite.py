@@ -1,12 +1,22 @@
+import asyncio
 import json
 import logging
-from typing import Literal, Optional
+import sqlite3
+import time
+from typing import List, Literal, Optional
 
 import aiosqlite
 
 from burr.common.types import BaseCopyable
 from burr.core import State
-from burr.core.persistence import AsyncBaseStatePersister, PersistedStateData
+from burr.core.persistence import (
+    SQLITE_PRODUCTION_BUSY_TIMEOUT_MS,
+    AsyncBaseStatePersister,
+    PersistedStateData,
+    StateToPersist,
+    _is_sqlite_locked_error,
+    _sqlite_production_pragmas,
+)
 
 logger = logging.getLogger()
 
@@ -16,6 +26,136 @@ except ImportError:
     Self = None
 
 
+class _AsyncSQLiteWriter:
+    """Writes the saves made on a connection from a single task, committing whatever is queued when it gets to
+    it in a single transaction -- so concurrent saves (E.G. from parallel sub-applications sharing the
+    connection through :py:meth:`AsyncSQLitePersister.copy`) share a commit."""
+
+    MAX_BATCH_SIZE = 256
+
+    def __init__(self, connection: aiosqlite.Connection):
+        self.connection = connection
+        self.configured = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def configure(self, connect_kwargs: Optional[dict] = None):
+        """Runs the production mode PRAGMAs on the connection. Setting the journal mode can fail with
+        "database is locked" without waiting on the busy timeout, so we retry those."""
+        deadline = time.monotonic() + SQLITE_PRODUCTION_BUSY_TIMEOUT_MS / 1000
+        for pragma in _sqlite_production_pragmas(connect_kwargs):
+            while True:
+                try:
+                    await self.connection.execute(pragma)
+                    break
+                except sqlite3.OperationalError as e:
+                    if not _is_sqlite_locked_error(e) or time.monotonic() > deadline:
+                        raise
+                    await asyncio.sleep(0.01)
+        self.configured = True
+
+    async def write(self, persister: "AsyncSQLitePersister", to_persist: List[StateToPersist]):
+        """Writes the states in a transaction (possibly shared with other saves), returning once it commits.
+
+        :param persister: The persister saving, which converts the states to rows
+        :param to_persist: The states to save
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run(self._queue))
+        future = loop.create_future()
+        self._queue.put_nowait((persister, to_persist, future))
+        await future
+
+    async def close(self):
+        """Writes anything queued, then stops the writer task."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self._queue.put_nowait(None)
+            await task
+
+    async def _run(self, queue: asyncio.Queue):
+        batch = []
+        error: BaseException = RuntimeError("The SQLite writer stopped before writing this save.")
+        try:
+            if not self.configured:
+                await self.configure()
+            while True:
+                request = await queue.get()
+                batch = []
+                while request is not None:
+                    batch.append(request)
+                    if len(batch) >= self.MAX_BATCH_SIZE:
+                        break
+                    try:
+                        request = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                if batch:
+                    await self._write_batch(batch)
+                if request is None:
+                    return
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Fail whatever we did not get to (E.G. if configure() failed), so no save waits forever.
+            # The next save starts a new task.
+            while not queue.empty():
+                request = queue.get_nowait()
+                if request is not None:
+                    batch.append(request)
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+
+    async def _write_batch(self, batch: List[tuple]):
+        """Writes a batch of saves, resolving their futures. Futures already done (E.G. cancelled,
+        as the caller waiting on them was) are skipped -- their saves are still written."""
+        try:
+            await self._transaction(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                if not batch[0][2].done():
+                    batch[0][2].set_exception(e)
+                return
+            # One of the saves failed (E.G. a duplicate key), and took the others down with it -- write them
+            # one transaction each, so only that one fails
+            for request in batch:
+                try:
+                    await self._transaction([request])
+                except Exception as request_error:
+                    if not request[2].done():
+                        request[2].set_exception(request_error)
+                else:
+                    if not request[2].done():
+                        request[2].set_result(None)
+            return
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _transaction(self, batch: List[tuple]):
+        # IMMEDIATE takes the write lock up front, waiting on other processes with the busy timeout
+        await self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            for persister, to_persist, _ in batch:
+                await self.connection.executemany(
+                    persister._insert_statement(),
+                    [persister._row_to_insert(**item) for item in to_persist],
+                )
+            await self.connection.commit()
+        except Exception:
+            if self.connection.in_transaction:
+                await self.connection.rollback()
+            raise
+
+
 class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
     """Class for asynchronous SQLite persistence of state. This is a simple implementation.
 
@@ -33,12 +173,22 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
 
         Note the third-party library `aiosqlite <https://aiosqlite.omnilib.dev/en/latest/index.html>`_,
         is maintained and considered stable considered stable: https://github.com/omnilib/aiosqlite/issues/309.
+
+    If several processes share the database, or many applications share the persister, use
+    ``production_mode=True``. As with :py:class:`SQLitePersister <burr.core.persistence.SQLitePersister>`,
+    this enables WAL and a busy timeout, and writes from a single task that commits concurrent saves together.
     """
 
     def copy(self) -> "Self":
-        return AsyncSQLitePersister(
-            connection=self.connection, table_name=self.table_name, serde_kwargs=self.serde_kwargs
+        persister = AsyncSQLitePersister(
+            connection=self.connection,
+            table_name=self.table_name,
+            serde_kwargs=self.serde_kwargs,
+            production_mode=self.production_mode,
         )
+        # we share the connection, so we share its writer
+        persister._writer = self._writer
+        return persister
 
     PARTITION_KEY_DEFAULT = ""
 
@@ -61,6 +211,7 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
         table_name: str = "burr_state",
         serde_kwargs: dict = None,
         connect_kwargs: dict = None,
+        production_mode: bool = False,
     ) -> "AsyncSQLitePersister":
         """Creates a new instance of the AsyncSQLitePersister from passed in values.
 
@@ -68,19 +219,28 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
         :param table_name: the table name to store things under.
         :param serde_kwargs: kwargs for state serialization/deserialization.
         :param connect_kwargs: kwargs to pass to the aiosqlite.connect method.
+        :param production_mode: if set, tunes the persister for concurrent use. See the class docstring.
         :return: async sqlite persister instance with an open connection. You are responsible
             for closing the connection yourself.
         """
+        if production_mode and db_path == ":memory:":
+            raise ValueError(
+                "production_mode needs a database file -- every connection to :memory: is a new database."
+            )
         connection = await aiosqlite.connect(
             db_path, **connect_kwargs if connect_kwargs is not None else {}
         )
-        return cls(connection, table_name, serde_kwargs)
+        persister = cls(connection, table_name, serde_kwargs, production_mode=production_mode)
+        if production_mode:
+            await persister._writer.configure(connect_kwargs)
+        return persister
 
     def __init__(
         self,
         connection,
         table_name: str = "burr_state",
         serde_kwargs: dict = None,
+        production_mode: bool = False,
     ):
         """Constructor.
 
@@ -90,11 +250,15 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
         :param connection: the path the DB will be stored.
         :param table_name: the table name to store things under.
         :param serde_kwargs: kwargs for state serialization/deserialization.
+        :param production_mode: if set, tunes the connection for concurrent use (WAL and a busy timeout,
+            applied before the first save) and commits concurrent saves together. See the class docstring.
         """
         self.connection = connection
         self.table_name = table_name
         self.serde_kwargs = serde_kwargs or {}
         self._initialized = False
+        self.production_mode = production_mode
+        self._writer = _AsyncSQLiteWriter(connection) if production_mode else None
 
     def set_serde_kwargs(self, serde_kwargs: dict):
         """Sets the serde_kwargs for the persister."""
@@ -104,7 +268,7 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        await self.connection.close()
+        await self.cleanup()
         return False
 
     async def create_table_if_not_exists(self, table_name: str):
@@ -128,6 +292,13 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
             CREATE INDEX IF NOT EXISTS {table_name}_created_at_index ON {table_name} (created_at);
         """
         )
+        # Covers list_app_ids and loading the latest state of a partition, so they read just the index
+        await cursor.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {table_name}_partition_key_created_at_index
+            ON {table_name} (partition_key, created_at, app_id);
+        """
+        )
         await self.connection.commit()
 
     async def initialize(self):
@@ -263,25 +434,63 @@ class AsyncSQLitePersister(AsyncBaseStatePersister, BaseCopyable):
             state,
             status,
         )
+        await self.save_many(
+            [
+                {
+                    "partition_key": partition_key,
+                    "app_id": app_id,
+                    "sequence_id": sequence_id,
+                    "position": position,
+                    "state": state,
+                    "status": status,
+                }
+            ]
+        )
+
+    async def save_many(self, to_persist: List[StateToPersist], **kwargs):
+        """Saves a batch of states in a single transaction, using executemany.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        if self._writer is not None:
+            await self._writer.write(self, to_persist)
+            return
+        await self.connection.executemany(
+            self._insert_statement(), [self._row_to_insert(**item) for item in to_persist]
+        )
+        await self.connection.commit()
+
+    def _insert_statement(self) -> str:
+        return (
+            f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
+            f"VALUES (?, ?, ?, ?, ?, ?)"
+        )
+
+    def _row_to_insert(
+        self,
+        partition_key: Optional[str],
+        app_id: str,
+        sequence_id: int,
+        position: str,
+        state: State,
+        status: str,
+    ) -> tuple:
+        """Converts the arguments to save to a row to insert"""
         partition_key = (
             partition_key
             if partition_key is not None
             else AsyncSQLitePersister.PARTITION_KEY_DEFAULT
         )
-        cursor = await self.connection.cursor()
         json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        await cursor.execute(
-            f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
-            f"VALUES (?, ?, ?, ?, ?, ?)",
-            (partition_key, app_id, sequence_id, position, json_state, status),
-        )
-        await self.connection.commit()
+        return partition_key, app_id, sequence_id, position, json_state, status
 
     async def cleanup(self):
         """Closes the connection to the database."""
+        if self._writer is not None:
+            await self._writer.close()
         await self.connection.close()
 
     async def close(self):
         """This is deprecated, please use .cleanup()"""
         logger.warning("The .close() method will be deprecated, please use .cleanup() instead.")
-        await self.connection.close()
+        await self.cleanup()
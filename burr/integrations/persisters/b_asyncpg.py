@@ -5,15 +5,34 @@ try:
 except ImportError as e:
     base.require_plugin(e, "asyncpg")
 
+import asyncio
+import contextlib
 import json
 import logging
-from typing import Literal, Optional
+from typing import AsyncIterator, List, Literal, Optional, Union
 
 from burr.core import persistence, state
 
 logger = logging.getLogger(__name__)
 
 
+async def register_jsonb_codec(connection: "asyncpg.Connection"):
+    """Registers a codec on the connection so JSONB values are passed to/from postgres as python objects,
+    rather than as JSON strings. Pass this as the ``init`` function of a pool to register it on every connection.
+
+    :param connection: Connection to register the codec on
+    """
+    await connection.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+async def _skip_reset(connection: "asyncpg.Connection"):
+    """We do not change any session state (settings, listeners, advisory locks), so connections
+    we return to our pools do not need the round trip to reset them."""
+    pass
+
+
 class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
     """Class for async PostgreSQL persistence of state.
 
@@ -48,7 +67,20 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
         p = await AsyncPostgreSQLPersister.from_values("postgres", "postgres", "my_password",
                                            "localhost", 54320, table_name="burr_state")
 
+    A single connection can only run one query at a time, so if many applications share the persister
+    concurrently (E.G. in a web server), back it with a connection pool instead:
+
+    .. code:: python
+
+        p = await AsyncPostgreSQLPersister.from_values("postgres", "postgres", "my_password",
+                                           "localhost", 54320, table_name="burr_state", pool_size=10)
+
+    Queries are fixed per persister, so asyncpg's per-connection statement cache prepares each one once
+    per connection and reuses it after that.
 
+    To store large state fields once (and out of the table), pass a
+    :py:class:`BlobStore <burr.core.persistence.BlobStore>` as ``blob_store``. Its calls are synchronous,
+    so saves offload on an executor thread. Fields loaded from it are fetched when first accessed.
     """
 
     PARTITION_KEY_DEFAULT = ""
@@ -67,6 +99,8 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
         host: str,
         port: int,
         table_name: str = "burr_state",
+        pool_size: Optional[int] = None,
+        blob_store: Optional[persistence.BlobStore] = None,
     ) -> "AsyncPostgreSQLPersister":
         """Builds a new instance of the PostgreSQLPersister from the provided values.
 
@@ -76,22 +110,65 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
         :param host: the host of the PostgreSQL database.
         :param port: the port of the PostgreSQL database.
         :param table_name:  the table name to store things under.
+        :param pool_size: If set, the maximum size of a connection pool to use, rather than a single connection.
+        :param blob_store: If set, large state fields are stored in this. See the class docstring.
         """
-        connection = await asyncpg.connect(
-            user=user, password=password, database=db_name, host=host, port=port
-        )
-        return cls(connection, table_name)
+        connection: Union[asyncpg.Connection, asyncpg.Pool]
+        if pool_size is not None:
+            connection = await asyncpg.create_pool(
+                user=user,
+                password=password,
+                database=db_name,
+                host=host,
+                port=port,
+                min_size=1,
+                max_size=pool_size,
+                init=register_jsonb_codec,
+                reset=_skip_reset,
+            )
+        else:
+            connection = await asyncpg.connect(
+                user=user, password=password, database=db_name, host=host, port=port
+            )
+            await register_jsonb_codec(connection)
+        return cls(connection, table_name, jsonb_codec=True, blob_store=blob_store)
 
-    def __init__(self, connection, table_name: str = "burr_state", serde_kwargs: dict = None):
+    def __init__(
+        self,
+        connection: Union["asyncpg.Connection", "asyncpg.Pool"],
+        table_name: str = "burr_state",
+        serde_kwargs: dict = None,
+        jsonb_codec: bool = False,
+        blob_store: Optional[persistence.BlobStore] = None,
+    ):
         """Constructor
 
-        :param connection: the connection to the PostgreSQL database.
+        :param connection: the connection to the PostgreSQL database, or a pool of connections to it.
         :param table_name:  the table name to store things under.
+        :param serde_kwargs: kwargs for state serialization/deserialization.
+        :param jsonb_codec: whether the connection (or every connection in the pool) has the JSONB codec
+            registered (see :py:func:`register_jsonb_codec`), in which case we pass states as python objects.
+        :param blob_store: if set, large state fields are stored in this, and states store references to them.
         """
         self.table_name = table_name
         self.connection = connection
         self.serde_kwargs = serde_kwargs or {}
+        self.jsonb_codec = jsonb_codec
+        self.blob_store = blob_store
         self._initialized = False
+        self._insert_query = (
+            f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
+            "VALUES ($1, $2, $3, $4, $5, $6)"
+        )
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self) -> AsyncIterator["asyncpg.Connection"]:
+        """Gives a connection to run queries on -- from the pool if we have one."""
+        if isinstance(self.connection, asyncpg.Pool):
+            async with self.connection.acquire() as connection:
+                yield connection
+        else:
+            yield self.connection
 
     async def __aenter__(self):
         return self
@@ -106,8 +183,8 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
 
     async def create_table(self, table_name: str):
         """Helper function to create the table where things are stored."""
-        async with self.connection.transaction():
-            await self.connection.execute(
+        async with self._acquire() as connection, connection.transaction():
+            await connection.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS {table_name} (
                     partition_key TEXT DEFAULT '{self.PARTITION_KEY_DEFAULT}',
@@ -120,7 +197,7 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
                     PRIMARY KEY (partition_key, app_id, sequence_id, position)
                 )"""
             )
-            await self.connection.execute(
+            await connection.execute(
                 f"""
                 CREATE INDEX IF NOT EXISTS {table_name}_created_at_index ON {table_name} (created_at);
             """
@@ -140,7 +217,8 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
             return True
 
         query = "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = $1)"
-        self._initialized = await self.connection.fetchval(query, self.table_name, column=0)
+        async with self._acquire() as connection:
+            self._initialized = await connection.fetchval(query, self.table_name, column=0)
         return self._initialized
 
     async def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
@@ -150,7 +228,8 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
             "WHERE partition_key = $1 "
             "ORDER BY created_at DESC"
         )
-        fetched_data = await self.connection.fetch(query, partition_key)
+        async with self._acquire() as connection:
+            fetched_data = await connection.fetch(query, partition_key)
         app_ids = [row[0] for row in fetched_data]
         return app_ids
 
@@ -178,7 +257,7 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
                 "WHERE partition_key = $1 "
                 f"ORDER BY CREATED_AT DESC LIMIT 1"
             )
-            row = await self.connection.fetchrow(query, partition_key)
+            args = (partition_key,)
 
         elif sequence_id is None:
             query = (
@@ -186,23 +265,20 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
                 "WHERE partition_key = $1 AND app_id = $2 "
                 f"ORDER BY sequence_id DESC LIMIT 1"
             )
-            row = await self.connection.fetchrow(query, partition_key, app_id)
+            args = (partition_key, app_id)
         else:
             query = (
                 f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
                 "WHERE partition_key = $1 AND app_id = $2 AND sequence_id = $3 "
             )
-            row = await self.connection.fetchrow(
-                query,
-                partition_key,
-                app_id,
-                sequence_id,
-            )
+            args = (partition_key, app_id, sequence_id)
+        async with self._acquire() as connection:
+            row = await connection.fetchrow(query, *args)
         if row is None:
             return None
-        # converts from asyncpg str to dict
-        json_row = json.loads(row[1])
-        _state = state.State.deserialize(json_row, **self.serde_kwargs)
+        # without the codec, asyncpg gives us the JSON string
+        json_row = row[1] if self.jsonb_codec else json.loads(row[1])
+        _state = persistence.deserialize_state(json_row, self.serde_kwargs, self.blob_store)
         return {
             "partition_key": partition_key,
             "app_id": row[3],
@@ -250,15 +326,87 @@ class AsyncPostgreSQLPersister(persistence.AsyncBaseStatePersister):
             status,
         )
 
-        json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        query = (
-            f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
-            "VALUES ($1, $2, $3, $4, $5, $6)"
+        (row,) = await self._rows_to_insert(
+            [
+                {
+                    "partition_key": partition_key,
+                    "app_id": app_id,
+                    "sequence_id": sequence_id,
+                    "position": position,
+                    "state": state,
+                    "status": status,
+                }
+            ]
         )
-        await self.connection.execute(
-            query, partition_key, app_id, sequence_id, position, json_state, status
+        try:
+            async with self._acquire() as connection:
+                await connection.execute(self._insert_query, *row)
+        except Exception:
+            await self._release_blob_references([row])
+            raise
+
+    async def save_many(self, to_persist: List[persistence.StateToPersist], **kwargs):
+        """Saves a batch of states in a single transaction, using executemany.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        rows = await self._rows_to_insert(to_persist)
+        try:
+            async with self._acquire() as connection, connection.transaction():
+                await connection.executemany(self._insert_query, rows)
+        except Exception:
+            await self._release_blob_references(rows)
+            raise
+
+    async def _rows_to_insert(self, to_persist: List[persistence.StateToPersist]) -> List[tuple]:
+        """Converts the states to save to rows to insert -- on an executor thread if we offload to a blob store"""
+        if self.blob_store is None:
+            return [self._row_to_insert(**item) for item in to_persist]
+
+        def _offload_rows() -> List[tuple]:
+            rows = []
+            try:
+                for item in to_persist:
+                    rows.append(self._row_to_insert(**item))
+            except Exception:
+                self._release_blob_references_sync(rows)
+                raise
+            return rows
+
+        return await asyncio.get_running_loop().run_in_executor(None, _offload_rows)
+
+    async def _release_blob_references(self, rows: List[tuple]):
+        """Releases the blob references taken when serializing rows that were not written
+        (see :py:meth:`BlobStore.offload <burr.core.persistence.BlobStore.offload>`)"""
+        if self.blob_store is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._release_blob_references_sync, rows
         )
 
+    def _release_blob_references_sync(self, rows: List[tuple]):
+        serialized_states = [row[4] if self.jsonb_codec else json.loads(row[4]) for row in rows]
+        self.blob_store.release(
+            key
+            for serialized_state in serialized_states
+            for key in persistence.BlobStore.references(serialized_state)
+        )
+
+    def _row_to_insert(
+        self,
+        partition_key: str,
+        app_id: str,
+        sequence_id: int,
+        position: str,
+        state: state.State,
+        status: str,
+    ) -> tuple:
+        """Converts the arguments to save to a row to insert"""
+        serialized_state = persistence.serialize_state(state, self.serde_kwargs, self.blob_store)
+        if not self.jsonb_codec:
+            serialized_state = json.dumps(serialized_state)
+        return partition_key, app_id, sequence_id, position, serialized_state, status
+
     async def cleanup(self):
-        """Closes the connection to the database."""
+        """Closes the connection (or pool of connections) to the database."""
         await self.connection.close()
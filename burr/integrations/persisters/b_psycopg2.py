@@ -2,12 +2,17 @@ from burr.integrations import base
 
 try:
     import psycopg2
+    import psycopg2.extras
+    import psycopg2.pool
 except ImportError as e:
     base.require_plugin(e, "postgresql")
 
+import contextlib
+import hashlib
 import json
 import logging
-from typing import Literal, Optional
+import threading
+from typing import Dict, Iterator, List, Literal, Optional, Set, Tuple, Union
 
 from burr.core import persistence, state
 
@@ -34,7 +39,15 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         p = PostgreSQLPersister.from_values("postgres", "postgres", "my_password",
                                            "localhost", 54320, table_name="burr_state")
 
+    A single connection cannot be used by multiple threads at once, so if many applications share the
+    persister concurrently, back it with a (thread-safe) connection pool instead:
 
+    .. code:: python
+
+        p = PostgreSQLPersister.from_values("postgres", "postgres", "my_password",
+                                           "localhost", 54320, table_name="burr_state", pool_size=10)
+
+    Saves and loads run as server-side prepared statements, prepared once per connection.
     """
 
     PARTITION_KEY_DEFAULT = ""
@@ -53,6 +66,7 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         host: str,
         port: int,
         table_name: str = "burr_state",
+        pool_size: Optional[int] = None,
     ):
         """Builds a new instance of the PostgreSQLPersister from the provided values.
 
@@ -62,28 +76,90 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         :param host: the host of the PostgreSQL database.
         :param port: the port of the PostgreSQL database.
         :param table_name:  the table name to store things under.
+        :param pool_size: If set, the maximum size of a (thread-safe) connection pool to use, rather than a single
+            connection.
         """
-        connection = psycopg2.connect(
-            dbname=db_name, user=user, password=password, host=host, port=port
-        )
+        connection_params = dict(dbname=db_name, user=user, password=password, host=host, port=port)
+        if pool_size is not None:
+            connection = psycopg2.pool.ThreadedConnectionPool(1, pool_size, **connection_params)
+        else:
+            connection = psycopg2.connect(**connection_params)
         return cls(connection, table_name)
 
-    def __init__(self, connection, table_name: str = "burr_state", serde_kwargs: dict = None):
+    def __init__(
+        self,
+        connection: Union["psycopg2.extensions.connection", "psycopg2.pool.AbstractConnectionPool"],
+        table_name: str = "burr_state",
+        serde_kwargs: dict = None,
+    ):
         """Constructor
 
-        :param connection: the connection to the PostgreSQL database.
+        :param connection: the connection to the PostgreSQL database, or a pool of connections to it.
         :param table_name:  the table name to store things under.
+        :param serde_kwargs: kwargs for state serialization/deserialization.
         """
         self.table_name = table_name
         self.connection = connection
         self.serde_kwargs = serde_kwargs or {}
         self._initialized = False
+        # (connection, backend) -> names of the statements prepared on it
+        self._prepared: Dict[Tuple[int, int], Set[str]] = {}
+        # psycopg2's pools raise if they are exhausted, so we wait for a free connection instead
+        self._pool_slots = threading.BoundedSemaphore(connection.maxconn) if self._is_pool else None
+
+    @property
+    def _is_pool(self) -> bool:
+        return isinstance(self.connection, psycopg2.pool.AbstractConnectionPool)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator["psycopg2.extensions.connection"]:
+        """Gives a connection to run queries on -- from the pool if we have one.
+        Rolls back the transaction if the queries fail, so the connection can be reused."""
+        if not self._is_pool:
+            with self._rollback_on_failure(self.connection):
+                yield self.connection
+            return
+        with self._pool_slots:
+            connection = self.connection.getconn()
+            try:
+                with self._rollback_on_failure(connection):
+                    yield connection
+            finally:
+                self.connection.putconn(connection)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _rollback_on_failure(connection: "psycopg2.extensions.connection") -> Iterator[None]:
+        try:
+            yield
+        except Exception:
+            if not connection.closed:
+                connection.rollback()
+            raise
+
+    def _execute_prepared(self, cursor, name: str, query: str, params: tuple):
+        """Executes a query as a prepared statement, preparing it if this is the first time
+        we run it on the cursor's connection.
+
+        :param cursor: Cursor to execute with
+        :param name: Name of the statement -- unique to the query
+        :param query: Query to prepare, with postgres-style ($1, $2, ...) parameters
+        :param params: Parameters to execute it with
+        """
+        connection = cursor.connection
+        prepared = self._prepared.setdefault((id(connection), connection.get_backend_pid()), set())
+        # statement names are per-connection, and table names may not be valid identifiers
+        statement = f"burr_{name}_{hashlib.md5(self.table_name.encode()).hexdigest()[:12]}"
+        if statement not in prepared:
+            cursor.execute(f"PREPARE {statement} AS {query}")
+            prepared.add(statement)
+        cursor.execute(f"EXECUTE {statement} ({', '.join(['%s'] * len(params))})", params)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.connection.close()
+        self.cleanup()
         return False
 
     def set_serde_kwargs(self, serde_kwargs: dict):
@@ -92,26 +168,27 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
 
     def create_table(self, table_name: str):
         """Helper function to create the table where things are stored."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                partition_key TEXT DEFAULT '{self.PARTITION_KEY_DEFAULT}',
-                app_id TEXT NOT NULL,
-                sequence_id INTEGER NOT NULL,
-                position TEXT NOT NULL,
-                status TEXT NOT NULL,
-                state JSONB NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (partition_key, app_id, sequence_id, position)
-            )"""
-        )
-        cursor.execute(
-            f"""
-            CREATE INDEX IF NOT EXISTS {table_name}_created_at_index ON {table_name} (created_at);
-        """
-        )
-        self.connection.commit()
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                    partition_key TEXT DEFAULT '{self.PARTITION_KEY_DEFAULT}',
+                    app_id TEXT NOT NULL,
+                    sequence_id INTEGER NOT NULL,
+                    position TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    state JSONB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (partition_key, app_id, sequence_id, position)
+                )"""
+            )
+            cursor.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {table_name}_created_at_index ON {table_name} (created_at);
+            """
+            )
+            connection.commit()
 
     def initialize(self):
         """Creates the table"""
@@ -125,24 +202,28 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         """
         if self._initialized:
             return True
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = %s)",
-            (self.table_name,),
-        )
-        self._initialized = cursor.fetchone()[0]
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = %s)",
+                (self.table_name,),
+            )
+            self._initialized = cursor.fetchone()[0]
+            connection.commit()
         return self._initialized
 
     def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
         """Lists the app_ids for a given partition_key."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            f"SELECT DISTINCT app_id, created_at FROM {self.table_name} "
-            "WHERE partition_key = %s "
-            "ORDER BY created_at DESC",
-            (partition_key,),
-        )
-        app_ids = [row[0] for row in cursor.fetchall()]
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"SELECT DISTINCT app_id, created_at FROM {self.table_name} "
+                "WHERE partition_key = %s "
+                "ORDER BY created_at DESC",
+                (partition_key,),
+            )
+            app_ids = [row[0] for row in cursor.fetchall()]
+            connection.commit()
         return app_ids
 
     def load(
@@ -161,29 +242,38 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         if partition_key is None:
             partition_key = self.PARTITION_KEY_DEFAULT
         logger.debug("Loading %s, %s, %s", partition_key, app_id, sequence_id)
-        cursor = self.connection.cursor()
-        if app_id is None:
-            # get latest for all app_ids
-            cursor.execute(
-                f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
-                f"WHERE partition_key = %s "
-                f"ORDER BY CREATED_AT DESC LIMIT 1",
-                (partition_key,),
-            )
-        elif sequence_id is None:
-            cursor.execute(
-                f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
-                f"WHERE partition_key = %s AND app_id = %s "
-                f"ORDER BY sequence_id DESC LIMIT 1",
-                (partition_key, app_id),
-            )
-        else:
-            cursor.execute(
-                f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
-                f"WHERE partition_key = %s AND app_id = %s AND sequence_id = %s ",
-                (partition_key, app_id, sequence_id),
-            )
-        row = cursor.fetchone()
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            if app_id is None:
+                # get latest for all app_ids
+                self._execute_prepared(
+                    cursor,
+                    "load_latest",
+                    f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
+                    f"WHERE partition_key = $1 "
+                    f"ORDER BY CREATED_AT DESC LIMIT 1",
+                    (partition_key,),
+                )
+            elif sequence_id is None:
+                self._execute_prepared(
+                    cursor,
+                    "load_latest_for_app",
+                    f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
+                    f"WHERE partition_key = $1 AND app_id = $2 "
+                    f"ORDER BY sequence_id DESC LIMIT 1",
+                    (partition_key, app_id),
+                )
+            else:
+                self._execute_prepared(
+                    cursor,
+                    "load_sequence_id",
+                    f"SELECT position, state, sequence_id, app_id, created_at, status FROM {self.table_name} "
+                    f"WHERE partition_key = $1 AND app_id = $2 AND sequence_id = $3 ",
+                    (partition_key, app_id, sequence_id),
+                )
+            row = cursor.fetchone()
+            # ends the transaction, so we do not hold it open between loads
+            connection.commit()
         if row is None:
             return None
         _state = state.State.deserialize(row[1], **self.serde_kwargs)
@@ -233,18 +323,52 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
             state,
             status,
         )
-        cursor = self.connection.cursor()
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            self._execute_prepared(
+                cursor,
+                "save",
+                f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
+                "VALUES ($1, $2, $3, $4, $5, $6)",
+                self._row_to_insert(partition_key, app_id, sequence_id, position, state, status),
+            )
+            connection.commit()
+
+    def save_many(self, to_persist: List[persistence.StateToPersist], **kwargs):
+        """Saves a batch of states in a single transaction, as a multi-row insert.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            psycopg2.extras.execute_values(
+                cursor,
+                f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
+                "VALUES %s",
+                [self._row_to_insert(**item) for item in to_persist],
+            )
+            connection.commit()
+
+    def _row_to_insert(
+        self,
+        partition_key: str,
+        app_id: str,
+        sequence_id: int,
+        position: str,
+        state: state.State,
+        status: str,
+    ) -> tuple:
+        """Converts the arguments to save to a row to insert"""
         json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        cursor.execute(
-            f"INSERT INTO {self.table_name} (partition_key, app_id, sequence_id, position, state, status) "
-            "VALUES (%s, %s, %s, %s, %s, %s)",
-            (partition_key, app_id, sequence_id, position, json_state, status),
-        )
-        self.connection.commit()
+        return partition_key, app_id, sequence_id, position, json_state, status
 
     def cleanup(self):
-        """Closes the connection to the database."""
-        self.connection.close()
+        """Closes the connection (or all connections in the pool) to the database."""
+        if self._is_pool:
+            if not self.connection.closed:
+                self.connection.closeall()
+        else:
+            self.connection.close()
 
     def __del__(self):
         # This should be deprecated -- using __del__ is unreliable for closing connections to db's;
@@ -252,30 +376,51 @@ class PostgreSQLPersister(persistence.BaseStatePersister):
         # method within a REST API framework.
 
         # closes connection at end when things are being shutdown.
-        self.connection.close()
+        self.cleanup()
 
     def __getstate__(self) -> dict:
         state = self.__dict__.copy()
-        if not hasattr(self.connection, "info"):
+        # prepared statements belong to our connections, so they do not carry over
+        state["_prepared"] = {}
+        del state["_pool_slots"]
+        if self._is_pool:
+            connection = self.connection.getconn()
+            state["pool_size"] = self.connection.maxconn
+            try:
+                info = connection.info
+            finally:
+                self.connection.putconn(connection)
+        elif hasattr(self.connection, "info"):
+            info = self.connection.info
+        else:
             logger.warning(
                 "Postgresql information for connection object not available. Cannot serialize persister."
             )
             return state
         state["connection_params"] = {
-            "dbname": self.connection.info.dbname,
-            "user": self.connection.info.user,
-            "password": self.connection.info.password,
-            "host": self.connection.info.host,
-            "port": self.connection.info.port,
+            "dbname": info.dbname,
+            "user": info.user,
+            "password": info.password,
+            "host": info.host,
+            "port": info.port,
         }
         del state["connection"]
         return state
 
     def __setstate__(self, state: dict):
         connection_params = state.pop("connection_params")
+        pool_size = state.pop("pool_size", None)
         # we assume normal psycopg2 client.
-        self.connection = psycopg2.connect(**connection_params)
+        if pool_size is not None:
+            self.connection = psycopg2.pool.ThreadedConnectionPool(
+                1, pool_size, **connection_params
+            )
+        else:
+            self.connection = psycopg2.connect(**connection_params)
         self.__dict__.update(state)
+        self._pool_slots = (
+            threading.BoundedSemaphore(self.connection.maxconn) if self._is_pool else None
+        )
 
 
 if __name__ == "__main__":
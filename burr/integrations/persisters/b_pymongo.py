@@ -1,9 +1,11 @@
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
-from pymongo import MongoClient
+from bson.errors import InvalidDocument
+from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
 from burr.core import persistence, state
 
@@ -31,10 +33,20 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
        loaded_state = persister.load(partition_key='example_partition', app_id='example_app', sequence_id=1)
        print(loaded_state)
 
+    The persister creates a unique index on ``(partition_key, app_id, sequence_id)`` the first time it
+    reads or writes (or when :py:meth:`initialize` is called), so loading the latest state does not scan
+    the collection. Pass ``ensure_indexes=False`` if you manage indexes yourself. States are stored as
+    BSON documents -- states written as JSON strings by older versions can still be loaded.
+
+    To store large state fields once (and out of MongoDB's 16MB documents), pass a
+    :py:class:`BlobStore <burr.core.persistence.BlobStore>` as ``blob_store``.
+
     Note: this is called MongoDBBasePersister because we had to change the constructor and wanted to make
      this change backwards compatible.
     """
 
+    INDEX_KEYS = [("partition_key", ASCENDING), ("app_id", ASCENDING), ("sequence_id", DESCENDING)]
+
     @classmethod
     def from_config(cls, config: dict) -> "MongoDBBasePersister":
         """Creates a new instance of the MongoDBBasePersister from a configuration dictionary."""
@@ -48,6 +60,8 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
         collection_name="mystates",
         serde_kwargs: dict = None,
         mongo_client_kwargs: dict = None,
+        ensure_indexes: bool = True,
+        blob_store: Optional[persistence.BlobStore] = None,
     ) -> "MongoDBBasePersister":
         """Initializes the MongoDBBasePersister class."""
         if mongo_client_kwargs is None:
@@ -58,6 +72,8 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
             db_name=db_name,
             collection_name=collection_name,
             serde_kwargs=serde_kwargs,
+            ensure_indexes=ensure_indexes,
+            blob_store=blob_store,
         )
 
     def __init__(
@@ -66,6 +82,8 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
         db_name="mydatabase",
         collection_name="mystates",
         serde_kwargs: dict = None,
+        ensure_indexes: bool = True,
+        blob_store: Optional[persistence.BlobStore] = None,
     ):
         """Initializes the MongoDBBasePersister class.
 
@@ -73,19 +91,50 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
         :param db_name: the name of the database to use
         :param collection_name: the name of the collection to use
         :param serde_kwargs: serializer/deserializer keyword arguments to pass to the state object
+        :param ensure_indexes: whether to create the unique (partition_key, app_id, sequence_id) index
+            on first use. Turn this off if the user cannot create indexes, and create it yourself.
+        :param blob_store: if set, large state fields are stored in this, and states store references to them.
         """
         self.client = client
         self.db = self.client[db_name]
         self.collection = self.db[collection_name]
         self.serde_kwargs = serde_kwargs or {}
+        self.ensure_indexes = ensure_indexes
+        self.blob_store = blob_store
+        self._indexes_ensured = not ensure_indexes
+        # whether the unique index guarantees no duplicate keys -- if not we check before inserting
+        self._unique_index = ensure_indexes
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.connection.close()
+        self.client.close()
         return False
 
+    def initialize(self):
+        """Creates the unique (partition_key, app_id, sequence_id) index, if it does not exist.
+        This is otherwise done on first use."""
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Creates the index once per persister. Creating an index that exists is a no-op on the server."""
+        if self._indexes_ensured:
+            return
+        try:
+            self.collection.create_index(self.INDEX_KEYS, unique=True)
+        except OperationFailure as e:
+            # E.G. a collection written to by an older version with duplicate keys, which cannot be
+            # uniquely indexed. We still work, we just check for duplicates before inserting.
+            logger.warning(
+                "Could not create a unique index on %s: %s. Remove duplicate "
+                "(partition_key, app_id, sequence_id) documents to enable it.",
+                self.collection.name,
+                e,
+            )
+            self._unique_index = False
+        self._indexes_ensured = True
+
     def set_serde_kwargs(self, serde_kwargs: dict):
         """Sets the serde_kwargs for the persister."""
         self.serde_kwargs = serde_kwargs
@@ -111,13 +160,18 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
 
         :returns: The state data if found, otherwise None.
         """
+        self._ensure_indexes()
         query = {"partition_key": partition_key, "app_id": app_id}
         if sequence_id is not None:
             query["sequence_id"] = sequence_id
-        document = self.collection.find_one(query, sort=[("sequence_id", -1)])
+        document = self.collection.find_one(query, sort=[("sequence_id", DESCENDING)])
         if not document:
             return None
-        _state = state.State.deserialize(json.loads(document["state"]), **self.serde_kwargs)
+        serialized_state = document["state"]
+        if isinstance(serialized_state, str):
+            # written as a JSON string, by older versions or if the state is not valid BSON
+            serialized_state = json.loads(serialized_state)
+        _state = persistence.deserialize_state(serialized_state, self.serde_kwargs, self.blob_store)
         return {
             "partition_key": partition_key,
             "app_id": app_id,
@@ -151,25 +205,122 @@ class MongoDBBasePersister(persistence.BaseStatePersister):
             before the action was applied.
         :return:
         """
-        key = {"partition_key": partition_key, "app_id": app_id, "sequence_id": sequence_id}
-        if self.collection.find_one(key):
-            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
-        json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        self.collection.insert_one(
-            {
-                "partition_key": partition_key,
-                "app_id": app_id,
-                "sequence_id": sequence_id,
-                "position": position,
-                "state": json_state,
-                "status": status,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
+        self._ensure_indexes()
+        document = self._document_to_insert(
+            partition_key, app_id, sequence_id, position, state, status
         )
+        try:
+            if not self._unique_index:
+                self._raise_if_exists(document)
+            self._insert_one(document)
+        except (DuplicateKeyError, ValueError) as e:
+            self._release_blobs([document])
+            if isinstance(e, ValueError):
+                raise
+            raise ValueError(
+                f"partition_key:app_id:sequence_id[{self._key(document)}] already exists."
+            )
+
+    def save_many(self, to_persist: List[persistence.StateToPersist], **kwargs):
+        """Saves a batch of states with a single ordered ``insert_many``. As with :py:meth:`save`, this
+        raises a ValueError if one of them already exists -- the ones before it are still written.
+
+        :param to_persist: The states to save, in the order they should be written
+        """
+        self._ensure_indexes()
+        documents = [self._document_to_insert(**item) for item in to_persist]
+        if not documents:
+            return
+        if not self._unique_index:
+            try:
+                for document in documents:
+                    self._raise_if_exists(document)
+            except ValueError:
+                self._release_blobs(documents)
+                raise
+        try:
+            self.collection.insert_many(documents, ordered=True)
+        except (InvalidDocument, OverflowError):
+            # some state is not valid BSON, so save the rest one at a time. Documents sent in an
+            # earlier batch (these are given an _id as they are sent) may already be written.
+            sent_ids = [document["_id"] for document in documents if "_id" in document]
+            written = {
+                document["_id"]
+                for document in self.collection.find(
+                    {"_id": {"$in": sent_ids}}, projection={"_id": 1}
+                )
+            }
+            for document in documents:
+                if document.get("_id") not in written:
+                    self._insert_one(document)
+        except BulkWriteError as e:
+            duplicates = [
+                error for error in e.details.get("writeErrors", []) if error.get("code") == 11000
+            ]
+            if not duplicates:
+                raise
+            # the ordered insert stopped there
+            self._release_blobs(documents[duplicates[0]["index"] :])
+            raise ValueError(
+                f"partition_key:app_id:sequence_id[{self._key(documents[duplicates[0]['index']])}] "
+                "already exists."
+            ) from e
+
+    def _document_to_insert(
+        self,
+        partition_key: Optional[str],
+        app_id: str,
+        sequence_id: int,
+        position: str,
+        state: state.State,
+        status: str,
+    ) -> dict:
+        """Converts the arguments to save to a document to insert"""
+        return {
+            "partition_key": partition_key,
+            "app_id": app_id,
+            "sequence_id": sequence_id,
+            "position": position,
+            "state": persistence.serialize_state(state, self.serde_kwargs, self.blob_store),
+            "status": status,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _insert_one(self, document: dict):
+        """Inserts a document, storing the state as a JSON string if it cannot be encoded as BSON
+        (E.G. integers that do not fit in 8 bytes, or non-string keys)."""
+        try:
+            self.collection.insert_one(document)
+        except (InvalidDocument, OverflowError):
+            self.collection.insert_one({**document, "state": json.dumps(document["state"])})
+
+    def _release_blobs(self, documents: List[dict]):
+        """Releases the references to blobs taken for documents we did not write."""
+        if self.blob_store is not None:
+            self.blob_store.release(
+                [
+                    key
+                    for document in documents
+                    for key in self.blob_store.references(document["state"])
+                ]
+            )
+
+    @staticmethod
+    def _key(document: dict) -> dict:
+        return {
+            "partition_key": document["partition_key"],
+            "app_id": document["app_id"],
+            "sequence_id": document["sequence_id"],
+        }
+
+    def _raise_if_exists(self, document: dict):
+        key = self._key(document)
+        if self.collection.find_one(key, projection={"_id": 1}):
+            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
 
     def cleanup(self):
         """Closes the connection to the database."""
-        self.connection.close()
+        self.client.close()
 
     def __del__(self):
         # This should be deprecated -- using __del__ is unreliable for closing connections to db's;
@@ -7,15 +7,40 @@ try:
 except ImportError as e:
     base.require_plugin(e, "redis")
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from burr.core import persistence, state
 
 logger = logging.getLogger(__name__)
 
+StateEncoding = Literal["json", "msgpack"]
+StateCompression = Literal["zstd"]
+
+# Writes the state's hash (if it does not already exist) and records its sequence ID as the latest for the app.
+# KEYS: state hash, partition key's sorted set. ARGV: sequence ID, app ID, then the hash's field/value pairs.
+_SAVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('ZADD', KEYS[2], ARGV[1], ARGV[2])
+return 1
+"""
+
+# Looks up the latest sequence ID for the app and reads the state's hash for it.
+# KEYS: partition key's sorted set. ARGV: app ID, prefix of the state hash's key (the key, less the sequence ID).
+_LOAD_LATEST_SCRIPT = """
+local sequence_id = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not sequence_id then
+    return false
+end
+return {sequence_id, redis.call('HGETALL', ARGV[2] .. sequence_id)}
+"""
+
 
 def add_namespace_to_partition_key(partition_key: str, namespace: Optional[str] = None) -> str:
     """Helper function to add namespace to partition key."""
@@ -25,6 +50,120 @@ def add_namespace_to_partition_key(partition_key: str, namespace: Optional[str]
     return partition_key
 
 
+def _encode_state(
+    serialized_state: dict, encoding: StateEncoding, compression: Optional[StateCompression]
+) -> bytes:
+    """Encodes a serialized state to store.
+
+    :param serialized_state: The state, serialized to a dict
+    :param encoding: Format to encode it with
+    :param compression: Compression to apply, None for none
+    :return: The encoded state
+    """
+    if encoding == "msgpack":
+        data = _import_msgpack().packb(serialized_state, use_bin_type=True)
+    else:
+        data = json.dumps(serialized_state).encode()
+    if compression == "zstd":
+        data = _import_zstandard().ZstdCompressor().compress(data)
+    return data
+
+
+def _decode_state(data: bytes, encoding: str) -> dict:
+    """Decodes a stored state (see :py:func:`_encode_state`).
+
+    :param data: The encoded state
+    :param encoding: What it was encoded with, as recorded with it (E.G. msgpack+zstd)
+    :return: The serialized state
+    """
+    format_, _, compression = encoding.partition("+")
+    if compression == "zstd":
+        data = _import_zstandard().ZstdDecompressor().decompress(data)
+    if format_ == "msgpack":
+        return _import_msgpack().unpackb(data, raw=False)
+    return json.loads(data)
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "msgpack is required to encode states with msgpack -- install it with `pip install msgpack`."
+        ) from e
+    return msgpack
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required to compress states with zstd -- install it with `pip install zstandard`."
+        ) from e
+    return zstandard
+
+
+def _hash_to_save(
+    partition_key: str,
+    app_id: str,
+    sequence_id: int,
+    position: str,
+    encoded_state: bytes,
+    status: str,
+    encoding: str,
+) -> List[Any]:
+    """Gives the field/value pairs of the hash we save a state to."""
+    return [
+        "partition_key",
+        partition_key,
+        "app_id",
+        app_id,
+        "sequence_id",
+        sequence_id,
+        "position",
+        position,
+        "state",
+        encoded_state,
+        "status",
+        status,
+        "created_at",
+        datetime.now(timezone.utc).isoformat(),
+        "encoding",
+        encoding,
+    ]
+
+
+def _persisted_state_data(
+    partition_key: str,
+    app_id: str,
+    sequence_id: int,
+    data: Dict[bytes, bytes],
+    serde_kwargs: dict,
+    blob_store: Optional[persistence.BlobStore] = None,
+) -> persistence.PersistedStateData:
+    """Converts a saved hash to the data to return from load."""
+    # states saved before we recorded the encoding are JSON
+    encoding = data.get(b"encoding", b"json").decode()
+    _state = persistence.deserialize_state(
+        _decode_state(data[b"state"], encoding), serde_kwargs, blob_store
+    )
+    return {
+        "partition_key": partition_key,
+        "app_id": app_id,
+        "sequence_id": sequence_id,
+        "position": data[b"position"].decode(),
+        "state": _state,
+        "created_at": data[b"created_at"].decode(),
+        "status": data[b"status"].decode(),
+    }
+
+
+def _pairs_to_dict(pairs: List[bytes]) -> Dict[bytes, bytes]:
+    """Converts the flat field/value list a script gets from HGETALL to a dict."""
+    return dict(zip(pairs[::2], pairs[1::2]))
+
+
 class RedisBasePersister(persistence.BaseStatePersister):
     """Main class for Redis persister.
 
@@ -35,6 +174,17 @@ class RedisBasePersister(persistence.BaseStatePersister):
 
     Note: We didn't create the right constructor for the initial implementation of the RedisPersister class,
     so this is an attempt to fix that in a backwards compatible way.
+
+    Saving a state and loading the latest state each take a single round trip, as server-side (Lua) scripts.
+    These touch keys across hash slots, so this needs a non-clustered Redis. Saves are atomic -- a state is
+    written, and recorded as the latest for the app, only if it has not been saved already.
+
+    States are JSON-encoded by default. Pass ``state_encoding="msgpack"`` (requires ``msgpack``) for a more
+    compact encoding, and/or ``compression="zstd"`` (requires ``zstandard``) to compress them. The encoding is
+    stored with each state, so states saved with any encoding can be loaded.
+
+    To store large state fields once (and out of Redis), pass a
+    :py:class:`BlobStore <burr.core.persistence.BlobStore>` as ``blob_store``.
     """
 
     @classmethod
@@ -52,6 +202,9 @@ class RedisBasePersister(persistence.BaseStatePersister):
         serde_kwargs: dict = None,
         redis_client_kwargs: dict = None,
         namespace: str = None,
+        state_encoding: StateEncoding = "json",
+        compression: Optional[StateCompression] = None,
+        blob_store: Optional[persistence.BlobStore] = None,
     ) -> "RedisBasePersister":
         """Creates a new instance of the RedisBasePersister from passed in values."""
         if redis_client_kwargs is None:
@@ -59,23 +212,43 @@ class RedisBasePersister(persistence.BaseStatePersister):
         connection = redis.Redis(
             host=host, port=port, db=db, password=password, **redis_client_kwargs
         )
-        return cls(connection, serde_kwargs, namespace)
+        return cls(connection, serde_kwargs, namespace, state_encoding, compression, blob_store)
 
     def __init__(
         self,
         connection,
         serde_kwargs: dict = None,
         namespace: str = None,
+        state_encoding: StateEncoding = "json",
+        compression: Optional[StateCompression] = None,
+        blob_store: Optional[persistence.BlobStore] = None,
     ):
         """Initializes the RedisPersister class.
 
         :param connection: the redis connection object.
         :param serde_kwargs: serialization and deserialization keyword arguments to pass to state SERDE.
         :param namespace: The name of the project to optionally use in the key prefix.
+        :param state_encoding: Format to encode states with, json or msgpack.
+        :param compression: Compression to apply to encoded states -- zstd, or None for none.
+        :param blob_store: If set, large state fields are stored in this, and states store references to them.
         """
         self.connection = connection
         self.serde_kwargs = serde_kwargs or {}
         self.namespace = namespace if namespace else ""
+        self.state_encoding = state_encoding
+        self.compression = compression
+        self.blob_store = blob_store
+        self._register_scripts()
+
+    def _register_scripts(self):
+        self._save_script = self.connection.register_script(_SAVE_SCRIPT)
+        self._load_latest_script = self.connection.register_script(_LOAD_LATEST_SCRIPT)
+
+    @property
+    def _encoding(self) -> str:
+        return (
+            f"{self.state_encoding}+{self.compression}" if self.compression else self.state_encoding
+        )
 
     def __enter__(self):
         return self
@@ -107,26 +280,23 @@ class RedisBasePersister(persistence.BaseStatePersister):
         :param kwargs:
         :return: Value or None.
         """
-        namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
         if sequence_id is None:
-            sequence_id = self.connection.zscore(namespaced_partition_key, app_id)
-            if sequence_id is None:
+            namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
+            result = self._load_latest_script(
+                keys=[namespaced_partition_key],
+                args=[app_id, self.create_key(app_id, partition_key, "")],
+            )
+            if result is None:
                 return None
-            sequence_id = int(sequence_id)
-        key = self.create_key(app_id, partition_key, sequence_id)
-        data = self.connection.hgetall(key)
+            sequence_id, pairs = int(result[0]), result[1]
+            data = _pairs_to_dict(pairs)
+        else:
+            data = self.connection.hgetall(self.create_key(app_id, partition_key, sequence_id))
         if not data:
             return None
-        _state = state.State.deserialize(json.loads(data[b"state"].decode()), **self.serde_kwargs)
-        return {
-            "partition_key": partition_key,
-            "app_id": app_id,
-            "sequence_id": sequence_id,
-            "position": data[b"position"].decode(),
-            "state": _state,
-            "created_at": data[b"created_at"].decode(),
-            "status": data[b"status"].decode(),
-        }
+        return _persisted_state_data(
+            partition_key, app_id, sequence_id, data, self.serde_kwargs, self.blob_store
+        )
 
     def create_key(self, app_id, partition_key, sequence_id):
         """Create a key for the Redis database."""
@@ -156,23 +326,29 @@ class RedisBasePersister(persistence.BaseStatePersister):
         :return:
         """
         key = self.create_key(app_id, partition_key, sequence_id)
-        if self.connection.exists(key):
-            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
-        json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        self.connection.hset(
-            key,
-            mapping={
-                "partition_key": partition_key,
-                "app_id": app_id,
-                "sequence_id": sequence_id,
-                "position": position,
-                "state": json_state,
-                "status": status,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        serialized_state = persistence.serialize_state(state, self.serde_kwargs, self.blob_store)
+        encoded_state = _encode_state(serialized_state, self.state_encoding, self.compression)
         namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
-        self.connection.zadd(namespaced_partition_key, {app_id: sequence_id})
+        saved = self._save_script(
+            keys=[key, namespaced_partition_key],
+            args=[
+                sequence_id,
+                app_id,
+                *_hash_to_save(
+                    partition_key,
+                    app_id,
+                    sequence_id,
+                    position,
+                    encoded_state,
+                    status,
+                    self._encoding,
+                ),
+            ],
+        )
+        if not saved:
+            if self.blob_store is not None:
+                self.blob_store.release(self.blob_store.references(serialized_state))
+            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
 
     def cleanup(self):
         """Closes the connection to the database."""
@@ -187,6 +363,9 @@ class RedisBasePersister(persistence.BaseStatePersister):
 
     def __getstate__(self) -> dict:
         state = self.__dict__.copy()
+        # scripts are bound to the connection
+        del state["_save_script"]
+        del state["_load_latest_script"]
         state["connection_params"] = {
             "host": self.connection.connection_pool.connection_kwargs["host"],
             "port": self.connection.connection_pool.connection_kwargs["port"],
@@ -201,6 +380,7 @@ class RedisBasePersister(persistence.BaseStatePersister):
         # we assume normal redis client.
         self.connection = redis.Redis(**connection_params)
         self.__dict__.update(state)
+        self._register_scripts()
 
 
 class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
@@ -216,6 +396,8 @@ class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
 
     This class is responsible for async persisting state data to a Redis database.
     It inherits from the AsyncBaseStatePersister class.
+
+    Saves and loads work as they do in :py:class:`RedisBasePersister` -- see there for details.
     """
 
     @classmethod
@@ -233,6 +415,9 @@ class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
         serde_kwargs: dict = None,
         redis_client_kwargs: dict = None,
         namespace: str = None,
+        state_encoding: StateEncoding = "json",
+        compression: Optional[StateCompression] = None,
+        blob_store: Optional[persistence.BlobStore] = None,
     ) -> "AsyncRedisBasePersister":
         """Creates a new instance of the AsyncRedisBasePersister from passed in values."""
         if redis_client_kwargs is None:
@@ -240,23 +425,43 @@ class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
         connection = aredis.Redis(
             host=host, port=port, db=db, password=password, **redis_client_kwargs
         )
-        return cls(connection, serde_kwargs, namespace)
+        return cls(connection, serde_kwargs, namespace, state_encoding, compression, blob_store)
 
     def __init__(
         self,
         connection,
         serde_kwargs: dict = None,
         namespace: str = None,
+        state_encoding: StateEncoding = "json",
+        compression: Optional[StateCompression] = None,
+        blob_store: Optional[persistence.BlobStore] = None,
     ):
         """Initializes the AsyncRedisPersister class.
 
         :param connection: the redis connection object.
         :param serde_kwargs: serialization and deserialization keyword arguments to pass to state SERDE.
         :param namespace: The name of the project to optionally use in the key prefix.
+        :param state_encoding: Format to encode states with, json or msgpack.
+        :param compression: Compression to apply to encoded states -- zstd, or None for none.
+        :param blob_store: If set, large state fields are stored in this, and states store references to them.
         """
         self.connection = connection
         self.serde_kwargs = serde_kwargs or {}
         self.namespace = namespace if namespace else ""
+        self.state_encoding = state_encoding
+        self.compression = compression
+        self.blob_store = blob_store
+        self._register_scripts()
+
+    def _register_scripts(self):
+        self._save_script = self.connection.register_script(_SAVE_SCRIPT)
+        self._load_latest_script = self.connection.register_script(_LOAD_LATEST_SCRIPT)
+
+    @property
+    def _encoding(self) -> str:
+        return (
+            f"{self.state_encoding}+{self.compression}" if self.compression else self.state_encoding
+        )
 
     async def __aenter__(self):
         return self
@@ -288,26 +493,25 @@ class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
         :param kwargs:
         :return: Value or None.
         """
-        namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
         if sequence_id is None:
-            sequence_id = await self.connection.zscore(namespaced_partition_key, app_id)
-            if sequence_id is None:
+            namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
+            result = await self._load_latest_script(
+                keys=[namespaced_partition_key],
+                args=[app_id, self.create_key(app_id, partition_key, "")],
+            )
+            if result is None:
                 return None
-            sequence_id = int(sequence_id)
-        key = self.create_key(app_id, partition_key, sequence_id)
-        data = await self.connection.hgetall(key)
+            sequence_id, pairs = int(result[0]), result[1]
+            data = _pairs_to_dict(pairs)
+        else:
+            data = await self.connection.hgetall(
+                self.create_key(app_id, partition_key, sequence_id)
+            )
         if not data:
             return None
-        _state = state.State.deserialize(json.loads(data[b"state"].decode()), **self.serde_kwargs)
-        return {
-            "partition_key": partition_key,
-            "app_id": app_id,
-            "sequence_id": sequence_id,
-            "position": data[b"position"].decode(),
-            "state": _state,
-            "created_at": data[b"created_at"].decode(),
-            "status": data[b"status"].decode(),
-        }
+        return _persisted_state_data(
+            partition_key, app_id, sequence_id, data, self.serde_kwargs, self.blob_store
+        )
 
     def create_key(self, app_id, partition_key, sequence_id):
         """Create a key for the Redis database."""
@@ -337,23 +541,35 @@ class AsyncRedisBasePersister(persistence.AsyncBaseStatePersister):
         :return:
         """
         key = self.create_key(app_id, partition_key, sequence_id)
-        if await self.connection.exists(key):
-            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
-        json_state = json.dumps(state.serialize(**self.serde_kwargs))
-        await self.connection.hset(
-            key,
-            mapping={
-                "partition_key": partition_key,
-                "app_id": app_id,
-                "sequence_id": sequence_id,
-                "position": position,
-                "state": json_state,
-                "status": status,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        if self.blob_store is not None:
+            # offloading writes to the blob store, which is synchronous
+            serialized_state = await asyncio.get_running_loop().run_in_executor(
+                None, persistence.serialize_state, state, self.serde_kwargs, self.blob_store
+            )
+        else:
+            serialized_state = state.serialize(**self.serde_kwargs)
+        encoded_state = _encode_state(serialized_state, self.state_encoding, self.compression)
         namespaced_partition_key = add_namespace_to_partition_key(partition_key, self.namespace)
-        await self.connection.zadd(namespaced_partition_key, {app_id: sequence_id})
+        saved = await self._save_script(
+            keys=[key, namespaced_partition_key],
+            args=[
+                sequence_id,
+                app_id,
+                *_hash_to_save(
+                    partition_key,
+                    app_id,
+                    sequence_id,
+                    position,
+                    encoded_state,
+                    status,
+                    self._encoding,
+                ),
+            ],
+        )
+        if not saved:
+            if self.blob_store is not None:
+                self.blob_store.release(self.blob_store.references(serialized_state))
+            raise ValueError(f"partition_key:app_id:sequence_id[{key}] already exists.")
 
     async def cleanup(self):
         """Closes the connection to the database."""
@@ -375,6 +591,8 @@ class RedisPersister(RedisBasePersister):
         serde_kwargs: dict = None,
         redis_client_kwargs: dict = None,
         namespace: str = None,
+        state_encoding: StateEncoding = "json",
+        compression: Optional[StateCompression] = None,
     ):
         """Initializes the RedisPersister class.
 
@@ -387,13 +605,17 @@ class RedisPersister(RedisBasePersister):
         :param serde_kwargs:
         :param redis_client_kwargs: Additional keyword arguments to pass to the redis.Redis client.
         :param namespace: The name of the project to optionally use in the key prefix.
+        :param state_encoding: Format to encode states with, json or msgpack.
+        :param compression: Compression to apply to encoded states -- zstd, or None for none.
         """
         if redis_client_kwargs is None:
             redis_client_kwargs = {}
         connection = redis.Redis(
             host=host, port=port, db=db, password=password, **redis_client_kwargs
         )
-        super(RedisPersister, self).__init__(connection, serde_kwargs, namespace)
+        super(RedisPersister, self).__init__(
+            connection, serde_kwargs, namespace, state_encoding, compression
+        )
 
 
 if __name__ == "__main__":
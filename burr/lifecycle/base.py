@@ -1,7 +1,7 @@
 import abc
 import datetime
 import enum
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import burr.common.types as burr_types
 
@@ -401,7 +401,10 @@ class PreStartStreamHookAsync(abc.ABC):
 
 @lifecycle.base_hook("post_stream_item")
 class PostStreamItemHook(abc.ABC):
-    """Hook that runs after a stream item is yielded"""
+    """Hook that runs after a stream item is yielded. With ``ApplicationBuilder.with_stream_item_coalescing``,
+    this runs once per batch of items, with the latest one -- ``item_count`` (passed in the kwargs) gives the
+    number of items the call stands for. See :py:class:`PostStreamItemsHook` if you need every item.
+    """
 
     @abc.abstractmethod
     def post_stream_item(
@@ -441,6 +444,52 @@ class PostStreamItemHookAsync(abc.ABC):
         pass
 
 
+@lifecycle.base_hook("post_stream_items")
+class PostStreamItemsHook(abc.ABC):
+    """Hook that runs after a batch of stream items is yielded. This is the batch-aware version of
+    :py:class:`PostStreamItemHook` -- with ``ApplicationBuilder.with_stream_item_coalescing``, items are
+    delivered in batches, otherwise each batch is a single item. The first item is always delivered in
+    its own batch, as soon as it is yielded."""
+
+    @abc.abstractmethod
+    def post_stream_items(
+        self,
+        *,
+        items: List[Any],
+        first_item_index: int,
+        stream_initialize_time: datetime.datetime,
+        first_stream_item_start_time: datetime.datetime,
+        action: str,
+        sequence_id: int,
+        app_id: str,
+        partition_key: Optional[str],
+        **future_kwargs: Any,
+    ):
+        pass
+
+
+@lifecycle.base_hook("post_stream_items")
+class PostStreamItemsHookAsync(abc.ABC):
+    """Hook that runs after a batch of stream items is yielded, async version. See
+    :py:class:`PostStreamItemsHook`."""
+
+    @abc.abstractmethod
+    async def post_stream_items(
+        self,
+        *,
+        items: List[Any],
+        first_item_index: int,
+        stream_initialize_time: datetime.datetime,
+        first_stream_item_start_time: datetime.datetime,
+        action: str,
+        sequence_id: int,
+        app_id: str,
+        partition_key: Optional[str],
+        **future_kwargs: Any,
+    ):
+        pass
+
+
 @lifecycle.base_hook("post_end_stream")
 class PostEndStreamHook(abc.ABC):
     """Hook that runs after a stream is ended"""
@@ -494,8 +543,10 @@ LifecycleAdapter = Union[
     PostEndSpanHookAsync,
     PreStartStreamHook,
     PostStreamItemHook,
+    PostStreamItemsHook,
     PostEndStreamHook,
     PreStartStreamHookAsync,
     PostStreamItemHookAsync,
+    PostStreamItemsHookAsync,
     PostEndStreamHookAsync,
 ]
@@ -3,7 +3,7 @@ hamilton implementation, but significantly simplified."""
 import asyncio
 import collections
 import inspect
-from typing import TYPE_CHECKING, Callable, Dict, List, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     # type-checking-only for a circular import
@@ -103,6 +103,16 @@ class LifecycleAdapterSet:
         """
         self._adapters = list(adapters)
         self.sync_hooks, self.async_hooks = self._get_lifecycle_hooks()
+        # Hooks are dispatched on every step (and stream item), so we resolve them to bound methods
+        # once, up front, rather than looking them up on every call
+        self._sync_hook_callables: Dict[str, Tuple[Callable, ...]] = {
+            hook_name: tuple(getattr(adapter, hook_name) for adapter in adapters)
+            for hook_name, adapters in self.sync_hooks.items()
+        }
+        self._async_hook_callables: Dict[str, Tuple[Callable, ...]] = {
+            hook_name: tuple(getattr(adapter, hook_name) for adapter in adapters)
+            for hook_name, adapters in self.async_hooks.items()
+        }
 
     def with_new_adapters(self, *adapters: "LifecycleAdapter") -> "LifecycleAdapterSet":
         """Adds new adapters to the set.
@@ -132,13 +142,12 @@ class LifecycleAdapterSet:
             {hook: adapters for hook, adapters in async_hooks.items()},
         )
 
-    def _does_hook(self, hook_name: str, is_async: bool) -> bool:
-        """Whether or not a hook is implemented by any of the adapters in this group.
-        If this hook is not registered, this will raise a ValueError.
+    @staticmethod
+    def _validate_hook_name(hook_name: str, is_async: bool):
+        """Validates that a hook is registered, raising a ValueError if it is not.
 
         :param hook_name: Name of the hook
         :param is_async: Whether you want the async version or not
-        :return: True if this adapter set does this hook, False otherwise
         """
         if is_async and hook_name not in REGISTERED_ASYNC_HOOKS:
             raise ValueError(
@@ -150,9 +159,33 @@ class LifecycleAdapterSet:
                 f"Hook {hook_name} is not registered as a synchronous lifecycle hook. "
                 f"Registered hooks are {REGISTERED_SYNC_HOOKS}"
             )
-        if not is_async:
-            return hook_name in self.sync_hooks
-        return hook_name in self.async_hooks
+
+    def _does_hook(self, hook_name: str, is_async: bool) -> bool:
+        """Whether or not a hook is implemented by any of the adapters in this group.
+        If this hook is not registered, this will raise a ValueError.
+
+        :param hook_name: Name of the hook
+        :param is_async: Whether you want the async version or not
+        :return: True if this adapter set does this hook, False otherwise
+        """
+        self._validate_hook_name(hook_name, is_async)
+        return self.does_hook(hook_name, is_async)
+
+    def does_hook(self, hook_name: str, is_async: Optional[bool] = False) -> bool:
+        """Whether or not a hook is implemented by any of the adapters in this group.
+        Unlike ``_does_hook`` this does not validate the hook name, so it is cheap enough to guard
+        hook calls in hot paths -- use it to skip computing the hook's arguments when nobody listens.
+
+        :param hook_name: Name of the hook
+        :param is_async: Whether you want the async version (True), the sync version (False),
+            or either (None)
+        :return: True if this adapter set does this hook, False otherwise
+        """
+        if is_async is None:
+            return hook_name in self._sync_hook_callables or hook_name in self._async_hook_callables
+        if is_async:
+            return hook_name in self._async_hook_callables
+        return hook_name in self._sync_hook_callables
 
     def call_all_lifecycle_hooks_sync(self, hook_name: str, **kwargs):
         """Calls all the lifecycle hooks in this group, by hook name (stage)
@@ -160,10 +193,13 @@ class LifecycleAdapterSet:
         :param hook_name: Name of the hooks to call
         :param kwargs: Keyword arguments to pass into the hook
         """
-        if not self._does_hook(hook_name, False):
+        hooks = self._sync_hook_callables.get(hook_name)
+        if hooks is None:
+            # we only have to check the registry if it's not implemented -- if it is, it's registered
+            self._validate_hook_name(hook_name, False)
             return
-        for adapter in self.sync_hooks[hook_name]:
-            getattr(adapter, hook_name)(**kwargs)
+        for hook in hooks:
+            hook(**kwargs)
 
     async def call_all_lifecycle_hooks_async(self, hook_name: str, **kwargs):
         """Calls all the lifecycle hooks in this group, by hook name (stage).
@@ -171,14 +207,14 @@ class LifecycleAdapterSet:
         :param hook_name: Name of the hook
         :param kwargs: Keyword arguments to pass into the hook
         """
-        if not self._does_hook(hook_name, True):
-            return
-        futures = []
-        for adapter in self.async_hooks[hook_name]:
-            futures.append(getattr(adapter, hook_name)(**kwargs))
-        if len(futures) == 0:
+        hooks = self._async_hook_callables.get(hook_name)
+        if hooks is None:
+            self._validate_hook_name(hook_name, True)
             return  # No async hooks to call
-        await asyncio.gather(*futures)
+        if len(hooks) == 1:
+            await hooks[0](**kwargs)
+            return
+        await asyncio.gather(*[hook(**kwargs) for hook in hooks])
 
     async def call_all_lifecycle_hooks_sync_and_async(self, hook_name: str, **kwargs):
         """Calls all the lifecycle hooks in this group, by hook name (stage).
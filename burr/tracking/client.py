@@ -1,10 +1,17 @@
 import abc
+import atexit
 import dataclasses
 import datetime
+import queue
+import threading
+import time
+import weakref
 
 from burr.common.types import BaseCopyable
 from burr.lifecycle.base import (
     DoLogAttributeHook,
+    ExecuteMethod,
+    PostApplicationExecuteCallHook,
     PostEndStreamHook,
     PostStreamItemHook,
     PreStartStreamHook,
@@ -32,7 +39,7 @@ import os
 import re
 import traceback
 from abc import ABC
-from typing import Any, Dict, Optional, Tuple
+from typing import IO, Any, Collection, Dict, List, Optional, Tuple
 
 try:
     from typing import Self
@@ -51,9 +58,11 @@ from burr.lifecycle import (
     PreRunStepHook,
     PreStartSpanHook,
 )
+from burr.tracking.common.log_index import write_index_record
 from burr.tracking.common.models import (
     ApplicationMetadataModel,
     ApplicationModel,
+    ApplicationWrittenModel,
     AttributeModel,
     BeginEntryModel,
     BeginSpanModel,
@@ -109,6 +118,133 @@ class StreamState:
 
 StateKey = Tuple[str, str, Optional[str]]
 
+# index file + sequence ID to record the line's offset under
+IndexTarget = Tuple[IO[bytes], int]
+
+
+def _write_log_lines(f: IO[str], lines: List[Tuple[str, Optional[IndexTarget]]], fsync: bool):
+    """Writes lines to the log, then records the offsets of the indexed ones in their index files.
+    The index is written after the log is flushed so it never points past the end of the log."""
+    pending = []
+    index_records = []
+    for line, index_target in lines:
+        if index_target is not None:
+            f.write("".join(pending))
+            pending = []
+            index_records.append(
+                (index_target, f.tell())
+            )  # tell() flushes, so this is a byte offset
+        pending.append(line)
+    f.write("".join(pending))
+    f.flush()
+    if fsync:
+        os.fsync(f.fileno())
+    index_files = {}
+    for (index_f, sequence_id), offset in index_records:
+        write_index_record(index_f, sequence_id, offset)
+        index_files[id(index_f)] = index_f
+    for index_f in index_files.values():
+        index_f.flush()
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+class _BufferedLogWriter:
+    """Writes log entries from a background thread. Entries are converted to JSON on the writer thread
+    and written in batches -- a batch is written once it has ``max_batch_size`` entries, once the
+    oldest entry in it is ``flush_interval_seconds`` old, or when :py:meth:`flush` is called."""
+
+    def __init__(self, flush_interval_seconds: float, max_batch_size: int, fsync: bool):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.fsync = fsync
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        _BUFFERED_LOG_WRITERS.add(self)
+
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def write(
+        self, f: IO[str], entry: pydantic.BaseModel, index_target: Optional[IndexTarget] = None
+    ):
+        """Enqueues an entry to be written to the file. The entry must not share mutable values with
+        anything the caller may change afterwards (E.G. state) -- serialize those first.
+
+        :param f: File to append the entry to
+        :param entry: Model to write
+        :param index_target: Index file and sequence ID to record the entry's offset under, if any
+        """
+        self._ensure_thread()
+        self._queue.put((f, entry, index_target))
+
+    def flush(self):
+        """Blocks until every entry enqueued so far has been written to its file."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done, None))
+        done.wait()
+
+    def close(self):
+        """Flushes all pending entries and stops the writer thread."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_STOP, done, None))
+        done.wait()
+
+    def _write_batch(self, batch: List[Tuple[IO[str], str, Optional[IndexTarget]]]):
+        by_file: Dict[int, Tuple[IO[str], List[Tuple[str, Optional[IndexTarget]]]]] = {}
+        for f, line, index_target in batch:
+            by_file.setdefault(id(f), (f, []))[1].append((line, index_target))
+        for f, lines in by_file.values():
+            try:
+                _write_log_lines(f, lines, self.fsync)
+            except Exception:
+                logger.exception(f"Failed to write {len(lines)} tracking entries to {f}")
+
+    def _run(self):
+        batch: List[Tuple[IO[str], str, Optional[IndexTarget]]] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                f, entry, index_target = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                f, entry, index_target = None, None, None
+            if f is not None and f is not _FLUSH and f is not _STOP:
+                try:
+                    batch.append((f, entry.model_dump_json() + "\n", index_target))
+                except Exception:
+                    logger.exception("Failed to serialize tracking entry")
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval_seconds
+                if len(batch) < self.max_batch_size:
+                    continue
+            self._write_batch(batch)
+            batch = []
+            deadline = None
+            if f is _FLUSH or f is _STOP:
+                entry.set()
+            if f is _STOP:
+                return
+
+
+_BUFFERED_LOG_WRITERS: "weakref.WeakSet[_BufferedLogWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_log_writers_at_exit():
+    for writer in list(_BUFFERED_LOG_WRITERS):
+        writer.flush()
+
 
 class SyncTrackingClient(
     PostApplicationCreateHook,
@@ -137,21 +273,34 @@ class SyncTrackingClient(
 
 class LocalTrackingClient(
     SyncTrackingClient,
+    PostApplicationExecuteCallHook,
     BaseStateLoader,
 ):
     """Tracker to track locally -- goes along with the Burr UI. Writes
     down the following:
     #. The whole application + debugging information (e.g. source code) to a file
     #. A line for the start/end of each step
+
+    By default every line is written and flushed as it is logged. With ``buffered=True``, lines are
+    encoded and written in batches by a background thread (state and results are still serialized
+    as they are logged, so later mutations do not leak into the log). Pending lines are flushed when the
+    application methods in ``flush_after`` return, when the state is loaded from the tracker, and at
+    interpreter exit.
     """
 
     GRAPH_FILENAME = "graph.json"
     METADATA_FILENAME = "metadata.json"
     LOG_FILENAME = "log.jsonl"
+    LOG_INDEX_FILENAME = (
+        "log.index"  # byte offset of each step in the log, see burr.tracking.common.log_index
+    )
     CHILDREN_FILENAME = (
         "children.jsonl"  # any applications that are spawned or forked will show up here
     )
     # This is purely an optimization for bi-directional relationships using filesystems (denormalized data)
+    WRITTEN_FILENAME = (
+        "written.jsonl"  # in the project directory -- a line per step of any of its applications
+    )
     DEFAULT_STORAGE_DIR = "~/.burr"
 
     def __init__(
@@ -159,6 +308,20 @@ class LocalTrackingClient(
         project: str,
         storage_dir: str = DEFAULT_STORAGE_DIR,
         serde_kwargs: Optional[Dict[str, Any]] = None,
+        buffered: bool = False,
+        flush_interval_seconds: float = 1.0,
+        max_batch_size: int = 1000,
+        fsync: bool = False,
+        flush_after: Collection[ExecuteMethod] = (
+            ExecuteMethod.iterate,
+            ExecuteMethod.aiterate,
+            ExecuteMethod.run,
+            ExecuteMethod.arun,
+            ExecuteMethod.stream_result,
+            ExecuteMethod.astream_result,
+            ExecuteMethod.stream_iterate,
+            ExecuteMethod.astream_iterate,
+        ),
     ):
         """Instantiates a local tracking client. This will create the following directories, if they don't exist:
         #. The base directory (defaults to ~/.burr)
@@ -170,9 +333,19 @@ class LocalTrackingClient(
 
         :param project: Project name -- if this already exists it will be used, otherwise it will be created.
         :param storage_dir: Storage directory
+        :param serde_kwargs: Keyword arguments to pass to the serializer
+        :param buffered: Whether to write log lines in batches from a background thread, rather than flushing each line as it is logged.
+        :param flush_interval_seconds: When buffered, the longest a logged line waits before it is written.
+        :param max_batch_size: When buffered, the number of lines that triggers a write regardless of the interval.
+        :param fsync: Whether to ``fsync`` the log file after each write, so lines survive an OS crash.
+        :param flush_after: When buffered, application methods that wait for all pending lines to be written when they return.
         """
 
         self.f = None
+        self.index_f = None
+        self.written_f = None
+        self.app_id = None
+        self._writer: Optional[_BufferedLogWriter] = None
         if not _allowed_project_name(project, on_windows=system.IS_WINDOWS):
             raise ValueError(
                 f"Project: {project} is not valid. Project name cannot contain non-alphanumeric (except _ and -) characters."
@@ -182,6 +355,11 @@ class LocalTrackingClient(
         self.storage_dir = LocalTrackingClient.get_storage_path(project, storage_dir)
         self.project_id = project
         self.serde_kwargs = serde_kwargs if serde_kwargs is not None else {}
+        self.buffered = buffered
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.fsync = fsync
+        self.flush_after = set(flush_after)
         # app_id, action, partition_key  -> stream data so we can track
         self.stream_state: Dict[StateKey, StreamState] = dict()
 
@@ -263,6 +441,11 @@ class LocalTrackingClient(
             project=self.project_id,
             storage_dir=self.raw_storage_dir,
             serde_kwargs=self.serde_kwargs,
+            buffered=self.buffered,
+            flush_interval_seconds=self.flush_interval_seconds,
+            max_batch_size=self.max_batch_size,
+            fsync=self.fsync,
+            flush_after=self.flush_after,
         )
 
     @classmethod
@@ -366,11 +549,16 @@ class LocalTrackingClient(
 
     def __getstate__(self):
         out = {
-            key: value for key, value in self.__dict__.items() if key != "f"
-        }  # the file we don't want to serialize
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("f", "index_f", "written_f", "_writer")
+        }  # the files (and the thread writing to them) we don't want to serialize
         # Note that this will only work if we also call post_application_create
         # For now that's OK as that's the only reason we'll add it -- if we want more distribution later we'll have to serialize the file
         out["f"] = None
+        out["index_f"] = None
+        out["written_f"] = None
+        out["_writer"] = None
         return out
 
     def post_application_create(
@@ -391,6 +579,14 @@ class LocalTrackingClient(
             encoding="utf-8",
             errors="replace",
         )
+        self.index_f = open(os.path.join(self.storage_dir, app_id, self.LOG_INDEX_FILENAME), "ab")
+        self.written_f = open(
+            os.path.join(self.storage_dir, self.WRITTEN_FILENAME),
+            "a",
+            encoding="utf-8",
+            errors="replace",
+        )
+        self.app_id = app_id
 
         graph_path = os.path.join(self.storage_dir, app_id, self.GRAPH_FILENAME)
         if os.path.exists(graph_path):
@@ -421,9 +617,44 @@ class LocalTrackingClient(
             app_id,
         )
 
-    def _append_write_line(self, model: pydantic.BaseModel):
-        self.f.write(model.model_dump_json() + "\n")
-        self.f.flush()
+    def _append_write_line(
+        self,
+        entry: pydantic.BaseModel,
+        indexed_sequence_id: Optional[int] = None,
+        f: Optional[IO[str]] = None,
+    ):
+        """Writes an entry to the log.
+
+        :param entry: Model to write
+        :param indexed_sequence_id: Sequence ID to record this line's offset under in the index, if any
+        :param f: File to write the entry to, if not the log
+        """
+        f = f if f is not None else self.f
+        index_target = None
+        if indexed_sequence_id is not None and self.index_f is not None:
+            index_target = (self.index_f, indexed_sequence_id)
+        if self.buffered:
+            if self._writer is None:
+                self._writer = _BufferedLogWriter(
+                    self.flush_interval_seconds, self.max_batch_size, self.fsync
+                )
+            self._writer.write(f, entry, index_target)
+            return
+        _write_log_lines(f, [(entry.model_dump_json() + "\n", index_target)], self.fsync)
+
+    def flush(self):
+        """Blocks until all buffered log lines have been written. A no-op if not buffered."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def post_run_execute_call(
+        self,
+        *,
+        method: ExecuteMethod,
+        **future_kwargs: Any,
+    ):
+        if method in self.flush_after:
+            self.flush()
 
     def pre_run_step(
         self,
@@ -440,7 +671,7 @@ class LocalTrackingClient(
             inputs=serde.serialize(_filtered_inputs, **self.serde_kwargs),
             sequence_id=sequence_id,
         )
-        self._append_write_line(pre_run_entry)
+        self._append_write_line(pre_run_entry, indexed_sequence_id=sequence_id)
 
     def post_run_step(
         self,
@@ -451,6 +682,8 @@ class LocalTrackingClient(
         exception: Exception,
         **future_kwargs: Any,
     ):
+        # Serialized here, rather than on the writer thread -- state values are shared with later
+        # states (and the user), so they may be mutated after this returns
         post_run_entry = EndEntryModel(
             end_time=datetime.datetime.now(),
             action=action.name,
@@ -460,6 +693,12 @@ class LocalTrackingClient(
             state=state.serialize(**self.serde_kwargs),
         )
         self._append_write_line(post_run_entry)
+        if self.written_f is not None:
+            # lets the server keep the project's applications ordered by when they were last written
+            self._append_write_line(
+                ApplicationWrittenModel(app_id=self.app_id, written_time=time.time()),
+                f=self.written_f,
+            )
 
     def pre_start_span(
         self,
@@ -553,7 +792,7 @@ class LocalTrackingClient(
     ):
         stream_state = self.stream_state[app_id, action, partition_key]
         if stream_state.count == 0:
-            stream_state.count += 1
+            stream_state.count += future_kwargs.get("item_count", 1)
             self._append_write_line(
                 FirstItemStreamModel(
                     action_sequence_id=sequence_id,
@@ -562,7 +801,7 @@ class LocalTrackingClient(
                 )
             )
         else:
-            stream_state.count += 1
+            stream_state.count += future_kwargs.get("item_count", 1)
 
     def post_end_stream(
         self,
@@ -585,8 +824,14 @@ class LocalTrackingClient(
         del self.stream_state[app_id, action, partition_key]
 
     def __del__(self):
+        if self._writer is not None:
+            self._writer.close()
         if self.f is not None:
             self.f.close()
+        if self.index_f is not None:
+            self.index_f.close()
+        if self.written_f is not None:
+            self.written_f.close()
 
     def list_app_ids(self, partition_key: str, **kwargs) -> list[str]:
         # TODO:
@@ -598,6 +843,7 @@ class LocalTrackingClient(
         # TODO:
         if app_id is None:
             return  # no application ID
+        self.flush()
         path = os.path.join(self.storage_dir, app_id, self.LOG_FILENAME)
         if not os.path.exists(path):
             return None
@@ -0,0 +1,63 @@
+"""Sidecar index for the local tracker's log.jsonl.
+
+The index is an append-only file of fixed-width records, one per step, written by the
+:py:class:`LocalTrackingClient <burr.tracking.client.LocalTrackingClient>` alongside the log.
+Each record holds the step's sequence ID and the byte offset of its ``begin_entry`` line in the log.
+Everything logged for a step (spans, attributes, stream events, the ``end_entry``) falls between
+that offset and the next step's, so readers can count steps or seek to a step without reading the log.
+
+The index may be absent (logs written by older clients) or cover only the later steps of a log
+(an older log appended to by a newer client) -- readers should fall back to scanning the log.
+"""
+
+import os
+import struct
+from typing import IO, List, Optional, Tuple
+
+# sequence_id, byte offset of the step's begin_entry line in log.jsonl
+INDEX_RECORD = struct.Struct("<qq")
+
+IndexRecord = Tuple[int, int]
+
+
+def write_index_record(f: IO[bytes], sequence_id: int, offset: int):
+    """Appends a record to an index file opened in binary append mode.
+
+    :param f: Index file
+    :param sequence_id: Sequence ID of the step
+    :param offset: Byte offset of the step's begin_entry line in the log
+    """
+    f.write(INDEX_RECORD.pack(sequence_id, offset))
+
+
+def read_last_index_record(index_path: str) -> Optional[IndexRecord]:
+    """Reads the last complete record of the index, without reading the rest of it.
+
+    :param index_path: Path to the index file
+    :return: (sequence_id, offset) of the latest step, or None if the index is missing/empty
+    """
+    try:
+        with open(index_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            num_records = size // INDEX_RECORD.size  # ignores a partially written trailing record
+            if num_records == 0:
+                return None
+            f.seek((num_records - 1) * INDEX_RECORD.size)
+            return INDEX_RECORD.unpack(f.read(INDEX_RECORD.size))
+    except FileNotFoundError:
+        return None
+
+
+def read_index(index_path: str) -> List[IndexRecord]:
+    """Reads all complete records of the index, in the order they were written.
+
+    :param index_path: Path to the index file
+    :return: List of (sequence_id, offset), empty if the index is missing
+    """
+    try:
+        with open(index_path, "rb") as f:
+            contents = f.read()
+    except FileNotFoundError:
+        return []
+    usable = len(contents) - len(contents) % INDEX_RECORD.size
+    return list(INDEX_RECORD.iter_unpack(contents[:usable]))
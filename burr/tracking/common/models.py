@@ -102,6 +102,16 @@ class ChildApplicationModel(IdentifyingModel):
     type: str = "child_application_data"
 
 
+class ApplicationWrittenModel(IdentifyingModel):
+    """Records that a step of an application was logged. One of these is appended to a file shared by
+    the project's applications, so the server can keep their last written times up to date without
+    reading each application's directory."""
+
+    app_id: str
+    written_time: float  # seconds since the epoch
+    type: str = "application_written"
+
+
 class ApplicationModel(IdentifyingModel):
     """Pydantic model that represents an application for storing/visualization in the UI"""
 
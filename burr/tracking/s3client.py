@@ -1,14 +1,18 @@
+import concurrent.futures
 import dataclasses
 import datetime
+import functools
+import gzip
 import json
 import logging
 import queue
+import random
 import re
 import threading
 import time
 import traceback
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pydantic
 
@@ -45,10 +49,13 @@ except ImportError as e:
 
 
 def fire_and_forget(func):
+    """Runs the decorated method on the client's upload pool if it is non-blocking,
+    otherwise runs it inline."""
+
     def wrapper(self, *args, **kwargs):
         if self.non_blocking:  # must be used with the S3TrackingClient
 
-            def run():
+            def run(_client):
                 try:
                     func(self, *args, **kwargs)
                 except Exception:
@@ -56,12 +63,106 @@ def fire_and_forget(func):
                         "Exception occurred in fire-and-forget function: %s", func.__name__
                     )
 
-            threading.Thread(target=run).start()
+            self.upload_pool.submit(run)
+            return
         return func(self, *args, **kwargs)
 
     return wrapper
 
 
+_STOP_WORKER = object()
+
+
+class _UploadPool:
+    """Fixed-size pool of upload threads. Each worker creates one boto3 client (from its own session,
+    as boto3 sessions are not thread-safe) and reuses it for every upload it runs.
+    Workers are non-daemon so queued uploads finish before the interpreter exits."""
+
+    def __init__(self, num_workers: int, client_factory: Callable[[], Any]):
+        self.num_workers = num_workers
+        self.client_factory = client_factory
+        self._queue: queue.Queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _ensure_started(self):
+        with self._lock:
+            if not self._workers:
+                for i in range(self.num_workers):
+                    worker = threading.Thread(target=self._run, name=f"burr-s3-upload-{i}")
+                    worker.start()
+                    self._workers.append(worker)
+
+    def in_worker(self) -> bool:
+        """Whether the current thread is one of this pool's workers."""
+        return getattr(self._local, "is_worker", False)
+
+    def client(self) -> Any:
+        """Returns the boto3 client for the current worker thread."""
+        if not hasattr(self._local, "client"):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def submit(self, fn: Callable[[Any], Any]) -> concurrent.futures.Future:
+        """Queues a function to be called with a worker's boto3 client.
+
+        :param fn: Function taking the boto3 client
+        :return: Future for the function's result
+        """
+        self._ensure_started()
+        future = concurrent.futures.Future()
+        self._queue.put((fn, future))
+        return future
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        self._local.is_worker = True
+        while True:
+            item = self._queue.get()
+            if item is _STOP_WORKER:
+                return
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(self.client()))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self):
+        """Waits for all queued uploads to finish, then stops the workers."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(_STOP_WORKER)
+        for worker in workers:
+            worker.join()
+
+
+@dataclasses.dataclass
+class S3UploadMetrics:
+    """Snapshot of the upload activity of an :py:class:`S3TrackingClient`."""
+
+    log_queue_depth: int  # events waiting to be batched
+    upload_queue_depth: int  # uploads waiting for a worker
+    uploads_succeeded: int
+    uploads_failed: int
+    retries: int
+    bytes_uploaded: int
+    total_upload_latency_seconds: float
+    max_upload_latency_seconds: float
+
+    @property
+    def mean_upload_latency_seconds(self) -> Optional[float]:
+        if self.uploads_succeeded == 0:
+            return None
+        return self.total_upload_latency_seconds / self.uploads_succeeded
+
+
 # TODO -- move to common and share with client.py
 
 INPUT_FILTERLIST = {"__tracer"}
@@ -126,7 +227,10 @@ class S3TrackingClient(SyncTrackingClient):
             ...
 
     This is designed to be fast to write, generally slow(ish) to read, but doable, and require no db.
-    This also has a non-blocking mode that just launches a thread (expensive but doable solution)
+    Uploads run on a fixed-size pool of worker threads, each reusing its own boto3 client. Log batches
+    for different applications are uploaded concurrently, and failed uploads are retried with jittered
+    exponential backoff. In non-blocking mode, the graph/metadata writes on application creation are
+    queued on the pool as well. Call :py:meth:`metrics` to see queue depths and upload latency.
     TODO -- get working with aiobotocore and an async tracker
     """
 
@@ -165,7 +269,26 @@ class S3TrackingClient(SyncTrackingClient):
         serde_kwargs: Optional[dict] = None,
         unique_tracker_id: str = None,
         flush_interval: int = 5,
+        upload_workers: int = 8,
+        compress: bool = False,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
     ):
+        """Instantiates an S3 tracking client.
+
+        :param project: Project name
+        :param bucket: Bucket to write to
+        :param region: AWS region of the bucket
+        :param endpoint_url: Endpoint URL, for S3-compatible stores (e.g. minio)
+        :param non_blocking: Whether to write the graph/metadata on application creation in the background
+        :param serde_kwargs: Keyword arguments to pass to the serializer
+        :param unique_tracker_id: ID for this tracker, written into the metadata of each object
+        :param flush_interval: Seconds to batch log events for before uploading them
+        :param upload_workers: Number of upload threads (and boto3 clients)
+        :param compress: Whether to gzip log files (stored with ``ContentEncoding: gzip``). The Burr S3 server reads both.
+        :param max_retries: Number of times to retry a failed upload
+        :param retry_backoff_seconds: Base backoff between retries -- doubled each attempt, with full jitter
+        """
         self.bucket = bucket
         self.project = project
         self.region = region
@@ -181,11 +304,72 @@ class S3TrackingClient(SyncTrackingClient):
         self.log_queue = queue.Queue()  # Tuple[app_id, EventType]
         self.flush_interval = flush_interval
         self.max_batch_size = 10000  # rather large batch size -- why not? It'll flush every 5 seconds otherwise and we don't want to spam s3 with files
+        self.upload_workers = upload_workers
+        self.compress = compress
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.upload_pool = _UploadPool(upload_workers, self._create_s3_client)
+        self._metrics_lock = threading.Lock()
+        self._upload_stats = dict(
+            uploads_succeeded=0,
+            uploads_failed=0,
+            retries=0,
+            bytes_uploaded=0,
+            total_upload_latency_seconds=0.0,
+            max_upload_latency_seconds=0.0,
+        )
         self.initialized = False
         self.running = True
         self.init()
         self.stream_state: Dict[StateKey, StreamState] = dict()
 
+    def _create_s3_client(self):
+        return boto3.session.Session().client(
+            "s3", region_name=self.region, endpoint_url=self.endpoint_url
+        )
+
+    def metrics(self) -> S3UploadMetrics:
+        """Returns a snapshot of the queue depths and upload statistics."""
+        with self._metrics_lock:
+            stats = dict(self._upload_stats)
+        return S3UploadMetrics(
+            log_queue_depth=self.log_queue.qsize(),
+            upload_queue_depth=self.upload_pool.queue_depth,
+            **stats,
+        )
+
+    def _record_upload(self, succeeded: bool, retries: int, num_bytes: int, latency: float):
+        with self._metrics_lock:
+            stats = self._upload_stats
+            stats["retries"] += retries
+            if not succeeded:
+                stats["uploads_failed"] += 1
+                return
+            stats["uploads_succeeded"] += 1
+            stats["bytes_uploaded"] += num_bytes
+            stats["total_upload_latency_seconds"] += latency
+            stats["max_upload_latency_seconds"] = max(stats["max_upload_latency_seconds"], latency)
+
+    def _put_object(
+        self, s3_client: Any, key: str, body: bytes, metadata: Dict[str, str], **kwargs
+    ):
+        """Puts an object, retrying with jittered exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            start = time.monotonic()
+            try:
+                s3_client.put_object(
+                    Bucket=self.bucket, Key=key, Body=body, Metadata=metadata, **kwargs
+                )
+            except Exception:
+                if attempt == self.max_retries:
+                    self._record_upload(False, attempt, len(body), time.monotonic() - start)
+                    raise
+                logger.warning(f"Failed to upload {key} to s3 (attempt {attempt + 1}), retrying")
+                time.sleep(random.uniform(0, self.retry_backoff_seconds * 2**attempt))
+                continue
+            self._record_upload(True, attempt, len(body), time.monotonic() - start)
+            return
+
     def _get_time_partition(self):
         time = datetime.datetime.utcnow().isoformat()
         return [time[:4], time[5:7], time[8:10], time[11:13], time[14:]]
@@ -201,6 +385,7 @@ class S3TrackingClient(SyncTrackingClient):
         if not self.initialized:
             logger.info("Initializing S3TrackingClient with flushing thread")
             thread = threading.Thread(target=self.thread)
+            self.flushing_thread = thread
             # This will quit when the main thread is ready to, and gracefully
             # But it will gracefully exit due to the "None" on the queue
             threading.Thread(
@@ -222,6 +407,7 @@ class S3TrackingClient(SyncTrackingClient):
                 if item is None:
                     self.log_events(batch)
                     self.running = False
+                    self.upload_pool.shutdown()
                     break
                 batch.append(item)
                 # Check if batch is full or flush interval has passed
@@ -247,18 +433,24 @@ class S3TrackingClient(SyncTrackingClient):
         events = []
         # Flush any remaining events
         while self.log_queue.qsize() > 0:
-            events.append(self.log_queue.get())
+            item = self.log_queue.get()
+            if item is not None:
+                events.append(item)
         self.log_events(events)
+        self.upload_pool.shutdown()
 
     def submit_log_event(self, event: EventType, app_id: str, partition_key: str):
         self.log_queue.put((app_id, partition_key, event))
 
     def log_events(self, events: List[Tuple[str, EventType]]):
+        """Uploads one log file per application, concurrently on the upload pool.
+        Blocks until all uploads have finished (or failed)."""
         events_by_app_id = {}
         for app_id, partition_key, event in events:
             if (app_id, partition_key) not in events_by_app_id:
                 events_by_app_id[(app_id, partition_key)] = []
             events_by_app_id[(app_id, partition_key)].append(event)
+        futures = []
         for (app_id, partition_key), app_events in events_by_app_id.items():
             logger.debug(f"Logging {len(app_events)} events for app {app_id}")
             min_sequence_id = min([e.sequence_id for e in app_events])
@@ -269,31 +461,59 @@ class S3TrackingClient(SyncTrackingClient):
                 str(uuid.uuid4())
                 + "__log.jsonl",  # in case we happen to have multiple at the same time....
             ]
-            self.log_object(
+            key, body, metadata, kwargs = self._prepare_object(
                 *path,
                 data=app_events,
                 metadata={
                     "min_sequence_id": str(min_sequence_id),
                     "max_sequence_id": str(max_sequence_id),
                 },
+                compress=self.compress,
             )
+            futures.append(
+                self.upload_pool.submit(
+                    functools.partial(
+                        self._put_object, key=key, body=body, metadata=metadata, **kwargs
+                    )
+                )
+            )
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                logger.error("Failed to upload log file to s3", exc_info=future.exception())
 
-    def log_object(
+    def _prepare_object(
         self,
         *path_within_project: str,
         data: Union[pydantic.BaseModel, List[pydantic.BaseModel]],
         metadata: Dict[str, str] = None,
-    ):
+        compress: bool = False,
+    ) -> Tuple[str, bytes, Dict[str, str], Dict[str, str]]:
         if metadata is None:
             metadata = {}
         metadata = {**metadata, "tracker_id": self.unique_tracker_id}
         full_path = self.get_prefix() + list(path_within_project)
         key = "/".join(full_path)
         if isinstance(data, list):
-            body = "\n".join([d.model_dump_json() for d in data])
+            body = "\n".join([d.model_dump_json() for d in data]).encode("utf-8")
         else:
-            body = data.model_dump_json()
-        self.s3.put_object(Bucket=self.bucket, Key=key, Body=body, Metadata=metadata)
+            body = data.model_dump_json().encode("utf-8")
+        kwargs = {}
+        if compress:
+            body = gzip.compress(body)
+            kwargs["ContentEncoding"] = "gzip"
+        return key, body, metadata, kwargs
+
+    def log_object(
+        self,
+        *path_within_project: str,
+        data: Union[pydantic.BaseModel, List[pydantic.BaseModel]],
+        metadata: Dict[str, str] = None,
+    ):
+        key, body, metadata, kwargs = self._prepare_object(
+            *path_within_project, data=data, metadata=metadata
+        )
+        s3_client = self.upload_pool.client() if self.upload_pool.in_worker() else self.s3
+        self._put_object(s3_client, key, body, metadata, **kwargs)
 
     @fire_and_forget
     def post_application_create(
@@ -423,6 +643,10 @@ class S3TrackingClient(SyncTrackingClient):
             serde_kwargs=self.serde_kwargs,
             unique_tracker_id=self.unique_tracker_id,
             flush_interval=self.flush_interval,
+            upload_workers=self.upload_workers,
+            compress=self.compress,
+            max_retries=self.max_retries,
+            retry_backoff_seconds=self.retry_backoff_seconds,
         )
 
     def pre_start_stream(
@@ -460,7 +684,7 @@ class S3TrackingClient(SyncTrackingClient):
     ):
         stream_state = self.stream_state[app_id, action, partition_key]
         if stream_state.count == 0:
-            stream_state.count += 1
+            stream_state.count += future_kwargs.get("item_count", 1)
             self.submit_log_event(
                 FirstItemStreamModel(
                     action_sequence_id=sequence_id,
@@ -471,7 +695,7 @@ class S3TrackingClient(SyncTrackingClient):
                 partition_key,
             )
         else:
-            stream_state.count += 1
+            stream_state.count += future_kwargs.get("item_count", 1)
 
     def post_end_stream(
         self,
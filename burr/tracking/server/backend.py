@@ -2,18 +2,22 @@ import abc
 import collections
 import importlib
 import json
+import logging
 import os.path
+import sqlite3
 import sys
+import time
 from datetime import datetime
-from typing import Any, Optional, Sequence, Tuple, Type, TypeVar
+from typing import Any, Collection, Dict, List, Optional, Sequence, Set, Tuple, Type, TypeVar
 
 import aiofiles
 import aiofiles.os as aiofilesos
 import fastapi
+import pydantic
 from fastapi import FastAPI
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from burr.tracking.common import models
+from burr.tracking.common import log_index, models
 from burr.tracking.common.models import ChildApplicationModel
 from burr.tracking.server import schema
 from burr.tracking.server.schema import (
@@ -23,8 +27,11 @@ from burr.tracking.server.schema import (
     ApplicationLogs,
     ApplicationSummary,
     Step,
+    StepPage,
 )
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 # The following is a backend for the server.
@@ -192,6 +199,35 @@ class BackendBase(abc.ABC):
         """
         pass
 
+    async def get_application_steps(
+        self,
+        request: fastapi.Request,
+        project_id: str,
+        app_id: str,
+        partition_key: Optional[str],
+        min_sequence_id: int = 0,
+        max_sequence_id: Optional[int] = None,
+        limit: int = 100,
+        include_payloads: bool = True,
+    ) -> StepPage:
+        """Gets a range of steps for a given app, ordered by sequence ID.
+        This default implementation loads all the logs -- backends should override it to only read the range.
+
+        :param request: The request object, used for authentication/authorization if needed
+        :param project_id: ID of the project
+        :param app_id: ID of the application
+        :param partition_key: Partition key of the application
+        :param min_sequence_id: Lowest sequence ID to return (inclusive) -- the cursor
+        :param max_sequence_id: Highest sequence ID to return (inclusive), None for no bound
+        :param limit: Maximum number of steps to return
+        :param include_payloads: Whether to include the state/result of each step
+        :return: The page of steps, with the cursor to the next page
+        """
+        logs = await self.get_application_logs(
+            request, project_id=project_id, app_id=app_id, partition_key=partition_key
+        )
+        return paginate_steps(logs.steps, min_sequence_id, max_sequence_id, limit, include_payloads)
+
     @classmethod
     @abc.abstractmethod
     def settings_model(cls) -> Type[BaseSettings]:
@@ -238,6 +274,40 @@ def safe_json_load(line: bytes):
     return json.loads(line.decode("utf-8", errors="replace"))
 
 
+def paginate_steps(
+    steps: Sequence[Step],
+    min_sequence_id: int,
+    max_sequence_id: Optional[int],
+    limit: int,
+    include_payloads: bool,
+) -> StepPage:
+    """Selects a page of steps from a superset of them.
+
+    :param steps: Steps to select from, in any order
+    :param min_sequence_id: Lowest sequence ID to return (inclusive)
+    :param max_sequence_id: Highest sequence ID to return (inclusive), None for no bound
+    :param limit: Maximum number of steps to return
+    :param include_payloads: Whether to include the state/result of each step
+    :return: The page, with a cursor to the next if there are more steps in the range
+    """
+    in_range = sorted(
+        (
+            step
+            for step in steps
+            if step.sequence_id >= min_sequence_id
+            and (max_sequence_id is None or step.sequence_id <= max_sequence_id)
+        ),
+        key=lambda step: step.sequence_id,
+    )
+    page = in_range[:limit]
+    if not include_payloads:
+        page = [step.without_payloads() for step in page]
+    return StepPage(
+        steps=page,
+        next_sequence_id=in_range[limit].sequence_id if len(in_range) > limit else None,
+    )
+
+
 def get_uri(project_id: str) -> str:
     project_id_map = {
         "demo_counter": "https://github.com/DAGWorks-Inc/burr/tree/main/examples/hello-world-counter",
@@ -251,14 +321,170 @@ def get_uri(project_id: str) -> str:
 DEFAULT_PATH = os.path.expanduser("~/.burr")
 
 
+class LocalAppIndex:
+    """SQLite index of the applications in a local storage directory, so listing them can sort,
+    filter by partition key and paginate without opening every application's directory.
+
+    It is kept up to date incrementally by :py:class:`LocalBackend`: a project is only listed when its
+    directory's mtime changes (i.e. applications were added or removed), and only the new
+    applications are read. Applications' last written times are taken from their logs' mtimes when
+    they are added, then from the lines the tracking client appends to the project's written file
+    for each step -- the index records how far into that file it has read. It is a cache -- deleting
+    the file just forces a full rescan."""
+
+    FILENAME = ".burr_app_index.db"
+
+    def __init__(self, storage_path: str):
+        self.db_path = os.path.join(storage_path, self.FILENAME)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS apps (
+                    project_id TEXT NOT NULL,
+                    app_id TEXT NOT NULL,
+                    partition_key TEXT,
+                    first_written REAL NOT NULL,
+                    last_written REAL NOT NULL,
+                    parent_pointer TEXT,
+                    spawning_parent_pointer TEXT,
+                    PRIMARY KEY (project_id, app_id)
+                );
+                CREATE INDEX IF NOT EXISTS apps_by_last_written
+                    ON apps (project_id, last_written DESC);
+                CREATE INDEX IF NOT EXISTS apps_by_partition_key
+                    ON apps (project_id, partition_key, last_written DESC);
+                CREATE TABLE IF NOT EXISTS projects (
+                    project_id TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS written_positions (
+                    project_id TEXT PRIMARY KEY,
+                    position INTEGER NOT NULL
+                );
+                """
+            )
+            self._connection = connection
+        return self._connection
+
+    def get_project_mtime(self, project_id: str) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT mtime_ns FROM projects WHERE project_id = ?", (project_id,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def get_app_ids(self, project_id: str) -> Set[str]:
+        """Gets the IDs of every indexed application in a project."""
+        cursor = self.connection.execute(
+            "SELECT app_id FROM apps WHERE project_id = ?", (project_id,)
+        )
+        return {row[0] for row in cursor}
+
+    def get_written_position(self, project_id: str) -> int:
+        """Gets how far (in bytes) into the project's written file the index has read."""
+        row = self.connection.execute(
+            "SELECT position FROM written_positions WHERE project_id = ?", (project_id,)
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def update_last_written(
+        self, project_id: str, last_written: Dict[str, float], written_position: int
+    ):
+        """Moves applications' last written times forward, in one transaction with how far into the
+        project's written file they were read from. Applications that are not indexed are ignored.
+
+        :param project_id: Project the applications belong to
+        :param last_written: Latest written time of each application, by app ID
+        :param written_position: Position in the written file the index is now up to date with
+        """
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE apps SET last_written = MAX(last_written, ?) "
+                "WHERE project_id = ? AND app_id = ?",
+                [(written, project_id, app_id) for app_id, written in last_written.items()],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO written_positions (project_id, position) VALUES (?, ?)",
+                (project_id, written_position),
+            )
+
+    def update_project(
+        self,
+        project_id: str,
+        added: Sequence[Dict[str, Any]],
+        removed: Collection[str],
+        mtime_ns: Optional[int],
+    ):
+        """Adds/removes applications for a project in one transaction.
+
+        :param project_id: Project the applications belong to
+        :param added: Rows to add -- dicts with the columns of the apps table (other than project_id)
+        :param removed: App IDs to remove
+        :param mtime_ns: Project directory mtime the index is now up to date with, None if it is not (yet)
+        """
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM apps WHERE project_id = ? AND app_id = ?",
+                [(project_id, app_id) for app_id in removed],
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO apps (project_id, app_id, partition_key, first_written, "
+                "last_written, parent_pointer, spawning_parent_pointer) "
+                "VALUES (:project_id, :app_id, :partition_key, :first_written, :last_written, "
+                ":parent_pointer, :spawning_parent_pointer)",
+                [{**row, "project_id": project_id} for row in added],
+            )
+            if mtime_ns is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO projects (project_id, mtime_ns) VALUES (?, ?)",
+                    (project_id, mtime_ns),
+                )
+
+    def query(
+        self, project_id: str, partition_key: Optional[str], limit: int, offset: int
+    ) -> Tuple[List[sqlite3.Row], int]:
+        """Gets a page of applications, most recently written first.
+
+        :param project_id: Project to query
+        :param partition_key: Partition key to filter by, None for all
+        :param limit: Maximum number of applications to return
+        :param offset: Number of applications to skip
+        :return: The rows of the page, and the total number of applications matching
+        """
+        where, params = "project_id = ?", [project_id]
+        if partition_key is not None:
+            where, params = where + " AND partition_key = ?", params + [partition_key]
+        self.connection.row_factory = sqlite3.Row
+        rows = self.connection.execute(
+            f"SELECT * FROM apps WHERE {where} ORDER BY last_written DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+        (total,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM apps WHERE {where}", params
+        ).fetchone()
+        return rows, total
+
+
 class LocalBackend(BackendBase, AnnotationsBackendMixin):
     """Quick implementation of a local backend for testing purposes. This is not a production backend.
 
     To override the path, set a `burr_path` environment variable to the path you want to use.
     """
 
+    # The tracking client creates the application directory before writing metadata.json,
+    # so we give it this long before indexing an application without one
+    METADATA_GRACE_PERIOD_SECONDS = 10
+    # Appended to by the tracking client for each step, see LocalAppIndex
+    WRITTEN_FILENAME = "written.jsonl"
+
     def __init__(self, path: str = DEFAULT_PATH):
         self.path = path
+        self.app_index = LocalAppIndex(path)
 
     def _get_annotation_path(self, project_id: str) -> str:
         return os.path.join(self.path, project_id, "annotations.jsonl")
@@ -396,8 +622,15 @@ class LocalBackend(BackendBase, AnnotationsBackendMixin):
         return out
 
     async def get_number_of_steps(self, file_path: str) -> int:
-        """Quick tool to get the latest sequence ID from a log file.
-        This is not efficient and should be replaced."""
+        """Gets the number of steps (latest sequence ID + 1) in a log file.
+        Reads the last record of the log's index if the tracker wrote one, otherwise scans the log.
+        """
+        last_record = log_index.read_last_index_record(self._get_index_path(file_path))
+        if last_record is not None:
+            sequence_id, _ = last_record
+            return sequence_id + 1
+        if not os.path.exists(file_path):
+            return 0
         async with aiofiles.open(file_path, "rb") as f:
             for line in reversed(await f.readlines()):
                 line_data = safe_json_load(line)
@@ -407,6 +640,10 @@ class LocalBackend(BackendBase, AnnotationsBackendMixin):
                     return line_data["sequence_id"] + 1
         return 0
 
+    @staticmethod
+    def _get_index_path(log_path: str) -> str:
+        return os.path.join(os.path.dirname(log_path), "log.index")
+
     async def _load_metadata(self, metadata_path: str) -> models.ApplicationMetadataModel:
         if os.path.exists(metadata_path):
             async with aiofiles.open(metadata_path, "rb") as f:
@@ -426,38 +663,131 @@ class LocalBackend(BackendBase, AnnotationsBackendMixin):
         if not os.path.exists(project_filepath):
             return [], 0
             # raise fastapi.HTTPException(status_code=404, detail=f"Project: {project_id} not found")
+        await self._refresh_app_index(project_id)
+        rows, total = self.app_index.query(project_id, partition_key, limit, offset)
         out = []
+        for row in rows:
+            log_path = os.path.join(project_filepath, row["app_id"], "log.jsonl")
+            out.append(
+                schema.ApplicationSummary(
+                    app_id=row["app_id"],
+                    partition_key=row["partition_key"],
+                    first_written=row["first_written"],
+                    last_written=row["last_written"],
+                    num_steps=await self.get_number_of_steps(log_path),
+                    tags={},
+                    parent_pointer=models.PointerModel.model_validate_json(row["parent_pointer"])
+                    if row["parent_pointer"] is not None
+                    else None,
+                    spawning_parent_pointer=models.PointerModel.model_validate_json(
+                        row["spawning_parent_pointer"]
+                    )
+                    if row["spawning_parent_pointer"] is not None
+                    else None,
+                )
+            )
+        return out, total
+
+    @staticmethod
+    def _get_last_written(app_path: str) -> Optional[float]:
+        """When an application was last written to -- appending to its log does not change its
+        directory's mtime, so we take the latest of the two. None if the application is gone."""
+        try:
+            last_written = os.stat(app_path).st_mtime
+        except FileNotFoundError:
+            return None
+        try:
+            return max(last_written, os.stat(os.path.join(app_path, "log.jsonl")).st_mtime)
+        except FileNotFoundError:
+            return last_written
+
+    async def _refresh_app_index(self, project_id: str):
+        """Brings the app index up to date with the project directory. Only lists the directory
+        if its mtime changed since the last refresh, and only reads the applications that are new.
+        Applications already indexed have their last written time moved forward by the lines
+        appended to the project's written file since the last refresh.
+        """
+        project_filepath = os.path.join(self.path, project_id)
+        mtime_ns = os.stat(project_filepath).st_mtime_ns
+        if self.app_index.get_project_mtime(project_id) != mtime_ns:
+            await self._refresh_app_ids(project_id, mtime_ns)
+        await self._refresh_last_written(project_id)
+
+    async def _refresh_last_written(self, project_id: str):
+        """Reads the lines appended to the project's written file since the last refresh, and moves
+        the last written times of the applications they name forward."""
+        written_filepath = os.path.join(self.path, project_id, self.WRITTEN_FILENAME)
+        try:
+            size = os.stat(written_filepath).st_size
+        except FileNotFoundError:
+            return
+        position = self.app_index.get_written_position(project_id)
+        if size < position:
+            position = 0  # the file was replaced
+        if size == position:
+            return
+        async with aiofiles.open(written_filepath, "rb") as f:
+            await f.seek(position)
+            data = await f.read(size - position)
+        # the last line may still be being written -- read it next time
+        data = data[: data.rfind(b"\n") + 1]
+        last_written = {}
+        for line in data.splitlines():
+            try:
+                written = models.ApplicationWrittenModel.model_validate_json(line)
+            except pydantic.ValidationError:
+                logger.warning(f"Skipping malformed line in {written_filepath}: {line!r}")
+                continue
+            last_written[written.app_id] = max(
+                written.written_time, last_written.get(written.app_id, written.written_time)
+            )
+        self.app_index.update_last_written(project_id, last_written, position + len(data))
+
+    async def _refresh_app_ids(self, project_id: str, mtime_ns: int):
+        """Lists the project directory, adding the applications that are new to the index and
+        removing the ones that are gone."""
+        project_filepath = os.path.join(self.path, project_id)
+        # an application created in the same mtime tick as a recent scan would not change it again,
+        # so only consider ourselves up to date with directories that have settled
+        up_to_date = time.time_ns() - mtime_ns > 1_000_000_000
+        app_ids = set()
         for entry in await aiofilesos.listdir(project_filepath):
-            if entry.startswith("."):
-                # skip hidden files/directories
+            # skip hidden files/directories
+            if not entry.startswith(".") and os.path.isdir(os.path.join(project_filepath, entry)):
+                app_ids.add(entry)
+        indexed_app_ids = self.app_index.get_app_ids(project_id)
+        added = []
+        for app_id in app_ids - indexed_app_ids:
+            app_path = os.path.join(project_filepath, app_id)
+            metadata_path = os.path.join(app_path, "metadata.json")
+            first_written = await aiofilesos.path.getctime(app_path)
+            if (
+                not os.path.exists(metadata_path)
+                and time.time() - first_written < self.METADATA_GRACE_PERIOD_SECONDS
+            ):
+                up_to_date = False  # still being created -- pick it up next time
                 continue
-            full_path = os.path.join(project_filepath, entry)
-            metadata_path = os.path.join(full_path, "metadata.json")
-            log_path = os.path.join(full_path, "log.jsonl")
-            if os.path.isdir(full_path):
-                metadata = await self._load_metadata(metadata_path)
-                app_partition_key = metadata.partition_key
-                # quick, hacky way to do it -- we should really have this be part of the path
-                # But we load it up anyway. TODO -- add partition key to the path
-                # If this is slow you'll want to use the s3-based storage system
-                # Which has an actual index
-                if partition_key is not None and partition_key != app_partition_key:
-                    continue
-                out.append(
-                    schema.ApplicationSummary(
-                        app_id=entry,
-                        partition_key=metadata.partition_key,
-                        first_written=await aiofilesos.path.getctime(full_path),
-                        last_written=await aiofilesos.path.getmtime(full_path),
-                        num_steps=await self.get_number_of_steps(log_path),
-                        tags={},
-                        parent_pointer=metadata.parent_pointer,
-                        spawning_parent_pointer=metadata.spawning_parent_pointer,
-                    )
+            metadata = await self._load_metadata(metadata_path)
+            added.append(
+                dict(
+                    app_id=app_id,
+                    partition_key=metadata.partition_key,
+                    first_written=first_written,
+                    last_written=self._get_last_written(app_path) or first_written,
+                    parent_pointer=metadata.parent_pointer.model_dump_json()
+                    if metadata.parent_pointer is not None
+                    else None,
+                    spawning_parent_pointer=metadata.spawning_parent_pointer.model_dump_json()
+                    if metadata.spawning_parent_pointer is not None
+                    else None,
                 )
-        out = sorted(out, key=lambda x: x.last_written, reverse=True)
-        # TODO -- actually only get the most recent ones rather than reading everything, this is inefficient
-        return out[offset : offset + limit], len(out)
+            )
+        self.app_index.update_project(
+            project_id,
+            added=added,
+            removed=indexed_app_ids - app_ids,
+            mtime_ns=mtime_ns if up_to_date else None,
+        )
 
     async def get_application_logs(
         self, request: fastapi.Request, project_id: str, app_id: str, partition_key: Optional[str]
@@ -502,6 +832,66 @@ class LocalBackend(BackendBase, AnnotationsBackendMixin):
             children=children,
         )
 
+    @staticmethod
+    def _get_step_byte_range(
+        log_file: str, min_sequence_id: int, num_steps: int
+    ) -> Tuple[int, int]:
+        """Uses the log's index to find the byte range holding (at least) ``num_steps`` steps from
+        ``min_sequence_id`` onwards. Returns (0, -1) -- the whole file -- if the index does not cover it.
+        """
+        records = log_index.read_index(LocalBackend._get_index_path(log_file))
+        if len(records) == 0:
+            return 0, -1
+        first_sequence_id, first_offset = records[0]
+        if first_offset != 0 and min_sequence_id < first_sequence_id:
+            return 0, -1  # the start of the log was written without an index
+        first = next(
+            (i for i, (sequence_id, _) in enumerate(records) if sequence_id >= min_sequence_id),
+            None,
+        )
+        if first is None:
+            # steps after the last indexed one (if any) have not had their index written yet
+            return records[-1][1], -1
+        start = records[first][1]
+        end = first + num_steps
+        return start, records[end][1] if end < len(records) else -1
+
+    async def get_application_steps(
+        self,
+        request: fastapi.Request,
+        project_id: str,
+        app_id: str,
+        partition_key: Optional[str],
+        min_sequence_id: int = 0,
+        max_sequence_id: Optional[int] = None,
+        limit: int = 100,
+        include_payloads: bool = True,
+    ) -> StepPage:
+        """Reads only the part of the log holding the requested steps, using the index the
+        tracking client writes alongside it. Falls back to reading the whole log if it is not indexed.
+        """
+        app_filepath = os.path.join(self.path, project_id, app_id)
+        if not os.path.exists(app_filepath):
+            raise fastapi.HTTPException(
+                status_code=404, detail=f"App: {app_id} from project: {project_id} not found"
+            )
+        log_file = os.path.join(app_filepath, "log.jsonl")
+        if not os.path.exists(log_file):
+            return StepPage(steps=[], next_sequence_id=None)
+        # one more step than the limit so we know whether there is another page
+        start, end = self._get_step_byte_range(log_file, min_sequence_id, limit + 1)
+        async with aiofiles.open(log_file, "rb") as f:
+            await f.seek(start)
+            contents = await f.read(end - start if end != -1 else -1)
+        steps = []
+        for step in Step.iter_from_logs(contents.splitlines(), include_payloads=include_payloads):
+            if step.sequence_id < min_sequence_id:
+                continue
+            steps.append(step)
+            if len(steps) > limit:
+                break  # one more than the limit tells us there is another page
+        return paginate_steps(steps, min_sequence_id, max_sequence_id, limit, include_payloads)
+
     def supports_demos(self) -> bool:
         return True
 
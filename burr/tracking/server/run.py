@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 
 try:
     import uvicorn
-    from fastapi import FastAPI, HTTPException, Request
+    from fastapi import FastAPI, HTTPException, Query, Request
     from fastapi.staticfiles import StaticFiles
     from fastapi_utils.tasks import repeat_every
     from starlette.templating import Jinja2Templates
@@ -36,6 +36,7 @@ try:
         ApplicationPage,
         BackendSpec,
         IndexingJob,
+        StepPage,
     )
 
     # dynamic importing due to the dashes (which make reading the examples on github easier)
@@ -65,6 +66,9 @@ SERVE_STATIC = os.getenv("BURR_SERVE_STATIC", "true").lower() == "true"
 
 SENTINEL_PARTITION_KEY = "__none__"
 
+# Upper bound on the number of steps a client can request per page
+MAX_STEPS_PER_PAGE = 1000
+
 backend = BackendBase.create_from_env()
 
 
@@ -228,6 +232,43 @@ async def get_application_logs(
     )
 
 
+@app.get("/api/v0/{project_id}/{app_id}/{partition_key}/steps", response_model=StepPage)
+async def get_application_steps(
+    request: Request,
+    project_id: str,
+    app_id: str,
+    partition_key: str,
+    min_sequence_id: int = 0,
+    max_sequence_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_STEPS_PER_PAGE),
+    include_payloads: bool = True,
+) -> StepPage:
+    """Gets a page of steps for a given App, ordered by sequence ID. Use the returned
+    ``next_sequence_id`` as the ``min_sequence_id`` of the next request.
+
+    :param request: FastAPI request
+    :param project_id: ID of the project
+    :param app_id: ID of the associated application
+    :param min_sequence_id: Lowest sequence ID to return (inclusive)
+    :param max_sequence_id: Highest sequence ID to return (inclusive)
+    :param limit: Maximum number of steps to return (1 to ``MAX_STEPS_PER_PAGE``)
+    :param include_payloads: Whether to include the state/result of each step (set to false for a summary)
+    :return: A page of steps with all associated step data
+    """
+    if partition_key == SENTINEL_PARTITION_KEY:
+        partition_key = None
+    return await backend.get_application_steps(
+        request,
+        project_id=project_id,
+        app_id=app_id,
+        partition_key=partition_key,
+        min_sequence_id=min_sequence_id,
+        max_sequence_id=max_sequence_id,
+        limit=limit,
+        include_payloads=include_payloads,
+    )
+
+
 @app.post(
     "/api/v0/{project_id}/{app_id}/{partition_key}/{sequence_id}/annotations",
     response_model=AnnotationOut,
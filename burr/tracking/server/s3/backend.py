@@ -1,6 +1,7 @@
 import dataclasses
 import datetime
 import functools
+import gzip
 import itertools
 import json
 import logging
@@ -27,6 +28,7 @@ from burr.tracking.server.backend import (
     BurrSettings,
     IndexingBackendMixin,
     SnapshottingBackendMixin,
+    paginate_steps,
 )
 from burr.tracking.server.s3 import settings, utils
 from burr.tracking.server.s3.models import (
@@ -37,7 +39,7 @@ from burr.tracking.server.s3.models import (
     LogFile,
     Project,
 )
-from burr.tracking.server.schema import ApplicationLogs, Step
+from burr.tracking.server.schema import ApplicationLogs, Step, StepPage
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,8 @@ async def _query_s3_file(
 ) -> Union[ContentsModel, List[ContentsModel]]:
     response = await client.get_object(Bucket=bucket, Key=key)
     body = await response["Body"].read()
+    if response.get("ContentEncoding") == "gzip":
+        body = gzip.decompress(body)
     return body
 
 
@@ -597,9 +601,9 @@ class SQLiteS3Backend(BackendBase, IndexingBackendMixin, SnapshottingBackendMixi
         total_app_count = await app_query.count()
         return out, total_app_count
 
-    async def get_application_logs(
-        self, request: fastapi.Request, project_id: str, app_id: str, partition_key: str
-    ) -> ApplicationLogs:
+    async def _get_application(
+        self, project_id: str, app_id: str, partition_key: Optional[str]
+    ) -> Application:
         # TODO -- handle partition keys
         query = (
             Application.filter(name=app_id, project__name=project_id)
@@ -609,7 +613,12 @@ class SQLiteS3Backend(BackendBase, IndexingBackendMixin, SnapshottingBackendMixi
             )
         )
         applications = await query.all()
-        application = applications[0]
+        return applications[0]
+
+    async def get_application_logs(
+        self, request: fastapi.Request, project_id: str, app_id: str, partition_key: str
+    ) -> ApplicationLogs:
+        application = await self._get_application(project_id, app_id, partition_key)
         application_logs = await LogFile.filter(application__id=application.id).order_by(
             "-created_at"
         )
@@ -639,6 +648,45 @@ class SQLiteS3Backend(BackendBase, IndexingBackendMixin, SnapshottingBackendMixi
             application=graph_data,
         )
 
+    async def get_application_steps(
+        self,
+        request: fastapi.Request,
+        project_id: str,
+        app_id: str,
+        partition_key: Optional[str],
+        min_sequence_id: int = 0,
+        max_sequence_id: Optional[int] = None,
+        limit: int = 100,
+        include_payloads: bool = True,
+    ) -> StepPage:
+        """Only downloads the log files whose (indexed) sequence ID range overlaps the requested steps."""
+        application = await self._get_application(project_id, app_id, partition_key)
+        # one more step than the limit so we know whether there is another page
+        upper_sequence_id = min_sequence_id + limit
+        if max_sequence_id is not None:
+            upper_sequence_id = min(upper_sequence_id, max_sequence_id)
+        log_files = await LogFile.filter(
+            application__id=application.id,
+            max_sequence_id__gte=min_sequence_id,
+            min_sequence_id__lte=upper_sequence_id,
+        )
+        async with self._session.create_client("s3") as client:
+            files = await utils.gather_with_concurrency(
+                self._aws_max_concurrency,
+                *[_query_s3_file(self._bucket, log_file.s3_path, client) for log_file in log_files],
+            )
+        steps = Step.from_logs(list(itertools.chain(*[f.splitlines() for f in files])))
+        page = paginate_steps(steps, min_sequence_id, upper_sequence_id, limit, include_payloads)
+        if page.next_sequence_id is None and (
+            max_sequence_id is None or upper_sequence_id < max_sequence_id
+        ):
+            # sequence IDs may have gaps, so steps past the window can still be on the next page
+            if await LogFile.filter(
+                application__id=application.id, max_sequence_id__gt=upper_sequence_id
+            ).exists():
+                page.next_sequence_id = upper_sequence_id + 1
+        return page
+
     async def indexing_jobs(
         self, offset: int = 0, limit: int = 100, filter_empty: bool = True
     ) -> Sequence[schema.IndexingJob]:
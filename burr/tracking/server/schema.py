@@ -1,6 +1,6 @@
 import collections
 import datetime
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Union
 
 import pydantic
 from pydantic import fields
@@ -20,6 +20,60 @@ from burr.tracking.common.models import (
 )
 from burr.tracking.utils import safe_json_load
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LogModel = Union[
+    BeginEntryModel,
+    EndEntryModel,
+    BeginSpanModel,
+    EndSpanModel,
+    AttributeModel,
+    InitializeStreamModel,
+    FirstItemStreamModel,
+    EndStreamModel,
+]
+
+LOG_MODELS_BY_TYPE = {
+    "begin_entry": BeginEntryModel,
+    "end_entry": EndEntryModel,
+    "begin_span": BeginSpanModel,
+    "end_span": EndSpanModel,
+    "attribute": AttributeModel,
+    "begin_stream": InitializeStreamModel,
+    "first_item_stream": FirstItemStreamModel,
+    "end_stream": EndStreamModel,
+}
+
+
+def _load_log_line(line: Union[bytes, str]) -> dict:
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8 -- fall back to the lenient parser
+    return safe_json_load(line if isinstance(line, bytes) else line.encode("utf-8"))
+
+
+def parse_log_line(line: Union[bytes, str], include_payloads: bool = True) -> Optional[LogModel]:
+    """Parses a line of a log file into its model, dispatching on its ``type``.
+    Uses orjson to parse the JSON if it is installed.
+
+    :param line: Line of the log
+    :param include_payloads: Whether to keep the step's state/result -- if False these are dropped before validation
+    :return: The model, or None if the line is of an unknown type
+    """
+    json_line = _load_log_line(line)
+    model = LOG_MODELS_BY_TYPE.get(json_line.get("type"))
+    if model is None:
+        return None
+    if not include_payloads and model is EndEntryModel:
+        json_line["state"] = {}
+        json_line["result"] = None
+    return model.model_validate(json_line)
+
 
 class Project(pydantic.BaseModel):
     name: str
@@ -84,42 +138,43 @@ class Step(pydantic.BaseModel):
     attributes: List[AttributeModel]
     streaming_events: List[Union[InitializeStreamModel, FirstItemStreamModel, EndStreamModel]]
 
+    @property
+    def sequence_id(self) -> int:
+        return self.step_start_log.sequence_id
+
+    def without_payloads(self) -> "Step":
+        """Returns a copy of the step without its (potentially large) state and result."""
+        if self.step_end_log is None:
+            return self
+        return self.model_copy(
+            update={
+                "step_end_log": self.step_end_log.model_copy(update={"state": {}, "result": None})
+            }
+        )
+
     @staticmethod
     def from_logs(log_lines: List[bytes]) -> List["Step"]:
         steps_by_sequence_id = collections.defaultdict(PartialStep)
         spans_by_id = collections.defaultdict(PartialSpan)
         attributes_by_step: dict[int, List[AttributeModel]] = collections.defaultdict(list)
         for line in log_lines:
-            json_line = safe_json_load(line)
-            # TODO -- make these into constants
-            if json_line["type"] == "begin_entry":
-                begin_step = BeginEntryModel.model_validate(json_line)
-                steps_by_sequence_id[begin_step.sequence_id].step_start_log = begin_step
-            elif json_line["type"] == "end_entry":
-                step_end_log = EndEntryModel.model_validate(json_line)
-                steps_by_sequence_id[step_end_log.sequence_id].step_end_log = step_end_log
-            elif json_line["type"] == "begin_span":
-                span = BeginSpanModel.model_validate(json_line)
-                spans_by_id[span.span_id] = PartialSpan(
-                    begin_entry=span,
+            entry = parse_log_line(line)
+            if isinstance(entry, BeginEntryModel):
+                steps_by_sequence_id[entry.sequence_id].step_start_log = entry
+            elif isinstance(entry, EndEntryModel):
+                steps_by_sequence_id[entry.sequence_id].step_end_log = entry
+            elif isinstance(entry, BeginSpanModel):
+                spans_by_id[entry.span_id] = PartialSpan(
+                    begin_entry=entry,
                     end_entry=None,
                 )
-            elif json_line["type"] == "end_span":
-                end_span = EndSpanModel.model_validate(json_line)
-                span = spans_by_id[end_span.span_id]
-                span.end_entry = end_span
-            elif json_line["type"] == "attribute":
-                attribute = AttributeModel.model_validate(json_line)
-                attributes_by_step[attribute.action_sequence_id].append(attribute)
-            elif json_line["type"] in ["begin_stream", "first_item_stream", "end_stream"]:
-                streaming_event = {
-                    "begin_stream": InitializeStreamModel,
-                    "first_item_stream": FirstItemStreamModel,
-                    "end_stream": EndStreamModel,
-                }[json_line["type"]].model_validate(json_line)
-                steps_by_sequence_id[streaming_event.sequence_id].streaming_events.append(
-                    streaming_event
-                )
+            elif isinstance(entry, EndSpanModel):
+                span = spans_by_id[entry.span_id]
+                span.end_entry = entry
+            elif isinstance(entry, AttributeModel):
+                attributes_by_step[entry.action_sequence_id].append(entry)
+            elif isinstance(entry, (InitializeStreamModel, FirstItemStreamModel, EndStreamModel)):
+                steps_by_sequence_id[entry.sequence_id].streaming_events.append(entry)
         for span in spans_by_id.values():
             sequence_id = (
                 span.begin_entry.action_sequence_id
@@ -149,11 +204,87 @@ class Step(pydantic.BaseModel):
             if value.step_start_log is not None
         ]
 
+    @staticmethod
+    def iter_from_logs(
+        log_lines: Iterable[Union[bytes, str]], include_payloads: bool = True
+    ) -> Iterator["Step"]:
+        """Parses steps from log lines as they are read, yielding each step once the next one
+        begins (or the lines run out). This keeps only one step in memory, so responses can be streamed.
+
+        Unlike :py:meth:`from_logs`, this relies on the lines being in the order the tracker writes them --
+        entries for a step that come after the next step has begun are dropped.
+
+        :param log_lines: Lines of the log, in order
+        :param include_payloads: Whether to include the state/result of each step -- skipping them saves validating them
+        :return: Iterator of steps, in order
+        """
+        current: Optional[PartialStep] = None
+        spans: Dict[str, PartialSpan] = {}
+        attributes: List[AttributeModel] = []
+
+        def build() -> Optional[Step]:
+            if current is None or current.step_start_log is None:
+                return None
+            return Step(
+                step_start_log=current.step_start_log,
+                step_end_log=current.step_end_log,
+                spans=[
+                    Span(begin_entry=span.begin_entry, end_entry=span.end_entry)
+                    for span in spans.values()
+                    if span.begin_entry is not None
+                ],
+                attributes=attributes,
+                streaming_events=current.streaming_events,
+            )
+
+        for line in log_lines:
+            if not line.strip():
+                continue
+            entry = parse_log_line(line, include_payloads=include_payloads)
+            if entry is None:
+                continue
+            if isinstance(entry, BeginEntryModel) and (
+                current is None
+                or current.step_start_log is None
+                or entry.sequence_id != current.step_start_log.sequence_id
+            ):
+                step = build()
+                if step is not None:
+                    yield step
+                current, spans, attributes = PartialStep(step_start_log=entry), {}, []
+                continue
+            if current is None or current.step_start_log is None:
+                continue  # nothing before the first step is part of a step
+            if entry.sequence_id != current.step_start_log.sequence_id:
+                continue
+            if isinstance(entry, EndEntryModel):
+                current.step_end_log = entry
+            elif isinstance(entry, BeginSpanModel):
+                spans[entry.span_id] = PartialSpan(begin_entry=entry)
+            elif isinstance(entry, EndSpanModel):
+                if entry.span_id in spans:
+                    spans[entry.span_id].end_entry = entry
+            elif isinstance(entry, AttributeModel):
+                attributes.append(entry)
+            elif isinstance(entry, (InitializeStreamModel, FirstItemStreamModel, EndStreamModel)):
+                current.streaming_events.append(entry)
+        step = build()
+        if step is not None:
+            yield step
+
 
 class StepWithMinimalData(Step):
     step_start_log: Optional[BeginEntryModel]
 
 
+class StepPage(pydantic.BaseModel):
+    """A range of steps of an application, ordered by sequence ID.
+    Pass ``next_sequence_id`` as ``min_sequence_id`` to get the following page."""
+
+    steps: List[Step]
+    next_sequence_id: Optional[int]  # None if there are no more steps
+
+
 class ApplicationLogs(pydantic.BaseModel):
     """Application logs are purely flat --
     we will likely be rethinking this but for now this provides for easy parsing."""
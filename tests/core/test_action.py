@@ -145,6 +145,28 @@ def test_condition__validate_failure():
         cond._validate(State({"baz": "baz"}))
 
 
+def test_condition_compile():
+    cond = Condition.expr("foo == 'bar' and len(baz) == 3")
+    evaluate = cond.compile()
+    assert evaluate(State({"foo": "bar", "baz": "qux", "other": 1})) is True
+    assert evaluate(State({"foo": "bar", "baz": "corge"})) is False
+    with pytest.raises(ValueError, match="baz"):
+        evaluate(State({"foo": "bar"}))
+
+
+def test_condition_compile_default():
+    assert default.compile() is None
+
+
+def test_condition_compile_respects_custom_run():
+    class AlwaysFalse(Condition):
+        def run(self, state: State, **run_kwargs) -> dict:
+            return {Condition.KEY: False}
+
+    cond = AlwaysFalse([], lambda state: True, name="always_false")
+    assert cond.compile()(State()) is False
+
+
 def test_condition_invert():
     cond = Condition(
         ["foo"],
@@ -1,7 +1,11 @@
 import asyncio
 import collections
+import concurrent.futures
 import datetime
 import logging
+import os
+import threading
+import time
 import typing
 import uuid
 from typing import Any, Awaitable, Callable, Dict, Generator, Literal, Optional, Tuple, Union
@@ -15,6 +19,7 @@ from burr.core.action import (
     AsyncGenerator,
     AsyncStreamingAction,
     Condition,
+    FunctionBasedAction,
     Reducer,
     Result,
     SingleStepAction,
@@ -29,6 +34,7 @@ from burr.core.application import (
     Application,
     ApplicationBuilder,
     ApplicationContext,
+    _ActionPlan,
     _adjust_single_step_output,
     _arun_function,
     _arun_multi_step_streaming_action,
@@ -66,6 +72,8 @@ from burr.lifecycle.base import (
     PostEndStreamHook,
     PostStreamItemHook,
     PostStreamItemHookAsync,
+    PostStreamItemsHook,
+    PostStreamItemsHookAsync,
     PreApplicationExecuteCallHook,
     PreApplicationExecuteCallHookAsync,
     PreStartStreamHook,
@@ -510,6 +518,35 @@ def test_run_reducer_errors_missing_writes():
         _run_reducer(reducer, state, {}, "broken_reducer")
 
 
+def test_run_reducer_uses_journal_of_derived_state():
+    class AppendingReducer(Reducer):
+        def update(self, result: dict, state: State) -> State:
+            return state.append(messages=result["message"]).wipe(delete=["to_delete"])
+
+        @property
+        def writes(self) -> list[str]:
+            return ["messages"]
+
+    state = State({"messages": ["hello"], "to_delete": 1, "__SEQUENCE_ID": 1}).commit()
+    new_state = _run_reducer(AppendingReducer(), state, {"message": "world"}, "appending")
+    assert new_state.get_all() == {"messages": ["hello", "world"], "__SEQUENCE_ID": 1}
+    assert [delta.name() for delta in new_state.journal] == ["append", "delete"]
+
+
+def test_run_reducer_drops_private_field_modifications():
+    class PrivateFieldReducer(Reducer):
+        def update(self, result: dict, state: State) -> State:
+            return state.update(**{"foo": 1, "__SEQUENCE_ID": 100})
+
+        @property
+        def writes(self) -> list[str]:
+            return ["foo"]
+
+    state = State({"__SEQUENCE_ID": 1})
+    new_state = _run_reducer(PrivateFieldReducer(), state, {}, "private_field")
+    assert new_state.get_all() == {"foo": 1, "__SEQUENCE_ID": 1}
+
+
 def test_run_single_step_action_errors_missing_writes():
     class BrokenAction(SingleStepAction):
         @property
@@ -1247,6 +1284,29 @@ def test_app_step():
     assert state[PRIOR_STEP] == "counter"  # internal contract, not part of the public API
 
 
+def test_app_step_state_journal():
+    """Tests that the state journal after a step contains just what that step changed"""
+    counter_action = base_counter_action.with_name("counter")
+    app = Application(
+        state=State({}),
+        entrypoint="counter",
+        partition_key="test",
+        uid="test-123",
+        sequence_id=0,
+        graph=Graph(
+            actions=[counter_action],
+            transitions=[Transition(counter_action, counter_action, default)],
+        ),
+    )
+    app.step()
+    *_, state = app.step()
+    assert State({}).apply_serialized_journal(state.serialize_journal()).get_all() == {
+        "count": 2,
+        "__SEQUENCE_ID": 2,
+        PRIOR_STEP: "counter",
+    }
+
+
 def test_app_step_with_inputs():
     """Tests that we can run a step in an app"""
     counter_action = base_single_step_counter_with_inputs.with_name("counter")
@@ -1397,6 +1457,73 @@ async def test_app_astep_context():
     await app.astep()
 
 
+async def test_app_astep_runs_sync_action_in_executor():
+    """Tests that sync actions are run off of the event loop with a sync action executor,
+    while still seeing the application context"""
+    ticks = []
+    action_window = []
+
+    @action(reads=["count"], writes=["count", "app_id", "thread"])
+    def blocking_counter(state: State) -> State:
+        action_window.append(time.time())
+        time.sleep(0.2)
+        action_window.append(time.time())
+        return state.update(
+            count=state["count"] + 1,
+            app_id=ApplicationContext.get().app_id,
+            thread=threading.current_thread().name,
+        )
+
+    async def tick():
+        for _ in range(10):
+            ticks.append(time.time())
+            await asyncio.sleep(0.01)
+
+    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix="sync_action") as executor:
+        app = await (
+            ApplicationBuilder()
+            .with_actions(counter=blocking_counter)
+            .with_transitions(("counter", "counter", default))
+            .with_state(count=0)
+            .with_entrypoint("counter")
+            .with_identifiers(app_id="test_app")
+            .with_sync_action_executor(executor)
+            .abuild()
+        )
+        (_, result, state), _ = await asyncio.gather(app.astep(), tick())
+    assert result == {}
+    assert state["count"] == 1
+    assert state["app_id"] == "test_app"
+    assert state["thread"].startswith("sync_action")
+    # the event loop was free to run the ticker while the action was blocking
+    start, end = action_window
+    assert len([tick for tick in ticks if start < tick < end]) > 1
+
+
+def _multiply_count(state: State, factor: int) -> Tuple[dict, State]:
+    result = {"count": state["count"] * factor, "pid": os.getpid()}
+    return result, state.update(**result)
+
+
+async def test_app_astep_runs_sync_action_in_process_pool():
+    multiply = FunctionBasedAction(_multiply_count, reads=["count"], writes=["count", "pid"])
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        app = (
+            ApplicationBuilder()
+            .with_actions(multiply=multiply)
+            .with_transitions(("multiply", "multiply", default))
+            .with_state(count=3)
+            .with_entrypoint("multiply")
+            .with_sync_action_executor(executor)
+            .build()
+        )
+        _, result, state = await app.astep(inputs={"factor": 2})
+    assert result["count"] == 6
+    assert result["pid"] != os.getpid()
+    assert state["count"] == 6
+    assert state["__PRIOR_STEP"] == "multiply"
+
+
 async def test_app_astep_with_inputs():
     """Tests that we can run an async step in an app"""
     counter_action = base_single_step_counter_with_inputs_async.with_name("counter_async")
@@ -2625,6 +2752,32 @@ def test_application_builder_unset():
         ApplicationBuilder().build()
 
 
+def test_lifecycle_adapter_set_dispatches_to_implementing_adapters():
+    action_tracker = CallCaptureTracker()
+    execute_method_tracker = ExecuteMethodTrackerAsync()
+    adapter_set = internal.LifecycleAdapterSet(action_tracker, execute_method_tracker)
+    assert adapter_set.does_hook("pre_run_step")
+    assert not adapter_set.does_hook("pre_run_step", is_async=True)
+    assert adapter_set.does_hook("pre_run_execute_call", is_async=True)
+    assert adapter_set.does_hook("pre_run_execute_call", is_async=None)
+    assert not adapter_set.does_hook("post_stream_item", is_async=None)
+    action = base_counter_action.with_name("counter")
+    adapter_set.call_all_lifecycle_hooks_sync(
+        "pre_run_step",
+        action=action,
+        state=State(),
+        inputs={},
+        sequence_id=0,
+        app_id="app_id",
+        partition_key=None,
+    )
+    assert [name for name, _ in action_tracker.pre_called] == ["counter"]
+    # hooks nobody implements are skipped, but unknown hooks are still an error
+    adapter_set.call_all_lifecycle_hooks_sync("post_stream_item", item={})
+    with pytest.raises(ValueError, match="not registered"):
+        adapter_set.call_all_lifecycle_hooks_sync("not_a_hook")
+
+
 def test_application_run_step_hooks_sync():
     action_tracker = CallCaptureTracker()
     counter_action = base_counter_action.with_name("counter")
@@ -3601,6 +3754,80 @@ def test_remap_context_variable_without_mangled_context():
     assert _remap_dunder_parameters(_action.run, inputs, ["__context", "__tracer"]) == expected
 
 
+class CounterWithContext(Action):
+    @property
+    def reads(self) -> list[str]:
+        return ["count"]
+
+    @property
+    def writes(self) -> list[str]:
+        return ["count", "app_id"]
+
+    @property
+    def inputs(self) -> Union[list[str], tuple[list[str], list[str]]]:
+        return ["increment"], ["unused", "__context"]
+
+    def run(self, state: State, increment: int, __context: ApplicationContext, unused=None) -> dict:
+        return {"count": state["count"] + increment, "app_id": __context.app_id}
+
+    def update(self, result: dict, state: State) -> State:
+        return state.update(**result)
+
+
+def test_action_plan_compile():
+    counter = CounterWithContext().with_name("counter")
+    plan = _ActionPlan.compile(counter, ["__context", "__tracer"])
+    assert plan.required_inputs == {"increment"}
+    assert plan.optional_inputs == {"unused", "__context"}
+    assert plan.declared_inputs == {"increment", "unused", "__context"}
+    assert plan.injected_inputs == ("__context",)
+    assert plan.writes == {"count", "app_id"}
+    assert not plan.is_async
+    assert plan.mangled_parameters == {"__context": f"_{CounterWithContext.__name__}__context"}
+
+
+def test_application_step_uses_action_plan():
+    app = (
+        ApplicationBuilder()
+        .with_actions(counter=CounterWithContext())
+        .with_transitions(("counter", "counter", default))
+        .with_identifiers(app_id="test_app")
+        .with_entrypoint("counter")
+        .with_state(count=0)
+        .build()
+    )
+    action_, result, state = app.step(inputs={"increment": 2, "not_declared": 1})
+    assert result == {"count": 2, "app_id": "test_app"}
+    assert state["count"] == 2
+    with pytest.raises(ValueError, match="missing required inputs"):
+        app.step(inputs={"unused": 1})
+
+
+class CounterWithPositiveIncrement(CounterWithContext):
+    def validate_inputs(self, inputs: Optional[Dict[str, Any]]) -> None:
+        super().validate_inputs(inputs)
+        if inputs["increment"] <= 0:
+            raise ValueError("increment must be positive")
+
+
+def test_application_step_calls_overridden_validate_inputs():
+    assert not _ActionPlan.compile(CounterWithContext(), []).custom_validation
+    assert _ActionPlan.compile(CounterWithPositiveIncrement(), []).custom_validation
+    app = (
+        ApplicationBuilder()
+        .with_actions(counter=CounterWithPositiveIncrement())
+        .with_transitions(("counter", "counter", default))
+        .with_entrypoint("counter")
+        .with_state(count=0)
+        .build()
+    )
+    with pytest.raises(ValueError, match="increment must be positive"):
+        app.step(inputs={"increment": -1})
+    assert app.state["count"] == 0
+    _, result, _ = app.step(inputs={"increment": 2})
+    assert result["count"] == 2
+
+
 async def test_async_application_builder_initialize_raises_on_broken_persistor():
     """Persisters should return None when there is no state to be loaded and the default used."""
     await asyncio.sleep(0.00001)
@@ -3665,3 +3892,91 @@ def test_application__process_control_flow_params():
     assert sorted(halt_after) == ["test_action", "test_action_2"]
     assert halt_before == ["test_action"]
     assert inputs == {}
+
+
+class StreamItemBatchCaptureTracker(PostStreamItemHook, PostStreamItemsHook):
+    def __init__(self):
+        self.item_calls = []
+        self.batches = []
+
+    def post_stream_item(self, *, item: Any, item_index: int, **future_kwargs: Any):
+        self.item_calls.append((item, item_index, future_kwargs["item_count"]))
+
+    def post_stream_items(self, *, items: list, first_item_index: int, **future_kwargs: Any):
+        self.batches.append((first_item_index, list(items)))
+
+
+class StreamItemBatchCaptureTrackerAsync(PostStreamItemsHookAsync):
+    def __init__(self):
+        self.batches = []
+
+    async def post_stream_items(self, *, items: list, first_item_index: int, **future_kwargs: Any):
+        self.batches.append((first_item_index, list(items)))
+
+
+def _streaming_counter_app(counter: Action, tracker, **coalescing):
+    builder = (
+        ApplicationBuilder()
+        .with_actions(counter=counter)
+        .with_transitions(("counter", "counter"))
+        .with_entrypoint("counter")
+        .with_state(count=0)
+        .with_hooks(tracker)
+    )
+    if coalescing:
+        builder = builder.with_stream_item_coalescing(**coalescing)
+    return builder.build()
+
+
+def test_stream_item_hooks_deliver_every_item_by_default():
+    tracker = StreamItemBatchCaptureTracker()
+    app = _streaming_counter_app(base_streaming_counter, tracker)
+    _, container = app.stream_result(halt_after=["counter"])
+    assert len(list(container)) == 10
+    assert [count for *_, count in tracker.item_calls] == [1] * 10
+    assert [len(items) for _, items in tracker.batches] == [1] * 10
+
+
+def test_stream_item_hooks_coalesce_by_count():
+    tracker = StreamItemBatchCaptureTracker()
+    app = _streaming_counter_app(base_streaming_counter, tracker, max_items=4)
+    _, container = app.stream_result(halt_after=["counter"])
+    items = list(container)
+    assert len(items) == 10
+    # first item is delivered on its own, the rest in batches of 4, plus the remainder at the end
+    assert [(index, len(batch)) for index, batch in tracker.batches] == [
+        (0, 1),
+        (1, 4),
+        (5, 4),
+        (9, 1),
+    ]
+    assert [item for _, batch in tracker.batches for item in batch] == items
+    assert [(index, count) for _, index, count in tracker.item_calls] == [
+        (0, 1),
+        (4, 4),
+        (8, 4),
+        (9, 1),
+    ]
+
+
+def test_stream_item_hooks_coalesce_by_time():
+    tracker = StreamItemBatchCaptureTracker()
+    app = _streaming_counter_app(base_streaming_counter, tracker, max_interval_ms=60_000)
+    _, container = app.stream_result(halt_after=["counter"])
+    assert len(list(container)) == 10
+    assert [len(batch) for _, batch in tracker.batches] == [1, 9]
+
+
+async def test_stream_item_hooks_coalesce_async():
+    tracker = StreamItemBatchCaptureTrackerAsync()
+    app = _streaming_counter_app(base_streaming_counter_async, tracker, max_items=5)
+    _, container = await app.astream_result(halt_after=["counter"])
+    items = [item async for item in container]
+    assert len(items) == 10
+    assert [len(batch) for _, batch in tracker.batches] == [1, 5, 4]
+    assert [item for _, batch in tracker.batches for item in batch] == items
+
+
+def test_stream_item_coalescing_requires_policy():
+    with pytest.raises(ValueError, match="max_items or max_interval_ms"):
+        ApplicationBuilder().with_stream_item_coalescing()
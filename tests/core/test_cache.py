@@ -0,0 +1,362 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from burr.core import ApplicationBuilder, State, action, default
+from burr.core.action import streaming_action
+from burr.core.cache import (
+    CachedActionResult,
+    InMemoryActionCache,
+    SQLiteActionCache,
+    create_cache_key,
+)
+from burr.lifecycle.base import DoLogAttributeHook
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryActionCache()
+    else:
+        cache = SQLiteActionCache(db_path=str(tmp_path / "cache.db"))
+        yield cache
+        cache.cleanup()
+
+
+def test_create_cache_key_is_stable():
+    key = create_cache_key("action", {"a": 1, "b": [1, 2]}, {"query": "foo"})
+    assert key == create_cache_key("action", {"b": [1, 2], "a": 1}, {"query": "foo"})
+    assert key != create_cache_key("other_action", {"a": 1, "b": [1, 2]}, {"query": "foo"})
+    assert key != create_cache_key("action", {"a": 2, "b": [1, 2]}, {"query": "foo"})
+    assert key != create_cache_key("action", {"a": 1, "b": [1, 2]}, {"query": "bar"})
+    assert key != create_cache_key("action", {"a": 1, "b": [1, 2]}, {"query": "foo"}, ["fn", "2"])
+
+
+@pytest.mark.parametrize(
+    "value,other",
+    [
+        ((1, 2), [1, 2]),
+        ({1: "x"}, {"1": "x"}),
+        ({1, 2}, [1, 2]),
+        ({"a": 1}, [["a", 1]]),
+        ([1], ["1"]),
+    ],
+)
+def test_create_cache_key_distinguishes_types(value, other):
+    assert create_cache_key("action", {"a": value}, {}) != create_cache_key(
+        "action", {"a": other}, {}
+    )
+
+
+def test_create_cache_key_sets_are_unordered():
+    assert create_cache_key("action", {"a": {"x", "y", "z"}}, {}) == create_cache_key(
+        "action", {"a": {"z", "y", "x"}}, {}
+    )
+
+
+def test_create_cache_key_unserializable_returns_none():
+    assert create_cache_key("action", {"a": object()}, {}) is None
+
+
+def test_cache_get_set_stats(cache):
+    value = CachedActionResult(result={"out": 1}, writes={"a": 1})
+    assert cache.get("key") is None
+    cache.set("key", value)
+    assert cache.get("key") == value
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryActionCache(max_size=2)
+    for key in ["a", "b"]:
+        cache.set(key, CachedActionResult(result={}, writes={}))
+    cache.get("a")
+    cache.set("c", CachedActionResult(result={}, writes={}))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
+
+
+def test_cache_expires(cache):
+    cache.ttl_seconds = 0.01
+    cache.set("key", CachedActionResult(result={}, writes={}))
+    time.sleep(0.02)
+    assert cache.get("key") is None
+    assert cache.stats().evictions == 1
+
+
+def test_cache_aget_aset(cache):
+    value = CachedActionResult(result={"out": 1}, writes={"a": 1}, deletes=("b",))
+
+    async def run():
+        assert await cache.aget("key") is None
+        await cache.aset("key", value)
+        return await cache.aget("key")
+
+    assert asyncio.run(run()) == value
+
+
+def test_sqlite_cache_does_io_off_the_event_loop(tmp_path):
+    cache = SQLiteActionCache(db_path=str(tmp_path / "cache.db"))
+    threads = []
+    get = cache._get
+    cache._get = lambda key: threads.append(threading.get_ident()) or get(key)
+
+    async def run():
+        await cache.aget("key")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 1
+    assert threads[0] != loop_thread
+    cache.cleanup()
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    cache = SQLiteActionCache(db_path=str(tmp_path / "cache.db"), max_size=2)
+    cache.set("a", CachedActionResult(result={}, writes={}))
+    time.sleep(0.001)
+    cache.set("b", CachedActionResult(result={}, writes={}))
+    time.sleep(0.001)
+    cache.get("a")
+    time.sleep(0.001)
+    cache.set("c", CachedActionResult(result={}, writes={}))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats().evictions == 1
+    cache.cleanup()
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = SQLiteActionCache(db_path=db_path)
+    cache.set("key", CachedActionResult(result={"out": [1, 2]}, writes={"a": "b"}))
+    cache.cleanup()
+    other = SQLiteActionCache(db_path=db_path)
+    assert other.get("key") == CachedActionResult(result={"out": [1, 2]}, writes={"a": "b"})
+    other.cleanup()
+
+
+def _counting_app(**action_kwargs):
+    calls = []
+
+    @action(reads=["query"], writes=["answer"], **action_kwargs)
+    def answer(state: State, suffix: str) -> State:
+        calls.append(state["query"])
+        return state.update(answer=state["query"] + suffix)
+
+    @action(reads=[], writes=["query"])
+    def ask(state: State, query: str) -> State:
+        return state.update(query=query)
+
+    builder = (
+        ApplicationBuilder()
+        .with_actions(ask=ask, answer=answer)
+        .with_transitions(("ask", "answer"), ("answer", "ask", default))
+        .with_entrypoint("ask")
+        .with_state(query="")
+    )
+    return builder, calls
+
+
+def test_application_caches_action_results():
+    cache = InMemoryActionCache()
+    builder, calls = _counting_app(cache=True)
+    app = builder.with_action_cache(cache).build()
+    answers = []
+    for query in ["foo", "bar", "foo"]:
+        app.step(inputs={"query": query})
+        _, _, state = app.step(inputs={"suffix": "!"})
+        answers.append(state["answer"])
+    assert answers == ["foo!", "bar!", "foo!"]
+    assert calls == ["foo", "bar"]
+    assert state["__PRIOR_STEP"] == "answer"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_application_cache_keys_on_inputs():
+    cache = InMemoryActionCache()
+    builder, calls = _counting_app(cache=cache)
+    app = builder.build()
+    for suffix in ["!", "?", "!"]:
+        app.step(inputs={"query": "foo"})
+        app.step(inputs={"suffix": suffix})
+    assert calls == ["foo", "foo"]
+
+
+@action(reads=["query"], writes=["answer"], cache=True)
+def shout(state: State, suffix: str) -> State:
+    return state.update(answer=state["query"].upper() + suffix)
+
+
+@action(reads=["query"], writes=["answer"], cache=True)
+def whisper(state: State, suffix: str) -> State:
+    return state.update(answer=state["query"].lower() + suffix)
+
+
+def _cached_answer(cache: InMemoryActionCache, answer, **inputs) -> str:
+    app = (
+        ApplicationBuilder()
+        .with_actions(answer=answer)
+        .with_transitions(("answer", "answer"))
+        .with_entrypoint("answer")
+        .with_state(query="Foo")
+        .with_action_cache(cache)
+        .build()
+    )
+    _, _, state = app.step(inputs=inputs)
+    return state["answer"]
+
+
+def test_application_cache_keys_on_function_and_bound_params():
+    cache = InMemoryActionCache()
+    answers = [
+        _cached_answer(cache, shout, suffix="!"),
+        _cached_answer(cache, whisper, suffix="!"),
+        _cached_answer(cache, shout.bind(suffix="?")),
+        _cached_answer(cache, shout.bind(suffix=".")),
+        _cached_answer(cache, shout, suffix="!"),
+    ]
+    assert answers == ["FOO!", "foo!", "FOO?", "FOO.", "FOO!"]
+    assert cache.stats().hits == 1
+
+
+def test_application_cache_keys_on_cache_version():
+    cache = InMemoryActionCache()
+    all_calls = []
+    for cache_version in ["1", "2", "2"]:
+        builder, calls = _counting_app(cache=True, cache_version=cache_version)
+        app = builder.with_action_cache(cache).build()
+        app.step(inputs={"query": "foo"})
+        app.step(inputs={"suffix": "!"})
+        all_calls.append(calls)
+    assert all_calls == [["foo"], ["foo"], []]
+
+
+def test_application_caches_actions_named_in_builder():
+    cache = InMemoryActionCache()
+    builder, calls = _counting_app()
+    app = builder.with_action_cache(cache, actions=["answer"]).build()
+    for _ in range(2):
+        app.step(inputs={"query": "foo"})
+        app.step(inputs={"suffix": "!"})
+    assert calls == ["foo"]
+
+
+def test_application_does_not_cache_by_default():
+    cache = InMemoryActionCache()
+    builder, calls = _counting_app()
+    app = builder.with_action_cache(cache).build()
+    for _ in range(2):
+        app.step(inputs={"query": "foo"})
+        app.step(inputs={"suffix": "!"})
+    assert calls == ["foo", "foo"]
+
+
+def test_application_cache_true_without_cache_raises():
+    builder, _ = _counting_app(cache=True)
+    with pytest.raises(ValueError, match="with_action_cache"):
+        builder.build()
+
+
+def test_application_streaming_action_cannot_be_cached():
+    @streaming_action(reads=[], writes=["out"])
+    def stream(state: State):
+        yield {"out": 1}, None
+        yield {"out": 1}, state.update(out=1)
+
+    with pytest.raises(ValueError, match="streaming"):
+        (
+            ApplicationBuilder()
+            .with_actions(stream=stream)
+            .with_transitions(("stream", "stream"))
+            .with_entrypoint("stream")
+            .with_action_cache(InMemoryActionCache(), actions=["stream"])
+            .build()
+        )
+
+
+def test_application_caches_async_action_results():
+    cache = InMemoryActionCache()
+    calls = []
+
+    @action(reads=["count"], writes=["count"], cache=cache)
+    async def increment(state: State) -> State:
+        calls.append(state["count"])
+        return state.update(count=state["count"] + 1)
+
+    @action(reads=["count"], writes=["count"])
+    async def reset(state: State) -> State:
+        return state.update(count=0)
+
+    app = (
+        ApplicationBuilder()
+        .with_actions(increment=increment, reset=reset)
+        .with_transitions(("increment", "reset"), ("reset", "increment"))
+        .with_entrypoint("increment")
+        .with_state(count=0)
+        .build()
+    )
+
+    async def run():
+        for _ in range(4):
+            await app.astep()
+
+    asyncio.run(run())
+    assert calls == [0]
+    assert app.state["count"] == 0
+    assert cache.stats().hits == 1
+
+
+def test_application_cache_hit_replays_deletes(cache):
+    calls = []
+
+    @action(reads=["query"], writes=["answer"], cache=cache)
+    def answer(state: State) -> State:
+        calls.append(state["query"])
+        return state.update(answer=state["query"] + "!").wipe(delete=["scratch"])
+
+    @action(reads=[], writes=["scratch"])
+    def prepare(state: State) -> State:
+        return state.update(scratch="notes")
+
+    app = (
+        ApplicationBuilder()
+        .with_actions(prepare=prepare, answer=answer)
+        .with_transitions(("prepare", "answer"), ("answer", "prepare"))
+        .with_entrypoint("prepare")
+        .with_state(query="foo")
+        .build()
+    )
+    for _ in range(2):
+        app.step()
+        assert "scratch" in app.state
+        _, _, state = app.step()
+        assert state["answer"] == "foo!"
+        assert "scratch" not in state
+    assert calls == ["foo"]
+
+
+def test_application_logs_cache_hits_to_tracker():
+    class AttributeCapture(DoLogAttributeHook):
+        def __init__(self):
+            self.logged = []
+
+        def do_log_attributes(self, *, attributes, action, **future_kwargs):
+            self.logged.append((action, attributes["__burr_cache_hit"]))
+
+    cache = InMemoryActionCache()
+    capture = AttributeCapture()
+    builder, _ = _counting_app(cache=cache)
+    app = builder.with_hooks(capture).build()
+    for _ in range(2):
+        app.step(inputs={"query": "foo"})
+        app.step(inputs={"suffix": "!"})
+    assert capture.logged == [("answer", False), ("answer", True)]
@@ -156,6 +156,44 @@ def test_graph_builder_get_next_node():
     assert graph.get_next_node(None, State({"count": 0}), entrypoint="counter").name == "counter"
 
 
+def test_graph_get_next_node_resolves_transitions_in_order():
+    graph = (
+        GraphBuilder()
+        .with_actions(counter=base_counter_action, result=Result("count"))
+        .with_transitions(
+            ("counter", "counter", Condition.expr("count < 10")),
+            ("counter", "result", Condition.when(count=10)),
+        )
+        .build()
+    )
+    assert (
+        graph.get_next_node("counter", State({"count": 1}), entrypoint="counter").name == "counter"
+    )
+    assert (
+        graph.get_next_node("counter", State({"count": 10}), entrypoint="counter").name == "result"
+    )
+    assert graph.get_next_node("counter", State({"count": 11}), entrypoint="counter") is None
+    assert graph.get_next_node("result", State({"count": 11}), entrypoint="counter") is None
+    with pytest.raises(ValueError, match="count"):
+        graph.get_next_node("counter", State({}), entrypoint="counter")
+
+
+def test_graph_decision_table_stops_at_default():
+    graph = (
+        GraphBuilder()
+        .with_actions(counter=base_counter_action, result=Result("count"))
+        .with_transitions(
+            ("counter", "result", default),
+            ("counter", "counter", Condition.expr("count < 10")),
+        )
+        .build()
+    )
+    assert [action.name for action, _ in graph._decision_table["counter"]] == ["result"]
+    assert (
+        graph.get_next_node("counter", State({"count": 0}), entrypoint="counter").name == "result"
+    )
+
+
 def test_get_actions_by_tag():
     action_with_tags = PassedInAction(
         reads=["count"],
@@ -2,6 +2,8 @@ import asyncio
 import concurrent.futures
 import dataclasses
 import datetime
+import threading
+import time
 from random import random
 from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, Literal, Optional, Union
 
@@ -16,17 +18,19 @@ from burr.core import (
     State,
     action,
 )
-from burr.core.action import Input, Result
+from burr.core.action import Input, Result, create_action
 from burr.core.graph import GraphBuilder
 from burr.core.parallelism import (
     MapActions,
     MapActionsAndStates,
     MapStates,
+    ParallelActions,
     RunnableGraph,
     SubGraphTask,
     TaskBasedParallelAction,
     _cascade_adapter,
     map_reduce_action,
+    parallel,
 )
 from burr.core.persistence import BaseStateLoader, BaseStateSaver, PersistedStateData
 from burr.tracking.base import SyncTrackingClient
@@ -1152,6 +1156,84 @@ def test_cascade_adapter_fixed():
     assert cascaded is next_adapter
 
 
+def test_subgraph_task_creates_apps_from_shared_template():
+    graph = RunnableGraph.create(simple_single_fn_subgraph)
+    parent_context = ApplicationContext(
+        app_id="parent",
+        partition_key="partition",
+        sequence_id=3,
+        tracker=None,
+        parallel_executor_factory=lambda: concurrent.futures.ThreadPoolExecutor(),
+        state_initializer=None,
+        state_persister=None,
+        action_name="parent_action",
+    )
+    tasks = [
+        SubGraphTask(
+            graph=graph,
+            inputs={},
+            state=State({"input_number": i, "number_to_add": 1}),
+            application_id=f"child_{i}",
+            tracker=DummyTracker(),
+        )
+        for i in range(2)
+    ]
+    apps = [task._create_app_from_template(parent_context) for task in tasks]
+    template = graph._template
+    assert template is not None
+    for task, app in zip(tasks, apps):
+        assert app.uid == task.application_id
+        assert app.partition_key == "partition"
+        assert app.spawning_parent_pointer == burr_types.ParentPointer(
+            app_id="parent", partition_key="partition", sequence_id=3
+        )
+        assert app.state["input_number"] == task.state["input_number"]
+        # each gets its own tracker, but the compiled graph is shared
+        assert task.tracker in app._adapter_set.adapters
+        assert app._action_plans is template.action_plans
+        # the template's builder only builds the placeholder application it was created from
+        assert app.builder is None
+    assert [task.run(parent_context)["output_number"] for task in tasks] == [1002, 1003]
+    assert graph._template is template
+
+
+def test_map_states_shares_graph_across_tasks():
+    class MapStatesSimple(MapStates):
+        def action(self, state: State, inputs: Dict[str, Any]) -> SubGraphType:
+            return simple_single_fn_subgraph
+
+        def states(
+            self, state: State, context: ApplicationContext, inputs: Dict[str, Any]
+        ) -> Generator[State, None, None]:
+            for i in range(3):
+                yield state.update(input_number=i)
+
+        def reduce(self, state: State, states: Generator[State, None, None]) -> State:
+            return state
+
+        @property
+        def reads(self) -> List[str]:
+            return ["number_to_add"]
+
+        @property
+        def writes(self) -> List[str]:
+            return []
+
+    context = ApplicationContext(
+        app_id="parent",
+        partition_key=None,
+        sequence_id=0,
+        tracker=None,
+        parallel_executor_factory=lambda: concurrent.futures.ThreadPoolExecutor(),
+        state_initializer=None,
+        state_persister=None,
+        action_name="map_states",
+    )
+    tasks = list(MapStatesSimple().tasks(State({"number_to_add": 1}), context, {}))
+    assert len(tasks) == 3
+    assert all(task.graph is tasks[0].graph for task in tasks)
+
+
 def test_map_actions_and_states_uses_same_persister_as_loader():
     """This tests the MapActionsAndStates functionality of using the correct persister. Specifically
     we want it to use the same instance for the saver as it does the loader, as that is
@@ -1210,3 +1292,313 @@ def test_map_actions_and_states_uses_same_persister_as_loader():
     assert task.state_initializer is not None
     assert task.tracker is not None
     assert task.state_persister is task.state_initializer  # This ensures they're the same
+
+
+@action(reads=["query"], writes=["documents"])
+def _retrieve(state: State, top_k: int = 2) -> State:
+    return state.update(documents=[f"{state['query']}_{i}" for i in range(top_k)])
+
+
+@action(reads=["query"], writes=["search_results"])
+def _search(state: State, engine: str) -> State:
+    return state.update(search_results=f"{engine}:{state['query']}")
+
+
+@action(reads=["query"], writes=["search_results"])
+async def _asearch(state: State, engine: str) -> State:
+    await asyncio.sleep(0.001)
+    return state.update(search_results=f"{engine}:{state['query']}")
+
+
+def _parallel_app(research: Action):
+    return (
+        ApplicationBuilder()
+        .with_actions(research=research, result=Result("documents", "search_results"))
+        .with_transitions(("research", "result"))
+        .with_entrypoint("research")
+        .with_state(query="burr")
+        .build()
+    )
+
+
+def test_parallel_merges_writes():
+    research = parallel(_retrieve, search=_search)
+    assert research.reads == ["query"]
+    assert research.writes == ["documents", "search_results"]
+    assert research.inputs == (["__context", "engine"], ["top_k"])
+    app = _parallel_app(research)
+    action_, _, state = app.run(halt_after=["result"], inputs={"engine": "web"})
+    assert state["documents"] == ["burr_0", "burr_1"]
+    assert state["search_results"] == "web:burr"
+    assert state["query"] == "burr"
+
+
+async def test_parallel_merges_writes_async():
+    research = parallel(_retrieve, search=_asearch)
+    assert research.is_async()
+    app = _parallel_app(research)
+    action_, _, state = await app.arun(halt_after=["result"], inputs={"engine": "web", "top_k": 1})
+    assert state["documents"] == ["burr_0"]
+    assert state["search_results"] == "web:burr"
+
+
+class _ParallelAsCompleted(ParallelActions):
+    def yield_as_completed(self) -> bool:
+        return True
+
+
+@action(reads=["query"], writes=["documents"])
+def _slow_retrieve(state: State) -> State:
+    time.sleep(0.05)
+    return state.update(documents=[state["query"]])
+
+
+@action(reads=["query"], writes=["documents"])
+async def _aslow_retrieve(state: State) -> State:
+    await asyncio.sleep(0.05)
+    return state.update(documents=[state["query"]])
+
+
+def test_parallel_merges_writes_as_completed():
+    research = _ParallelAsCompleted(
+        [create_action(_slow_retrieve, "retrieve"), create_action(_search, "search")]
+    )
+    app = _parallel_app(research)
+    action_, _, state = app.run(halt_after=["result"], inputs={"engine": "web"})
+    assert state["documents"] == ["burr"]
+    assert state["search_results"] == "web:burr"
+
+
+async def test_parallel_merges_writes_as_completed_async():
+    research = _ParallelAsCompleted(
+        [create_action(_aslow_retrieve, "retrieve"), create_action(_asearch, "search")]
+    )
+    app = _parallel_app(research)
+    action_, _, state = await app.arun(halt_after=["result"], inputs={"engine": "web"})
+    assert state["documents"] == ["burr"]
+    assert state["search_results"] == "web:burr"
+
+
+def test_parallel_conflicting_actions_raise():
+    @action(reads=["documents"], writes=["summary"])
+    def summarize(state: State) -> State:
+        return state.update(summary="")
+
+    with pytest.raises(ValueError, match="conflict"):
+        parallel(_retrieve, summarize)
+    with pytest.raises(ValueError, match="conflict"):
+        parallel(_search, other_search=_search)
+
+
+def test_parallel_duplicate_names_raise():
+    with pytest.raises(ValueError, match="unique"):
+        parallel(_retrieve, _retrieve=_search)
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, *args):
+        with self.lock:
+            self.running -= 1
+
+
+def _bounded_map_states(
+    sleep_action: Action,
+    num_tasks: int,
+    max_concurrency: Optional[int] = None,
+    task_timeout: Optional[float] = None,
+    as_completed: bool = False,
+    is_async: bool = False,
+    consume_states: bool = True,
+    executor_factory: Optional[Callable[[], concurrent.futures.Executor]] = None,
+):
+    class BoundedMapStates(MapStates):
+        def action(self, state: State, inputs: Dict[str, Any]) -> Action:
+            return sleep_action
+
+        def states(
+            self, state: State, context: ApplicationContext, inputs: Dict[str, Any]
+        ) -> Generator[State, None, None]:
+            for i in range(num_tasks):
+                yield state.update(task=i)
+
+        def reduce(self, state: State, states: Any) -> Any:
+            if is_async:
+
+                async def _areduce():
+                    if not consume_states:
+                        return state.update(completed=[])
+                    return state.update(completed=[item["task"] async for item in states])
+
+                return _areduce()
+            if not consume_states:
+                return state.update(completed=[])
+            return state.update(completed=[item["task"] for item in states])
+
+        def max_concurrency(self) -> Optional[int]:
+            return max_concurrency
+
+        def task_timeout(self) -> Optional[float]:
+            return task_timeout
+
+        def yield_as_completed(self) -> bool:
+            return as_completed
+
+        def is_async(self) -> bool:
+            return is_async
+
+        @property
+        def reads(self) -> list[str]:
+            return []
+
+        @property
+        def writes(self) -> list[str]:
+            return ["completed"]
+
+    builder = (
+        ApplicationBuilder()
+        .with_actions(map_states=BoundedMapStates(), final=Result("completed"))
+        .with_transitions(("map_states", "final"))
+        .with_entrypoint("map_states")
+    )
+    if executor_factory is not None:
+        builder = builder.with_parallel_executor(executor_factory)
+    return builder.build()
+
+
+def test_task_based_parallel_action_bounded_concurrency_sync():
+    tracker = _ConcurrencyTracker()
+
+    @action(reads=["task"], writes=["task"])
+    def sleep(state: State) -> State:
+        with tracker:
+            time.sleep(0.005)
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=10, max_concurrency=2)
+    _, _, state = app.run(halt_after=["final"])
+    assert state["completed"] == list(range(10))
+    assert tracker.peak <= 2
+
+
+async def test_task_based_parallel_action_bounded_concurrency_async():
+    tracker = _ConcurrencyTracker()
+
+    @action(reads=["task"], writes=["task"])
+    async def sleep(state: State) -> State:
+        with tracker:
+            await asyncio.sleep(0.005)
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=10, max_concurrency=3, is_async=True)
+    _, _, state = await app.arun(halt_after=["final"])
+    assert state["completed"] == list(range(10))
+    assert tracker.peak == 3
+
+
+async def test_task_based_parallel_action_as_completed_async():
+    @action(reads=["task"], writes=["task"])
+    async def sleep(state: State) -> State:
+        await asyncio.sleep(0.01 * (3 - state["task"]))
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=3, as_completed=True, is_async=True)
+    _, _, state = await app.arun(halt_after=["final"])
+    assert state["completed"] == [2, 1, 0]
+
+
+def test_task_based_parallel_action_as_completed_sync():
+    @action(reads=["task"], writes=["task"])
+    def sleep(state: State) -> State:
+        time.sleep(0.02 * (3 - state["task"]))
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=3, as_completed=True)
+    _, _, state = app.run(halt_after=["final"])
+    assert state["completed"] == [2, 1, 0]
+
+
+async def test_task_based_parallel_action_timeout_cancels_stragglers_async():
+    cancelled = []
+
+    @action(reads=["task"], writes=["task"])
+    async def sleep(state: State) -> State:
+        try:
+            await asyncio.sleep(0 if state["task"] == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(state["task"])
+            raise
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=3, task_timeout=0.05, is_async=True)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await app.arun(halt_after=["final"])
+    assert time.monotonic() - start < 5
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_task_based_parallel_action_timeout_sync():
+    @action(reads=["task"], writes=["task"])
+    def sleep(state: State) -> State:
+        time.sleep(0 if state["task"] == 0 else 0.5)
+        return state
+
+    app = _bounded_map_states(sleep, num_tasks=2, task_timeout=0.05)
+    with pytest.raises(TimeoutError):
+        app.run(halt_after=["final"])
+
+
+def test_task_based_parallel_action_timeout_counts_from_task_start_sync():
+    @action(reads=["task"], writes=["task"])
+    def sleep(state: State) -> State:
+        time.sleep(0.05)
+        return state
+
+    # each task waits for the ones before it on the single worker, but runs within its timeout
+    app = _bounded_map_states(
+        sleep,
+        num_tasks=6,
+        task_timeout=0.2,
+        executor_factory=lambda: concurrent.futures.ThreadPoolExecutor(1),
+    )
+    _, _, state = app.run(halt_after=["final"])
+    assert state["completed"] == list(range(6))
+
+
+def test_task_based_parallel_action_runs_tasks_reduce_does_not_consume_sync():
+    ran = []
+
+    @action(reads=["task"], writes=["task"])
+    def record(state: State) -> State:
+        ran.append(state["task"])
+        return state
+
+    app = _bounded_map_states(record, num_tasks=5, max_concurrency=2, consume_states=False)
+    app.run(halt_after=["final"])
+    assert sorted(ran) == list(range(5))
+
+
+async def test_task_based_parallel_action_runs_tasks_reduce_does_not_consume_async():
+    ran = []
+
+    @action(reads=["task"], writes=["task"])
+    async def record(state: State) -> State:
+        await asyncio.sleep(0)
+        ran.append(state["task"])
+        return state
+
+    app = _bounded_map_states(
+        record, num_tasks=5, max_concurrency=2, consume_states=False, is_async=True
+    )
+    await app.arun(halt_after=["final"])
+    assert sorted(ran) == list(range(5))
@@ -106,7 +106,74 @@ def test_persister_methods_none_partition_key(persistence, method_name: str, kwa
     # these operations are stateful (i.e., read/write to a db)
 
 
+def _save_incremental_history(persister: SQLLitePersister, num_steps: int) -> list:
+    """Saves a history of states where each step appends to the prior one"""
+    states = []
+    state = State({"messages": [], "count": 0})
+    for sequence_id in range(num_steps):
+        state = state.commit().append(messages=f"message_{sequence_id}").increment(count=1)
+        persister.save("pk", "app_id", sequence_id, "step", state, "completed")
+        states.append(state)
+    return states
+
+
+def test_sqlite_persistence_incremental_saves_and_loads():
+    persister = SQLLitePersister(db_path=":memory:", table_name="test_table", checkpoint_every=3)
+    persister.initialize()
+    states = _save_incremental_history(persister, 8)
+    cursor = persister.connection.cursor()
+    cursor.execute("SELECT state FROM test_table ORDER BY sequence_id")
+    checkpoints = ["__burr_journal__" not in row[0] for row in cursor.fetchall()]
+    assert checkpoints == [True, False, False, True, False, False, True, False]
+    for sequence_id, state in enumerate(states):
+        loaded = persister.load("pk", "app_id", sequence_id)
+        assert loaded["state"].get_all() == state.get_all()
+    assert persister.load("pk", "app_id")["state"].get_all() == states[-1].get_all()
+    persister.cleanup()
+
+
+def test_sqlite_persistence_incremental_checkpoints_unrelated_state():
+    persister = SQLLitePersister(db_path=":memory:", table_name="test_table", checkpoint_every=10)
+    persister.initialize()
+    persister.save("pk", "app_id", 0, "step", State({"foo": "bar"}), "completed")
+    # not derived from the prior state, so this has to be a checkpoint
+    persister.save("pk", "app_id", 1, "step", State({"foo": "baz"}), "completed")
+    cursor = persister.connection.cursor()
+    cursor.execute("SELECT state FROM test_table WHERE sequence_id = 1")
+    assert "__burr_journal__" not in cursor.fetchone()[0]
+    assert persister.load("pk", "app_id")["state"].get_all() == {"foo": "baz"}
+    persister.cleanup()
+
+
+def test_sqlite_persistence_compact_production_mode_uses_writer(tmp_path):
+    persister = SQLLitePersister(
+        db_path=str(tmp_path / "test.db"), table_name="test_table", production_mode=True
+    )
+    persister.initialize()
+    states = _save_incremental_history(persister, 4)
+    executed = []
+    execute = persister._writer.execute
+    persister._writer.execute = lambda function: executed.append(function) or execute(function)
+    assert persister.compact("pk", "app_id") == 3
+    assert len(executed) == 1
+    assert persister.load("pk", "app_id")["state"].get_all() == states[-1].get_all()
+    persister.cleanup()
+
+
+def test_sqlite_persistence_compact():
+    persister = SQLLitePersister(db_path=":memory:", table_name="test_table", checkpoint_every=3)
+    persister.initialize()
+    states = _save_incremental_history(persister, 8)
+    assert persister.compact("pk", "app_id", before_sequence_id=5) == 5
+    assert persister.load("pk", "app_id", 4) is None
+    for sequence_id in [5, 6, 7]:
+        loaded = persister.load("pk", "app_id", sequence_id)
+        assert loaded["state"].get_all() == states[sequence_id].get_all()
+    persister.cleanup()
+
+
 import asyncio
+import threading
 from typing import Tuple
 
 import aiosqlite
@@ -356,3 +423,577 @@ async def test_async_save_and_load_from_sqlite_persister_end_to_end(tmp_path):
         raise e
     finally:
         await sqlite_persister_2.close()
+
+
+from burr.core import default
+from burr.core.persistence import AsyncWriteBehindPersister, BaseStateSaver, WriteBehindPersister
+
+
+@action(reads=["count"], writes=["count"])
+def counter(state: State) -> State:
+    return state.update(count=state["count"] + 1)
+
+
+@action(reads=["count"], writes=["count"])
+async def async_counter(state: State) -> State:
+    return state.update(count=state["count"] + 1)
+
+
+def test_write_behind_persister_saves_by_end_of_run(tmp_path):
+    persister = SQLLitePersister(
+        db_path=tmp_path / "test.db",
+        table_name="test_table",
+        connect_kwargs={"check_same_thread": False},
+    )
+    persister.initialize()
+    write_behind_persister = WriteBehindPersister(persister, max_batch_size=3)
+    app = (
+        ApplicationBuilder()
+        .with_actions(counter)
+        .with_transitions(("counter", "counter", default))
+        .with_state(count=0)
+        .with_entrypoint("counter")
+        .with_identifiers(app_id="app_id", partition_key="pk")
+        .with_state_persister(write_behind_persister)
+        .build()
+    )
+    app.run(halt_after=["counter"])
+    for _ in range(9):
+        app.step()
+    write_behind_persister.flush()
+    cursor = persister.connection.cursor()
+    cursor.execute("SELECT COUNT(*) FROM test_table")
+    assert cursor.fetchone()[0] == 10
+    loaded = write_behind_persister.load("pk", "app_id")
+    assert loaded["sequence_id"] == 9
+    assert loaded["state"]["count"] == 10
+    write_behind_persister.close()
+    persister.cleanup()
+
+
+class _BlockingSaver(BaseStateSaver):
+    def __init__(self):
+        self.saved = []
+        self.unblocked = threading.Event()
+
+    def save(self, partition_key, app_id, sequence_id, position, state, status, **kwargs):
+        self.unblocked.wait()
+        if state.get("fail"):
+            raise ValueError("failed to save")
+        self.saved.append(sequence_id)
+
+
+def _to_persist(sequence_id: int, state: State) -> dict:
+    return {
+        "partition_key": "pk",
+        "app_id": "app_id",
+        "sequence_id": sequence_id,
+        "position": "counter",
+        "state": state,
+        "status": "completed",
+    }
+
+
+def test_write_behind_persister_raises_when_full():
+    saver = _BlockingSaver()
+    write_behind_persister = WriteBehindPersister(
+        saver, max_queue_size=2, max_batch_size=1, on_full="raise"
+    )
+    with pytest.raises(RuntimeError, match="full"):
+        # one can be taken by the worker, two are queued, so we fill up by the fourth
+        for sequence_id in range(4):
+            write_behind_persister.enqueue(_to_persist(sequence_id, State()))
+    saver.unblocked.set()
+    write_behind_persister.close()
+    assert saver.saved == sorted(saver.saved)
+
+
+def test_write_behind_persister_raises_save_errors_on_flush():
+    saver = _BlockingSaver()
+    saver.unblocked.set()
+    write_behind_persister = WriteBehindPersister(saver)
+    write_behind_persister.enqueue(_to_persist(0, State({"fail": True})))
+    with pytest.raises(ValueError, match="failed to save"):
+        write_behind_persister.flush()
+    write_behind_persister.enqueue(_to_persist(1, State()))
+    write_behind_persister.close()
+    assert saver.saved == [1]
+
+
+def test_write_behind_persister_cannot_load_from_saver():
+    with pytest.raises(TypeError):
+        WriteBehindPersister(_BlockingSaver()).load("pk", "app_id")
+
+
+async def test_async_write_behind_persister_saves_by_end_of_arun():
+    persister = AsyncInMemoryPersister()
+    write_behind_persister = AsyncWriteBehindPersister(persister, max_batch_size=2)
+    app = await (
+        ApplicationBuilder()
+        .with_actions(counter=async_counter)
+        .with_transitions(("counter", "counter", default))
+        .with_state(count=0)
+        .with_entrypoint("counter")
+        .with_identifiers(app_id="app_id", partition_key="pk")
+        .with_state_persister(write_behind_persister)
+        .abuild()
+    )
+    await app.arun(halt_after=["counter"])
+    assert len(persister._storage["pk"]["app_id"]) == 1
+    for _ in range(4):
+        await app.astep()
+    loaded = await write_behind_persister.load("pk", "app_id")
+    assert loaded["sequence_id"] == 4
+    assert loaded["state"]["count"] == 5
+    await write_behind_persister.close()
+
+
+async def test_async_write_behind_persister_stops_worker_when_flushed():
+    persister = AsyncInMemoryPersister()
+    write_behind_persister = AsyncWriteBehindPersister(persister)
+    app = await (
+        ApplicationBuilder()
+        .with_actions(counter=async_counter)
+        .with_transitions(("counter", "counter", default))
+        .with_state(count=0)
+        .with_entrypoint("counter")
+        .with_identifiers(app_id="app_id", partition_key="pk")
+        .with_state_persister(write_behind_persister)
+        .abuild()
+    )
+    await app.arun(halt_after=["counter"])
+    assert write_behind_persister._worker is None
+    # and saving again starts a new one
+    await app.astep()
+    assert write_behind_persister._worker is not None
+    await write_behind_persister.flush()
+    assert write_behind_persister._worker is None
+    assert len(persister._storage["pk"]["app_id"]) == 2
+
+
+async def test_write_behind_persister_saves_by_end_of_arun():
+    saver = _BlockingSaver()
+    saver.unblocked.set()
+    write_behind_persister = WriteBehindPersister(saver)
+    app = (
+        ApplicationBuilder()
+        .with_actions(counter=async_counter)
+        .with_transitions(("counter", "counter", default))
+        .with_state(count=0)
+        .with_entrypoint("counter")
+        .with_identifiers(app_id="app_id", partition_key="pk")
+        .with_state_persister(write_behind_persister)
+        .build()
+    )
+    # slow down the worker, so the save is still pending unless arun flushes
+    saver.unblocked.clear()
+    threading.Timer(0.1, saver.unblocked.set).start()
+    await app.arun(halt_after=["counter"])
+    assert saver.saved == [0]
+    write_behind_persister.close()
+
+
+import concurrent.futures
+import io
+import json
+import pickle
+import sqlite3
+
+from burr.core.persistence import _connect_sqlite_for_production, _SQLiteWriter
+
+
+def _production_persister(db_path) -> SQLLitePersister:
+    persister = SQLLitePersister(
+        db_path=str(db_path), table_name="test_table", production_mode=True
+    )
+    persister.initialize()
+    return persister
+
+
+def test_sqlite_production_mode_concurrent_saves_and_loads(tmp_path):
+    persister = _production_persister(tmp_path / "test.db")
+    copies = [persister.copy() for _ in range(4)]
+    # copies write through the same writer
+    assert len({copy._writer for copy in copies + [persister]}) == 1
+
+    def save_and_load(i: int) -> int:
+        copy = copies[i % len(copies)]
+        for sequence_id in range(5):
+            copy.save("pk", f"app_id_{i}", sequence_id, "pos", State({"a": i}), "completed")
+        return copy.load("pk", f"app_id_{i}")["state"]["a"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(save_and_load, range(16))) == list(range(16))
+    assert len(persister.list_app_ids("pk")) == 16
+    assert persister.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    for copy in copies:
+        copy.cleanup()
+    persister.cleanup()
+    assert _SQLiteWriter._writers == {}
+
+
+def test_sqlite_production_mode_failed_save_does_not_fail_batch(tmp_path):
+    persister = _production_persister(tmp_path / "test.db")
+    persister.save("pk", "app_id", 1, "counter", State({"a": 1}), "completed")
+    batch = [
+        (
+            persister,
+            [_to_persist(sequence_id, State({"a": sequence_id}))],
+            concurrent.futures.Future(),
+        )
+        for sequence_id in [0, 1, 2]
+    ]
+    connection = _connect_sqlite_for_production(persister.db_path, None)
+    persister._writer._write_batch(connection, batch)
+    connection.close()
+    assert batch[0][2].result() is None
+    with pytest.raises(Exception, match="UNIQUE"):
+        batch[1][2].result()
+    assert batch[2][2].result() is None
+    assert persister.load("pk", "app_id", 1)["state"]["a"] == 1
+    assert persister.load("pk", "app_id")["sequence_id"] == 2
+    persister.cleanup()
+
+
+def test_sqlite_production_mode_list_app_ids_uses_covering_index(tmp_path):
+    persister = _production_persister(tmp_path / "test.db")
+    plan = persister.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT app_id FROM test_table "
+        "WHERE partition_key = ? ORDER BY created_at DESC",
+        ("pk",),
+    ).fetchall()
+    assert "COVERING INDEX test_table_partition_key_created_at_index" in str(plan)
+    persister.cleanup()
+
+
+def test_sqlite_production_mode_pickle(tmp_path):
+    persister = _production_persister(tmp_path / "test.db")
+    persister.save("pk", "app_id", 0, "pos", State({"a": 1}), "completed")
+    unpickled = pickle.loads(pickle.dumps(persister))
+    assert unpickled._writer is persister._writer
+    assert unpickled.load("pk", "app_id")["state"]["a"] == 1
+    unpickled.cleanup()
+    persister.cleanup()
+
+
+def test_sqlite_production_mode_requires_a_file():
+    with pytest.raises(ValueError, match="database file"):
+        SQLLitePersister(db_path=":memory:", production_mode=True)
+
+
+def test_sqlite_production_mode_writer_that_cannot_connect_fails_saves(tmp_path, monkeypatch):
+    def fail_to_connect(*args, **kwargs):
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr("burr.core.persistence._connect_sqlite_for_production", fail_to_connect)
+    persister = SQLLitePersister(
+        db_path=str(tmp_path / "test.db"), table_name="test_table", production_mode=True
+    )
+    persister.initialize()
+    for sequence_id in range(2):
+        with pytest.raises(sqlite3.OperationalError, match="unable to open"):
+            persister.save("pk", "app_id", sequence_id, "pos", State({"a": 1}), "completed")
+    persister.cleanup()
+    monkeypatch.undo()
+    # the failed writer is not handed to the next persister
+    persister = _production_persister(tmp_path / "test.db")
+    persister.save("pk", "app_id", 0, "pos", State({"a": 1}), "completed")
+    assert persister.load("pk", "app_id")["state"]["a"] == 1
+    persister.cleanup()
+    assert _SQLiteWriter._writers == {}
+
+
+async def test_async_sqlite_production_mode_concurrent_saves(tmp_path):
+    persister = await AsyncSQLitePersister.from_values(
+        db_path=str(tmp_path / "test.db"), table_name="test_table", production_mode=True
+    )
+    await persister.initialize()
+    copies = [persister.copy() for _ in range(4)]
+
+    async def save_and_load(i: int) -> int:
+        copy = copies[i % len(copies)]
+        for sequence_id in range(5):
+            await copy.save("pk", f"app_id_{i}", sequence_id, "pos", State({"a": i}), "completed")
+        return (await copy.load("pk", f"app_id_{i}"))["state"]["a"]
+
+    assert await asyncio.gather(*[save_and_load(i) for i in range(16)]) == list(range(16))
+    with pytest.raises(Exception, match="UNIQUE"):
+        await persister.save("pk", "app_id_0", 0, "pos", State({"a": 0}), "completed")
+    cursor = await persister.connection.execute("PRAGMA journal_mode")
+    assert (await cursor.fetchone())[0] == "wal"
+    await persister.cleanup()
+
+
+async def test_async_sqlite_production_mode_cancelled_save_does_not_fail_batch(tmp_path):
+    persister = await AsyncSQLitePersister.from_values(
+        db_path=str(tmp_path / "test.db"), table_name="test_table", production_mode=True
+    )
+    await persister.initialize()
+    saves = [
+        asyncio.ensure_future(
+            persister.save("pk", f"app_id_{i}", 0, "pos", State({"a": i}), "completed")
+        )
+        for i in range(2)
+    ]
+    while persister._writer._queue is None or persister._writer._queue.qsize() < 2:
+        await asyncio.sleep(0)
+    # the caller gave up waiting, but the writer still has the save in its batch
+    saves[0].cancel()
+    await asyncio.wait_for(saves[1], timeout=5)
+    assert (await persister.load("pk", "app_id_1"))["state"]["a"] == 1
+    await persister.cleanup()
+
+
+async def test_async_sqlite_production_mode_writer_that_cannot_configure_fails_saves(tmp_path):
+    connection = await aiosqlite.connect(str(tmp_path / "test.db"))
+    persister = AsyncSQLitePersister(
+        connection=connection, table_name="test_table", production_mode=True
+    )
+    await persister.initialize()
+    configure = persister._writer.configure
+
+    async def fail_to_configure(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    persister._writer.configure = fail_to_configure
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        await asyncio.wait_for(
+            persister.save("pk", "app_id", 0, "pos", State({"a": 1}), "completed"), timeout=5
+        )
+    # the next save starts a new writer task
+    persister._writer.configure = configure
+    await persister.save("pk", "app_id", 0, "pos", State({"a": 1}), "completed")
+    assert (await persister.load("pk", "app_id"))["state"]["a"] == 1
+    await persister.cleanup()
+
+
+from burr.core.persistence import BlobReference, LocalBlobStore, S3BlobStore
+
+
+class _CountingBlobStore(LocalBlobStore):
+    def __init__(self, root_dir: str):
+        super().__init__(root_dir, min_size_bytes=100)
+        self.gets = 0
+
+    def get(self, key: str) -> bytes:
+        self.gets += 1
+        return super().get(key)
+
+
+@pytest.fixture()
+def blob_store(tmp_path):
+    blob_store = _CountingBlobStore(str(tmp_path / "blobs"))
+    yield blob_store
+    blob_store.close()
+
+
+def _blob_persister(tmp_path, blob_store, **kwargs) -> SQLLitePersister:
+    persister = SQLLitePersister(
+        db_path=str(tmp_path / "test.db"), table_name="test_table", blob_store=blob_store, **kwargs
+    )
+    persister.initialize()
+    return persister
+
+
+def test_blob_store_stores_large_fields_once(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store)
+    document = "lorem ipsum " * 100
+    for app_id in ["app_id_1", "app_id_2"]:
+        for sequence_id in range(3):
+            persister.save(
+                "pk",
+                app_id,
+                sequence_id,
+                "pos",
+                State({"document": document, "count": sequence_id}),
+                "completed",
+            )
+    (row,) = persister.connection.execute(
+        "SELECT state FROM test_table WHERE app_id = 'app_id_1' AND sequence_id = 0"
+    ).fetchone()
+    stored = json.loads(row)
+    assert stored["count"] == 0
+    key = stored["document"]["key"]
+    assert blob_store.exists(key)
+    assert blob_store.refcount(key) == 6
+    loaded = persister.load("pk", "app_id_2")
+    assert loaded["state"]["document"] == document
+    assert loaded["state"].get_all() == {"document": document, "count": 2}
+    persister.cleanup()
+
+
+def test_blob_store_loads_fields_lazily(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store)
+    persister.save(
+        "pk", "app_id", 0, "pos", State({"document": ["a" * 50] * 10, "count": 0}), "completed"
+    )
+    state = persister.load("pk", "app_id")["state"]
+    assert state["count"] == 0
+    # saving a state loaded from the same blob store keeps the reference, rather than fetching it
+    persister.save("pk", "app_id", 1, "pos", state.update(count=1), "completed")
+    assert blob_store.gets == 0
+    assert persister.load("pk", "app_id")["state"].append(document="b")["document"][-2:] == [
+        "a" * 50,
+        "b",
+    ]
+    assert blob_store.gets == 1
+    persister.cleanup()
+
+
+def test_blob_store_with_incremental_persistence(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store, checkpoint_every=3)
+    state = State({"document": "x" * 200, "count": 0})
+    for sequence_id in range(5):
+        state = state.update(count=sequence_id)
+        persister.save("pk", "app_id", sequence_id, "pos", state, "completed")
+    loaded = persister.load("pk", "app_id")["state"]
+    assert loaded.get_all() == {"document": "x" * 200, "count": 4}
+    persister.cleanup()
+
+
+def test_blob_store_compact_releases_blobs_for_collect(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store)
+    for sequence_id in range(3):
+        persister.save(
+            "pk",
+            "app_id",
+            sequence_id,
+            "pos",
+            State({"document": str(sequence_id) * 200}),
+            "completed",
+        )
+    keys = [
+        json.loads(row)["document"]["key"]
+        for (row,) in persister.connection.execute(
+            "SELECT state FROM test_table ORDER BY sequence_id"
+        ).fetchall()
+    ]
+    assert persister.compact("pk", "app_id") == 2
+    assert [blob_store.refcount(key) for key in keys] == [0, 0, 1]
+    assert blob_store.collect() == 2
+    assert [blob_store.exists(key) for key in keys] == [False, False, True]
+    assert persister.load("pk", "app_id")["state"]["document"] == "2" * 200
+    persister.cleanup()
+
+
+@pytest.mark.parametrize("production_mode", [False, True])
+def test_blob_store_failed_save_releases_references(tmp_path, blob_store, production_mode):
+    persister = _blob_persister(tmp_path, blob_store, production_mode=production_mode)
+    state = State({"document": "x" * 200})
+    persister.save("pk", "app_id", 0, "pos", state, "completed")
+    (key,) = blob_store.references(
+        json.loads(persister.connection.execute("SELECT state FROM test_table").fetchone()[0])
+    )
+    with pytest.raises(sqlite3.IntegrityError):
+        persister.save("pk", "app_id", 0, "pos", state, "completed")
+    assert blob_store.refcount(key) == 1
+    # a batch fails as a whole, so none of its states keep their references
+    with pytest.raises(sqlite3.IntegrityError):
+        persister.save_many(
+            [
+                {
+                    "partition_key": "pk",
+                    "app_id": "app_id",
+                    "sequence_id": sequence_id,
+                    "position": "pos",
+                    "state": state,
+                    "status": "completed",
+                }
+                for sequence_id in [1, 0]
+            ]
+        )
+    assert blob_store.refcount(key) == 1
+    persister.cleanup()
+
+
+@pytest.mark.parametrize("production_mode", [False, True])
+def test_blob_store_failed_compact_rolls_back_and_releases_references(
+    tmp_path, blob_store, production_mode
+):
+    persister = _blob_persister(tmp_path, blob_store, production_mode=production_mode)
+    for sequence_id in range(3):
+        persister.save(
+            "pk", "app_id", sequence_id, "pos", State({"document": "x" * 200}), "completed"
+        )
+    (key,) = blob_store.references(
+        json.loads(persister.connection.execute("SELECT state FROM test_table").fetchone()[0])
+    )
+    persister.connection.execute(
+        "CREATE TRIGGER no_deletes BEFORE DELETE ON test_table BEGIN SELECT RAISE(ABORT, 'no'); END"
+    )
+    persister.connection.commit()
+    with pytest.raises(sqlite3.IntegrityError):
+        persister.compact("pk", "app_id")
+    assert not persister.connection.in_transaction
+    assert persister.connection.execute("SELECT COUNT(*) FROM test_table").fetchone()[0] == 3
+    assert blob_store.refcount(key) == 3
+    persister.connection.execute("DROP TRIGGER no_deletes")
+    persister.connection.commit()
+    assert persister.compact("pk", "app_id") == 2
+    assert blob_store.refcount(key) == 1
+    persister.cleanup()
+
+
+def test_blob_reference_pickles_as_its_value(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store)
+    persister.save("pk", "app_id", 0, "pos", State({"document": "x" * 200}), "completed")
+    state = persister.load("pk", "app_id")["state"]
+    assert isinstance(state._state["document"], BlobReference)
+    unpickled = pickle.loads(pickle.dumps(state))
+    assert unpickled._state["document"] == "x" * 200
+    assert pickle.loads(pickle.dumps(blob_store)).refcount(
+        state._state["document"].key
+    ) == blob_store.refcount(state._state["document"].key)
+    persister.cleanup()
+
+
+def test_blob_reference_without_blob_store_raises(tmp_path, blob_store):
+    persister = _blob_persister(tmp_path, blob_store)
+    persister.save("pk", "app_id", 0, "pos", State({"document": "x" * 200}), "completed")
+    persister.blob_store = None
+    with pytest.raises(ValueError, match="no blob store"):
+        persister.load("pk", "app_id")
+    persister.cleanup()
+
+
+class _S3Error(Exception):
+    def __init__(self, code: str):
+        self.response = {"Error": {"Code": code}}
+
+
+class _FakeS3Client:
+    """Stand-in for the parts of a boto3 S3 client we use"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        if (Bucket, Key) not in self.objects:
+            raise _S3Error("404")
+        return {}
+
+    def delete_object(self, Bucket: str, Key: str):
+        self.objects.pop((Bucket, Key), None)
+
+
+def test_s3_blob_store(tmp_path):
+    client = _FakeS3Client()
+    blob_store = S3BlobStore(
+        client, "bucket", str(tmp_path / "refcounts.db"), prefix="blobs/", min_size_bytes=100
+    )
+    persister = _blob_persister(tmp_path, blob_store)
+    persister.save("pk", "app_id", 0, "pos", State({"document": "x" * 200}), "completed")
+    ((bucket, key),) = client.objects
+    assert bucket == "bucket" and key.startswith("blobs/")
+    assert persister.load("pk", "app_id")["state"]["document"] == "x" * 200
+    blob_store.release([key[len("blobs/") :]])
+    assert blob_store.collect() == 1
+    assert client.objects == {}
+    persister.cleanup()
+    blob_store.close()
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from burr.core import ApplicationBuilder, State, action, default
+from burr.core.persistence import InMemoryPersister
+from burr.core.pool import ApplicationPool
+
+
+@action(reads=["count"], writes=["count"])
+async def increment(state: State) -> State:
+    await asyncio.sleep(0)
+    return state.update(count=state["count"] + 1)
+
+
+class _SlowLoadingPersister(InMemoryPersister):
+    """Records the threads it loads on, and the most loads it ran at once"""
+
+    def __init__(self):
+        super().__init__()
+        self.load_threads = []
+        self.loading = 0
+        self.peak_loading = 0
+        self.lock = threading.Lock()
+
+    def load(self, *args, **kwargs):
+        with self.lock:
+            self.load_threads.append(threading.get_ident())
+            self.loading += 1
+            self.peak_loading = max(self.peak_loading, self.loading)
+        time.sleep(0.02)
+        with self.lock:
+            self.loading -= 1
+        return super().load(*args, **kwargs)
+
+
+def _builder_factory(persister: InMemoryPersister, builds: list):
+    def builder_factory() -> ApplicationBuilder:
+        builds.append(1)
+        return (
+            ApplicationBuilder()
+            .with_actions(increment=increment)
+            .with_transitions(("increment", "increment", default))
+            .initialize_from(
+                persister,
+                resume_at_next_action=True,
+                default_state={"count": 0},
+                default_entrypoint="increment",
+            )
+            .with_state_persister(persister)
+        )
+
+    return builder_factory
+
+
+async def test_pool_keeps_applications():
+    builds = []
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), builds))
+    for _ in range(3):
+        _, _, state = await pool.astep("app", partition_key="user")
+    assert state["count"] == 3
+    assert len(builds) == 1
+    assert ("user", "app") in pool
+    stats = pool.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+async def test_pool_evicts_least_recently_used_and_reloads():
+    builds = []
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), builds), max_size=2)
+    await pool.astep("a")
+    await pool.astep("b")
+    await pool.astep("a")
+    await pool.astep("c")
+    assert len(pool) == 2
+    assert (None, "b") not in pool
+    assert pool.stats().evictions == 1
+    # reloaded from the persister
+    _, _, state = await pool.astep("b")
+    assert state["count"] == 2
+    assert len(builds) == 4
+
+
+async def test_pool_serializes_access_per_application():
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), []), max_concurrent_steps=2)
+    await asyncio.gather(*[pool.astep(f"app_{i % 3}") for i in range(30)])
+    for i in range(3):
+        async with pool.acquire(f"app_{i}") as app:
+            assert app.state["count"] == 10
+            assert app.sequence_id == 9
+
+
+async def test_pool_does_not_evict_applications_in_use():
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), []), max_size=1)
+    async with pool.acquire("a") as app:
+        await pool.astep("b")
+        assert (None, "a") in pool
+        await app.astep()
+    assert len(pool) == 1
+
+
+async def test_pool_drops_entry_when_build_fails():
+    def builder_factory() -> ApplicationBuilder:
+        return ApplicationBuilder().with_actions(increment=increment)
+
+    pool = ApplicationPool(builder_factory)
+    with pytest.raises(ValueError):
+        await pool.astep("app")
+    assert len(pool) == 0
+
+
+async def test_pool_evict():
+    builds = []
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), builds))
+    await pool.astep("app")
+    assert pool.evict("app")
+    assert not pool.evict("app")
+    _, _, state = await pool.astep("app")
+    assert state["count"] == 2
+    assert len(builds) == 2
+
+
+async def test_pool_evict_while_in_use_rebuilds_after_it():
+    builds = []
+    persister = InMemoryPersister()
+    pool = ApplicationPool(_builder_factory(persister, builds))
+    async with pool.acquire("app") as app:
+        assert pool.evict("app")
+        assert (None, "app") not in pool
+        # queues behind the step in flight, rather than running a second copy of the application
+        next_step = asyncio.create_task(pool.astep("app"))
+        await asyncio.sleep(0)
+        await app.astep()
+        assert not next_step.done()
+    _, _, state = await next_step
+    assert state["count"] == 2
+    assert len(builds) == 2
+    # each sequence ID was saved once
+    assert [saved["sequence_id"] for saved in persister._storage[None]["app"]] == [0, 1]
+
+
+async def test_pool_evict_in_use_drops_entry_on_release():
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), []))
+    async with pool.acquire("app"):
+        assert pool.evict("app")
+        assert not pool.evict("app")
+        assert len(pool) == 1
+    assert len(pool) == 0
+    assert pool.stats().evictions == 1
+
+
+def test_pool_creates_semaphore_in_running_loop():
+    pool = ApplicationPool(_builder_factory(InMemoryPersister(), []), max_concurrent_steps=1)
+    for _ in range(2):
+        # a new event loop each time
+        _, _, state = asyncio.run(pool.astep("app"))
+    assert state["count"] == 2
+
+
+async def test_pool_builds_sync_applications_off_the_event_loop():
+    persister = _SlowLoadingPersister()
+    pool = ApplicationPool(_builder_factory(persister, []))
+    await asyncio.gather(*[pool.astep(f"app_{i}") for i in range(3)])
+    assert len(persister.load_threads) == 3
+    assert threading.get_ident() not in persister.load_threads
+    assert persister.peak_loading > 1
+
+
+async def test_pool_bounds_concurrent_builds():
+    persister = _SlowLoadingPersister()
+    pool = ApplicationPool(_builder_factory(persister, []), max_concurrent_steps=2)
+    await asyncio.gather(*[pool.astep(f"app_{i}") for i in range(6)])
+    assert len(persister.load_threads) == 6
+    assert persister.peak_loading == 2
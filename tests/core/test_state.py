@@ -1,9 +1,10 @@
+import pickle
 from typing import Any
 
 import pytest
 
 from burr.core import Action, Graph
-from burr.core.state import State, register_field_serde
+from burr.core.state import LazyValue, State, register_field_serde
 from burr.core.typing import TypingSystem
 
 
@@ -209,3 +210,130 @@ def test_state_apply_keeps_typing_system():
     state = State({"foo": "bar"}, typing_system=SimpleTypingSystem())
     assert state.update(foo="baz").typing_system is state.typing_system
     assert state.subset("foo").typing_system is state.typing_system
+
+
+def test_state_append_does_not_modify_prior_state():
+    state = State({"foo": ["bar"]})
+    appended = state.append(foo="baz")
+    assert state["foo"] == ["bar"]
+    assert appended["foo"] == ["bar", "baz"]
+
+
+def test_state_extend_does_not_modify_prior_state():
+    state = State({"foo": ["bar"]})
+    extended = state.extend(foo=["baz"])
+    assert state["foo"] == ["bar"]
+    assert extended["foo"] == ["bar", "baz"]
+
+
+def test_state_operations_share_untouched_values():
+    messages = [{"role": "user", "content": "hello"}]
+    document = {"text": "some large document"}
+    state = State({"messages": messages, "document": document, "count": 0})
+    new_state = state.append(messages={"role": "assistant", "content": "hi"}).increment(count=1)
+    # untouched values are shared, not copied
+    assert new_state["document"] is document
+    # mutated lists are copied shallowly -- the items themselves are shared
+    assert new_state["messages"] is not messages
+    assert new_state["messages"][0] is messages[0]
+    # updating a value does not copy the prior value
+    updated = state.update(document={"text": "other"})
+    assert state["document"] is document
+    assert updated["messages"] is messages
+
+
+def test_state_journal_records_operations():
+    state = State({"foo": [1], "count": 0})
+    new_state = state.append(foo=2).increment(count=1).wipe(delete=["count"])
+    assert state.journal == ()
+    assert [delta.name() for delta in new_state.journal] == ["append", "increment", "delete"]
+    assert new_state.commit().journal == ()
+    assert new_state.commit().get_all() == new_state.get_all()
+
+
+def test_state_journal_is_shared_between_derived_states():
+    base = State({"count": 0})
+    state = base
+    for i in range(10_000):
+        state = state.update(count=i)
+    branch = state.increment(count=1)
+    # derived states share the journal they have in common, rather than copying it
+    assert branch._journal.parent is state._journal
+    assert len(branch.journal) == 10_001
+    assert [delta.name() for delta in branch._deltas_since(state)] == ["increment"]
+    assert branch._deltas_since(base) == branch.journal
+    assert state._deltas_since(branch) is None
+    assert state.update(count=0)._deltas_since(branch) is None
+    # long journals pickle without recursing through every entry
+    unpickled = pickle.loads(pickle.dumps(branch))
+    assert [delta.name() for delta in unpickled.journal] == ["set"] * 10_000 + ["increment"]
+
+
+def test_state_serialize_journal_round_trip():
+    base = State({"foo": [1], "count": 0, "to_delete": "x"}).commit()
+    new_state = (
+        base.append(foo=2)
+        .extend(foo=[3, 4])
+        .increment(count=5)
+        .update(bar={"a": "b"})
+        .wipe(delete=["to_delete"])
+    )
+    serialized = new_state.serialize_journal()
+    assert serialized == [
+        {"name": "append", "operation": {"values": {"foo": 2}}},
+        {"name": "extend", "operation": {"values": {"foo": [3, 4]}}},
+        {"name": "increment", "operation": {"values": {"count": 5}}},
+        {"name": "set", "operation": {"values": {"bar": {"a": "b"}}}},
+        {"name": "delete", "operation": {"keys": ["to_delete"]}},
+    ]
+    assert base.apply_serialized_journal(serialized).get_all() == new_state.get_all()
+
+
+def test_state_serialize_journal_field_level_serde_falls_back_to_final_value():
+    def my_list_serializer(value: list, **kwargs) -> dict:
+        return {"items": [f"serialized_{item}" for item in value]}
+
+    def my_list_deserializer(value: dict, **kwargs) -> list:
+        return [item.replace("serialized_", "") for item in value["items"]]
+
+    register_field_serde("my_list_field", my_list_serializer, my_list_deserializer)
+    base = State({"my_list_field": ["a"], "other": []}).commit()
+    new_state = base.append(my_list_field="b", other=1).append(my_list_field="c")
+    serialized = new_state.serialize_journal()
+    assert serialized == [
+        {"name": "append", "operation": {"values": {"other": 1}}},
+        {
+            "name": "set",
+            "operation": {
+                "values": {
+                    "my_list_field": {"items": ["serialized_a", "serialized_b", "serialized_c"]}
+                }
+            },
+        },
+    ]
+    assert base.apply_serialized_journal(serialized).get_all() == new_state.get_all()
+
+
+class _CountingLazyValue(LazyValue):
+    def __init__(self, value: Any):
+        self.value = value
+        self.resolved = 0
+
+    def resolve(self) -> Any:
+        self.resolved += 1
+        return self.value
+
+
+def test_state_resolves_lazy_values_on_access():
+    lazy = _CountingLazyValue([1, 2])
+    state = State.deserialize({"items": lazy, "count": 0})
+    assert state.update(count=1)["count"] == 1
+    assert lazy.resolved == 0
+    assert state["items"] == [1, 2]
+    assert state.get("items") == [1, 2]
+    assert state.get_all() == {"items": [1, 2], "count": 0}
+    assert state.subset("items")["items"] == [1, 2]
+    appended = state.append(items=3)
+    assert appended["items"] == [1, 2, 3]
+    assert state["items"] == [1, 2]
+    assert state.serialize() == {"items": [1, 2], "count": 0}
@@ -4,6 +4,7 @@ import pickle
 import pytest
 
 from burr.core import state
+from burr.core.persistence import LocalBlobStore
 from burr.integrations.persisters.b_mongodb import MongoDBPersister
 from burr.integrations.persisters.b_pymongo import MongoDBBasePersister
 
@@ -84,3 +85,97 @@ def test_partition_key_is_optional(mongodb_persister):
     loaded_data2 = mongodb_persister.load(None, "app_id_none2", 2)
     assert loaded_data2 is not None
     assert loaded_data2["state"].get_all() == {"hello": "world"}
+
+
+def test_creates_unique_index(mongodb_persister):
+    mongodb_persister.initialize()
+    index_keys = [
+        list(index["key"].items()) for index in mongodb_persister.collection.list_indexes()
+    ]
+    assert [("partition_key", 1), ("app_id", 1), ("sequence_id", -1)] in index_keys
+
+
+def test_save_duplicate_raises(mongodb_persister):
+    mongodb_persister.save("pk", "app_id_dupe", 1, "pos", state.State({"a": 1}), "completed")
+    with pytest.raises(ValueError, match="already exists"):
+        mongodb_persister.save("pk", "app_id_dupe", 1, "pos", state.State({"a": 2}), "completed")
+    assert mongodb_persister.load("pk", "app_id_dupe")["state"].get_all() == {"a": 1}
+
+
+def test_state_is_stored_as_document(mongodb_persister):
+    mongodb_persister.save("pk", "app_id_bson", 1, "pos", state.State({"a": [1, 2]}), "completed")
+    document = mongodb_persister.collection.find_one({"app_id": "app_id_bson"})
+    assert document["state"]["a"] == [1, 2]
+
+
+def test_load_legacy_json_state(mongodb_persister):
+    mongodb_persister.collection.insert_one(
+        {
+            "partition_key": "pk",
+            "app_id": "app_id_legacy",
+            "sequence_id": 1,
+            "position": "pos",
+            "state": '{"a": 1}',
+            "status": "completed",
+            "created_at": "2024-01-01T00:00:00+00:00",
+        }
+    )
+    assert mongodb_persister.load("pk", "app_id_legacy")["state"].get_all() == {"a": 1}
+
+
+def test_save_state_that_is_not_valid_bson(mongodb_persister):
+    mongodb_persister.save(
+        "pk", "app_id_bigint", 1, "pos", state.State({"a": 2**70}), "completed"
+    )
+    assert mongodb_persister.load("pk", "app_id_bigint")["state"].get_all() == {"a": 2**70}
+
+
+def _to_persist(app_id: str, sequence_ids: range, value=None) -> list:
+    return [
+        {
+            "partition_key": "pk",
+            "app_id": app_id,
+            "sequence_id": i,
+            "position": "pos",
+            "state": state.State({"a": i if value is None else value}),
+            "status": "completed",
+        }
+        for i in sequence_ids
+    ]
+
+
+def test_save_many(mongodb_persister):
+    mongodb_persister.save_many(_to_persist("app_id_many", range(5)))
+    data = mongodb_persister.load("pk", "app_id_many")
+    assert data["sequence_id"] == 4
+    assert data["state"].get_all() == {"a": 4}
+
+
+def test_save_many_duplicate_raises(mongodb_persister):
+    mongodb_persister.save("pk", "app_id_many_dupe", 2, "pos", state.State({"a": 2}), "completed")
+    with pytest.raises(ValueError, match="already exists"):
+        mongodb_persister.save_many(_to_persist("app_id_many_dupe", range(5)))
+    # ordered, so the ones before the duplicate are written
+    assert mongodb_persister.load("pk", "app_id_many_dupe", 1)["state"].get_all() == {"a": 1}
+    assert mongodb_persister.load("pk", "app_id_many_dupe", 3) is None
+
+
+def test_save_many_state_that_is_not_valid_bson(mongodb_persister):
+    mongodb_persister.save_many(_to_persist("app_id_many_bigint", range(3), value=2**70))
+    data = mongodb_persister.load("pk", "app_id_many_bigint")
+    assert data["sequence_id"] == 2
+    assert data["state"].get_all() == {"a": 2**70}
+
+
+def test_save_many_with_blob_store(mongodb_persister, tmp_path):
+    blob_store = LocalBlobStore(str(tmp_path / "blobs"), min_size_bytes=100)
+    mongodb_persister.blob_store = blob_store
+    mongodb_persister.save("pk", "app_id_blobs", 2, "pos", state.State({"a": 2}), "completed")
+    with pytest.raises(ValueError, match="already exists"):
+        mongodb_persister.save_many(_to_persist("app_id_blobs", range(5), value="x" * 200))
+    stored = mongodb_persister.collection.find_one({"app_id": "app_id_blobs", "sequence_id": 1})
+    key = stored["state"]["a"]["key"]
+    # states 0 and 1 were written, the ones from the duplicate on released their references
+    assert blob_store.refcount(key) == 2
+    assert mongodb_persister.load("pk", "app_id_blobs", 1)["state"]["a"] == "x" * 200
+    blob_store.close()
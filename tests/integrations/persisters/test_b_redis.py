@@ -1,9 +1,12 @@
+import json
 import os
 import pickle
+import uuid
 
 import pytest
 
 from burr.core import state
+from burr.core.persistence import LocalBlobStore
 from burr.integrations.persisters.b_redis import (
     AsyncRedisBasePersister,
     RedisBasePersister,
@@ -155,3 +158,143 @@ async def test_async_list_app_ids_with_ns(async_redis_persister_with_ns):
 async def test_async_load_nonexistent_key_with_ns(async_redis_persister_with_ns):
     state_data = await async_redis_persister_with_ns.load("pk", "nonexistent_key")
     assert state_data is None
+
+
+def test_save_existing_raises(redis_persister_with_ns):
+    redis_persister_with_ns.save("pk", "app_id_dupe", 1, "pos", state.State({"a": 1}), "completed")
+    with pytest.raises(ValueError, match="already exists"):
+        redis_persister_with_ns.save(
+            "pk", "app_id_dupe", 1, "pos", state.State({"a": 2}), "completed"
+        )
+    data = redis_persister_with_ns.load("pk", "app_id_dupe")
+    assert data["sequence_id"] == 1
+    assert data["state"].get_all() == {"a": 1}
+
+
+def test_load_latest(redis_persister_with_ns):
+    for sequence_id in range(3):
+        redis_persister_with_ns.save(
+            "pk",
+            "app_id_latest",
+            sequence_id,
+            f"pos{sequence_id}",
+            state.State({"a": sequence_id}),
+            "completed",
+        )
+    data = redis_persister_with_ns.load("pk", "app_id_latest")
+    assert data["sequence_id"] == 2
+    assert data["position"] == "pos2"
+    assert data["state"].get_all() == {"a": 2}
+
+
+@pytest.mark.parametrize(
+    "state_encoding,compression", [("msgpack", None), ("json", "zstd"), ("msgpack", "zstd")]
+)
+def test_save_and_load_state_encodings(state_encoding, compression):
+    persister = RedisBasePersister.from_values(
+        host="localhost",
+        port=6379,
+        db=0,
+        namespace=f"test_{state_encoding}_{compression}",
+        state_encoding=state_encoding,
+        compression=compression,
+    )
+    persister.save("pk", "app_id", 1, "pos", state.State({"a": [1, 2], "b": "c"}), "completed")
+    assert persister.load("pk", "app_id")["state"].get_all() == {"a": [1, 2], "b": "c"}
+    # other persisters read it regardless of how they encode
+    json_persister = RedisBasePersister(
+        persister.connection, namespace=f"test_{state_encoding}_{compression}"
+    )
+    assert json_persister.load("pk", "app_id", 1)["state"].get_all() == {"a": [1, 2], "b": "c"}
+    persister.cleanup()
+
+
+def test_load_state_saved_without_encoding(redis_persister_with_ns):
+    """States saved before we recorded the encoding are JSON."""
+    redis_persister_with_ns.connection.hset(
+        redis_persister_with_ns.create_key("app_id_legacy", "pk", 1),
+        mapping={
+            "partition_key": "pk",
+            "app_id": "app_id_legacy",
+            "sequence_id": 1,
+            "position": "pos",
+            "state": json.dumps({"a": 1}),
+            "status": "completed",
+            "created_at": "2024-01-01T00:00:00+00:00",
+        },
+    )
+    redis_persister_with_ns.connection.zadd("test:pk", {"app_id_legacy": 1})
+    data = redis_persister_with_ns.load("pk", "app_id_legacy")
+    assert data["state"].get_all() == {"a": 1}
+
+
+async def test_async_save_existing_raises(async_redis_persister_with_ns):
+    await async_redis_persister_with_ns.save(
+        "pk", "app_id_dupe", 1, "pos", state.State({"a": 1}), "completed"
+    )
+    with pytest.raises(ValueError, match="already exists"):
+        await async_redis_persister_with_ns.save(
+            "pk", "app_id_dupe", 1, "pos", state.State({"a": 2}), "completed"
+        )
+    data = await async_redis_persister_with_ns.load("pk", "app_id_dupe")
+    assert data["state"].get_all() == {"a": 1}
+
+
+async def test_async_save_and_load_latest_msgpack_zstd():
+    persister = AsyncRedisBasePersister.from_values(
+        host="localhost",
+        port=6379,
+        db=1,
+        namespace="test_async_msgpack_zstd",
+        state_encoding="msgpack",
+        compression="zstd",
+    )
+    for sequence_id in range(3):
+        await persister.save(
+            "pk", "app_id", sequence_id, "pos", state.State({"a": sequence_id}), "completed"
+        )
+    data = await persister.load("pk", "app_id")
+    assert data["sequence_id"] == 2
+    assert data["state"].get_all() == {"a": 2}
+    await persister.cleanup()
+
+
+def test_save_and_load_with_blob_store(tmp_path):
+    blob_store = LocalBlobStore(str(tmp_path / "blobs"), min_size_bytes=100)
+    persister = RedisBasePersister.from_values(
+        host="localhost",
+        port=6379,
+        db=0,
+        namespace=f"test_blobs_{uuid.uuid4()}",
+        blob_store=blob_store,
+    )
+    document = "x" * 200
+    persister.save("pk", "app_id", 1, "pos", state.State({"a": document, "b": 1}), "completed")
+    with pytest.raises(ValueError, match="already exists"):
+        persister.save("pk", "app_id", 1, "pos", state.State({"a": document, "b": 2}), "completed")
+    stored = json.loads(persister.connection.hget(persister.create_key("app_id", "pk", 1), "state"))
+    assert stored["b"] == 1
+    # the failed save released its reference
+    assert blob_store.refcount(stored["a"]["key"]) == 1
+    assert persister.load("pk", "app_id")["state"].get_all() == {"a": document, "b": 1}
+    persister.cleanup()
+    blob_store.close()
+
+
+async def test_async_save_and_load_with_blob_store(tmp_path):
+    blob_store = LocalBlobStore(str(tmp_path / "blobs"), min_size_bytes=100)
+    persister = AsyncRedisBasePersister.from_values(
+        host="localhost",
+        port=6379,
+        db=0,
+        namespace=f"test_blobs_{uuid.uuid4()}",
+        blob_store=blob_store,
+    )
+    document = ["x" * 50] * 10
+    for sequence_id in range(2):
+        await persister.save(
+            "pk", "app_id", sequence_id, "pos", state.State({"a": document}), "completed"
+        )
+    assert (await persister.load("pk", "app_id"))["state"]["a"] == document
+    await persister.cleanup()
+    blob_store.close()
@@ -1,9 +1,15 @@
+import asyncio
+import concurrent.futures
 import os
 import pickle
+import uuid
 
+import asyncpg
+import psycopg2
 import pytest
 
 from burr.core import state
+from burr.core.persistence import LocalBlobStore
 from burr.integrations.persisters.b_asyncpg import AsyncPostgreSQLPersister
 from burr.integrations.persisters.b_psycopg2 import PostgreSQLPersister
 
@@ -144,3 +150,219 @@ async def test_async_list_app_ids(asyncpostgresql_persister):
 async def test_async_load_nonexistent_key(asyncpostgresql_persister):
     state_data = await asyncpostgresql_persister.load("pk", "nonexistent_key")
     assert state_data is None
+
+
+@pytest.fixture
+def postgresql_pool_persister():
+    persister = PostgreSQLPersister.from_values(
+        db_name="postgres",
+        user="postgres",
+        password="postgres",
+        host="localhost",
+        port=5432,
+        table_name="testtable_pool",
+        pool_size=4,
+    )
+    persister.initialize()
+    yield persister
+    persister.cleanup()
+
+
+def test_pool_save_and_load_state_concurrently(postgresql_pool_persister):
+    def save_and_load(i: int):
+        postgresql_pool_persister.save(
+            "pk", f"app_id_{i}", 1, "pos", state.State({"a": i}), "completed"
+        )
+        return postgresql_pool_persister.load("pk", f"app_id_{i}")["state"]["a"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(save_and_load, range(20))) == list(range(20))
+
+
+def test_save_reuses_prepared_statements(postgresql_persister):
+    for sequence_id in range(3):
+        postgresql_persister.save(
+            "pk", "app_id_prepared", sequence_id, "pos", state.State({"a": 1}), "completed"
+        )
+    (prepared,) = postgresql_persister._prepared.values()
+    assert len([name for name in prepared if name.startswith("burr_save_")]) == 1
+    assert postgresql_persister.load("pk", "app_id_prepared")["sequence_id"] == 2
+
+
+def test_save_failure_rolls_back(postgresql_pool_persister):
+    postgresql_pool_persister.save(
+        "pk", "app_id_dupe", 1, "pos", state.State({"a": 1}), "completed"
+    )
+    with pytest.raises(psycopg2.IntegrityError):
+        postgresql_pool_persister.save(
+            "pk", "app_id_dupe", 1, "pos", state.State({"a": 2}), "completed"
+        )
+    assert postgresql_pool_persister.load("pk", "app_id_dupe")["state"]["a"] == 1
+
+
+def test_save_many(postgresql_pool_persister):
+    postgresql_pool_persister.save_many(
+        [
+            {
+                "partition_key": "pk",
+                "app_id": "app_id_many",
+                "sequence_id": i,
+                "position": "pos",
+                "state": state.State({"a": i}),
+                "status": "completed",
+            }
+            for i in range(5)
+        ]
+    )
+    data = postgresql_pool_persister.load("pk", "app_id_many")
+    assert data["sequence_id"] == 4
+    assert data["state"].get_all() == {"a": 4}
+
+
+def test_serialization_with_pickle_pool(postgresql_pool_persister):
+    postgresql_pool_persister.save(
+        "pk", "app_id_serde_pool", 1, "pos", state.State({"a": 1}), "completed"
+    )
+    deserialized_persister = pickle.loads(pickle.dumps(postgresql_pool_persister))
+    data = deserialized_persister.load("pk", "app_id_serde_pool", 1)
+    assert data["state"].get_all() == {"a": 1}
+
+
+@pytest.fixture
+async def asyncpostgresql_pool_persister():
+    persister = await AsyncPostgreSQLPersister.from_values(
+        db_name="postgres",
+        user="postgres",
+        password="postgres",
+        host="localhost",
+        port=5432,
+        table_name="testtable_async_pool",
+        pool_size=4,
+    )
+    await persister.initialize()
+    yield persister
+    await persister.cleanup()
+
+
+async def test_async_pool_save_and_load_state_concurrently(asyncpostgresql_pool_persister):
+    async def save_and_load(i: int):
+        await asyncpostgresql_pool_persister.save(
+            "pk", f"app_id_{i}", 1, "pos", state.State({"a": i}), "completed"
+        )
+        return (await asyncpostgresql_pool_persister.load("pk", f"app_id_{i}"))["state"]["a"]
+
+    assert await asyncio.gather(*[save_and_load(i) for i in range(20)]) == list(range(20))
+
+
+async def test_async_save_many(asyncpostgresql_pool_persister):
+    await asyncpostgresql_pool_persister.save_many(
+        [
+            {
+                "partition_key": "pk",
+                "app_id": "app_id_many",
+                "sequence_id": i,
+                "position": "pos",
+                "state": state.State({"a": i}),
+                "status": "completed",
+            }
+            for i in range(5)
+        ]
+    )
+    data = await asyncpostgresql_pool_persister.load("pk", "app_id_many")
+    assert data["sequence_id"] == 4
+    assert data["state"].get_all() == {"a": 4}
+
+
+async def test_async_without_jsonb_codec(asyncpostgresql_persister):
+    # a connection without the codec registered, E.G. one passed in by the user
+    connection = await asyncpg.connect(
+        user="postgres", password="postgres", database="postgres", host="localhost", port=5432
+    )
+    async with AsyncPostgreSQLPersister(connection, table_name="testtable_async") as persister:
+        await persister.save("pk", "app_id_no_codec", 1, "pos", state.State({"a": 1}), "completed")
+        data = await persister.load("pk", "app_id_no_codec")
+    assert data["state"].get_all() == {"a": 1}
+    # and it reads the same data with the codec registered
+    data = await asyncpostgresql_persister.load("pk", "app_id_no_codec")
+    assert data["state"].get_all() == {"a": 1}
+
+
+async def test_async_save_many_with_blob_store(tmp_path):
+    blob_store = LocalBlobStore(str(tmp_path / "blobs"), min_size_bytes=100)
+    persister = await AsyncPostgreSQLPersister.from_values(
+        db_name="postgres",
+        user="postgres",
+        password="postgres",
+        host="localhost",
+        port=5432,
+        table_name="testtable_async_blobs",
+        pool_size=2,
+        blob_store=blob_store,
+    )
+    await persister.initialize()
+    document = {"text": "x" * 200}
+    await persister.save_many(
+        [
+            {
+                "partition_key": "pk",
+                "app_id": f"app_id_{uuid.uuid4()}",
+                "sequence_id": 0,
+                "position": "pos",
+                "state": state.State({"document": document, "a": i}),
+                "status": "completed",
+            }
+            for i in range(3)
+        ]
+    )
+    async with persister._acquire() as connection:
+        stored = await connection.fetchval(
+            "SELECT state FROM testtable_async_blobs ORDER BY created_at DESC LIMIT 1"
+        )
+    assert set(stored["document"]) == {"__burr_serde__", "key", "size"}
+    assert blob_store.refcount(stored["document"]["key"]) >= 3
+    data = await persister.load("pk", None)
+    assert data["state"]["document"] == document
+    await persister.cleanup()
+    blob_store.close()
+
+
+async def test_async_failed_save_releases_blob_references(tmp_path):
+    blob_store = LocalBlobStore(str(tmp_path / "blobs"), min_size_bytes=100)
+    persister = await AsyncPostgreSQLPersister.from_values(
+        db_name="postgres",
+        user="postgres",
+        password="postgres",
+        host="localhost",
+        port=5432,
+        table_name="testtable_async_blobs",
+        blob_store=blob_store,
+    )
+    await persister.initialize()
+    app_id = f"app_id_{uuid.uuid4()}"
+    document_state = state.State({"document": {"text": str(uuid.uuid4()) * 10}})
+    await persister.save("pk", app_id, 0, "pos", document_state, "completed")
+    async with persister._acquire() as connection:
+        stored = await connection.fetchval(
+            "SELECT state FROM testtable_async_blobs WHERE app_id = $1", app_id
+        )
+    key = stored["document"]["key"]
+    with pytest.raises(asyncpg.UniqueViolationError):
+        await persister.save("pk", app_id, 0, "pos", document_state, "completed")
+    assert blob_store.refcount(key) == 1
+    with pytest.raises(asyncpg.UniqueViolationError):
+        await persister.save_many(
+            [
+                {
+                    "partition_key": "pk",
+                    "app_id": app_id,
+                    "sequence_id": sequence_id,
+                    "position": "pos",
+                    "state": document_state,
+                    "status": "completed",
+                }
+                for sequence_id in [1, 0]
+            ]
+        )
+    assert blob_store.refcount(key) == 1
+    await persister.cleanup()
+    blob_store.close()
@@ -0,0 +1,194 @@
+import os
+import shutil
+import time
+import uuid
+
+import pytest
+
+from burr.core import ApplicationBuilder, Result, State, action, default, expr
+from burr.tracking import LocalTrackingClient
+from burr.tracking.common import log_index
+from burr.tracking.server.backend import LocalBackend
+
+PROJECT = "test_local_backend"
+
+
+@action(reads=["counter"], writes=["counter"])
+def counter(state: State) -> State:
+    return state.update(counter=state["counter"] + 1)
+
+
+def _tracked_app(storage_dir: str, num_steps: int, app_id: str = None, **identifiers) -> str:
+    """Runs an app that takes ``num_steps`` steps (sequence IDs 0 to num_steps - 1), tracked locally"""
+    app_id = app_id or str(uuid.uuid4())
+    app = (
+        ApplicationBuilder()
+        .with_state(counter=0)
+        .with_actions(counter=counter, result=Result("counter"))
+        .with_transitions(
+            ("counter", "counter", expr(f"counter < {num_steps - 1}")),
+            ("counter", "result", default),
+        )
+        .with_entrypoint("counter")
+        .with_tracker(tracker=LocalTrackingClient(project=PROJECT, storage_dir=storage_dir))
+        .with_identifiers(app_id=app_id, **identifiers)
+        .build()
+    )
+    app.run(halt_after=["result"])
+    return app_id
+
+
+def _log_path(storage_dir: str, app_id: str, filename: str) -> str:
+    return os.path.join(storage_dir, PROJECT, app_id, filename)
+
+
+@pytest.fixture(params=["indexed", "legacy"])
+def tracked_app(tmp_path, request):
+    app_id = _tracked_app(str(tmp_path), 10)
+    if request.param == "legacy":
+        # written before the tracking client wrote an index
+        os.remove(_log_path(str(tmp_path), app_id, LocalTrackingClient.LOG_INDEX_FILENAME))
+    return LocalBackend(str(tmp_path)), app_id
+
+
+async def test_get_application_steps_follows_cursor_to_end(tracked_app):
+    backend, app_id = tracked_app
+    sequence_ids, cursor, pages = [], 0, 0
+    while cursor is not None:
+        page = await backend.get_application_steps(
+            None, PROJECT, app_id, None, min_sequence_id=cursor, limit=3
+        )
+        assert len(page.steps) <= 3
+        sequence_ids.extend(step.sequence_id for step in page.steps)
+        cursor = page.next_sequence_id
+        pages += 1
+    assert sequence_ids == list(range(10))
+    assert pages == 4
+
+
+async def test_get_application_steps_max_sequence_id(tracked_app):
+    backend, app_id = tracked_app
+    page = await backend.get_application_steps(
+        None, PROJECT, app_id, None, min_sequence_id=2, max_sequence_id=5, limit=10
+    )
+    assert [step.sequence_id for step in page.steps] == [2, 3, 4, 5]
+    assert page.next_sequence_id is None
+    page = await backend.get_application_steps(
+        None, PROJECT, app_id, None, min_sequence_id=2, max_sequence_id=5, limit=3
+    )
+    assert [step.sequence_id for step in page.steps] == [2, 3, 4]
+    assert page.next_sequence_id == 5
+
+
+async def test_get_application_steps_without_payloads(tracked_app):
+    backend, app_id = tracked_app
+    page = await backend.get_application_steps(None, PROJECT, app_id, None, limit=10)
+    assert page.steps[-1].step_end_log.state["counter"] == 9
+    page = await backend.get_application_steps(
+        None, PROJECT, app_id, None, limit=10, include_payloads=False
+    )
+    assert [step.sequence_id for step in page.steps] == list(range(10))
+    assert all(step.step_end_log.state == {} for step in page.steps)
+    assert all(step.step_end_log.result is None for step in page.steps)
+
+
+def test_get_step_byte_range_uses_index(tmp_path):
+    app_id = _tracked_app(str(tmp_path), 10)
+    log_file = _log_path(str(tmp_path), app_id, LocalTrackingClient.LOG_FILENAME)
+    records = log_index.read_index(
+        _log_path(str(tmp_path), app_id, LocalTrackingClient.LOG_INDEX_FILENAME)
+    )
+    assert LocalBackend._get_step_byte_range(log_file, 4, 3) == (records[4][1], records[7][1])
+    # the last steps run to the end of the file
+    assert LocalBackend._get_step_byte_range(log_file, 8, 3) == (records[8][1], -1)
+    os.remove(_log_path(str(tmp_path), app_id, LocalTrackingClient.LOG_INDEX_FILENAME))
+    assert LocalBackend._get_step_byte_range(log_file, 4, 3) == (0, -1)
+
+
+def _settle(path: str, seconds_ago: float = 100):
+    """Backdates a file/directory's mtime, as if it was last written a while ago"""
+    written = time.time() - seconds_ago
+    os.utime(path, (written, written))
+
+
+async def _list_app_ids(backend: LocalBackend, partition_key: str = None, **kwargs) -> list:
+    apps, _ = await backend.list_apps(None, PROJECT, partition_key, **kwargs)
+    return [app.app_id for app in apps]
+
+
+async def test_list_apps_adds_and_removes_apps_incrementally(tmp_path):
+    storage_dir = str(tmp_path)
+    app_ids = [_tracked_app(storage_dir, 2) for _ in range(2)]
+    backend = LocalBackend(storage_dir)
+    assert set(await _list_app_ids(backend)) == set(app_ids)
+    app_ids.append(_tracked_app(storage_dir, 2))
+    assert set(await _list_app_ids(backend)) == set(app_ids)
+    shutil.rmtree(os.path.join(storage_dir, PROJECT, app_ids.pop(0)))
+    assert set(await _list_app_ids(backend)) == set(app_ids)
+    # a new backend (E.G. after a restart) reads the same index
+    assert set(await _list_app_ids(LocalBackend(storage_dir))) == set(app_ids)
+
+
+async def test_list_apps_filters_by_partition_key(tmp_path):
+    storage_dir = str(tmp_path)
+    app_ids_a = {_tracked_app(storage_dir, 2, partition_key="a") for _ in range(2)}
+    app_id_b = _tracked_app(storage_dir, 2, partition_key="b")
+    backend = LocalBackend(storage_dir)
+    assert set(await _list_app_ids(backend, "a")) == app_ids_a
+    assert await _list_app_ids(backend, "b") == [app_id_b]
+    assert len(await _list_app_ids(backend)) == 3
+
+
+async def test_list_apps_orders_by_latest_write(tmp_path):
+    storage_dir = str(tmp_path)
+    first = _tracked_app(storage_dir, 2)
+    second = _tracked_app(storage_dir, 2)
+    for app_id, seconds_ago in [(first, 200), (second, 100)]:
+        _settle(_log_path(storage_dir, app_id, LocalTrackingClient.LOG_FILENAME), seconds_ago)
+        _settle(os.path.join(storage_dir, PROJECT, app_id), seconds_ago)
+    # so the index records it is up to date with the project's directory
+    _settle(os.path.join(storage_dir, PROJECT))
+    backend = LocalBackend(storage_dir)
+    assert await _list_app_ids(backend) == [second, first]
+    # appending to the first app's log does not change its (or the project's) directory
+    _tracked_app(storage_dir, 2, app_id=first)
+    assert await _list_app_ids(backend) == [first, second]
+    apps, _ = await backend.list_apps(None, PROJECT, None)
+    assert apps[0].last_written > apps[1].last_written
+
+
+async def test_list_apps_paginates(tmp_path):
+    storage_dir = str(tmp_path)
+    app_ids = []
+    for seconds_ago in range(500, 0, -100):
+        app_id = _tracked_app(storage_dir, 2)
+        _settle(_log_path(storage_dir, app_id, LocalTrackingClient.LOG_FILENAME), seconds_ago)
+        _settle(os.path.join(storage_dir, PROJECT, app_id), seconds_ago)
+        app_ids.insert(0, app_id)  # most recently written first
+    backend = LocalBackend(storage_dir)
+    apps, total = await backend.list_apps(None, PROJECT, None, limit=2, offset=2)
+    assert total == 5
+    assert [app.app_id for app in apps] == app_ids[2:4]
+    assert await _list_app_ids(backend, limit=2, offset=4) == app_ids[4:]
+
+
+async def test_list_apps_reads_last_written_from_written_file(tmp_path, monkeypatch):
+    storage_dir = str(tmp_path)
+    app_ids = [_tracked_app(storage_dir, 2) for _ in range(3)]
+    _settle(os.path.join(storage_dir, PROJECT))
+    backend = LocalBackend(storage_dir)
+    assert await _list_app_ids(backend) == app_ids[::-1]
+    stats = []
+    monkeypatch.setattr(backend, "_get_last_written", lambda path: stats.append(path))
+    _tracked_app(storage_dir, 2, app_id=app_ids[0])
+    written_filepath = os.path.join(storage_dir, PROJECT, LocalBackend.WRITTEN_FILENAME)
+    with open(written_filepath, "a") as f:
+        f.write('{"app_id": "')  # still being written
+    assert await _list_app_ids(backend) == [app_ids[0], app_ids[2], app_ids[1]]
+    # applications that are already indexed are not read
+    assert stats == []
+    with open(written_filepath, "a") as f:
+        f.write(
+            f'{app_ids[1]}", "written_time": {time.time() + 10}, "type": "application_written"}}\n'
+        )
+    assert await _list_app_ids(backend) == [app_ids[1], app_ids[0], app_ids[2]]
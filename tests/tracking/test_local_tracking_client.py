@@ -11,6 +11,7 @@ from burr.core import Action, Application, ApplicationBuilder, Result, State, ac
 from burr.core.persistence import BaseStatePersister, PersistedStateData
 from burr.tracking import LocalTrackingClient
 from burr.tracking.client import _allowed_project_name
+from burr.tracking.common import log_index
 from burr.tracking.common.models import (
     ApplicationMetadataModel,
     ApplicationModel,
@@ -477,3 +478,143 @@ def test_local_tracking_client_copy():
     assert copy.project_id == tracking_client.project_id
     assert copy.serde_kwargs == tracking_client.serde_kwargs
     assert copy.storage_dir == tracking_client.storage_dir
+
+
+def test_buffered_tracking_client_flushes_on_run(tmp_path):
+    app_id = str(uuid.uuid4())
+    project_name = "test_buffered_tracking_client_flushes_on_run"
+    tracker = LocalTrackingClient(
+        project=project_name, storage_dir=str(tmp_path), buffered=True, flush_interval_seconds=60
+    )
+    app = (
+        ApplicationBuilder()
+        .with_state(counter=0, break_at=-1)
+        .with_actions(counter=counter, result=Result("counter"))
+        .with_transitions(
+            ("counter", "counter", expr("counter < 2")),
+            ("counter", "result", default),
+        )
+        .with_entrypoint("counter")
+        .with_tracker(tracker=tracker)
+        .with_identifiers(app_id=app_id)
+        .build()
+    )
+    app.run(halt_after=["result"])
+    log_output = os.path.join(tmp_path, project_name, app_id, LocalTrackingClient.LOG_FILENAME)
+    with open(log_output) as f:
+        log_contents = [json.loads(item) for item in f.readlines()]
+    end_entries = [
+        EndEntryModel.model_validate(line) for line in log_contents if line["type"] == "end_entry"
+    ]
+    assert [entry.action for entry in end_entries] == ["counter", "counter", "result"]
+    assert end_entries[-1].state["counter"] == 2
+    loaded = tracker.load("", app_id)
+    assert loaded["state"]["counter"] == 2
+
+
+def test_buffered_tracking_client_batches_writes(tmp_path):
+    tracker = LocalTrackingClient(
+        project="test_buffered_batches",
+        storage_dir=str(tmp_path),
+        buffered=True,
+        flush_interval_seconds=60,
+        max_batch_size=2,
+    )
+    path = os.path.join(tmp_path, "log.jsonl")
+    tracker.f = open(path, "a")
+    action_ = Result("counter").with_name("result")
+    tracker.pre_run_step(state=State(), action=action_, inputs={}, sequence_id=0)
+    tracker.flush()
+    with open(path) as f:
+        assert len(f.readlines()) == 1
+    tracker.post_run_step(
+        state=State({"counter": 1}), action=action_, result={}, sequence_id=0, exception=None
+    )
+    tracker.pre_run_step(state=State(), action=action_, inputs={}, sequence_id=1)
+    tracker.pre_run_step(state=State(), action=action_, inputs={}, sequence_id=2)
+    tracker._writer.close()  # flushes the remaining entry and stops the thread
+    with open(path) as f:
+        lines = [json.loads(line) for line in f.readlines()]
+    assert [line["type"] for line in lines] == [
+        "begin_entry",
+        "end_entry",
+        "begin_entry",
+        "begin_entry",
+    ]
+    assert lines[1]["state"] == {"counter": 1}
+
+
+def test_buffered_tracking_client_logs_state_at_end_of_step(tmp_path):
+    tracker = LocalTrackingClient(
+        project="test_buffered_state_snapshot",
+        storage_dir=str(tmp_path),
+        buffered=True,
+        flush_interval_seconds=60,
+    )
+    path = os.path.join(tmp_path, "log.jsonl")
+    tracker.f = open(path, "a")
+    state = State({"history": [{"n": "at-end-of-step"}]})
+    tracker.post_run_step(
+        state=state,
+        action=Result("history").with_name("result"),
+        result={},
+        sequence_id=0,
+        exception=None,
+    )
+    # values are shared by reference, so they can change before the writer thread gets to them
+    state["history"][-1]["n"] = "mutated-after-step"
+    tracker.flush()
+    with open(path) as f:
+        (line,) = [json.loads(line) for line in f.readlines()]
+    assert line["state"] == {"history": [{"n": "at-end-of-step"}]}
+    tracker._writer.close()
+
+
+def test_buffered_tracking_client_copy():
+    tracking_client = LocalTrackingClient(
+        "foo", "storage_dir", buffered=True, flush_interval_seconds=5, max_batch_size=10, fsync=True
+    )
+    copy = tracking_client.copy()
+    assert copy.buffered
+    assert copy.flush_interval_seconds == 5
+    assert copy.max_batch_size == 10
+    assert copy.fsync
+    assert copy.flush_after == tracking_client.flush_after
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_tracking_client_writes_step_index(tmp_path, buffered: bool):
+    app_id = str(uuid.uuid4())
+    project_name = "test_tracking_client_writes_step_index"
+    tracker = LocalTrackingClient(
+        project=project_name, storage_dir=str(tmp_path), buffered=buffered
+    )
+    app = (
+        ApplicationBuilder()
+        .with_state(counter=0, break_at=-1)
+        .with_actions(counter=counter, result=Result("counter"))
+        .with_transitions(
+            ("counter", "counter", expr("counter < 2")),
+            ("counter", "result", default),
+        )
+        .with_entrypoint("counter")
+        .with_tracker(tracker=tracker)
+        .with_identifiers(app_id=app_id)
+        .build()
+    )
+    app.run(halt_after=["result"])
+    app_dir = os.path.join(tmp_path, project_name, app_id)
+    index = log_index.read_index(os.path.join(app_dir, LocalTrackingClient.LOG_INDEX_FILENAME))
+    assert [sequence_id for sequence_id, _ in index] == [0, 1, 2]
+    assert (
+        log_index.read_last_index_record(
+            os.path.join(app_dir, LocalTrackingClient.LOG_INDEX_FILENAME)
+        )
+        == index[-1]
+    )
+    with open(os.path.join(app_dir, LocalTrackingClient.LOG_FILENAME), "rb") as f:
+        for sequence_id, offset in index:
+            f.seek(offset)
+            line = json.loads(f.readline())
+            assert line["type"] == "begin_entry"
+            assert line["sequence_id"] == sequence_id
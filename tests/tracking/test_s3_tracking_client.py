@@ -0,0 +1,117 @@
+import gzip
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from burr.core import ApplicationBuilder, Result, State, default, expr
+from burr.core.action import action
+from burr.tracking.s3client import S3TrackingClient, _UploadPool
+
+BUCKET = "burr-tracking-test"
+
+
+@action(reads=["counter"], writes=["counter"])
+def counter(state: State) -> State:
+    return state.update(counter=state["counter"] + 1)
+
+
+@pytest.fixture
+def s3_bucket():
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        yield s3
+
+
+def _build_app(tracker: S3TrackingClient, app_id: str):
+    return (
+        ApplicationBuilder()
+        .with_state(counter=0)
+        .with_actions(counter=counter, result=Result("counter"))
+        .with_transitions(
+            ("counter", "counter", expr("counter < 3")), ("counter", "result", default)
+        )
+        .with_entrypoint("counter")
+        .with_tracker(tracker)
+        .with_identifiers(app_id=app_id)
+        .build()
+    )
+
+
+def _read_objects(s3, suffix: str):
+    keys = [obj["Key"] for obj in s3.list_objects_v2(Bucket=BUCKET).get("Contents", [])]
+    out = []
+    for key in keys:
+        if key.endswith(suffix):
+            response = s3.get_object(Bucket=BUCKET, Key=key)
+            body = response["Body"].read()
+            if response.get("ContentEncoding") == "gzip":
+                body = gzip.decompress(body)
+            out.append((key, body.decode("utf-8")))
+    return out
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_s3_tracking_client_uploads_logs_for_each_app(s3_bucket, compress: bool):
+    tracker = S3TrackingClient(
+        project="test_s3", bucket=BUCKET, region="us-east-1", compress=compress, upload_workers=2
+    )
+    for app_id in ["app_1", "app_2"]:
+        _build_app(tracker, app_id).run(halt_after=["result"])
+    tracker.log_queue.put(None)  # the flushing thread does a final flush and exits
+    tracker.flushing_thread.join()
+    logs = _read_objects(s3_bucket, "__log.jsonl")
+    assert sorted(key.split("/")[-2] for key, _ in logs) == ["app_1", "app_2"]
+    for _, body in logs:
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [line["type"] for line in lines if line["type"] == "end_entry"] == ["end_entry"] * 4
+    assert len(_read_objects(s3_bucket, "graph.json")) == 2
+    metrics = tracker.metrics()
+    assert metrics.uploads_succeeded == 6  # graph, metadata, and a log file per app
+    assert metrics.uploads_failed == 0
+    assert metrics.upload_queue_depth == 0
+    assert metrics.mean_upload_latency_seconds is not None
+
+
+def test_s3_tracking_client_retries_failed_uploads(s3_bucket):
+    tracker = S3TrackingClient(
+        project="test_s3", bucket=BUCKET, region="us-east-1", retry_backoff_seconds=0
+    )
+
+    class FlakyClient:
+        def __init__(self, failures: int):
+            self.failures = failures
+            self.calls = 0
+
+        def put_object(self, **kwargs):
+            self.calls += 1
+            if self.calls <= self.failures:
+                raise ConnectionError("Simulated failure")
+            return s3_bucket.put_object(**kwargs)
+
+    tracker._put_object(FlakyClient(failures=2), "key_1", b"body", {})
+    assert s3_bucket.get_object(Bucket=BUCKET, Key="key_1")["Body"].read() == b"body"
+    with pytest.raises(ConnectionError):
+        tracker._put_object(FlakyClient(failures=10), "key_2", b"body", {})
+    metrics = tracker.metrics()
+    assert metrics.uploads_succeeded == 1
+    assert metrics.uploads_failed == 1
+    assert metrics.retries == 2 + tracker.max_retries
+    tracker.log_queue.put(None)
+
+
+def test_upload_pool_reuses_one_client_per_worker():
+    created = []
+
+    def client_factory():
+        created.append(object())
+        return created[-1]
+
+    pool = _UploadPool(num_workers=2, client_factory=client_factory)
+    futures = [pool.submit(lambda client: id(client)) for _ in range(20)]
+    client_ids = {future.result() for future in futures}
+    pool.shutdown()
+    assert len(created) <= 2
+    assert client_ids == {id(client) for client in created}
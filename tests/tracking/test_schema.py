@@ -0,0 +1,64 @@
+import os
+import uuid
+from typing import Tuple
+
+from burr.core import ApplicationBuilder, Result, State, action, default, expr
+from burr.tracking.server.schema import Step
+from burr.visibility import TracerFactory
+
+
+@action(reads=["counter"], writes=["counter"])
+def counter(state: State, __tracer: TracerFactory) -> Tuple[dict, State]:
+    with __tracer("increment") as t:
+        result = {"counter": state["counter"] + 1}
+        t.log_attributes(counter=result["counter"])
+    return result, state.update(**result)
+
+
+def _tracked_log_lines(tmp_path) -> list:
+    app_id = str(uuid.uuid4())
+    app = (
+        ApplicationBuilder()
+        .with_state(counter=0)
+        .with_actions(counter=counter, result=Result("counter"))
+        .with_transitions(
+            ("counter", "counter", expr("counter < 3")), ("counter", "result", default)
+        )
+        .with_entrypoint("counter")
+        .with_tracker("local", project="test_schema", params={"storage_dir": str(tmp_path)})
+        .with_identifiers(app_id=app_id)
+        .build()
+    )
+    app.run(halt_after=["result"])
+    with open(os.path.join(tmp_path, "test_schema", app_id, "log.jsonl"), "rb") as f:
+        return f.readlines()
+
+
+def test_iter_from_logs_matches_from_logs(tmp_path):
+    lines = _tracked_log_lines(tmp_path)
+    assert list(Step.iter_from_logs(lines)) == Step.from_logs(lines)
+
+
+def test_iter_from_logs_is_incremental(tmp_path):
+    lines = _tracked_log_lines(tmp_path)
+    consumed = []
+
+    def lines_iter():
+        for line in lines:
+            consumed.append(line)
+            yield line
+
+    steps = Step.iter_from_logs(lines_iter())
+    first = next(steps)
+    assert first.sequence_id == 0
+    assert len(first.spans) == 1
+    assert len(first.attributes) == 1
+    assert len(consumed) < len(lines)
+
+
+def test_iter_from_logs_without_payloads(tmp_path):
+    lines = _tracked_log_lines(tmp_path)
+    steps = list(Step.iter_from_logs(lines, include_payloads=False))
+    assert [step.sequence_id for step in steps] == [0, 1, 2, 3]
+    assert all(step.step_end_log.state == {} for step in steps)
+    assert all(step.step_end_log.result is None for step in steps)